@@ -199,30 +199,83 @@ def parse_player_response(player_response: str, available_actions: Dict[str, Act
     lines = player_response.strip().splitlines()
 
     for line in lines:
-        trimmed_line = line.strip()
-        if trimmed_line.startswith(">"):
-            action_line = trimmed_line[1:].strip()
-            if action_line:
-                parsed_action = _parse_single_action_line(action_line, available_actions, room_objects)
-                if parsed_action:
-                    action_config, params = parsed_action
-                    # Check for parse errors in the parameters
-                    if '_whisper_parse_error' in params or '_give_parse_error' in params or '_throw_parse_error' in params or '_use_parse_error' in params:
-                        # Treat as invalid action with helpful error message
-                        error_msg = params.get('_whisper_parse_error') or params.get('_give_parse_error') or params.get('_throw_parse_error') or params.get('_use_parse_error')
-                        invalid_actions.append(f"{action_line} - {error_msg}")
-                    else:
-                        parsed_actions.append(parsed_action)
-                else:
-                    # Add suggestion for similar actions
-                    suggestion = _suggest_similar_action(action_line, available_actions)
-                    if suggestion:
-                        invalid_actions.append(f"{action_line} (did you mean '{suggestion}'?)")
-                    else:
-                        invalid_actions.append(action_line)
+        action_line = _action_line_text(line)
+        if action_line:
+            parsed_action, invalid_action = parse_action_line(action_line, available_actions, room_objects)
+            if parsed_action:
+                parsed_actions.append(parsed_action)
+            else:
+                invalid_actions.append(invalid_action)
 
     return parsed_actions, invalid_actions
 
+def parse_action_line(action_line: str, available_actions: Dict[str, ActionConfig], room_objects: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Tuple[ActionConfig, Dict[str, Any]]], Optional[str]]:
+    """Parses one action line (without its '>' prefix).
+
+    Returns:
+        Tuple of (parsed_action, invalid_action); exactly one of them is set.
+    """
+    parsed_action = _parse_single_action_line(action_line, available_actions, room_objects)
+    if parsed_action:
+        action_config, params = parsed_action
+        # Check for parse errors in the parameters
+        if '_whisper_parse_error' in params or '_give_parse_error' in params or '_throw_parse_error' in params or '_use_parse_error' in params:
+            # Treat as invalid action with helpful error message
+            error_msg = params.get('_whisper_parse_error') or params.get('_give_parse_error') or params.get('_throw_parse_error') or params.get('_use_parse_error')
+            return None, f"{action_line} - {error_msg}"
+        return parsed_action, None
+
+    # Add suggestion for similar actions
+    suggestion = _suggest_similar_action(action_line, available_actions)
+    if suggestion:
+        return None, f"{action_line} (did you mean '{suggestion}'?)"
+    return None, action_line
+
+def _action_line_text(line: str) -> str:
+    """Returns the action text of a '>' line, or '' for any other line."""
+    trimmed_line = line.strip()
+    if trimmed_line.startswith(">"):
+        return trimmed_line[1:].strip()
+    return ""
+
+class ActionLineStream:
+    """Collects '>' action lines from a player response as it streams in.
+
+    A line counts once its newline arrives (or the stream finishes), so a
+    partially generated action is never parsed.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.action_lines: List[str] = []
+        self._line_start = 0  # Offset of the first incomplete line in text
+
+    @property
+    def complete_text(self) -> str:
+        """The response up to the end of the last complete line."""
+        return self.text[:self._line_start]
+
+    def feed(self, chunk: str) -> List[str]:
+        """Adds streamed text and returns the action lines it completed."""
+        self.text += chunk
+        end = self.text.rfind("\n")
+        if end < self._line_start:
+            return []
+        new_lines = self._collect(self.text[self._line_start:end].split("\n"))
+        self._line_start = end + 1
+        return new_lines
+
+    def finish(self) -> List[str]:
+        """Treats the trailing partial line as complete."""
+        new_lines = self._collect([self.text[self._line_start:]])
+        self._line_start = len(self.text)
+        return new_lines
+
+    def _collect(self, lines: List[str]) -> List[str]:
+        new_lines = [text for text in (_action_line_text(line) for line in lines) if text]
+        self.action_lines.extend(new_lines)
+        return new_lines
+
 def _suggest_similar_action(action_line: str, available_actions: Dict[str, ActionConfig]) -> Optional[str]:
     """Suggests a similar action if the input doesn't match any known actions."""
     action_line_lower = action_line.lower().strip()
@@ -0,0 +1,271 @@
+"""
+Batch mode: advance many games in lockstep through batched LLM requests.
+
+For offline data generation, latency does not matter but cost and throughput
+do. In batch mode every player's LLM client is a BatchLLMClient: its
+``ainvoke`` queues the request and waits. Once every live game is waiting on
+a model reply (or ``max_wait`` seconds pass), the queued requests are
+submitted as one job per provider to a BatchBackend, and each game resumes
+when its reply arrives.
+
+FileBatchBackend is a local stand-in for a provider batch endpoint. It writes
+each job as ``input.jsonl`` in the OpenAI Batch API request format and reads
+``output.jsonl`` in the matching response format. The output comes either from
+a ``responder`` callable (tests, dry runs) or from an external process that
+uploads the input to a discounted batch endpoint and writes the results back.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage
+
+
+logger = logging.getLogger(__name__)
+
+_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    provider: str
+    model: str
+    messages: List[Dict[str, str]]
+    future: asyncio.Future = field(repr=False, default=None)
+
+
+def message_dicts(messages: List[Any]) -> List[Dict[str, str]]:
+    """LangChain messages as chat-completions role/content dicts."""
+    converted = []
+    for message in messages:
+        role = _ROLES.get(getattr(message, 'type', None), "user")
+        content = getattr(message, 'content', message)
+        if isinstance(content, list):  # Content blocks, e.g. with cache-control markers
+            content = "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
+        converted.append({"role": role, "content": str(content)})
+    return converted
+
+
+class BatchBackend(ABC):
+    """Runs one provider batch job: request lines in, results by custom_id out."""
+
+    @abstractmethod
+    async def run(self, provider: str, requests: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Submit one job's request lines and return the result line for each custom_id."""
+
+
+class FileBatchBackend(BatchBackend):
+    """File-based stand-in for provider batch endpoints (OpenAI Batch JSONL format)."""
+
+    def __init__(self, directory: str, responder: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 poll_interval: float = 2.0, timeout: Optional[float] = None):
+        self.directory = directory
+        self.responder = responder
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.jobs_submitted = 0
+
+    async def run(self, provider: str, requests: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        self.jobs_submitted += 1
+        job_dir = os.path.join(self.directory, f"job_{self.jobs_submitted:05d}_{provider}")
+        os.makedirs(job_dir, exist_ok=True)
+        input_path = os.path.join(job_dir, "input.jsonl")
+        output_path = os.path.join(job_dir, "output.jsonl")
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for request in requests:
+                f.write(json.dumps(request) + "\n")
+
+        if self.responder is not None:
+            self._respond(requests, output_path)
+        else:
+            logger.info(f"Batch job with {len(requests)} request(s) written to {input_path}; waiting for {output_path}")
+            await self._wait_for(output_path)
+
+        results = {}
+        with open(output_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    result = json.loads(line)
+                    results[result["custom_id"]] = result
+        return results
+
+    def _respond(self, requests: List[Dict[str, Any]], output_path: str) -> None:
+        partial_path = output_path + ".part"
+        with open(partial_path, 'w', encoding='utf-8') as f:
+            for request in requests:
+                content = self.responder(request)
+                f.write(json.dumps({
+                    "id": f"batch_req_{request['custom_id']}",
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": {
+                        "model": request["body"]["model"],
+                        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0},
+                    }},
+                    "error": None,
+                }) + "\n")
+        os.replace(partial_path, output_path)
+
+    async def _wait_for(self, path: str) -> None:
+        waited = 0.0
+        while not os.path.exists(path):
+            if self.timeout is not None and waited >= self.timeout:
+                raise TimeoutError(f"Batch output {path} did not appear within {self.timeout}s")
+            await asyncio.sleep(self.poll_interval)
+            waited += self.poll_interval
+
+
+class BatchCollector:
+    """Queues player requests and flushes them as batch jobs when all games are waiting."""
+
+    def __init__(self, backend: BatchBackend, max_wait: Optional[float] = 30.0):
+        self.backend = backend
+        self.max_wait = max_wait
+        self.live_games = 0
+        self.batches_flushed = 0
+        self.requests_submitted = 0
+        self._pending: List[BatchRequest] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: List[asyncio.Task] = []
+        self._batch_id = uuid.uuid4().hex[:8]
+
+    def client(self, provider: str, model: str) -> 'BatchLLMClient':
+        return BatchLLMClient(self, provider, model)
+
+    async def run_games(self, games: List[Awaitable[Any]]) -> List[Any]:
+        """Run game coroutines to completion; exceptions are returned, not raised."""
+        self.live_games += len(games)
+        return await asyncio.gather(*(self._track(game) for game in games), return_exceptions=True)
+
+    async def _track(self, game: Awaitable[Any]) -> Any:
+        try:
+            return await game
+        finally:
+            self.live_games -= 1
+            self._maybe_flush()
+
+    async def submit(self, provider: str, model: str, messages: List[Any]) -> AIMessage:
+        self.requests_submitted += 1
+        request = BatchRequest(
+            custom_id=f"{self._batch_id}-{self.requests_submitted}",
+            provider=provider,
+            model=model,
+            messages=message_dicts(messages),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._pending.append(request)
+        if self._timer is None and self.max_wait is not None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        self._maybe_flush()
+        return await request.future
+
+    def _maybe_flush(self) -> None:
+        if self._pending and len(self._pending) >= self.live_games:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        by_provider: Dict[str, List[BatchRequest]] = {}
+        for request in pending:
+            by_provider.setdefault(request.provider, []).append(request)
+        self.batches_flushed += 1
+        for provider, requests in by_provider.items():
+            self._flushes.append(asyncio.ensure_future(self._run_job(provider, requests)))
+
+    async def _run_job(self, provider: str, requests: List[BatchRequest]) -> None:
+        lines = [{
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": request.model, "messages": request.messages},
+        } for request in requests]
+        try:
+            results = await self.backend.run(provider, lines)
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        for request in requests:
+            if request.future.done():
+                continue
+            result = results.get(request.custom_id)
+            try:
+                request.future.set_result(self._to_message(request, result))
+            except Exception as e:
+                request.future.set_exception(e)
+
+    @staticmethod
+    def _to_message(request: BatchRequest, result: Optional[Dict[str, Any]]) -> AIMessage:
+        if result is None:
+            raise RuntimeError(f"Batch result missing for request {request.custom_id}")
+        if result.get("error"):
+            raise RuntimeError(f"Batch request {request.custom_id} failed: {result['error']}")
+        body = result["response"]["body"]
+        usage = body.get("usage") or {}
+        input_tokens = int(usage.get("prompt_tokens") or 0)
+        output_tokens = int(usage.get("completion_tokens") or 0)
+        return AIMessage(
+            content=body["choices"][0]["message"]["content"],
+            usage_metadata={"input_tokens": input_tokens, "output_tokens": output_tokens,
+                            "total_tokens": input_tokens + output_tokens},
+        )
+
+
+class BatchLLMClient:
+    """Stands in for a chat model; requests go through a BatchCollector."""
+
+    def __init__(self, collector: BatchCollector, provider: str, model: str):
+        self.collector = collector
+        self.provider = provider
+        self.model = model
+
+    async def ainvoke(self, messages: List[Any], **kwargs: Any) -> AIMessage:
+        return await self.collector.submit(self.provider, self.model, messages)
+
+
+def run_batch_games(num_games: int, batch_dir: str, responder: Optional[Callable[[Dict[str, Any]], str]] = None,
+                    max_wait: Optional[float] = 30.0, base_game_id: Optional[str] = None,
+                    seed: Optional[int] = None, **game_args: Any) -> List[Any]:
+    """
+    Build ``num_games`` games from CLI-style arguments and run them in lockstep.
+    With a seed, game i plays with seed + i; each game draws from its own
+    random streams, so running them side by side does not change them.
+    """
+    from motive.cli import build_game_master
+
+    backend = FileBatchBackend(batch_dir, responder=responder)
+    collector = BatchCollector(backend, max_wait=max_wait)
+    base_game_id = base_game_id or f"batch_{uuid.uuid4().hex[:8]}"
+
+    game_masters = []
+    for i in range(num_games):
+        game_master = build_game_master(game_id=f"{base_game_id}_game_{i + 1}",
+                                        llm_client_factory=collector.client,
+                                        seed=None if seed is None else seed + i, **game_args)
+        if game_master is None:
+            return []
+        game_masters.append(game_master)
+
+    print(f"📦 Running {num_games} games in batch mode; jobs are written to {batch_dir}")
+    results = asyncio.run(collector.run_games([game_master.run_game() for game_master in game_masters]))
+    failures = [result for result in results if isinstance(result, Exception)]
+    print(f"📦 Batch mode finished: {collector.requests_submitted} requests in "
+          f"{backend.jobs_submitted} job(s), {len(failures)} game(s) failed")
+    for game_master, result in zip(game_masters, results):
+        if isinstance(result, Exception):
+            print(f"  ❌ {game_master.game_id}: {result}")
+        game_master.close_logs()
+    return results
@@ -0,0 +1,248 @@
+"""
+Micro-benchmark timing, results files and baseline comparison.
+
+The engine benchmarks live in ``tests/benchmarks`` and use the
+``benchmark`` fixture from its conftest, which follows pytest-benchmark's
+calling convention::
+
+    def test_parse(benchmark):
+        actions, invalid = benchmark(parse_player_response, text, actions, objects)
+
+    def test_pickup(benchmark):
+        benchmark.pedantic(game_master._execute_effects, setup=reset, rounds=50)
+
+Each benchmark reports seconds per call (min, median, mean, max, stddev).
+A results file is JSON; ``tests/benchmarks/baseline.json`` is the
+committed baseline. ``compare`` flags every benchmark whose time grew
+by more than a threshold over the baseline. ``motive-util bench run``
+runs the suite and compares it with the baseline, and
+``motive-util bench compare`` compares two saved results files.
+
+Timings depend on the machine: refresh the baseline with
+``motive-util bench run --save tests/benchmarks/baseline.json`` on the
+machine that runs the comparison, before the change under test.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.join(REPO_ROOT, "tests", "benchmarks")
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.25        # A benchmark regressed if it got more than 25% slower
+DEFAULT_STATISTIC = "min"       # Noise only ever adds time, so the fastest round is the steadiest
+MIN_ROUND_TIME = 0.002          # Calls per round are calibrated so a round takes at least this long
+MIN_ROUNDS = 5
+MAX_ROUNDS = 1000               # Caps single-call rounds (benchmarks with a setup)
+MIN_TIME = 0.2                  # Keep adding rounds until this much time was measured
+
+REGRESSED, IMPROVED, UNCHANGED, NEW, MISSING = "regressed", "improved", "unchanged", "new", "missing"
+
+
+@dataclass
+class BenchmarkStats:
+    """Seconds per call of one benchmark."""
+    name: str
+    group: str
+    rounds: int
+    iterations: int  # Calls per round
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+
+    @classmethod
+    def from_rounds(cls, name: str, group: str, round_times: List[float], iterations: int) -> "BenchmarkStats":
+        per_call = [seconds / iterations for seconds in round_times]
+        return cls(name=name, group=group, rounds=len(per_call), iterations=iterations,
+                   min=min(per_call), max=max(per_call), mean=statistics.fmean(per_call),
+                   median=statistics.median(per_call),
+                   stddev=statistics.stdev(per_call) if len(per_call) > 1 else 0.0)
+
+
+def _calibrate(call: Callable[[], Any], timer: Callable[[], float]) -> int:
+    """Calls per round so that one round takes at least MIN_ROUND_TIME."""
+    iterations = 1
+    while True:
+        start = timer()
+        for _ in range(iterations):
+            call()
+        if timer() - start >= MIN_ROUND_TIME or iterations >= 1 << 20:
+            return iterations
+        iterations *= 2
+
+
+def measure(name: str, target: Callable[..., Any], args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None,
+            group: str = "", setup: Optional[Callable[[], Any]] = None, rounds: Optional[int] = None,
+            timer: Callable[[], float] = time.perf_counter) -> Tuple[BenchmarkStats, Any]:
+    """
+    Time target(*args, **kwargs) and return (stats, the target's result).
+
+    Without setup the call count per round is calibrated and rounds are
+    added until MIN_TIME is measured. With setup, every round is a single
+    call preceded by an untimed setup() - for targets that change the state
+    they run on; setup may return (args, kwargs) to use for that call.
+    """
+    kwargs = kwargs or {}
+    round_times: List[float] = []
+    if setup is None:
+        result = target(*args, **kwargs)  # Warm-up
+        iterations = _calibrate(lambda: target(*args, **kwargs), timer)
+    else:
+        result, iterations = None, 1
+    spent = 0.0
+    while True:
+        call_args, call_kwargs = args, kwargs
+        if setup is not None:
+            prepared = setup()
+            if prepared is not None:
+                call_args, call_kwargs = prepared
+        start = timer()
+        for _ in range(iterations):
+            result = target(*call_args, **call_kwargs)
+        elapsed = timer() - start
+        round_times.append(elapsed)
+        spent += elapsed
+        if rounds is not None:
+            if len(round_times) >= rounds:
+                break
+        elif len(round_times) >= MIN_ROUNDS and (spent >= MIN_TIME or len(round_times) >= MAX_ROUNDS):
+            break
+    return BenchmarkStats.from_rounds(name, group, round_times, iterations), result
+
+
+@dataclass
+class BenchmarkResults:
+    """All benchmarks of one run, with the machine they ran on."""
+    benchmarks: Dict[str, BenchmarkStats] = field(default_factory=dict)
+    machine: Dict[str, str] = field(default_factory=lambda: {
+        "python": platform.python_version(), "implementation": platform.python_implementation(),
+        "platform": platform.platform(), "processor": platform.processor() or platform.machine(),
+        "cpus": str(os.cpu_count()),
+    })
+    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+    def add(self, stats: BenchmarkStats):
+        self.benchmarks[stats.name] = stats
+
+    def save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {"version": RESULTS_VERSION, "created": self.created, "machine": self.machine,
+                "benchmarks": {name: asdict(stats) for name, stats in sorted(self.benchmarks.items())}}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BenchmarkResults":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != RESULTS_VERSION:
+            raise ValueError(f"Unsupported benchmark results version {data.get('version')} in {path}")
+        return cls(benchmarks={name: BenchmarkStats(**stats) for name, stats in data["benchmarks"].items()},
+                   machine=data.get("machine", {}), created=data.get("created", ""))
+
+
+@dataclass
+class Comparison:
+    name: str
+    status: str
+    baseline: Optional[float]
+    current: Optional[float]
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change in time: 0.5 is 50% slower, -0.2 is 20% faster."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def compare(baseline: BenchmarkResults, current: BenchmarkResults, threshold: float = DEFAULT_THRESHOLD,
+            statistic: str = DEFAULT_STATISTIC) -> List[Comparison]:
+    """Compare every benchmark on one statistic; beyond +/-threshold is a regression/improvement."""
+    comparisons = []
+    for name in sorted(set(baseline.benchmarks) | set(current.benchmarks)):
+        before = getattr(baseline.benchmarks[name], statistic) if name in baseline.benchmarks else None
+        after = getattr(current.benchmarks[name], statistic) if name in current.benchmarks else None
+        if before is None:
+            status = NEW
+        elif after is None:
+            status = MISSING
+        elif after > before * (1 + threshold):
+            status = REGRESSED
+        elif after < before * (1 - threshold):
+            status = IMPROVED
+        else:
+            status = UNCHANGED
+        comparisons.append(Comparison(name, status, before, after))
+    return comparisons
+
+
+def run_suite(keyword: Optional[str] = None) -> BenchmarkResults:
+    """Run tests/benchmarks in a fresh interpreter and return its results."""
+    fd, results_path = tempfile.mkstemp(prefix="motive_benchmarks_", suffix=".json")
+    os.close(fd)
+    os.remove(results_path)  # Only a complete run writes the file
+    command = [sys.executable, "-m", "pytest", BENCHMARKS_DIR, "-q", "-p", "no:cacheprovider"]
+    if keyword:
+        command += ["-k", keyword]
+    env = {**os.environ, "MOTIVE_BENCHMARK": "1", "MOTIVE_BENCHMARK_JSON": results_path}
+    try:
+        completed = subprocess.run(command, cwd=REPO_ROOT, env=env)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Benchmark run failed (pytest exit code {completed.returncode})")
+        if not os.path.exists(results_path):
+            raise RuntimeError("No benchmarks ran")
+        return BenchmarkResults.load(results_path)
+    finally:
+        if os.path.exists(results_path):
+            os.remove(results_path)
+
+
+def format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def format_results(results: BenchmarkResults) -> str:
+    width = max((len(name) for name in results.benchmarks), default=4)
+    lines = [f"{'Benchmark':<{width}}  {'min':>9}  {'median':>9}  {'mean':>9}  {'stddev':>9}  rounds x calls"]
+    for name, stats in sorted(results.benchmarks.items()):
+        lines.append(f"{name:<{width}}  {format_time(stats.min):>9}  {format_time(stats.median):>9}  "
+                     f"{format_time(stats.mean):>9}  {format_time(stats.stddev):>9}  {stats.rounds} x {stats.iterations}")
+    return "\n".join(lines)
+
+
+def format_comparison(comparisons: List[Comparison], statistic: str = DEFAULT_STATISTIC) -> str:
+    markers = {REGRESSED: "❌", IMPROVED: "🚀", UNCHANGED: "  ", NEW: "🆕", MISSING: "❔"}
+    width = max((len(comparison.name) for comparison in comparisons), default=4)
+    lines = [f"   {'Benchmark':<{width}}  {'baseline':>9}  {'current':>9}  change ({statistic})"]
+    for comparison in comparisons:
+        change = comparison.change
+        change_text = f"{change:+.1%}" if change is not None else comparison.status
+        lines.append(f"{markers[comparison.status]} {comparison.name:<{width}}  {format_time(comparison.baseline):>9}  "
+                     f"{format_time(comparison.current):>9}  {change_text}")
+    regressed = sum(comparison.status == REGRESSED for comparison in comparisons)
+    lines.append(f"\n{regressed} regression(s) in {len(comparisons)} benchmark(s)")
+    return "\n".join(lines)
@@ -24,6 +24,7 @@ class Character:
         deterministic: bool = False,  # Use deterministic selection instead of random
         short_name: Optional[str] = None,  # Short display name for observations
         template_id: Optional[str] = None,  # Identifier of the character template (e.g., detective_thorne)
+        rng: Optional[random.Random] = None,  # The game's motive stream; module-level random if not given
     ):
         self.id = char_id
         self.name = name
@@ -52,7 +53,7 @@ class Character:
             if deterministic:
                 self.selected_motive = motives[0]  # Always pick first motive in deterministic mode
             else:
-                self.selected_motive = random.choice(motives)
+                self.selected_motive = (rng or random).choice(motives)
             self.motive = self.selected_motive.description  # For backward compatibility
         elif motive:
             # Legacy single motive
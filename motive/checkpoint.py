@@ -0,0 +1,341 @@
+"""
+Turn-level checkpoints, so a long game can continue after a crash.
+
+A checkpointed game keeps two files under ``<log_dir>/checkpoints/<game_id>/``:
+
+* ``manifest.json`` - how to rebuild the game: config path, command line
+  options (including the seed, so rebuilding assigns the same characters,
+  motives and starting rooms) and config hash.
+* ``journal.jsonl`` - one line per completed turn holding only what changed
+  since the previous line: the serialized state of changed objects, rooms
+  and characters, new conversation messages per player, hints and other
+  game master bookkeeping, and the state of the game's random streams. The
+  first line holds the full initial state; the last line of a finished
+  game also holds each player's motive outcome.
+
+Resuming rebuilds the game from the manifest, folds the journal into the
+latest state of every entity and continues with the first player who had
+not finished the last checkpointed round, so no completed LLM call is paid
+for twice. ``motive --resume <game_id>`` is the command-line entry point.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import messages_from_dict, messages_to_dict
+
+from motive.config import Event
+
+CHECKPOINT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+JOURNAL_FILE = "journal.jsonl"
+
+
+class CheckpointError(Exception):
+    """Raised when a checkpoint is missing, unreadable or does not match the game."""
+
+
+def checkpoint_dir(log_dir: str, game_id: str) -> str:
+    return os.path.join(log_dir, "checkpoints", game_id)
+
+
+def _json_default(value: Any):
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted(value, key=str)}
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def _json_object(data: Dict[str, Any]):
+    if len(data) == 1 and "__set__" in data:
+        return set(data["__set__"])
+    return data
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=_json_default, separators=(",", ":"))
+
+
+def _loads(text: str) -> Any:
+    return json.loads(text, object_hook=_json_object)
+
+
+# -- entity state -------------------------------------------------------------
+
+def _object_state(obj) -> Dict[str, Any]:
+    return {"name": obj.name, "description": obj.description, "location": obj.current_location_id,
+            "tags": sorted(obj.tags), "properties": obj.properties}
+
+
+def _room_state(room) -> Dict[str, Any]:
+    return {"objects": list(room.objects), "characters": list(room.players), "tags": sorted(room.tags),
+            "properties": room.properties, "exits": room.exits}
+
+
+def _character_state(character) -> Dict[str, Any]:
+    return {"room": character.current_room_id, "inventory": list(character.inventory),
+            "tags": sorted(character.tags), "properties": character.properties,
+            "action_points": character.action_points,
+            "motive_conditions": getattr(character, "_motive_condition_state", {})}
+
+
+def _game_master_state(game_master) -> Dict[str, Any]:
+    return {
+        "executed_hints": {hint_id: sorted(names) for hint_id, names in game_master.executed_hints.items()},
+        "first_interaction_done": game_master.player_first_interaction_done,
+        "observations": {char_id: [event.model_dump(mode="json") for event in events]
+                         for char_id, events in game_master.player_observations.items()},
+        "play_stats": {name: {**stats, "actions": dict(stats["actions"])}
+                       for name, stats in getattr(game_master, "_play_stats", {}).items()},
+        "recent_example_actions": list(getattr(game_master, "_recent_example_actions", [])),
+    }
+
+
+def capture_entities(game_master) -> Dict[str, str]:
+    """Serialized state of every entity, keyed 'kind:id'."""
+    entities = {f"object:{obj_id}": _dumps(_object_state(obj)) for obj_id, obj in game_master.game_objects.items()}
+    entities.update({f"room:{room_id}": _dumps(_room_state(room)) for room_id, room in game_master.rooms.items()})
+    entities.update({f"character:{char_id}": _dumps(_character_state(character))
+                     for char_id, character in game_master.player_characters.items()})
+    entities["game"] = _dumps(_game_master_state(game_master))
+    return entities
+
+
+def capture_state(game_master) -> Dict[str, Any]:
+    """Like capture_entities, but decoded: the state a journal folds to."""
+    return {key: _loads(value) for key, value in capture_entities(game_master).items()}
+
+
+class CheckpointWriter:
+    """Appends one journal line per completed turn with the state that changed."""
+
+    def __init__(self, directory: str, manifest: Optional[Dict[str, Any]] = None):
+        self.directory = directory
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.turns = 0
+        self._entities: Dict[str, str] = {}
+        self._history_lengths: Dict[str, int] = {}
+        self._summaries: Dict[str, str] = {}
+        self._rng: Optional[Dict[str, Any]] = None
+        os.makedirs(directory, exist_ok=True)
+        if manifest is not None:
+            manifest = {"version": CHECKPOINT_VERSION, "created": time.time(), **manifest}
+            tmp_path = os.path.join(directory, MANIFEST_FILE + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, default=_json_default)
+            os.replace(tmp_path, os.path.join(directory, MANIFEST_FILE))
+            open(self.journal_path, "w").close()  # A fresh game starts a fresh journal
+
+    def prime(self, game_master, turns: int):
+        """Treat the (restored) current state as already written; later lines hold changes from here."""
+        self.turns = turns
+        self._entities = capture_entities(game_master)
+        for player in game_master.players:
+            self._history_lengths[player.name] = len(player.conversation_history)
+            self._summaries[player.name] = player.conversation_summary
+        self._rng = game_master.rng.getstate()
+
+    def record_start(self, game_master):
+        """The full initial state, before the first turn."""
+        self._write(game_master, 1, [])
+
+    def record_turn(self, game_master, round_num: int, done: List[str]):
+        """Changes made by a completed turn; done lists the players who finished round_num."""
+        self.turns += 1
+        self._write(game_master, round_num, done)
+
+    def record_complete(self, game_master):
+        outcomes = [{key: result.get(key) for key in ("player", "character", "motive", "outcome")}
+                    for result in getattr(game_master, "game_results", [])]
+        self._write(game_master, game_master.num_rounds, [], complete=True, outcomes=outcomes)
+
+    def _write(self, game_master, round_num: int, done: List[str], complete: bool = False,
+               outcomes: Optional[List[Dict[str, Any]]] = None):
+        entities = capture_entities(game_master)
+        changes = {key: _loads(value) for key, value in entities.items() if self._entities.get(key) != value}
+        changes.update({key: None for key in self._entities if key not in entities})
+        self._entities = entities
+
+        players = {}
+        for player in game_master.players:
+            history = player.conversation_history
+            start = self._history_lengths.get(player.name, 0)
+            if start > len(history):
+                start = 0  # History was replaced rather than appended to; write it again
+            prefix_ids = {id(message) for message in player.prompt_prefix}
+            recent_ids = {id(message) for message in player.recent_messages}
+            new_messages = history[start:]
+            delta = {
+                "start": start,
+                "messages": messages_to_dict(new_messages),
+                "flags": ["p" * (id(m) in prefix_ids) + "r" * (id(m) in recent_ids) for m in new_messages],
+                "recent": len(player.recent_messages),
+                "token_usage": player.token_usage,
+            }
+            if player.conversation_summary != self._summaries.get(player.name, ""):
+                delta["summary"] = player.conversation_summary
+            self._history_lengths[player.name] = len(history)
+            self._summaries[player.name] = player.conversation_summary
+            players[player.name] = delta
+
+        record = {"turn": self.turns, "round": round_num, "done": list(done), "complete": complete,
+                  "time": time.time(), "entities": changes, "players": players}
+        if outcomes is not None:
+            record["outcomes"] = outcomes
+        rng = game_master.rng.getstate()
+        if rng != self._rng:  # About 7 KB per stream; most turns draw no random numbers
+            record["rng"] = self._rng = rng
+        line = json.dumps(record, default=_json_default, separators=(",", ":")) + "\n"
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+# -- resuming -----------------------------------------------------------------
+
+class Checkpoint:
+    """A manifest plus the journal folded into the latest state."""
+
+    def __init__(self, manifest: Dict[str, Any], records: List[Dict[str, Any]]):
+        if not records:
+            raise CheckpointError("The checkpoint journal is empty; the game never started")
+        self.manifest = manifest
+        self.last = records[-1]
+        self.rng_state = None
+        self.entities: Dict[str, Any] = {}
+        self.players: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            self.rng_state = record.get("rng", self.rng_state)
+            self.entities.update(record["entities"])
+            for name, delta in record["players"].items():
+                state = self.players.setdefault(name, {"messages": [], "flags": [], "summary": ""})
+                del state["messages"][delta["start"]:]
+                del state["flags"][delta["start"]:]
+                state["messages"].extend(delta["messages"])
+                state["flags"].extend(delta["flags"])
+                state["recent"] = delta["recent"]
+                state["token_usage"] = delta["token_usage"]
+                if "summary" in delta:
+                    state["summary"] = delta["summary"]
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.last.get("complete"))
+
+    @property
+    def round(self) -> int:
+        return self.last["round"]
+
+    @property
+    def done(self) -> List[str]:
+        return self.last["done"]
+
+    @property
+    def turns(self) -> int:
+        return self.last["turn"]
+
+    @property
+    def outcomes(self) -> Optional[List[Dict[str, Any]]]:
+        """Per-player motive outcomes of a finished game."""
+        return self.last.get("outcomes")
+
+
+def load_checkpoint(directory: str) -> Checkpoint:
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise CheckpointError(f"No checkpoint found in {directory}") from None
+    except json.JSONDecodeError as e:
+        raise CheckpointError(f"Unreadable checkpoint manifest {manifest_path}: {e}") from e
+    if manifest.get("version") != CHECKPOINT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint version {manifest.get('version')}")
+
+    records = []
+    try:
+        with open(os.path.join(directory, JOURNAL_FILE), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line, object_hook=_json_object))
+                except json.JSONDecodeError:
+                    break  # A line cut short by the crash; everything before it is intact
+    except FileNotFoundError:
+        pass
+    return Checkpoint(manifest, records)
+
+
+def restore(game_master, checkpoint: Checkpoint):
+    """Put a freshly built game master into the checkpointed state."""
+    objects = game_master.game_objects
+    characters = game_master.player_characters
+    registries = {"object": objects, "room": game_master.rooms, "character": characters}
+    missing = []
+    for key, state in checkpoint.entities.items():
+        kind, _, entity_id = key.partition(":")
+        if state is not None and kind in registries and entity_id not in registries[kind]:
+            missing.append(key)
+    if missing:
+        raise CheckpointError(f"The rebuilt game does not match the checkpoint (missing {', '.join(missing[:5])})")
+
+    for key, state in checkpoint.entities.items():
+        kind, _, entity_id = key.partition(":")
+        if state is None or kind != "object":
+            continue
+        obj = objects[entity_id]
+        obj.name, obj.description = state["name"], state["description"]
+        obj.current_location_id = state["location"]
+        obj.tags = set(state["tags"])
+        obj.properties = state["properties"]
+    for key, state in checkpoint.entities.items():
+        kind, _, entity_id = key.partition(":")
+        if state is None:
+            continue
+        if kind == "character":
+            character = characters[entity_id]
+            character.current_room_id = state["room"]
+            character.inventory = {obj_id: objects[obj_id] for obj_id in state["inventory"]}
+            character.tags = set(state["tags"])
+            character.properties = state["properties"]
+            character.action_points = state["action_points"]
+            character._motive_condition_state = state["motive_conditions"]
+        elif kind == "room":
+            room = game_master.rooms[entity_id]
+            room.objects = {obj_id: objects[obj_id] for obj_id in state["objects"]}
+            room.players = {char_id: characters[char_id] for char_id in state["characters"]}
+            room.tags = set(state["tags"])
+            room.properties = state["properties"]
+            room.exits = state["exits"]
+            room.touch()
+    game_master._world_graph = None  # Exits may have changed
+
+    game = checkpoint.entities.get("game") or {}
+    game_master.executed_hints = {hint_id: set(names) for hint_id, names in game.get("executed_hints", {}).items()}
+    game_master.player_first_interaction_done.update(game.get("first_interaction_done", {}))
+    game_master.player_observations = {char_id: [Event.model_validate(event) for event in events]
+                                       for char_id, events in game.get("observations", {}).items()}
+    game_master._play_stats = {name: {**stats, "actions": Counter(stats["actions"])}
+                               for name, stats in game.get("play_stats", {}).items()}
+    game_master._recent_example_actions = game.get("recent_example_actions", [])
+
+    for player in game_master.players:
+        state = checkpoint.players.get(player.name)
+        if state is None:
+            continue
+        messages = messages_from_dict(state["messages"])
+        player.conversation_history[:] = messages  # chat_history is the same list
+        player.prompt_prefix = [m for m, flags in zip(messages, state["flags"]) if "p" in flags]
+        recent = [m for m, flags in zip(messages, state["flags"]) if "r" in flags]
+        player.recent_messages = recent[len(recent) - state["recent"]:] if state["recent"] else []
+        player.conversation_summary = state["summary"]
+        player.token_usage.update(state["token_usage"])
+        player.continue_chat_log()
+
+    if checkpoint.rng_state is not None:
+        game_master.rng.setstate(checkpoint.rng_state)
+    game_master.resume_point = (checkpoint.round, set(checkpoint.done))
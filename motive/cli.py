@@ -9,11 +9,11 @@ import logging
 import os
 import sys
 import uuid
-import yaml
 import subprocess
 import threading
 import time
 import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
@@ -24,6 +24,12 @@ from dotenv import load_dotenv
 from motive.game_master import GameMaster
 # v1 config imports removed - v1 is DEAD
 from motive.sim_v2.config_loader import V2ConfigLoader
+from motive import progress_channel
+from motive.progress_channel import ProgressBoard, ProgressPublisher, ProgressReader
+from motive import worker_pool
+from motive.worker_pool import GameSpec, WorkerPool
+from motive.checkpoint import CheckpointError, checkpoint_dir, load_checkpoint, restore
+from motive.rng import DETERMINISTIC_SEED, PLAYERS, GameRandom, new_seed
 
 
 class GameStatus(Enum):
@@ -50,6 +56,16 @@ class GameProgress:
     last_output_time: Optional[datetime] = None  # Track when we last received output
     completed_turns: int = 0  # Track completed turns for progress calculation
     current_turn_in_round: int = 0  # Track current turn within the current round
+    tokens: int = 0  # Input + output tokens so far (progress board only)
+    errors: int = 0
+
+
+# ParallelGameRunner options that build_game_master takes, for pool workers
+POOL_GAME_ARGS = (
+    'rounds', 'ap', 'players', 'manual', 'hint', 'hint_character', 'character', 'characters', 'motives',
+    'character_motives', 'starting_rooms', 'player_models', 'stream', 'stream_max_actions', 'deterministic',
+    'log_dir', 'no_file_logging',
+)
 
 
 class ParallelGameRunner:
@@ -58,11 +74,23 @@ class ParallelGameRunner:
     def __init__(self, num_games: int, config_path: str, **game_args):
         self.num_games = num_games
         self.config_path = config_path
+        # With pool_workers, games run on that many long-lived workers instead of one process each
+        self.pool_workers: Optional[int] = game_args.pop('pool_workers', None)
+        self.max_attempts: int = game_args.pop('max_attempts', None) or 3
+        self.pool: Optional[WorkerPool] = None
         self.game_args = game_args
         self.games: Dict[str, GameProgress] = {}
         self.processes: Dict[str, subprocess.Popen] = {}
         self.monitor_threads: Dict[str, threading.Thread] = {}
         self.running = True
+        # Set up by run(): workers publish progress to shared-memory slots instead of stdout
+        self.progress_board: Optional[ProgressBoard] = None
+        self.progress_reader: Optional[ProgressReader] = None
+        self.game_slots: Dict[str, int] = {}
+        self._stderr_files: Dict[str, Any] = {}
+        self._frame: List[str] = []  # Status lines last drawn, for incremental redraws
+        self.max_fps = 4  # Upper bound on status redraws per second
+        self.hang_timeout_seconds = 120
         
         # Load config for progress tracking
         try:
@@ -91,12 +119,66 @@ class ParallelGameRunner:
                 status=GameStatus.STARTING,
                 start_time=datetime.now()
             )
+            if self.progress_board is not None:
+                self.game_slots[game_id] = i
+            if self.pool_workers:
+                self.games[game_id].start_time = None  # Set when a worker picks the game up
+                continue
             
             # Start the game process
             self._start_single_game(game_id)
             
+        if self.pool_workers:
+            self._start_pool(list(self.games))
+            print(f"✅ Queued {self.num_games} games on {self.pool.workers} workers")
+            return
         print(f"✅ Started {self.num_games} games")
     
+    def _start_pool(self, game_ids: List[str]):
+        """Start the worker pool and queue every game on it."""
+        game_kwargs = {name: value for name, value in self.game_args.items()
+                       if name in POOL_GAME_ARGS and value is not None}
+        game_kwargs['validate'] = not self.game_args.get('no_validate')
+        self.pool = WorkerPool(
+            self.config_path, game_kwargs, workers=min(self.pool_workers, len(game_ids)),
+            board_name=self.progress_board.name if self.progress_board is not None else None,
+            max_attempts=self.max_attempts,
+        )
+        for slot, game_id in enumerate(game_ids):
+            self.pool.submit(GameSpec(game_id, slot, seed=self._game_seed(game_id)))
+        self.pool.start()
+    
+    def _game_seed(self, game_id: str) -> Optional[int]:
+        """With --seed S, game i of the run plays with seed S + i."""
+        seed = self.game_args.get('seed')
+        return None if seed is None else seed + list(self.games).index(game_id)
+    
+    def _poll_pool(self) -> bool:
+        """Apply worker pool events to the games; True if any arrived."""
+        if self.pool is None:
+            return False
+        events = self.pool.poll()
+        for event in events:
+            game_id = event.spec.game_id
+            game = self.games[game_id]
+            if event.kind == worker_pool.STARTED:
+                game.status = GameStatus.RUNNING
+                game.start_time = datetime.now()
+            elif event.ok:
+                game.status = GameStatus.COMPLETED
+                game.end_time = game.end_time or datetime.now()
+            elif event.final:
+                game.status = GameStatus.FAILED
+                game.error_message = f"Attempt {event.spec.attempt} failed: {event.error}"
+                game.end_time = datetime.now()
+            else:
+                # Requeued: start the display over, keeping the error until the retry starts
+                self.games[game_id] = GameProgress(
+                    game_id=game_id, status=GameStatus.STARTING, errors=game.errors + 1,
+                    error_message=f"Attempt {event.spec.attempt} failed, retrying: {event.error}",
+                )
+        return bool(events)
+    
     def _start_single_game(self, game_id: str):
         """Start a single game process."""
         # Use absolute path for config to ensure worker processes can find it
@@ -127,8 +209,14 @@ class ParallelGameRunner:
             cmd.extend(["--character-motives"] + self.game_args['character_motives'])
         if self.game_args.get('starting_rooms'):
             cmd.extend(["--starting-rooms"] + self.game_args['starting_rooms'])
+        if self.game_args.get('player_models'):
+            cmd.extend(["--player-models"] + self.game_args['player_models'])
         if self.game_args.get('deterministic'):
             cmd.append("--deterministic")
+        if self.game_args.get('stream'):
+            cmd.append("--stream")
+        if self.game_args.get('stream_max_actions'):
+            cmd.extend(["--stream-max-actions", str(self.game_args['stream_max_actions'])])
         if self.game_args.get('manual'):
             cmd.extend(["--manual", self.game_args['manual']])
         if self.game_args.get('no_validate'):
@@ -137,12 +225,30 @@ class ParallelGameRunner:
             cmd.extend(["--log-dir", self.game_args['log_dir']])
         if self.game_args.get('no_file_logging'):
             cmd.append("--no-file-logging")
+        seed = self._game_seed(game_id)
+        if seed is not None:
+            cmd.extend(["--seed", str(seed)])
+        slot = self.game_slots.get(game_id) if self.progress_board is not None else None
+        if slot is not None:
+            cmd.extend(["--progress-board", f"{self.progress_board.name}:{slot}"])
             
         try:
             # Set environment variables for unbuffered output
             env = os.environ.copy()
             env['PYTHONUNBUFFERED'] = '1'
-            
+
+            if slot is not None:
+                # Progress comes through shared memory: drop the narrative (it is in game.log)
+                # and keep stderr in a file, so no reader threads are needed
+                stderr_file = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+                self._stderr_files[game_id] = stderr_file
+                process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr_file, text=True, env=env)
+                self.processes[game_id] = process
+                monitor_thread = threading.Thread(target=self._wait_for_game, args=(game_id, process), daemon=True)
+                monitor_thread.start()
+                self.monitor_threads[game_id] = monitor_thread
+                return
+
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
@@ -256,6 +362,82 @@ class ParallelGameRunner:
                         game.error_message = f"Process exited with code {process.returncode}"
             game.end_time = datetime.now()
     
+    def _wait_for_game(self, game_id: str, process: subprocess.Popen):
+        """Wait for a worker that reports through the progress board and record how it ended."""
+        game = self.games[game_id]
+        process.wait()
+        if process.returncode != 0:
+            stderr_lines = self._stderr_tail(game_id)
+            game.status = GameStatus.FAILED
+            game.error_message = f"Process exited with code {process.returncode}"
+            if stderr_lines:
+                game.error_message += f": {stderr_lines[-1]}"
+        elif game.status != GameStatus.FAILED:
+            game.status = GameStatus.COMPLETED
+        game.end_time = game.end_time or datetime.now()
+
+    def _stderr_tail(self, game_id: str, lines: int = 20) -> List[str]:
+        stderr_file = self._stderr_files.get(game_id)
+        if stderr_file is None:
+            return []
+        try:
+            stderr_file.seek(0)
+            return [line.strip() for line in stderr_file.read().splitlines()[-lines:] if line.strip()]
+        except (OSError, ValueError):
+            return []
+
+    def _sync_progress(self) -> bool:
+        """Apply the progress records that changed since the last poll; True if any did."""
+        if self.progress_reader is None:
+            return False
+        changes = self.progress_reader.changed()
+        slots = {slot: game_id for game_id, slot in self.game_slots.items()}
+        for slot, record in changes.items():
+            game_id = slots.get(slot)
+            if game_id is not None:
+                self._apply_progress_record(self.games[game_id], record)
+        if self.pool is not None:
+            return bool(changes)  # The pool detects dead workers itself; slow games are left alone
+
+        now = time.time()
+        for game_id, slot in self.game_slots.items():
+            game = self.games[game_id]
+            if game.status in (GameStatus.COMPLETED, GameStatus.FAILED):
+                continue
+            last_update = game.last_output_time.timestamp() if game.last_output_time else None
+            if last_update is None and game.start_time and now - game.start_time.timestamp() > 60:
+                game.status = GameStatus.FAILED
+                game.error_message = "Worker process failed to start within 60s"
+            elif last_update is not None and now - last_update > self.hang_timeout_seconds:
+                game.status = GameStatus.FAILED
+                game.error_message = f"Worker process hung - no progress for {self.hang_timeout_seconds}s"
+        return bool(changes)
+
+    @staticmethod
+    def _apply_progress_record(game: GameProgress, record: progress_channel.ProgressRecord):
+        game.current_round = record.round
+        game.total_rounds = record.total_rounds
+        game.current_turn_in_round = record.turn
+        game.total_players = record.total_players
+        game.completed_turns = record.completed_turns
+        game.tokens = record.input_tokens + record.output_tokens
+        game.errors = record.errors
+        if record.log_file:
+            game.log_file = record.log_file
+        if record.updated_at:
+            game.last_output_time = datetime.fromtimestamp(record.updated_at)
+        # Statuses only move forward; the process watcher may already have seen the exit
+        if game.status in (GameStatus.COMPLETED, GameStatus.FAILED):
+            return
+        if record.status == progress_channel.RUNNING:
+            game.status = GameStatus.RUNNING
+        elif record.status == progress_channel.COMPLETED:
+            game.status = GameStatus.COMPLETED
+            game.end_time = datetime.now()
+        elif record.status == progress_channel.FAILED:
+            game.status = GameStatus.FAILED
+            game.error_message = game.error_message or "Worker reported an error"
+
     def _parse_game_output(self, game_id: str, line: str):
         """Parse game output to extract progress information."""
         game = self.games[game_id]
@@ -362,41 +544,60 @@ class ParallelGameRunner:
             game.error_message = line.strip()
     
     def display_status(self, fancy_mode=False):
-        """Display current status of all games."""
+        """
+        Display current status of all games.
+
+        In fancy mode only the lines that changed since the last frame are
+        rewritten in place; the screen is cleared only when the layout changes.
+        """
         if not self.running:
             return
-            
-        # Clear screen and move cursor to top (only in fancy mode)
+        lines = self._status_lines()
+
         if fancy_mode and os.environ.get("MOTIVE_NO_CLEAR") != "1":
-            print("\033[2J\033[H", end="")
-        
-        print("🎮 Motive Parallel Games Monitor")
-        print("=" * 50)
-        print(f"📊 Running {self.num_games} games")
-        
+            if len(lines) != len(self._frame):
+                # Clear screen and move cursor to top
+                print("\033[2J\033[H" + "\n".join(lines), flush=True)
+            else:
+                updates = "".join(f"\033[{row};1H\033[2K{line}"
+                                  for row, (line, old) in enumerate(zip(lines, self._frame), 1) if line != old)
+                if updates:
+                    print(f"{updates}\033[{len(lines) + 1};1H", end="", flush=True)
+        elif lines != self._frame:
+            print("\n".join(lines))
+        self._frame = lines
+
+    def _status_lines(self) -> List[str]:
+        lines = [
+            "🎮 Motive Parallel Games Monitor",
+            "=" * 50,
+            f"📊 Running {self.num_games} games",
+        ]
+        if self.pool is not None:
+            lines[-1] += f" on {len(self.pool.processes)} workers (in flight: {len(self.pool.in_flight)}/{self.pool.controller.limit})"
+
         # Show log files section
         log_files = [game for game in self.games.values() if game.log_file]
         if log_files:
-            print()
-            print("📄 Log Files:")
+            lines += ["", "📄 Log Files:"]
             for i, (game_id, game) in enumerate(self.games.items(), 1):
                 if game.log_file:
                     rel_log_path = os.path.relpath(game.log_file)
                     # Just show the clean path - most terminals don't handle file links well
-                    print(f"Game {i:2d}: {rel_log_path}")
-        
-        print()
-        print("📊 Progress:")
-        
-        # Display each game's progress
+                    lines.append(f"Game {i:2d}: {rel_log_path}")
+
+        lines += ["", "📊 Progress:"]
         for i, (game_id, game) in enumerate(self.games.items(), 1):
-            self._display_game_progress(i, game)
-        
-        print()
-        print("Press Ctrl+C to stop monitoring (games will continue running)")
+            lines.append(self._game_progress_line(i, game))
+        lines += ["", "Press Ctrl+C to stop monitoring (games will continue running)"]
+        return lines
     
     def _display_game_progress(self, game_num: int, game: GameProgress):
         """Display progress for a single game."""
+        print(self._game_progress_line(game_num, game))
+
+    def _game_progress_line(self, game_num: int, game: GameProgress) -> str:
+        """One status line for a game."""
         # Status indicator
         status_icons = {
             GameStatus.STARTING: "🔄",
@@ -462,29 +663,48 @@ class ParallelGameRunner:
         
         # Error message
         error_info = f" | Error: {game.error_message}" if game.error_message else ""
+        tokens_info = f" | {game.tokens:,} tok" if game.tokens else ""
         
         # Combine all info with two progress bars
-        main_info = f"Game {game_num:2d}: {icon} {game_progress_info} | {round_info} | {duration_str}"
-        print(f"{main_info}{error_info}")
+        main_info = f"Game {game_num:2d}: {icon} {game_progress_info} | {round_info} | {duration_str}{tokens_info}"
+        return f"{main_info}{error_info}"
     
     def run(self, fancy_mode=False):
         """Run all games and monitor their progress."""
+        try:
+            self.progress_board = ProgressBoard.create(self.num_games)
+            self.progress_reader = ProgressReader(self.progress_board)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Shared-memory progress unavailable ({e}); parsing worker output instead")
         self.start_games()
         
         try:
+            frame_interval = 1.0 / self.max_fps
+            last_frame = 0.0
             while self.running:
-                self.display_status(fancy_mode)
-                time.sleep(1)  # Update every second
+                changed = self._poll_pool()
+                changed = self._sync_progress() or changed
+                # Redraw on progress (at most max_fps times a second) and every second for durations
+                now = time.monotonic()
+                if now - last_frame >= 1.0 or (changed and now - last_frame >= frame_interval):
+                    self.display_status(fancy_mode)
+                    last_frame = now
                 
                 # Check if all games are done
-                if all(game.status in [GameStatus.COMPLETED, GameStatus.FAILED] for game in self.games.values()):
+                if self.pool is not None:
+                    if self.pool.done:
+                        break
+                elif all(game.status in [GameStatus.COMPLETED, GameStatus.FAILED] for game in self.games.values()):
                     break
+                time.sleep(frame_interval)
                     
         except KeyboardInterrupt:
             print("\n🛑 Stopping monitor (games continue running)...")
             self.running = False
         
         # Final status
+        self._poll_pool()
+        self._sync_progress()
         self.display_status(fancy_mode)
         
         # Summary
@@ -501,6 +721,12 @@ class ParallelGameRunner:
                     process.wait(timeout=5)
                 except subprocess.TimeoutExpired:
                     process.kill()
+        if self.pool is not None:
+            self.pool.shutdown()
+        for stderr_file in self._stderr_files.values():
+            stderr_file.close()
+        if self.progress_board is not None:
+            self.progress_board.close()
 
 
 def setup_logging():
@@ -514,65 +740,37 @@ def setup_logging():
 # All v1 conversion functions removed - v1 is DEAD
 
 
-def _is_hierarchical_v2_config(config_data: Dict[str, Any], base_path: str) -> bool:
-    """Check if a hierarchical config is v2 by examining included files."""
-    includes = config_data.get('includes', [])
-    for include_path in includes:
-        full_path = Path(base_path) / include_path
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                included_data = yaml.safe_load(f)
-            if 'entity_definitions' in included_data or 'action_definitions' in included_data:
-                return True
-            # Recursively check nested includes
-            if 'includes' in included_data:
-                if _is_hierarchical_v2_config(included_data, str(full_path.parent)):
-                    return True
-        except (FileNotFoundError, yaml.YAMLError):
-            continue
-    return False
-
-
 def load_config(config_path: str, validate: bool = True):
     """Load game configuration from file with optional validation.
     Returns a V2GameConfig object - v1 is DEAD.
+    
+    The include tree is parsed once; v2 detection and merging share that parse.
     """
     try:
-        # Check if it's a v2 config or hierarchical config
-        with open(config_path, 'r', encoding='utf-8') as f:
-            raw_config = yaml.safe_load(f)
-        
-        if 'includes' in raw_config:
-            # Check if this is a hierarchical v2 config by looking at included files
-            base_path = str(Path(config_path).parent)
-            is_v2_hierarchical = _is_hierarchical_v2_config(raw_config, base_path)
-            
-            if is_v2_hierarchical:
-                # This is a hierarchical v2 config - use v2 pre-processor + Pydantic validation
-                from motive.sim_v2.v2_config_preprocessor import load_and_validate_v2_config
-                config_file = Path(config_path).name
-                v2_config = load_and_validate_v2_config(config_file, base_path, validate=validate)
-                print(f"DEBUG: v2_config type: {type(v2_config)}")
-                # Return v2 config directly - GameMaster will be updated to work with v2
-                return v2_config
-            else:
-                # This is a v1 hierarchical config - v1 is DEAD!
+        if not Path(config_path).is_file():
+            raise FileNotFoundError(config_path)
+        
+        from motive.sim_v2.v2_config_preprocessor import V2ConfigPreprocessor
+        base_path = str(Path(config_path).parent)
+        result = V2ConfigPreprocessor(base_path).load_config_with_metadata(Path(config_path).name)
+        
+        if not result.is_v2:
+            # v1 is DEAD!
+            if result.has_includes:
                 print("ERROR: Found v1 hierarchical config - v1 is DEAD! Please use v2 configs only.", file=sys.stderr)
-                raise ValueError("v1 configs are no longer supported. Please use v2 configs.")
-        elif 'entity_definitions' in raw_config or 'action_definitions' in raw_config:
-            # This is a standalone v2 config - use v2 pre-processor + Pydantic validation
-            from motive.sim_v2.v2_config_preprocessor import load_and_validate_v2_config
-            base_path = str(Path(config_path).parent)
-            config_file = Path(config_path).name
-            v2_config = load_and_validate_v2_config(config_file, base_path, validate=validate)
-            print(f"DEBUG: v2_config type: {type(v2_config)}")
-            # Return v2 config directly - GameMaster will be updated to work with v2
-            return v2_config
-        else:
-            # This is a v1 config - v1 is DEAD!
-            print("ERROR: Found v1 config - v1 is DEAD! Please use v2 configs only.", file=sys.stderr)
+            else:
+                print("ERROR: Found v1 config - v1 is DEAD! Please use v2 configs only.", file=sys.stderr)
             raise ValueError("v1 configs are no longer supported. Please use v2 configs.")
         
+        if not validate:
+            return result.config
+        
+        from motive.sim_v2.v2_config_validator import validate_v2_config
+        v2_config = validate_v2_config(result.config)
+        print(f"DEBUG: v2_config type: {type(v2_config)}")
+        # Return v2 config directly - GameMaster will be updated to work with v2
+        return v2_config
+        
     except FileNotFoundError:
         print(f"Error: Configuration file '{config_path}' not found.", file=sys.stderr)
         raise FileNotFoundError(f"Configuration file '{config_path}' not found.")
@@ -587,21 +785,27 @@ def load_config(config_path: str, validate: bool = True):
         raise e
 
 
-async def run_game(config_path: str, game_id: str = None, validate: bool = True,
-                   rounds: int = None, ap: int = None, manual: str = None, hint: str = None,
-                   hint_character: str = None, deterministic: bool = False, players: int = None,
-                   character: str = None, motive: str = None, characters: List[str] = None, 
-                   motives: List[str] = None, character_motives: List[str] = None,
-                   starting_rooms: List[str] = None, worker: bool = False, log_dir: str = "logs", no_file_logging: bool = False):
-    """Run a Motive game with the specified configuration."""
+def build_game_master(config_path: str, game_id: str = None, validate: bool = True,
+                      rounds: int = None, ap: int = None, manual: str = None, hint: str = None,
+                      hint_character: str = None, deterministic: bool = False, players: int = None,
+                      character: str = None, motive: str = None, characters: List[str] = None, 
+                      motives: List[str] = None, character_motives: List[str] = None,
+                      starting_rooms: List[str] = None, log_dir: str = "logs", no_file_logging: bool = False,
+                      player_models: List[str] = None, stream: bool = False, stream_max_actions: int = None,
+                      llm_client_factory=None, seed: int = None) -> Optional[GameMaster]:
+    """Load a config, apply command line overrides and create its GameMaster.
+
+    Returns None if the config could not be loaded (after reporting and sys.exit).
+    """
     # Load environment variables
     load_dotenv()
     
-    # Setup deterministic mode if requested
+    # Every random choice of the game comes from streams of this seed
+    if seed is None:
+        seed = DETERMINISTIC_SEED if deterministic else new_seed()
     if deterministic:
-        import random
-        random.seed(42)  # Fixed seed for reproducibility
-        print("Running in deterministic mode with fixed random seed (42)")
+        print(f"Running in deterministic mode with fixed random seed ({seed})")
+    rng = GameRandom(seed)
     
     # Setup logging
     setup_logging()
@@ -644,6 +848,12 @@ async def run_game(config_path: str, game_id: str = None, validate: bool = True,
         print(f"Overriding action points: {game_config.game_settings.initial_ap_per_turn} -> {ap}")
         game_config.game_settings.initial_ap_per_turn = ap
     
+    if stream or stream_max_actions:
+        print("Streaming player responses" + (f" (at most {stream_max_actions} action lines)" if stream_max_actions else ""))
+        game_config.game_settings.stream_responses = True
+        if stream_max_actions:
+            game_config.game_settings.stream_max_action_lines = stream_max_actions
+    
     if manual is not None:
         # v2 config - modify the Pydantic object
         if not hasattr(game_config, 'game_settings') or game_config.game_settings is None:
@@ -714,14 +924,27 @@ async def run_game(config_path: str, game_id: str = None, validate: bool = True,
                 if deterministic:
                     source_player = original_players[i % len(original_players)]
                 else:
-                    import random
-                    source_player = random.choice(original_players)
+                    source_player = rng.stream(PLAYERS).choice(original_players)
                 
                 # Create a new player with sequential numbering (Player_3, Player_4, etc.)
                 new_player = source_player.copy()
                 new_player.name = f"Player_{original_player_count + i + 1}"
                 game_config.players.append(new_player)
     
+    # Replace the configured players with one per provider/model entry
+    if player_models:
+        from motive.sim_v2.v2_config_validator import PlayerConfigV2
+        new_players = []
+        for i, spec in enumerate(player_models):
+            provider, sep, model = spec.partition('/')
+            if not sep or not provider or not model:
+                print(f"Error: --player-models entry '{spec}' must be provider/model", file=sys.stderr)
+                sys.exit(1)
+                return  # Ensure function exits even when sys.exit is mocked
+            new_players.append(PlayerConfigV2(name=f"Player_{i + 1}", provider=provider, model=model))
+        print(f"Overriding players: {', '.join(player_models)}")
+        game_config.players = new_players
+    
     # Character/motive assignment is handled by GameInitializer, not in config
     # The overrides are passed to GameMaster which passes them to GameInitializer
     
@@ -729,7 +952,69 @@ async def run_game(config_path: str, game_id: str = None, validate: bool = True,
     print(f"Initializing game with ID: {game_id}")
     
     # Create GameMaster with v2 config
-    game_master = GameMaster(game_config, game_id=game_id, deterministic=deterministic, log_dir=log_dir, no_file_logging=no_file_logging, character=character, motive=motive, characters=characters, motives=motives, character_motives=character_motives, starting_rooms=starting_rooms)
+    return GameMaster(game_config, game_id=game_id, deterministic=deterministic, log_dir=log_dir, no_file_logging=no_file_logging, character=character, motive=motive, characters=characters, motives=motives, character_motives=character_motives, starting_rooms=starting_rooms, llm_client_factory=llm_client_factory, seed=seed)
+
+
+async def run_game(config_path: str, game_id: str = None, validate: bool = True,
+                   rounds: int = None, ap: int = None, manual: str = None, hint: str = None,
+                   hint_character: str = None, deterministic: bool = False, players: int = None,
+                   character: str = None, motive: str = None, characters: List[str] = None, 
+                   motives: List[str] = None, character_motives: List[str] = None,
+                   starting_rooms: List[str] = None, worker: bool = False, log_dir: str = "logs", no_file_logging: bool = False,
+                   player_models: List[str] = None, stream: bool = False, stream_max_actions: int = None,
+                   progress_board: str = None, checkpoints: bool = True, seed: int = None):
+    """Run a Motive game with the specified configuration."""
+    options = dict(
+        validate=validate, rounds=rounds, ap=ap, manual=manual, hint=hint,
+        hint_character=hint_character, deterministic=deterministic, players=players, character=character,
+        motive=motive, characters=characters, motives=motives, character_motives=character_motives,
+        starting_rooms=starting_rooms, log_dir=log_dir, no_file_logging=no_file_logging,
+        player_models=player_models, stream=stream, stream_max_actions=stream_max_actions, seed=seed,
+    )
+    game_master = build_game_master(config_path, game_id=game_id, **options)
+    if game_master is None:
+        return  # Ensure function exits even when sys.exit is mocked
+    if checkpoints and not no_file_logging:
+        # The seed a resumed game is rebuilt with, even when it was drawn rather than given
+        options["seed"] = game_master.seed
+        game_master.enable_checkpoints({"config_path": os.path.abspath(config_path), "options": options,
+                                         "worker": worker})
+    return await _play(game_master, worker, progress_board)
+
+
+async def resume_game(game_id: str, log_dir: str = "logs", worker: bool = False, progress_board: str = None):
+    """Continue a checkpointed game after its last completed turn."""
+    directory = checkpoint_dir(log_dir, game_id)
+    try:
+        checkpoint = load_checkpoint(directory)
+    except CheckpointError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+        return  # Ensure function exits even when sys.exit is mocked
+    if checkpoint.complete:
+        print(f"Game {game_id} already finished; nothing to resume.")
+        return
+    manifest = checkpoint.manifest
+    game_master = build_game_master(manifest["config_path"], game_id=game_id, **manifest["options"])
+    if game_master is None:
+        return  # Ensure function exits even when sys.exit is mocked
+    try:
+        if game_master._config_hash() != manifest["config_hash"]:
+            raise CheckpointError(f"The configuration in {manifest['config_path']} changed since the game started")
+        restore(game_master, checkpoint)
+    except CheckpointError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+        return
+    game_master.enable_checkpoints().prime(game_master, checkpoint.turns)
+    print(f"Resuming game {game_id} at round {checkpoint.round} after {checkpoint.turns} completed turns")
+    return await _play(game_master, worker, progress_board)
+
+
+async def _play(game_master: GameMaster, worker: bool, progress_board: Optional[str]):
+    publisher = ProgressPublisher.attach(progress_board) if progress_board else None
+    if publisher is not None:
+        game_master.progress_publisher = publisher
     
     # Run the game
     try:
@@ -746,6 +1031,11 @@ async def run_game(config_path: str, game_id: str = None, validate: bool = True,
         sys.exit(0)
     except Exception as e:
         print(f"Error running game: {e}", file=sys.stderr)
+        if getattr(game_master, 'checkpoints', None) is not None:
+            print(f"Progress up to the last completed turn is checkpointed; continue with: "
+                  f"motive --resume {game_master.game_id}", file=sys.stderr)
+        if publisher is not None:
+            publisher.update(status=progress_channel.FAILED, errors=publisher.record.errors + 1)
         sys.exit(1)
 
 
@@ -770,12 +1060,22 @@ def main():
     parser.add_argument("--motives", nargs="+", help="List of motives to assign to players (e.g., --motives avenge_partner seek_redemption seek_redemption)")
     parser.add_argument("--character-motives", nargs="+", dest="character_motives", help="Character-motive pairs (e.g., --character-motives detective_thorne:avenge_partner father_marcus:seek_redemption)")
     parser.add_argument("--starting-rooms", nargs="+", dest="starting_rooms", help="Character-starting room pairs (e.g., --starting-rooms detective_thorne:church father_marcus:town_square)")
+    parser.add_argument("--player-models", nargs="+", dest="player_models", metavar="PROVIDER/MODEL", help="Replace the configured players with one per model (e.g., --player-models openai/gpt-4o google/gemini-2.5-flash)")
     
     # Game behavior
     parser.add_argument("--deterministic", action="store_true", 
                        help="Run in deterministic mode with fixed random seed")
+    parser.add_argument("--seed", type=int,
+                       help="Seed for all random choices (character assignment, start rooms, motives); "
+                            "parallel and batch game i uses seed + i")
+    parser.add_argument("--stream", action="store_true",
+                       help="Stream player responses and stop generation once the turn's actions are in")
+    parser.add_argument("--stream-max-actions", type=int, metavar="N",
+                       help="Stop a streamed response after N action lines (implies --stream)")
     parser.add_argument("--worker", action="store_true", 
                        help="Run in worker mode (for parallel games)")
+    parser.add_argument("--progress-board", metavar="NAME:SLOT",
+                       help="Publish worker progress to this shared-memory slot (set by --parallel)")
     parser.add_argument("--no-validate", action="store_true", 
                        help="Skip configuration validation")
     
@@ -787,14 +1087,104 @@ def main():
     # Game ID
     parser.add_argument("--game-id", help="Custom game ID")
     
+    # Checkpoints
+    parser.add_argument("--resume", metavar="GAME_ID",
+                       help="Continue a crashed game from its last checkpoint (looked up under --log-dir)")
+    parser.add_argument("--no-checkpoints", action="store_true",
+                       help="Do not write per-turn checkpoints")
+    
     # Parallel games
     parser.add_argument("--parallel", type=int, metavar="N", 
                        help="Run N parallel games")
     parser.add_argument("--fancy", action="store_true", 
                        help="Use fancy progress display for parallel games")
+    parser.add_argument("--pool-workers", type=int, metavar="K",
+                       help="Run the --parallel games on K long-lived workers, adapting concurrency to rate limits")
+    parser.add_argument("--max-attempts", type=int, default=3, metavar="N",
+                       help="With --pool-workers, run a failed game up to N times (default: 3)")
+    
+    # Tournaments
+    parser.add_argument("--tournament", nargs="+", metavar="PROVIDER/MODEL[@IN,OUT]",
+                       help="Rank models with adaptively scheduled games; optional prices are USD per million input/output tokens")
+    parser.add_argument("--budget-games", type=int, default=50,
+                       help="Maximum tournament games (default: 50)")
+    parser.add_argument("--budget-tokens", type=int, help="Stop the tournament after this many tokens")
+    parser.add_argument("--budget-dollars", type=float, help="Stop the tournament after spending this many dollars")
+    parser.add_argument("--confidence-z", type=float, default=1.96,
+                       help="Stop once neighbouring ratings differ by this many combined deviations (default: 1.96)")
+    
+    # Batch mode
+    parser.add_argument("--batch", type=int, metavar="N",
+                       help="Run N games in lockstep, submitting LLM requests as batch jobs")
+    parser.add_argument("--batch-dir", default="logs/batches",
+                       help="Directory for batch job input/output files (default: logs/batches)")
+    parser.add_argument("--batch-max-wait", type=float, default=30.0,
+                       help="Seconds to wait for all games before submitting a partial batch (default: 30)")
     
     args = parser.parse_args()
     
+    # Handle tournaments
+    if args.tournament:
+        from motive.tournament import Budget, run_tournament
+        worker_args = []
+        if args.rounds:
+            worker_args += ["--rounds", str(args.rounds)]
+        if args.ap:
+            worker_args += ["--ap", str(args.ap)]
+        if args.no_validate:
+            worker_args.append("--no-validate")
+        if args.deterministic:
+            worker_args.append("--deterministic")
+        try:
+            run_tournament(
+                config_path=args.config,
+                entry_specs=args.tournament,
+                budget=Budget(max_games=args.budget_games, max_tokens=args.budget_tokens,
+                              max_dollars=args.budget_dollars),
+                concurrency=args.parallel or 2,
+                players=args.players,
+                z=args.confidence_z,
+                log_dir=args.log_dir,
+                worker_args=worker_args,
+                tournament_id=args.game_id,
+            )
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    # Handle batch mode
+    if args.batch:
+        from motive.batch_mode import run_batch_games
+        run_batch_games(
+            num_games=args.batch,
+            batch_dir=args.batch_dir,
+            max_wait=args.batch_max_wait,
+            base_game_id=args.game_id,
+            config_path=args.config,
+            validate=not args.no_validate,
+            rounds=args.rounds,
+            ap=args.ap,
+            manual=args.manual,
+            hint=args.hint,
+            hint_character=args.hint_character,
+            deterministic=args.deterministic,
+            players=args.players,
+            character=args.character,
+            motive=args.motive,
+            characters=args.characters,
+            motives=args.motives,
+            character_motives=args.character_motives,
+            starting_rooms=args.starting_rooms,
+            log_dir=args.log_dir,
+            no_file_logging=args.no_file_logging,
+            player_models=args.player_models,
+            stream=args.stream,
+            stream_max_actions=args.stream_max_actions,
+            seed=args.seed,
+        )
+        return
+    
     # Handle parallel games
     if args.parallel:
         runner = ParallelGameRunner(
@@ -811,15 +1201,26 @@ def main():
             motives=args.motives,
             character_motives=args.character_motives,
             starting_rooms=args.starting_rooms,
+            player_models=args.player_models,
+            stream=args.stream,
+            stream_max_actions=args.stream_max_actions,
             deterministic=args.deterministic,
             no_validate=args.no_validate,
             log_dir=args.log_dir,
             no_file_logging=args.no_file_logging,
-            game_id=args.game_id
+            game_id=args.game_id,
+            seed=args.seed,
+            pool_workers=args.pool_workers,
+            max_attempts=args.max_attempts,
         )
         runner.run(fancy_mode=args.fancy)
         return
     
+    if args.resume:
+        asyncio.run(resume_game(args.resume, log_dir=args.log_dir, worker=args.worker,
+                                progress_board=args.progress_board))
+        return
+    
         # Run single game
     asyncio.run(run_game(
         config_path=args.config,
@@ -840,7 +1241,13 @@ def main():
         starting_rooms=args.starting_rooms,
         worker=args.worker,
         log_dir=args.log_dir,
-        no_file_logging=args.no_file_logging
+        no_file_logging=args.no_file_logging,
+        player_models=args.player_models,
+        stream=args.stream,
+        stream_max_actions=args.stream_max_actions,
+        progress_board=args.progress_board,
+        checkpoints=not args.no_checkpoints,
+        seed=args.seed
     ))
 
 
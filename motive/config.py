@@ -282,6 +282,9 @@ class GameSettings(BaseModel):
     manual: str = Field("MANUAL.md", description="Path to the game manual markdown file.")
     initial_ap_per_turn: int = Field(20, description="Initial action points per player per turn. Defaults to 20 for testing.")
     hints: Optional[List[Dict[str, Any]]] = Field(None, description="Optional hints to guide LLM players toward specific actions for validation.")
+    stream_responses: bool = Field(False, description="Stream player responses and stop generation once the turn's actions are in.")
+    stream_max_action_lines: Optional[int] = Field(None, ge=1, description="Stop a streamed response after this many action lines.")
+    log_compression: Optional[Literal["gzip", "zstd"]] = Field(None, description="Write game and chat logs compressed (zstd needs the zstandard package).")
     
     # Legacy fields for backward compatibility (deprecated)
     core_config_path: Optional[str] = Field(None, description="DEPRECATED: Use includes instead.")
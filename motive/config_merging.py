@@ -4,32 +4,66 @@ Unified configuration merging system.
 This module provides version-agnostic YAML configuration merging capabilities,
 supporting flexible merge strategies for lists and dictionaries. It operates
 at the raw YAML level, independent of config versions (v1, v2, v3, etc.).
+
+Merges share structure: unchanged subtrees of the inputs are referenced by
+the result rather than copied, and a MergeSession folding many configs
+together copies each shared dict or list at most once, on its first write.
 """
 
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
 from .list_merge_strategies import ListMerger, ListMergeStrategy
 
 
-class ConfigMerger:
-    """Unified configuration merger for all config versions."""
+# Key path (e.g. ('entity_definitions', 'torch', 'properties')) -> source label
+Provenance = Dict[Tuple[str, ...], str]
+
+
+class MergeSession:
+    """Folds a sequence of configs into one result, copy-on-write.
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.list_merger = ListMerger()
+    Dicts and lists from the inputs are shared with the result until a later
+    merge writes into them; the first write copies that one container and the
+    session owns the copy from then on, so each merge costs roughly the size of
+    the override rather than the size of everything merged so far. Inputs are
+    never mutated.
     
-    def merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Merge two configuration dictionaries with support for flexible merge strategies.
-        
-        Args:
-            base: Base configuration (will be overridden)
-            override: Override configuration (takes precedence)
-            
-        Returns:
-            Merged configuration dictionary
-        """
-        result = base.copy()
+    With track_provenance, ``provenance`` maps each key path written by a merge
+    to the ``source`` label that wrote it last. Merged dicts are recorded at the
+    keys written inside them; a value attached wholesale is recorded once, at
+    the key it was attached to.
+    """
+    
+    def __init__(self, base: Dict[str, Any], merger: Optional['ConfigMerger'] = None,
+                 track_provenance: bool = False):
+        self.merger = merger or ConfigMerger()
+        # id -> container; holding the object keeps its id from being reused
+        self._owned: Dict[int, Any] = {}
+        self.result: Dict[str, Any] = self._own(base.copy())
+        self.provenance: Optional[Provenance] = {} if track_provenance else None
+    
+    def merge(self, override: Dict[str, Any], source: Optional[str] = None) -> Dict[str, Any]:
+        """Merge ``override`` on top of the result so far and return the result."""
+        self._merge_into(self.result, override, (), source)
+        return self.result
+    
+    def _own(self, container: Any) -> Any:
+        self._owned[id(container)] = container
+        return container
+    
+    def _is_owned(self, container: Any) -> bool:
+        return self._owned.get(id(container)) is container
+    
+    def _writable(self, parent: Dict[str, Any], key: str) -> Any:
+        """Return parent[key], copying it first if it is still shared."""
+        child = parent[key]
+        if not self._is_owned(child):
+            child = parent[key] = self._own(child.copy())
+        return child
+    
+    def _merge_into(self, result: Dict[str, Any], override: Dict[str, Any],
+                    path: Tuple[str, ...], source: Optional[str]) -> None:
+        merger = self.merger
         
         # Remove includes from result if present
         if 'includes' in result:
@@ -39,39 +73,65 @@ class ConfigMerger:
             if key == 'includes':
                 # Skip includes in merged configs
                 continue
-            elif key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            current = result.get(key)
+            if key in result and isinstance(current, dict) and isinstance(value, dict):
                 # Recursively merge dictionaries
-                result[key] = self.merge_configs(result[key], value)
+                self._merge_into(self._writable(result, key), value, path + (key,), source)
+                continue
             elif isinstance(value, list):
                 # Check for merge strategy markers first
-                if self._is_merge_strategy_list(value):
+                if merger._is_merge_strategy_list(value):
                     # Handle merge strategy - create empty base list if key doesn't exist
                     base_list = result.get(key, [])
-                    result[key] = self._apply_merge_strategy_list(base_list, value)
-                elif key in result and isinstance(result[key], list):
+                    result[key] = self._own(merger._apply_merge_strategy_list(base_list, value))
+                elif key in result and isinstance(current, list):
                     # Handle patch-based list operations
-                    if self._is_patch_list(value):
-                        result[key] = self._apply_patch_list(result[key], value)
-                    else:
+                    if merger._is_patch_list(value):
+                        result[key] = self._own(merger._apply_patch_list(current, value))
+                    elif self._is_owned(current):
                         # Simple append strategy - most intuitive for users
-                        result[key] = result[key] + value
+                        current.extend(value)
+                    else:
+                        result[key] = self._own(current + value)
                 else:
                     # New list - just assign it
                     result[key] = value
-            elif key in result and isinstance(result[key], dict) and isinstance(value, list):
+            elif key in result and isinstance(current, dict) and isinstance(value, list):
                 # Handle case where base is dict but override is list (advanced merging)
-                result[key] = self._apply_patch_list(list(result[key].values()), value)
-            elif self._is_patch_reference(value):
+                result[key] = self._own(merger._apply_patch_list(list(current.values()), value))
+            elif merger._is_patch_reference(value):
                 # Handle patch-based references
-                result[key] = self._apply_patch_reference(result.get(key, {}), value)
-            elif self._is_patch_list(value):
+                result[key] = merger._apply_patch_reference(result.get(key, {}), value)
+            elif merger._is_patch_list(value):
                 # Handle patch-based list operations
-                result[key] = self._apply_patch_list(result.get(key, []), value)
+                result[key] = self._own(merger._apply_patch_list(result.get(key, []), value))
             else:
                 # Simple override with new value
                 result[key] = value
+            
+            if self.provenance is not None and source is not None:
+                self.provenance[path + (key,)] = source
+
+
+class ConfigMerger:
+    """Unified configuration merger for all config versions."""
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.list_merger = ListMerger()
+    
+    def merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge two configuration dictionaries with support for flexible merge strategies.
         
-        return result
+        Args:
+            base: Base configuration (will be overridden)
+            override: Override configuration (takes precedence)
+            
+        Returns:
+            Merged configuration dictionary
+        """
+        return MergeSession(base, self).merge(override)
     
     def _is_merge_strategy_list(self, value: Any) -> bool:
         """Check if a value is a merge strategy list operation."""
@@ -99,7 +159,7 @@ class ConfigMerger:
         except ValueError:
             # Fall back to append behavior for invalid strategies
             self.logger.warning(f"Unknown merge strategy '{strategy}', falling back to append")
-            return base_list.copy() + clean_items
+            return base_list + clean_items
     
     def _is_patch_reference(self, value: Any) -> bool:
         """Check if a value is a patch reference."""
@@ -23,9 +23,10 @@ from motive.room import Room
 from motive.player import Player
 from motive.character import Character
 from motive.exceptions import ConfigNotFoundError, ConfigParseError, ConfigValidationError
+from motive.rng import ASSIGNMENT, MOTIVES, START_ROOMS, GameRandom
 
 class GameInitializer:
-    def __init__(self, game_config, game_id: str, game_logger: logging.Logger, initial_ap_per_turn: int = 20, deterministic: bool = False, character_override: str = None, motive_override: str = None, characters_override: List[str] = None, motives_override: List[str] = None, character_motives_override: List[str] = None, starting_rooms_override: List[str] = None):
+    def __init__(self, game_config, game_id: str, game_logger: logging.Logger, initial_ap_per_turn: int = 20, deterministic: bool = False, character_override: str = None, motive_override: str = None, characters_override: List[str] = None, motives_override: List[str] = None, character_motives_override: List[str] = None, starting_rooms_override: List[str] = None, rng: Optional[GameRandom] = None):
         self.game_config = game_config # This is the overall GameConfig loaded from config.yaml
         self.game_id = game_id
         self.game_logger = game_logger
@@ -37,6 +38,7 @@ class GameInitializer:
         self.motives_override = motives_override # Store motives override for multiple players
         self.character_motives_override = character_motives_override # Store character-motives override
         self.starting_rooms_override = starting_rooms_override # Store starting-rooms override
+        self.rng = rng or GameRandom() # Seeded streams for assignment, start rooms and motives
         # GameInitializer now works with v2 configs directly - no conversion needed
 
         self.rooms: Dict[str, Room] = {}
@@ -783,7 +785,7 @@ class GameInitializer:
             return
 
         # Handle character assignment with override support
-        import random
+        assignment = self.rng.stream(ASSIGNMENT)
         
         # Assign characters to players based on override parameters
         char_assignments = []
@@ -827,7 +829,7 @@ class GameInitializer:
             self.game_logger.info(f"Using motives override: {self.motives_override}")
             # For now, just assign random characters - motive assignment happens later
             if not self.deterministic:
-                char_assignments = random.sample(available_character_ids, len(players))
+                char_assignments = assignment.sample(available_character_ids, len(players))
             else:
                 char_assignments = available_character_ids[:len(players)]
         
@@ -838,7 +840,7 @@ class GameInitializer:
                 # Fill remaining slots with random characters
                 remaining_characters = [c for c in available_character_ids if c != self.character_override]
                 if not self.deterministic:
-                    additional_chars = random.sample(remaining_characters, min(len(players) - 1, len(remaining_characters)))
+                    additional_chars = assignment.sample(remaining_characters, min(len(players) - 1, len(remaining_characters)))
                 else:
                     additional_chars = remaining_characters[:len(players) - 1]
                 char_assignments.extend(additional_chars)
@@ -847,7 +849,7 @@ class GameInitializer:
                 self.game_logger.warning(f"Character override '{self.character_override}' not found in available characters. Available: {available_character_ids}")
                 # Fall back to random assignment
                 if not self.deterministic:
-                    char_assignments = random.sample(available_character_ids, len(players))
+                    char_assignments = assignment.sample(available_character_ids, len(players))
                 else:
                     char_assignments = available_character_ids[:len(players)]
         
@@ -855,7 +857,7 @@ class GameInitializer:
         else:
             if not self.deterministic:
                 # Random assignment in normal mode
-                char_assignments = random.sample(available_character_ids, len(players))
+                char_assignments = assignment.sample(available_character_ids, len(players))
             else:
                 # Deterministic assignment (first N characters in order)
                 char_assignments = available_character_ids[:len(players)]
@@ -1041,6 +1043,7 @@ class GameInitializer:
                 action_points=self.initial_ap_per_turn, # Use configurable initial AP
                 aliases=char_aliases,
                 deterministic=self.deterministic,  # Pass deterministic flag
+                rng=self.rng.stream(MOTIVES),
                 properties=char_properties,
                 short_name=getattr(char_cfg, 'short_name', None) if hasattr(char_cfg, 'short_name') else char_cfg.get('short_name', None) if isinstance(char_cfg, dict) else None,
                 template_id=char_id,
@@ -1315,7 +1318,6 @@ class GameInitializer:
 
     def _select_initial_room(self, char_config, default_room_id: str, char_id: str = None) -> str:
         """Select an initial room for a character based on their configuration."""
-        import random
         
         # Check for CLI override first
         if self.starting_rooms_override and char_id:
@@ -1377,8 +1379,8 @@ class GameInitializer:
             # In deterministic mode, always pick the first room
             return rooms[0]
         else:
-            # Use random.choices for weighted selection
-            return random.choices(rooms, weights=weights, k=1)[0]
+            # Weighted selection from the game's start-room stream
+            return self.rng.stream(START_ROOMS).choices(rooms, weights=weights, k=1)[0]
 
     def _instantiate_player_characters(self, players: List[Player]):
         self.game_logger.info("🎭 Instantiating player characters and assigning to players...")
@@ -1432,7 +1434,7 @@ class GameInitializer:
             return
 
         # Handle character assignment with override support
-        import random
+        assignment = self.rng.stream(ASSIGNMENT)
         
         # Assign characters to players based on override parameters
         char_assignments = []
@@ -1499,12 +1501,12 @@ class GameInitializer:
                     if not self.deterministic:
                         # Random assignment for remaining characters (with duplication if needed)
                         if remaining_players <= len(remaining_characters):
-                            remaining_assignments = random.sample(remaining_characters, remaining_players)
+                            remaining_assignments = assignment.sample(remaining_characters, remaining_players)
                         else:
                             # Need to duplicate characters
                             remaining_assignments = []
                             for i in range(remaining_players):
-                                remaining_assignments.append(random.choice(remaining_characters))
+                                remaining_assignments.append(assignment.choice(remaining_characters))
                     else:
                         # Deterministic assignment (cycle through characters if needed)
                         remaining_assignments = []
@@ -1519,7 +1521,7 @@ class GameInitializer:
         if not char_assignments:
             if not self.deterministic:
                 # Random assignment in normal mode
-                char_assignments = random.sample(available_character_ids, len(players))
+                char_assignments = assignment.sample(available_character_ids, len(players))
             else:
                 # Deterministic assignment (cycle through characters if needed)
                 char_assignments = []
@@ -1659,6 +1661,7 @@ class GameInitializer:
                 action_points=self.initial_ap_per_turn, # Use configurable initial AP
                 aliases=char_aliases,
                 deterministic=self.deterministic,  # Pass deterministic flag
+                rng=self.rng.stream(MOTIVES),
                 short_name=getattr(char_cfg, 'short_name', None) if hasattr(char_cfg, 'short_name') else char_cfg.get('short_name', None) if isinstance(char_cfg, dict) else None
             )
             
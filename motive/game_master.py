@@ -3,9 +3,10 @@ import time
 import asyncio
 import os
 import logging
+import json
 import sys # Added for stdout logging
 import yaml # Added for YAML loading
-from typing import List, Dict, Any, Optional, Tuple # Added for type hints
+from typing import List, Dict, Any, Optional, Tuple, Callable # Added for type hints
 from pydantic import BaseModel, ValidationError # Added for Pydantic validation
 from motive.player import Player
 from motive.character import Character
@@ -27,11 +28,22 @@ from motive.config import (
 )
 from motive.game_object import GameObject # Import GameObject
 from motive.room import Room # Import Room
-from motive.action_parser import parse_player_response # Import the new action parser
+from motive.action_parser import parse_player_response, parse_action_line # Import the new action parser
 from motive.exceptions import ConfigNotFoundError, ConfigParseError, ConfigValidationError # Import custom exceptions
 from motive.game_initializer import GameInitializer # Import GameInitializer
+from motive.sim_v2.world_graph import WorldGraph
+from motive.prompt_fragments import FragmentCache
+from motive.llm_factory import game_narrative_logger
+from motive.log_writer import LazyMessage, QueueFileHandler, flush_logs
+from motive.message_templates import FORMAT, compile_template, normalize_format_template, precompile_action_messages, precompile_interaction_messages
 from datetime import datetime # Added for datetime logging
 import uuid # Added for UUID logging
+import hashlib
+from collections import Counter
+from motive.outcome_store import OutcomeStore
+from motive import progress_channel
+from motive.checkpoint import CheckpointWriter, checkpoint_dir
+from motive.rng import DETERMINISTIC_SEED, GameRandom
 
 
 class GameMaster:
@@ -39,8 +51,10 @@ class GameMaster:
     def __init__(self, game_config, game_id: str, deterministic: bool = False, 
                  log_dir: str = "logs", no_file_logging: bool = False, character: str = None, motive: str = None,
                  characters: List[str] = None, motives: List[str] = None, character_motives: List[str] = None,
-                 starting_rooms: List[str] = None):
+                 starting_rooms: List[str] = None, llm_client_factory: Optional[Callable[[str, str], Any]] = None,
+                 seed: Optional[int] = None):
         self.players = []
+        self.llm_client_factory = llm_client_factory  # (provider, model) -> client; None uses create_llm_client
         self.character_override = character  # Store character override for GameInitializer
         self.motive_override = motive  # Store motive override for GameInitializer
         self.characters_override = characters  # Store characters override for GameInitializer
@@ -64,8 +78,17 @@ class GameMaster:
             
         self.game_id = game_id
         self.deterministic = deterministic
+        # All randomness comes from named streams of this seed, so the game replays from the seed alone
+        self.rng = GameRandom(DETERMINISTIC_SEED if seed is None and deterministic else seed)
+        self.seed = self.rng.seed
         self.log_dir = log_dir
         self.no_file_logging = no_file_logging
+        self.outcome_store_dir = os.path.join(log_dir, "outcomes")  # Cross-run outcome rows (motive-util stats)
+        self._play_stats: Dict[str, Dict[str, Any]] = {}  # Per player: AP spent, actions per type, LLM time
+        self.progress_publisher = None  # Shared-memory progress slot when run by the parallel runner
+        self.checkpoint_dir = checkpoint_dir(log_dir, game_id)
+        self.checkpoints = None  # CheckpointWriter; the CLI enables checkpoints for the games it runs
+        self.resume_point = None  # (round, names of players done in it) when resumed from a checkpoint
 
         self.game_config = game_config # Assign game_config earlier
 
@@ -77,8 +100,9 @@ class GameMaster:
         # Track which hints have been executed (hint_id -> set of player_names)
         self.executed_hints: Dict[str, set] = {}
 
-        # Initialize a basic logger that logs to stdout before full setup
-        self.game_logger = logging.getLogger("GameNarrative")
+        # Initialize a basic logger that logs to stdout before full setup; one per game, so
+        # games sharing a process (batch mode, pool workers) never write to each other's game.log
+        self.game_logger = logging.getLogger(f"GameNarrative.{game_id}")
         self.game_logger.propagate = False # Prevent propagation to root logger to avoid duplicate output
         if not self.game_logger.handlers:
             handler = logging.StreamHandler(sys.stdout)
@@ -93,10 +117,15 @@ class GameMaster:
             initial_ap = game_config.game_settings.initial_ap_per_turn
         else:
             initial_ap = game_config['game_settings']['initial_ap_per_turn']
+        self.stream_responses, self.stream_max_action_lines = self._stream_settings(game_config)
+        self.log_compression = self._log_compression_setting(game_config)
+        self._prefix_messages = None  # Shared (system, manual) prompt prefix messages, built on first use
+        self.prompt_fragments = FragmentCache()  # Rendered prompt fragments keyed on state versions
+        self._player_names_by_character: Dict[str, str] = {}
         # Pass v2 config directly to GameInitializer - no conversion needed
         # GameInitializer will be updated to work with v2 structures directly
         
-        self.game_initializer = GameInitializer(game_config, game_id, self.game_logger, initial_ap, self.deterministic, self.character_override, self.motive_override, self.characters_override, self.motives_override, self.character_motives_override, self.starting_rooms_override)
+        self.game_initializer = GameInitializer(game_config, game_id, self.game_logger, initial_ap, self.deterministic, self.character_override, self.motive_override, self.characters_override, self.motives_override, self.character_motives_override, self.starting_rooms_override, rng=self.rng)
 
         # Load configurations from merged config
         self.game_initializer._load_configurations()
@@ -129,6 +158,7 @@ class GameMaster:
         # Event management
         self.event_queue: List[Event] = [] # All events generated during a turn
         self.player_observations: Dict[str, List[Event]] = {} # Events specific to each player
+        self.game_results: List[Dict[str, Any]] = [] # Per-player outcomes, filled at game end
 
         # Handle both Pydantic objects and dictionaries from merged config
         if hasattr(game_config, 'players'):
@@ -145,6 +175,8 @@ class GameMaster:
         self.game_object_types = self.game_initializer.game_object_types
         self.game_actions = self.game_initializer.game_actions
         self.game_character_types = self.game_initializer.game_character_types
+        self._world_graph: Optional[WorldGraph] = None
+        self.template_problems = self._precompile_message_templates()
 
         # Pass initial AP to GameInitializer for character instantiation
         # Handle both Pydantic objects and dictionaries from merged config
@@ -228,19 +260,21 @@ class GameMaster:
         # Remove all existing handlers from the logger before reconfiguring
         for handler in list(self.game_logger.handlers):
             self.game_logger.removeHandler(handler)
+            if not isinstance(handler, logging.StreamHandler):  # Log files; stdout stays open
+                handler.close()
 
         # Set the level for the game logger (now that it's the main logger)
         self.game_logger.setLevel(logging.INFO)
 
-        # File handler for game.log (skip in tests when disabled)
+        # File handler for game.log (skip in tests when disabled); written by the background log writer
         log_targets = ["stdout"]
         if not disable_file_logging:
             game_narrative_file = os.path.join(game_log_dir, "game.log")
-            game_file_handler = logging.FileHandler(game_narrative_file, encoding="utf-8")
+            game_file_handler = QueueFileHandler(game_narrative_file, encoding="utf-8", compression=self.log_compression)
             game_formatter = logging.Formatter('%(asctime)s - %(message)s') # Simpler format for narrative
             game_file_handler.setFormatter(game_formatter)
             self.game_logger.addHandler(game_file_handler)
-            log_targets.insert(0, game_narrative_file)
+            log_targets.insert(0, os.path.relpath(game_file_handler.baseFilename) if self.log_compression else game_narrative_file)
 
         # Stream handler for stdout
         stdout_handler = logging.StreamHandler(sys.stdout)
@@ -252,6 +286,14 @@ class GameMaster:
         
         return game_log_dir
 
+    @property
+    def world_graph(self) -> WorldGraph:
+        """Room connectivity (paths, reachability, distance to goal), built on first use."""
+        graph = getattr(self, '_world_graph', None)
+        if graph is None:
+            graph = self._world_graph = WorldGraph.from_rooms(self.rooms)
+        return graph
+
     def _initialize_players(self, player_configs: list[PlayerConfig]):
         """Initializes players from typed or dict configs."""
         for p_config in player_configs:
@@ -265,18 +307,23 @@ class GameMaster:
                 provider = p_config.get('provider')
                 model = p_config.get('model')
 
+            llm_client_factory = getattr(self, 'llm_client_factory', None)
             player = Player(
                 name=name,
                 provider=provider,
                 model=model,
                 log_dir=self.log_dir,
-                no_file_logging=self.no_file_logging  # Pass the log directory to the player
+                no_file_logging=self.no_file_logging,  # Pass the log directory to the player
+                game_id=self.game_id,
+                log_compression=self.log_compression,
+                llm_client=llm_client_factory(provider, model) if llm_client_factory else None
             )
             self.players.append(player)
             self.player_first_interaction_done[player.name] = False # Initialize for tracking
 
     async def run_game(self):
         """Main game loop."""
+        game_narrative_logger.set(self.game_logger)
         self.game_logger.info("🚀 ==================== GAME STARTING ====================")
         
         # Log game settings for training data metadata
@@ -287,11 +334,12 @@ class GameMaster:
 
         # Removed: await self._send_initial_messages()
 
-        for round_num in range(1, self.num_rounds + 1):
+        start_round, done_before = self._start_point()
+        for round_num in range(start_round, self.num_rounds + 1):
             self.game_logger.info(f"🎯 Round {round_num} of {self.num_rounds}")
             
             # Log character snapshot report before each round
-            self.game_logger.info(self._generate_character_snapshot_report())
+            self.game_logger.info(LazyMessage(self._generate_character_snapshot_report))
             
             # Filter out players who have quit
             active_players = [player for player in self.players if player.character.action_points != -1]
@@ -300,7 +348,10 @@ class GameMaster:
                 self.game_logger.info("No active players remaining. Game ending early.")
                 break
                 
+            done = list(done_before) if round_num == start_round else []
             for player in active_players:
+                if player.name in done:
+                    continue  # Played before the checkpoint this game was resumed from
                 # Handle both Pydantic objects and dictionaries from merged config
                 if hasattr(self.game_config, 'game_settings'):
                     player.character.action_points = self.game_config.game_settings.initial_ap_per_turn
@@ -311,6 +362,8 @@ class GameMaster:
                 # Check if player quit during their turn
                 if player.character.action_points == -1:
                     self.game_logger.info(f"Player {player.name} has quit the game.")
+                done.append(player.name)
+                self._checkpoint("turn", round_num, done)
                     
             self.game_logger.info(f"✅ Round {round_num} complete")
 
@@ -318,11 +371,16 @@ class GameMaster:
         
         # Check win conditions and provide game summary
         self._check_win_conditions_and_summarize()
+        self._log_prompt_fragment_stats()
+        self._record_outcomes()
+        self._checkpoint("complete")
+        await asyncio.to_thread(flush_logs)  # Game and chat logs are complete on disk once the game returns
 
     async def run_game_worker(self):
         """Worker version of run_game with structured progress output for parallel monitoring."""
         # Print structured progress information that the parallel runner can parse
         print(f"WORKER_START: {self.game_id}")
+        game_narrative_logger.set(self.game_logger)
         
         # Still log to file but suppress most stdout output
         self.game_logger.info("🚀 ==================== GAME STARTING (WORKER MODE) ====================")
@@ -336,13 +394,18 @@ class GameMaster:
             print(f"WORKER_ROUNDS: {self.game_config['game_settings']['num_rounds']}")
             print(f"WORKER_PLAYERS: {len(self.players)}")
             self.game_logger.info(f"⚙️ Game Settings: {self.game_config['game_settings']['num_rounds']} rounds, {self.game_config['game_settings']['initial_ap_per_turn']} AP/turn")
+        log_file = '' if self.no_file_logging else os.path.join(self.log_dir, 'game.log')
+        self._publish_progress(status=progress_channel.RUNNING, total_rounds=self.num_rounds,
+                               total_players=len(self.players), log_file=log_file)
 
-        for round_num in range(1, self.num_rounds + 1):
+        start_round, done_before = self._start_point()
+        for round_num in range(start_round, self.num_rounds + 1):
             print(f"WORKER_ROUND_START: {round_num}")
+            self._publish_progress(round=round_num, turn=0)
             self.game_logger.info(f"🎯 Round {round_num} of {self.num_rounds}")
             
             # Log character snapshot report before each round
-            self.game_logger.info(self._generate_character_snapshot_report())
+            self.game_logger.info(LazyMessage(self._generate_character_snapshot_report))
             
             # Filter out players who have quit
             active_players = [player for player in self.players if player.character.action_points != -1]
@@ -352,7 +415,10 @@ class GameMaster:
                 self.game_logger.info("No active players remaining. Game ending early.")
                 break
                 
+            done = list(done_before) if round_num == start_round else []
             for player in active_players:
+                if player.name in done:
+                    continue  # Played before the checkpoint this game was resumed from
                 # Handle both Pydantic objects and dictionaries from merged config
                 if hasattr(self.game_config, 'game_settings'):
                     player.character.action_points = self.game_config.game_settings.initial_ap_per_turn
@@ -360,13 +426,17 @@ class GameMaster:
                     player.character.action_points = self.game_config['game_settings']['initial_ap_per_turn']
                 
                 print(f"WORKER_PLAYER_TURN: {player.name}")
+                self._publish_progress(turn=self._progress_record().turn + 1)
                 await self._execute_player_turn_worker(player, round_num)
                 print(f"WORKER_TURN_COMPLETE: {player.name}")
+                self._publish_progress(completed_turns=self._progress_record().completed_turns + 1, **self._token_totals())
                 
                 # Check if player quit during their turn
                 if player.character.action_points == -1:
                     print(f"WORKER_PLAYER_QUIT: {player.name}")
                     self.game_logger.info(f"Player {player.name} has quit the game.")
+                done.append(player.name)
+                self._checkpoint("turn", round_num, done)
                     
             print(f"WORKER_ROUND_END: {round_num}")
             self.game_logger.info(f"✅ Round {round_num} complete")
@@ -376,6 +446,75 @@ class GameMaster:
         
         # Check win conditions and provide game summary
         self._check_win_conditions_and_summarize()
+        self._log_prompt_fragment_stats()
+        self._record_outcomes()
+        self._checkpoint("complete")
+        await asyncio.to_thread(flush_logs)  # Game and chat logs are complete on disk once the game returns
+        # One line per player for the parallel runner / tournament scheduler
+        for result in self.game_results:
+            print(f"WORKER_RESULT: {json.dumps(result, default=str)}")
+        self._publish_progress(status=progress_channel.COMPLETED, **self._token_totals())
+
+    def close_logs(self):
+        """Close this game's narrative and chat log handlers (processes that go on to run other games)."""
+        for game_logger in [self.game_logger, *(player.logger for player in self.players)]:
+            for handler in list(game_logger.handlers):
+                game_logger.removeHandler(handler)
+                if not isinstance(handler, logging.StreamHandler):  # Log files; stdout stays open
+                    handler.close()
+
+    def enable_checkpoints(self, manifest: Optional[Dict[str, Any]] = None) -> CheckpointWriter:
+        """
+        Write a checkpoint after every completed turn. A manifest (config path,
+        options including the seed) starts a new checkpoint; None continues
+        the existing one after a resume.
+        """
+        if manifest is not None:
+            manifest = {'game_id': self.game_id, 'config_hash': self._config_hash(), **manifest}
+        self.checkpoints = CheckpointWriter(self.checkpoint_dir, manifest)
+        return self.checkpoints
+
+    def _start_point(self) -> Tuple[int, List[str]]:
+        """
+        (first round, players already done in it): round 1 for a new game,
+        which also records the initial checkpoint, or the resume point.
+        """
+        resume_point = getattr(self, 'resume_point', None)
+        if resume_point is None:
+            self._checkpoint("start")
+            return 1, []
+        start_round, done = resume_point
+        self.game_logger.info(f"⏩ Resuming at round {start_round}" + (f" after {', '.join(sorted(done))}" if done else ""))
+        return start_round, list(done)
+
+    def _checkpoint(self, event: str, *args):
+        """Record a checkpoint (start, turn or complete) if checkpoints are enabled."""
+        writer = getattr(self, 'checkpoints', None)
+        if writer is None:
+            return
+        try:
+            getattr(writer, f"record_{event}")(self, *args)
+        except OSError as e:
+            self.game_logger.warning(f"Could not write checkpoint to {writer.directory}: {e}")
+
+    def _publish_progress(self, **fields):
+        """Update this worker's progress slot, if the parallel runner gave it one."""
+        publisher = getattr(self, 'progress_publisher', None)
+        if publisher is not None:
+            publisher.update(**fields)
+
+    def _progress_record(self) -> progress_channel.ProgressRecord:
+        publisher = getattr(self, 'progress_publisher', None)
+        return publisher.record if publisher is not None else progress_channel.ProgressRecord()
+
+    def _token_totals(self) -> Dict[str, int]:
+        totals = {'input_tokens': 0, 'output_tokens': 0}
+        for player in self.players:
+            usage = getattr(player, 'token_usage', None)
+            if isinstance(usage, dict):
+                for key in totals:
+                    totals[key] += usage.get(key, 0) or 0
+        return totals
 
     def _generate_character_snapshot_report(self) -> str:
         """Generate a snapshot report of all characters' locations and inventories."""
@@ -413,16 +552,33 @@ class GameMaster:
         """Checks if any players achieved their motives and provides a detailed game summary."""
         winners = []
         losers = []
+        self.game_results = []  # Structured per-player outcomes
         
         for player in self.players:
+            result = {
+                "player": player.name,
+                "provider": getattr(player, 'provider', None),
+                "model": getattr(player, 'model', None),
+                "character": getattr(player.character, 'id', None),
+                "motive": None,
+            }
+            usage = getattr(player, 'token_usage', None)
+            if isinstance(usage, dict):
+                result.update(usage)
+            stats = self._player_play_stats(player)
+            result.update(rounds=self.num_rounds, ap_spent=stats['ap_spent'], llm_calls=stats['llm_calls'],
+                          llm_seconds=round(stats['llm_seconds'], 3), actions=dict(stats['actions']))
+            self.game_results.append(result)
             if player.character.action_points == -1:  # Player quit
                 losers.append(f"{player.name} (quit)")
+                result["outcome"] = "quit"
                 continue
             
             # Get detailed motive information
             char = player.character
             motive_name = char.selected_motive.id if char.selected_motive else "legacy_motive"
             motive_desc = char.motive
+            result["motive"] = motive_name
             
             # Check motive success/failure using the new system
             success_result = char.check_motive_success(self)
@@ -431,11 +587,14 @@ class GameMaster:
             # Success requires BOTH success conditions AND no failure conditions (redemption logic)
             if success_result and not failure_result:
                 winners.append(f"{player.name} ({char.name}) - Motive '{motive_name}': {motive_desc}")
+                result["outcome"] = "won"
             elif failure_result:
                 losers.append(f"{player.name} ({char.name}) - Motive '{motive_name}' FAILED: {motive_desc}")
+                result["outcome"] = "failed"
             else:
                 # Neither success nor failure conditions met - player didn't achieve motive
                 losers.append(f"{player.name} ({char.name}) - Motive '{motive_name}' NOT ACHIEVED: {motive_desc}")
+                result["outcome"] = "not_achieved"
         
         # Log and display results with human-readable formatting
         self.game_logger.info("=" * 60)
@@ -875,14 +1034,12 @@ class GameMaster:
                 if effect_message and effect_observers:
                     # Determine character-specific variants for actor feedback
                     variant_template = self._resolve_effect_message(effect, player_char)
-                    actor_template = variant_template or effect_message
-                    actor_template = self._normalize_event_template(actor_template)
-                    actor_message = actor_template.format(**params, player_name=player_char.name)
+                    template_values = {**params, 'player_name': player_char.name}
+                    actor_message = compile_template(variant_template or effect_message, FORMAT).render(template_values)
                     feedback_messages.append(actor_message)
 
                     # Keep event broadcast generic for other observers
-                    base_template = self._normalize_event_template(effect_message)
-                    event_message = base_template.format(**params, player_name=player_char.name)
+                    event_message = compile_template(effect_message, FORMAT).render(template_values)
                     events_generated.append(Event(
                         message=event_message,
                         event_type="action_event", # A generic type for now
@@ -946,6 +1103,94 @@ class GameMaster:
         # After processing all effects, add generated events to the main event queue
         return events_generated, feedback_messages
 
+    def _add_prompt_prefix(self, player: Player, player_char: Character):
+        """
+        Opens a player's conversation with the messages that never change:
+        the system prompt, the game manual and the character introduction.
+
+        They lead every later request in this order, so providers can serve
+        them from their prompt cache; the system prompt and manual are
+        identical for all players.
+        """
+        if self._prefix_messages is None:
+            # System message should only contain persistent instructions, not the manual
+            system_prompt = f"You are a player in a text-based adventure game.\n\n" \
+                            f"🚨 CRITICAL ACTION FORMAT RULE 🚨\n" \
+                            f"ALL actions MUST start with '>' on their own line!\n" \
+                            f"✅ CORRECT: > look\n" \
+                            f"✅ CORRECT: > say \"hello\"\n" \
+                            f"✅ CORRECT: > move north\n" \
+                            f"❌ WRONG: look (missing >)\n" \
+                            f"❌ WRONG: say hello (missing >)\n" \
+                            f"❌ WRONG: move north (missing >)\n" \
+                            f"Without the '>' prefix, your actions will be IGNORED and you'll receive a penalty!"
+            # Manual followed by a clear separation from the game start
+            manual_text = "\n\n".join([f"**📖 GAME MANUAL:**\n{self.manual_content}", "---", "**🎮 GAME BEGINS NOW**", "---"])
+            self._prefix_messages = (SystemMessage(content=system_prompt), HumanMessage(content=manual_text))
+        
+        system_msg, manual_msg = self._prefix_messages
+        character_msg = HumanMessage(content=player_char.get_introduction_message())
+        
+        player.add_prefix_message(system_msg)
+        self.game_logger.info(f"GM ➡️ {player.name} (SYSTEM):\n{system_msg.content}")
+        player.logger.info(f"{player.name} ⬅️ GM (SYSTEM):\n{system_msg.content}")
+        for message in (manual_msg, character_msg):
+            player.add_prefix_message(message)
+            self.game_logger.info(f"GM ➡️ {player.name}:\n{message.content}")
+            player.logger.info(f"{player.name} ⬅️ GM:\n{message.content}")
+        self.player_first_interaction_done[player_char.id] = True
+
+    @staticmethod
+    def _stream_settings(game_config: Any) -> Tuple[bool, Optional[int]]:
+        """Read (stream_responses, stream_max_action_lines) from the game settings."""
+        if hasattr(game_config, 'game_settings'):
+            settings = game_config.game_settings
+            stream, max_lines = getattr(settings, 'stream_responses', False), getattr(settings, 'stream_max_action_lines', None)
+        else:
+            settings = game_config.get('game_settings', {}) if isinstance(game_config, dict) else {}
+            stream, max_lines = settings.get('stream_responses', False), settings.get('stream_max_action_lines')
+        return stream is True, max_lines if isinstance(max_lines, int) else None
+
+    @staticmethod
+    def _log_compression_setting(game_config: Any) -> Optional[str]:
+        """Read log_compression ("gzip", "zstd" or None) from the game settings."""
+        if hasattr(game_config, 'game_settings'):
+            compression = getattr(game_config.game_settings, 'log_compression', None)
+        else:
+            settings = game_config.get('game_settings', {}) if isinstance(game_config, dict) else {}
+            compression = settings.get('log_compression')
+        return compression if isinstance(compression, str) else None
+
+    def _action_cutoff(self, player_char: Character, room_objects: Dict[str, Any]) -> Callable[[List[str]], bool]:
+        """
+        Build the stop condition for a streamed turn response.
+
+        The response is complete once it has stream_max_action_lines action lines
+        or once the parsed actions would leave the character without AP. Costs are
+        deducted the way the turn loop spends them: an action costing more than
+        the AP left is skipped (later, cheaper actions still run) and an action
+        whose requirements fail spends nothing.
+        """
+        state = {"parsed": 0, "ap": player_char.action_points}
+
+        def stop_when(action_lines: List[str]) -> bool:
+            for action_line in action_lines[state["parsed"]:]:
+                parsed_action, _ = parse_action_line(action_line, self.game_actions, room_objects)
+                if parsed_action:
+                    action_config, params = parsed_action
+                    try:
+                        cost = self._calculate_action_cost(player_char, action_config, params)
+                        if cost <= state["ap"] and self._check_requirements(player_char, action_config, params)[0]:
+                            state["ap"] -= cost
+                    except Exception:
+                        pass  # Cost is only a cutoff hint; the real cost is computed when the action runs
+            state["parsed"] = len(action_lines)
+            if self.stream_max_action_lines and len(action_lines) >= self.stream_max_action_lines:
+                return True
+            return state["ap"] <= 0
+
+        return stop_when
+
     def _calculate_action_cost(self, player_char: Character, action_config: Any, params: Dict[str, Any]) -> int:
         """Calculate the actual cost for an action, using cost calculation function if available."""
         # Handle new cost configuration format
@@ -1050,14 +1295,34 @@ class GameMaster:
     @staticmethod
     def _normalize_event_template(template: str) -> str:
         """Convert legacy double-brace placeholders to str.format-compatible tokens."""
-        if not template or not isinstance(template, str):
-            return template
-        return (
-            template
-            .replace('{{player_name}}', '{player_name}')
-            .replace('{{object_name}}', '{object_name}')
-            .replace('{{target_name}}', '{target_name}')
-        )
+        return normalize_format_template(template)
+
+    def _precompile_message_templates(self) -> List[str]:
+        """
+        Compile every action effect and object interaction message once at load.
+        Unknown placeholders are logged here rather than discovered mid-game.
+        """
+        problems = []
+        if isinstance(self.game_actions, dict):
+            for action_id, action in self.game_actions.items():
+                problems.extend(precompile_action_messages(action_id, action))
+        if isinstance(self.rooms, dict):
+            holders = list(self.rooms.values())
+            if isinstance(self.player_characters, dict):
+                holders.extend(self.player_characters.values())
+            seen = set()
+            for holder in holders:
+                objects = getattr(holder, 'objects', None) or getattr(holder, 'inventory', None)
+                if not isinstance(objects, dict):
+                    continue
+                for obj in objects.values():
+                    interactions = getattr(obj, 'interactions', None)
+                    if interactions and id(interactions) not in seen:
+                        seen.add(id(interactions))
+                        problems.extend(precompile_interaction_messages(f"object '{getattr(obj, 'id', '?')}'", interactions))
+        for problem in problems:
+            self.game_logger.warning(f"Message template: {problem}")
+        return problems
 
     def _distribute_events(self):
         """Distributes generated events to relevant players based on observer scopes."""
@@ -1218,12 +1483,12 @@ class GameMaster:
             if motive_status_message:
                 observation_messages.append(motive_status_message)
             
-            # Log detailed motive condition tree (non-chat logging)
-            condition_tree = player_char.get_motive_condition_tree(self)
-            self.game_logger.info(f"Motive condition tree for {player.name} ({player_char.name}):\n{condition_tree}")
+            # Log detailed motive condition tree (non-chat logging), built only if INFO is enabled
+            self.game_logger.info(LazyMessage(
+                lambda: f"Motive condition tree for {player.name} ({player_char.name}):\n{player_char.get_motive_condition_tree(self)}"))
 
             # Get formatted room description from the Room object
-            current_room_description = current_room.get_formatted_description()
+            current_room_description = self._render_room_description(current_room)
 
             # Check if this is the first interaction for this player
             is_first_interaction = not self.player_first_interaction_done.get(player_char.id, False)
@@ -1232,20 +1497,9 @@ class GameMaster:
             # Construct the message content
             message_content_parts = []
             
-            # Add character assignment and initial location for first interaction
+            # Open with the stable prompt prefix (system, manual, character) and initial location for first interaction
             if is_first_interaction:
-                # Add the game manual FIRST for first interaction only
-                manual_text = f"**📖 GAME MANUAL:**\n{self.manual_content}"
-                message_content_parts.append(manual_text)
-                
-                # Add clear separation between manual and game start
-                message_content_parts.append("---")
-                message_content_parts.append("**🎮 GAME BEGINS NOW**")
-                message_content_parts.append("---")
-                
-                # Add character assignment
-                character_assignment = player_char.get_introduction_message()
-                message_content_parts.append(character_assignment)
+                self._add_prompt_prefix(player, player_char)
                 
                 # Add initial location with character's reason
                 initial_location_text = f"**🏠 Initial location:**\n{current_room_description}"
@@ -1268,26 +1522,6 @@ class GameMaster:
             
             message_content = "\n\n".join(message_content_parts)
             
-            # Send system message for first interaction only
-            if is_first_interaction:
-                # System message should only contain persistent instructions, not the manual
-                system_prompt = f"You are a player in a text-based adventure game.\n\n" \
-                                f"🚨 CRITICAL ACTION FORMAT RULE 🚨\n" \
-                                f"ALL actions MUST start with '>' on their own line!\n" \
-                                f"✅ CORRECT: > look\n" \
-                                f"✅ CORRECT: > say \"hello\"\n" \
-                                f"✅ CORRECT: > move north\n" \
-                                f"❌ WRONG: look (missing >)\n" \
-                                f"❌ WRONG: say hello (missing >)\n" \
-                                f"❌ WRONG: move north (missing >)\n" \
-                                f"Without the '>' prefix, your actions will be IGNORED and you'll receive a penalty!"
-                
-                system_msg = SystemMessage(content=system_prompt)
-                player.add_message(system_msg)
-                self.game_logger.info(f"GM ➡️ {player.name} (SYSTEM):\n{system_prompt}")
-                player.logger.info(f"{player.name} ⬅️ GM (SYSTEM):\n{system_prompt}")
-                self.player_first_interaction_done[player_char.id] = True
-            
             # Send the main message
             human_msg = HumanMessage(content=message_content)
             player.add_message(human_msg)
@@ -1295,8 +1529,14 @@ class GameMaster:
             player.logger.info(f"{player.name} ⬅️ GM:\n{message_content}")
 
             start_time = time.time()
-            response = await player.get_response_and_update_history(player.chat_history)
+            if self.stream_responses:
+                room_objects = current_room.objects if hasattr(current_room, 'objects') else {}
+                response = await player.get_response_and_update_history(
+                    player.chat_history, stop_when=self._action_cutoff(player_char, room_objects))
+            else:
+                response = await player.get_response_and_update_history(player.chat_history)
             duration = time.time() - start_time
+            self._record_llm_latency(player, duration)
             
             response_len = len(response.content)
 
@@ -1452,6 +1692,7 @@ class GameMaster:
                             
                             # Mark hint as executed if this action matches a hint                                                         
                             self._mark_hint_executed(player.name, action_name, params)
+                            self._record_action_stats(player, action_name, actual_cost)
                             
                             # Collect action info for batch logging
                             executed_actions.append({
@@ -1599,6 +1840,7 @@ class GameMaster:
         start_time = time.time()
         response = await player.get_response_and_update_history(player.chat_history)
         duration = time.time() - start_time
+        self._record_llm_latency(player, duration)
         response_len = len(response.content)
         
         player_input = response.content.strip().lower()
@@ -1933,6 +2175,25 @@ class GameMaster:
 
     def _get_action_display(self, player_char: Character, is_first_turn: bool = False, round_num: int = 1) -> str:
         """Get standardized action display text."""
+        # Example actions depend on AP, whether the inventory is empty and the
+        # ranking's recently shown actions, which the render also advances
+        recent = tuple(getattr(self, '_recent_example_actions', ()))
+        key = (id(self.game_actions), player_char.action_points, bool(player_char.inventory), recent)
+        action_display, recent = self.prompt_fragments.get(
+            "example_actions", key, lambda: self._render_example_actions(player_char))
+        self._recent_example_actions = list(recent)
+        
+        # Add applicable hints
+        player_name = self._player_name_for(player_char)
+        if player_name:
+            hints = self._get_applicable_hints(player_name, round_num)
+            if hints:
+                action_display += "\n\nHint(s), try these actions please, we're testing game mechanics:\n" + "\n".join(hints)
+        
+        return action_display
+
+    def _render_example_actions(self, player_char: Character) -> Tuple[str, Tuple[str, ...]]:
+        """Render the example action list; returns it with the ranking's updated recent actions."""
         # Generate example actions dynamically
         example_actions = self._get_example_actions(player_char)
         
@@ -1955,19 +2216,71 @@ class GameMaster:
             else:
                 action_display += f"  > {action}\n"
         
-        # Add applicable hints
-        player_name = None
-        for player in self.players:
-            if player.character and player.character.id == player_char.id:
-                player_name = player.name
-                break
-        
-        if player_name:
-            hints = self._get_applicable_hints(player_name, round_num)
-            if hints:
-                action_display += "\n\nHint(s), try these actions please, we're testing game mechanics:\n" + "\n".join(hints)
-        
-        return action_display
+        return action_display, tuple(getattr(self, '_recent_example_actions', ()))
+
+    def _player_name_for(self, player_char: Character) -> Optional[str]:
+        """Name of the player controlling a character (looked up once per character)."""
+        player_name = self._player_names_by_character.get(player_char.id)
+        if player_name is None:
+            for player in self.players:
+                if player.character and player.character.id == player_char.id:
+                    player_name = self._player_names_by_character[player_char.id] = player.name
+                    break
+        return player_name
+
+    def _render_room_description(self, room: Room) -> str:
+        """A room's formatted description, re-rendered only after the room changes."""
+        version = getattr(room, 'version', None)
+        if not isinstance(version, int):
+            return room.get_formatted_description()
+        return self.prompt_fragments.get("room_description", (room.id, version), room.get_formatted_description)
+
+    def _player_play_stats(self, player: Player) -> Dict[str, Any]:
+        stats = self._play_stats.get(player.name)
+        if stats is None:
+            stats = self._play_stats[player.name] = {'ap_spent': 0, 'actions': Counter(), 'llm_calls': 0, 'llm_seconds': 0.0}
+        return stats
+
+    def _record_action_stats(self, player: Player, action_name: str, cost: int):
+        """Count an executed action and its AP cost for the outcome store."""
+        stats = self._player_play_stats(player)
+        stats['ap_spent'] += cost if isinstance(cost, (int, float)) else 0
+        stats['actions'][action_name] += 1
+
+    def _record_llm_latency(self, player: Player, seconds: float):
+        stats = self._player_play_stats(player)
+        stats['llm_calls'] += 1
+        stats['llm_seconds'] += seconds
+        self._publish_progress(**self._token_totals())  # Also shows the monitor the worker is alive mid-turn
+
+    def _config_hash(self) -> str:
+        """Short hash of the merged game config, to group outcomes of identical setups."""
+        config = self.game_config.model_dump(warnings=False) if hasattr(self.game_config, 'model_dump') else self.game_config
+        encoded = json.dumps(config, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _record_outcomes(self):
+        """Append one row per player of this game to the columnar outcome store."""
+        if self.no_file_logging or not self.game_results:
+            return
+        game_fields = {
+            'game_id': self.game_id,
+            'config_hash': self._config_hash(),
+            'seed': getattr(self, 'seed', None),
+            'deterministic': bool(self.deterministic),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'players': len(self.players),
+        }
+        try:
+            OutcomeStore(self.outcome_store_dir).append({**game_fields, **result} for result in self.game_results)
+        except OSError as e:
+            self.game_logger.warning(f"Could not record game outcomes in {self.outcome_store_dir}: {e}")
+
+    def _log_prompt_fragment_stats(self):
+        """Log per-fragment cache hits, renders and render time for this game."""
+        report = self.prompt_fragments.report()
+        if report:
+            self.game_logger.info("🧩 Prompt fragment cache:\n" + "\n".join(f"  • {line}" for line in report))
 
     def _setup_game_world(self, theme_cfg: ThemeConfig, edition_cfg: EditionConfig):
         """Sets up the initial game world by merging configs and instantiating objects."""
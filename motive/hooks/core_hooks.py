@@ -3,8 +3,18 @@ from typing import List, Dict, Any, Tuple
 from motive.game_master import GameMaster # Circular import for now, will refine
 from motive.character import Character
 from motive.config import Event
+from motive.message_templates import FORMAT, normalize_format_template, render_template
 from datetime import datetime
 
+def _render_format_message(template: Any, values: Dict[str, Any]) -> Any:
+    """Render a format-style effect message; if it cannot be filled in, show it unformatted."""
+    if not isinstance(template, str):
+        return template
+    try:
+        return render_template(template, values, style=FORMAT)
+    except Exception:
+        return normalize_format_template(template)
+
 def generate_help_message(game_master: Any, player_char: Character, action_config: Any, params: Dict[str, Any]) -> Tuple[List[Event], List[str]]:
     """Generates a help message with available actions, optionally filtered by category."""
     feedback_messages: List[str] = []
@@ -107,21 +117,8 @@ def look_at_target(game_master: Any, player_char: Character, action_config: Any,
         if current_room:
             # Visibility gating: if room is dark and no lit light sources in room inventories, it's too dark
             is_dark = bool(getattr(current_room, 'properties', {}) and current_room.properties.get('dark', False))
-            has_light = False
-            if is_dark:
-                for p in game_master.players:
-                    pc = getattr(p, 'character', None)
-                    if not pc or pc.current_room_id != current_room.id:
-                        continue
-                    for obj in pc.inventory.values():
-                        try:
-                            if obj.get_property('is_lit', False):
-                                has_light = True
-                                break
-                        except Exception:
-                            continue
-                    if has_light:
-                        break
+            # Only characters in this room can carry light into it
+            has_light = is_dark and current_room.has_carried_light_source()
             if is_dark and not has_light:
                 # Too dark to see objects, but show exits for navigation
                 feedback_messages.append("It's too dark to see anything here.")
@@ -270,15 +267,7 @@ def look_at_target(game_master: Any, player_char: Character, action_config: Any,
                                 message_template = effect.get('message', '')
                                 if message_template:
                                     # Replace template variables
-                                    message = message_template.replace('{{player_name}}', player_char.get_display_name())
-                                    # Replace player property templates
-                                    import re
-                                    property_pattern = r'\{\{player_property:(\w+)\}\}'
-                                    def replace_property(match):
-                                        prop_name = match.group(1)
-                                        # Get the updated value after increment
-                                        return str(player_char.get_property(prop_name, 0))
-                                    message = re.sub(property_pattern, replace_property, message)
+                                    message = render_template(message_template, {'player_name': player_char.get_display_name()}, player_char)
                                     observers = effect.get('observers', ['room_characters'])
                                     events_generated.append(Event(
                                         message=message,
@@ -362,16 +351,7 @@ def handle_talk_action(game_master: Any, player_char: Character, action_config:
                         message_template = effect.get('message', '')
                         if message_template:
                             # Replace template variables
-                            message = message_template.replace('{{player_name}}', player_char.get_display_name())
-                            message = message.replace('{{target}}', target_character.get('name', target_name))
-                            # Replace player property templates
-                            import re
-                            property_pattern = r'\{\{player_property:(\w+)\}\}'
-                            def replace_property(match):
-                                prop_name = match.group(1)
-                                # Get the updated value after increment
-                                return str(player_char.get_property(prop_name, 0))
-                            message = re.sub(property_pattern, replace_property, message)
+                            message = render_template(message_template, {'player_name': player_char.get_display_name(), 'target': target_character.get('name', target_name)}, player_char)
                             observers = effect.get('observers', ['room_characters'])
                             events_generated.append(Event(
                                 message=message,
@@ -452,15 +432,7 @@ def handle_expose_action(game_master: Any, player_char: Character, action_config
                         message_template = effect.get('message', '')
                         if message_template:
                             # Replace template variables
-                            message = message_template.replace('{{player_name}}', player_char.get_display_name())
-                            message = message.replace('{{target}}', target_character.get('name', target_name))
-                            # Replace player property templates
-                            import re
-                            property_pattern = r'\{\{player_property:(\w+)\}\}'
-                            def replace_property(match):
-                                prop_name = match.group(1)
-                                return str(player_char.get_property(prop_name, 0))
-                            message = re.sub(property_pattern, replace_property, message)
+                            message = render_template(message_template, {'player_name': player_char.get_display_name(), 'target': target_character.get('name', target_name)}, player_char)
                             observers = effect.get('observers', ['room_characters'])
                             events_generated.append(Event(
                                 message=message,
@@ -541,15 +513,7 @@ def handle_arrest_action(game_master: Any, player_char: Character, action_config
                         message_template = effect.get('message', '')
                         if message_template:
                             # Replace template variables
-                            message = message_template.replace('{{player_name}}', player_char.get_display_name())
-                            message = message.replace('{{target}}', target_character.get('name', target_name))
-                            # Replace player property templates
-                            import re
-                            property_pattern = r'\{\{player_property:(\w+)\}\}'
-                            def replace_property(match):
-                                prop_name = match.group(1)
-                                return str(player_char.get_property(prop_name, 0))
-                            message = re.sub(property_pattern, replace_property, message)
+                            message = render_template(message_template, {'player_name': player_char.get_display_name(), 'target': target_character.get('name', target_name)}, player_char)
                             observers = effect.get('observers', ['room_characters'])
                             events_generated.append(Event(
                                 message=message,
@@ -1233,15 +1197,7 @@ def handle_pickup_action(game_master: Any, player_char: Character, action_config
                         feedback_messages.append(f"You discovered crucial information! {property_name.replace('_', ' ').title()}: {property_value}")
                 elif effect.get('type') == 'generate_event':
                     # Generate the event from the pickup_action interaction
-                    message = effect.get('message', '').replace('{{player_name}}', player_char.get_display_name())
-                    # Replace player property placeholders
-                    if '{{player_property:' in message:
-                        import re
-                        def replace_property(match):
-                            prop_name = match.group(1)
-                            prop_value = player_char.properties.get(prop_name, 0)
-                            return str(prop_value)
-                        message = re.sub(r'\{\{player_property:([^}]+)\}\}', replace_property, message)
+                    message = render_template(effect.get('message', ''), {'player_name': player_char.get_display_name()}, player_char)
                     
                     observers = effect.get('observers', ['room_characters'])
                     action_event = Event(
@@ -1352,6 +1308,7 @@ def handle_drop_action(game_master: Any, player_char: Character, action_config:
     # Move object from inventory to room
     del player_char.inventory[target_object_id]
     current_room.objects[target_object_id] = target_object
+    current_room.touch()
     
     # Update object's location
     target_object.current_location_id = player_char.current_room_id
@@ -1992,15 +1949,6 @@ def handle_use_action(game_master: Any, player_char: Character, action_config: A
                 target_entity.remove_tag(tag)
         elif eff_type == 'generate_event':
             base_template = eff.get('message', '')
-            def _normalize(template: str) -> str:
-                if not isinstance(template, str):
-                    return template
-                return (
-                    template
-                    .replace('{{player_name}}', '{player_name}')
-                    .replace('{{object_name}}', '{object_name}')
-                    .replace('{{target_name}}', '{target_name}')
-                )
             resolver = getattr(game_master, '_resolve_effect_message', None)
             variant_template = resolver(eff, player_char) if callable(resolver) else None
             if not isinstance(variant_template, str):
@@ -2016,19 +1964,12 @@ def handle_use_action(game_master: Any, player_char: Character, action_config: A
             })
 
             # Actor-facing feedback uses the variant when available
-            actor_template = _normalize(variant_template or base_template)
-            try:
-                actor_message = actor_template.format(**fmt_params)
-            except Exception:
-                actor_message = actor_template
+            actor_message = _render_format_message(variant_template or base_template, fmt_params)
             if actor_message:
                 feedback_messages.append(actor_message)
 
             # Broadcast event remains generic for other observers
-            try:
-                event_message = _normalize(base_template).format(**fmt_params)
-            except Exception:
-                event_message = _normalize(base_template)
+            event_message = _render_format_message(base_template, fmt_params)
             events_generated.append(Event(
                 message=event_message,
                 event_type="player_action",
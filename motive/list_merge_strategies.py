@@ -3,6 +3,8 @@ List merging strategies for hierarchical configuration system.
 
 This module provides different strategies for merging lists in hierarchical configs,
 supporting various use cases like override, append, prepend, and remove operations.
+Every strategy returns a new list and leaves its inputs untouched; concatenation
+builds that list in one step rather than copying each input first.
 """
 
 from typing import Any, List, Dict, Union
@@ -76,18 +78,30 @@ class ListMerger:
     
     def _append_strategy(self, base_list: List[Any], override_list: List[Any], **kwargs) -> List[Any]:
         """Add items from override list to the end of base list."""
-        return base_list.copy() + override_list.copy()
+        return base_list + override_list
     
     def _prepend_strategy(self, base_list: List[Any], override_list: List[Any], **kwargs) -> List[Any]:
         """Add items from override list to the beginning of base list."""
-        return override_list.copy() + base_list.copy()
+        return override_list + base_list
     
     def _merge_unique_strategy(self, base_list: List[Any], override_list: List[Any], **kwargs) -> List[Any]:
         """Merge lists and remove duplicates, preserving order."""
         result = base_list.copy()
+        seen = set()
+        for item in result:
+            try:
+                seen.add(item)
+            except TypeError:
+                pass  # Unhashable items fall back to a linear scan below
         for item in override_list:
-            if item not in result:
-                result.append(item)
+            try:
+                if item in seen:
+                    continue
+                seen.add(item)
+            except TypeError:
+                if item in result:
+                    continue
+            result.append(item)
         return result
     
     def _remove_items_strategy(self, base_list: List[Any], override_list: List[Any], **kwargs) -> List[Any]:
@@ -145,6 +159,16 @@ class ListMerger:
         # Start with base list
         result = base_list.copy()
         
+        # Index of the first item carrying each key value
+        index_of: Dict[Any, int] = {}
+        unhashable_keys = False
+        for i, existing_item in enumerate(result):
+            if isinstance(existing_item, dict) and actual_key_field in existing_item:
+                try:
+                    index_of.setdefault(existing_item[actual_key_field], i)
+                except TypeError:
+                    unhashable_keys = True
+        
         # Process each override item
         for override_item in override_list:
             if not isinstance(override_item, dict) or actual_key_field not in override_item:
@@ -153,13 +177,14 @@ class ListMerger:
                 continue
             
             # Find existing item with same key
-            found_index = None
-            for i, existing_item in enumerate(result):
-                if (isinstance(existing_item, dict) and 
-                    actual_key_field in existing_item and 
-                    existing_item[actual_key_field] == override_item[actual_key_field]):
-                    found_index = i
-                    break
+            key_value = override_item[actual_key_field]
+            try:
+                found_index = index_of.get(key_value)
+            except TypeError:
+                found_index = None
+                unhashable_keys = True
+            if found_index is None and unhashable_keys:
+                found_index = self._find_by_key(result, actual_key_field, key_value)
             
             if found_index is not None:
                 # Update existing item
@@ -167,9 +192,23 @@ class ListMerger:
             else:
                 # Add new item
                 result.append(override_item)
+                try:
+                    index_of.setdefault(key_value, len(result) - 1)
+                except TypeError:
+                    pass
         
         return result
     
+    @staticmethod
+    def _find_by_key(items: List[Any], key_field: str, key_value: Any) -> Union[int, None]:
+        """Linear search fallback for unhashable key values."""
+        for i, existing_item in enumerate(items):
+            if (isinstance(existing_item, dict) and 
+                key_field in existing_item and 
+                existing_item[key_field] == key_value):
+                return i
+        return None
+    
     def _handle_special_markers(self, base_list: List[Any], override_list: List[Any]) -> List[Any]:
         """Handle special markers in override list for advanced operations."""
         result = base_list.copy()
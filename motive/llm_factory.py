@@ -1,9 +1,11 @@
-from typing import Type
+from typing import Any, Dict, List, Type
 import time
 import asyncio
 import os
 import logging
+from contextvars import ContextVar
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk
 
 # Dynamic imports for specific chat models
 try:
@@ -41,6 +43,10 @@ PROVIDER_API_KEYS = {
     # "cohere": "COHERE_API_KEY",
 }
 
+# Providers whose prompt caching needs explicit cache-control markers on messages.
+# OpenAI and Gemini cache long identical prompt prefixes automatically.
+CACHE_CONTROL_PROVIDERS = {"anthropic"}
+
 # Request timeout configuration (seconds)
 DEFAULT_LLM_REQUEST_TIMEOUT = float(os.getenv("MOTIVE_LLM_REQUEST_TIMEOUT", "45"))
 
@@ -85,10 +91,28 @@ RATE_LIMIT_CONFIG = {
 _rate_limit_state = {
     "request_counts": {},  # {"provider": {"minute": count, "hour": count}}
     "last_reset": {},      # {"provider": {"minute": timestamp, "hour": timestamp}}
-    "active_requests": {}  # {"provider": count}
+    "active_requests": {},  # {"provider": count}
+    "pressure": {}         # {"provider": {"requests": n, "throttled": n, "rate_limit_errors": n}}
 }
 
 
+def _record_pressure(provider: str, event: str):
+    """Count requests and rate-limit hits (local throttling or provider 429s) per provider."""
+    counters = _rate_limit_state["pressure"].setdefault(
+        provider, {"requests": 0, "throttled": 0, "rate_limit_errors": 0})
+    counters[event] += 1
+
+
+def rate_limit_pressure() -> Dict[str, Dict[str, int]]:
+    """
+    Cumulative request and rate-limit counters per provider for this process.
+
+    The worker pool compares successive snapshots to back off when
+    requests start getting throttled.
+    """
+    return {provider: dict(counters) for provider, counters in _rate_limit_state["pressure"].items()}
+
+
 def _check_rate_limit(provider: str) -> bool:
     """
     Check if the provider is within rate limits.
@@ -158,11 +182,16 @@ def _increment_rate_limit(provider: str):
 
 logger = logging.getLogger(__name__)
 
+# The narrative logger of the game making the request; each game sets it for the task it runs in,
+# so games sharing a process (batch mode, pool workers) keep their warnings in their own game.log
+game_narrative_logger: ContextVar[logging.Logger] = ContextVar(
+    "game_narrative_logger", default=logging.getLogger("GameNarrative"))
+
 
 def _log_llm_warning(message: str):
     """Emit warnings both to module logger and the GameNarrative logger if available."""
     logger.warning(message)
-    game_logger = logging.getLogger("GameNarrative")
+    game_logger = game_narrative_logger.get()
     try:
         game_logger.warning(message)
     except Exception:
@@ -173,7 +202,7 @@ def _log_llm_warning(message: str):
 def _log_llm_error(message: str):
     """Emit errors both to module logger and the GameNarrative logger if available."""
     logger.error(message)
-    game_logger = logging.getLogger("GameNarrative")
+    game_logger = game_narrative_logger.get()
     try:
         game_logger.error(message)
     except Exception:
@@ -208,6 +237,7 @@ async def _rate_limited_request(
     while retry_count <= max_retries:
         # Check rate limit before making request
         if not _check_rate_limit(provider):
+            _record_pressure(provider, "throttled")
             if retry_count < max_retries:
                 _log_llm_warning(
                     f"Rate limit exceeded for {provider}, waiting {retry_delay}s before retry {retry_count + 1}/{max_retries}"
@@ -222,6 +252,7 @@ async def _rate_limited_request(
         try:
             # Make the request
             _increment_rate_limit(provider)
+            _record_pressure(provider, "requests")
             result = await asyncio.wait_for(
                 llm_client.ainvoke(messages, **kwargs),
                 timeout=timeout,
@@ -244,6 +275,7 @@ async def _rate_limited_request(
         except Exception as e:
             error_str = str(e).lower()
             if "rate limit" in error_str or "quota" in error_str or "429" in error_str:
+                _record_pressure(provider, "rate_limit_errors")
                 if retry_count < max_retries:
                     _log_llm_warning(
                         f"Rate limit error for {provider}: {e}"
@@ -264,6 +296,68 @@ async def _rate_limited_request(
     raise RuntimeError(f"Unexpected error in rate-limited request for {provider}")
 
 
+async def _rate_limited_stream(
+    provider: str,
+    llm_client: BaseChatModel,
+    messages,
+    timeout: float | None = None,
+    **kwargs,
+):
+    """
+    Stream a response from the LLM client once the provider is within rate limits.
+    The timeout applies to each chunk; a stream is not retried once it has started.
+    """
+    if provider in RATE_LIMIT_CONFIG:
+        config = RATE_LIMIT_CONFIG[provider]
+        if timeout is None:
+            timeout = config.get("request_timeout", DEFAULT_LLM_REQUEST_TIMEOUT)
+        retry_delay = config["retry_delay"]
+        for attempt in range(config["max_retries"] + 1):
+            if _check_rate_limit(provider):
+                break
+            _record_pressure(provider, "throttled")
+            if attempt == config["max_retries"]:
+                raise RuntimeError(f"Rate limit exceeded for {provider} after {config['max_retries']} retries")
+            _log_llm_warning(
+                f"Rate limit exceeded for {provider}, waiting {retry_delay}s before retry {attempt + 1}/{config['max_retries']}"
+            )
+            await asyncio.sleep(retry_delay)
+            retry_delay *= config.get("backoff_multiplier", 1.0)
+        _increment_rate_limit(provider)
+        _record_pressure(provider, "requests")
+
+    stream = llm_client.astream(messages, **kwargs)
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(stream.__anext__(), timeout=timeout)
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError as e:
+                raise TimeoutError(f"LLM stream from {provider} timed out after {timeout}s without a chunk") from e
+            yield chunk
+    finally:
+        await stream.aclose()
+
+
+def apply_cache_markers(provider: str, messages: List[Any], breakpoints: List[int]) -> List[Any]:
+    """
+    Return messages with provider cache-control markers after the given message indexes.
+    Marked messages are copies with their text in a content block; the inputs are not changed.
+    """
+    if provider not in CACHE_CONTROL_PROVIDERS:
+        return messages
+    marked = list(messages)
+    for index in breakpoints:
+        message = marked[index]
+        if not isinstance(message.content, str):
+            continue
+        marked[index] = message.model_copy(update={"content": [
+            {"type": "text", "text": message.content, "cache_control": {"type": "ephemeral"}}
+        ]})
+    return marked
+
+
 def create_llm_client(provider: str, model: str) -> BaseChatModel:
     """
     Factory function to create an LLM client based on the provider string from config.
@@ -277,6 +371,11 @@ def create_llm_client(provider: str, model: str) -> BaseChatModel:
         mock_response = MagicMock()
         mock_response.content = "> look"
         mock_llm.ainvoke = AsyncMock(return_value=mock_response)
+
+        async def astream(messages, **kwargs):
+            yield AIMessageChunk(content="> look")
+
+        mock_llm.astream = astream
         return mock_llm
 
     llm_class = LLM_PROVIDER_MAP.get(provider)
@@ -321,6 +420,10 @@ def create_llm_client(provider: str, model: str) -> BaseChatModel:
                     **kwargs,
                 )
             
+            def astream(self, messages, **kwargs):
+                timeout = kwargs.pop("timeout", None)
+                return _rate_limited_stream(self.provider, self.base_llm, messages, timeout=timeout, **kwargs)
+            
             def invoke(self, messages, **kwargs):
                 # For synchronous calls, we'll need to handle this differently
                 # For now, just call the base method
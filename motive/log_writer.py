@@ -0,0 +1,298 @@
+"""
+Asynchronous, batched writer for the game and chat log files.
+
+logging.FileHandler opens, writes and flushes on the thread that logs, so
+every narrative line and chat message blocks the game's event loop on file
+I/O. QueueFileHandler only queues the record: one LogWriter thread per
+process opens the files, formats the queued records, writes them in batches
+and fsyncs each file at most once per fsync_interval (and on flush/close).
+Log files can be written gzip- or zstd-compressed (zstd needs the optional
+``zstandard`` package).
+
+Messages that are expensive to build (reports, condition trees) can be
+wrapped in LazyMessage, so they are only built when a handler emits them.
+"""
+
+import atexit
+import gzip
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class LazyMessage:
+    """A log message built on first use; never built when the level is disabled."""
+
+    __slots__ = ("_build", "_text")
+
+    def __init__(self, build: Callable[[], Any]):
+        self._build = build
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = str(self._build())
+        return self._text
+
+
+def log_file_path(filename: str, compression: Optional[str] = None) -> str:
+    """The path a log is written to: filename plus the compression suffix."""
+    if compression is None:
+        return filename
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown log compression '{compression}' (expected one of {', '.join(COMPRESSION_SUFFIXES)})")
+    if compression == "zstd" and zstandard is None:
+        raise ImportError("zstd log compression requires the 'zstandard' package")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    return filename if filename.endswith(suffix) else filename + suffix
+
+
+class _LogFile:
+    """One open log file; only touched by the writer thread."""
+
+    def __init__(self, path: str, mode: str, encoding: str, compression: Optional[str]):
+        self.path = path
+        self.mode = mode
+        self.encoding = encoding
+        self.compression = compression
+        self.raw = None
+        self.stream = None
+        self.unsynced = False
+
+    def open(self):
+        self.raw = open(self.path, self.mode + "b")
+        if self.compression == "gzip":
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode="wb")
+        elif self.compression == "zstd":
+            self.stream = zstandard.ZstdCompressor().stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+
+    def write(self, text: str):
+        if self.raw is None:
+            self.open()
+        self.stream.write(text.encode(self.encoding, errors="backslashreplace"))
+        self.unsynced = True
+
+    def flush(self):
+        # Compressed streams are only flushed on sync; flushing them per batch costs ratio
+        if self.raw is not None and self.stream is self.raw:
+            self.raw.flush()
+
+    def sync(self):
+        if self.raw is None or not self.unsynced:
+            return
+        if self.stream is not self.raw:
+            self.stream.flush()
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        self.unsynced = False
+
+    def close(self):
+        if self.raw is None:
+            return
+        self.sync()
+        if self.stream is not self.raw:
+            self.stream.close()
+        self.raw.close()
+        self.raw = self.stream = None
+
+
+class LogWriter:
+    """
+    The writer thread and the files it owns.
+
+    Callers only put operations on a queue; the thread drains up to
+    max_batch of them at a time, writes them, flushes the touched files
+    and fsyncs every fsync_interval seconds.
+    """
+
+    def __init__(self, fsync_interval: float = 1.0, max_batch: int = 1000):
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        self.batches_written = 0
+        self.records_written = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._files: Dict[int, _LogFile] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _ensure_running(self):
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name="motive-log-writer", daemon=True)
+                self._thread.start()
+
+    def open(self, path: str, mode: str = "a", encoding: str = "utf-8", compression: Optional[str] = None) -> _LogFile:
+        """Register a log file; it is opened by the writer thread on first write."""
+        log_file = _LogFile(path, mode, encoding, compression)
+        self._ensure_running()
+        self._queue.put(("open", log_file, None))
+        return log_file
+
+    def write(self, log_file: _LogFile, handler: logging.Handler, record: logging.LogRecord):
+        self._ensure_running()
+        self._queue.put(("write", log_file, (handler, record)))
+
+    def flush(self, log_file: Optional[_LogFile] = None, timeout: Optional[float] = 10.0) -> bool:
+        """Wait until everything queued so far is written and fsynced."""
+        return self._wait_for("flush", log_file, timeout)
+
+    def close(self, log_file: _LogFile, timeout: Optional[float] = 10.0) -> bool:
+        """Write out, fsync and close one log file."""
+        return self._wait_for("close", log_file, timeout)
+
+    def _wait_for(self, operation: str, log_file: Optional[_LogFile], timeout: Optional[float]) -> bool:
+        if self._thread is None or self._pid != os.getpid():
+            return True  # Nothing was ever queued by this process
+        self._ensure_running()
+        done = threading.Event()
+        self._queue.put((operation, log_file, done))
+        return done.wait(timeout)
+
+    def _run(self):
+        last_sync = time.monotonic()
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.fsync_interval)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            touched = set()
+            waiters = []
+            for operation, log_file, argument in batch:
+                try:
+                    if operation == "open":
+                        self._files[id(log_file)] = log_file
+                    elif operation == "write":
+                        handler, record = argument
+                        log_file.write(handler.format(record) + handler.terminator)
+                        touched.add(log_file)
+                        self.records_written += 1
+                    else:
+                        waiters.append((operation, log_file, argument))
+                except Exception as e:
+                    self._report_error(log_file, e)
+
+            for log_file in touched:
+                self._guarded(log_file, log_file.flush)
+            if batch:
+                self.batches_written += 1
+
+            now = time.monotonic()
+            if waiters or now - last_sync >= self.fsync_interval:
+                for log_file in list(self._files.values()):
+                    self._guarded(log_file, log_file.sync)
+                last_sync = now
+            for operation, log_file, done in waiters:
+                if operation == "close" and self._files.pop(id(log_file), None) is not None:
+                    self._guarded(log_file, log_file.close)
+                done.set()
+
+    def _guarded(self, log_file: _LogFile, operation: Callable[[], None]):
+        try:
+            operation()
+        except Exception as e:
+            self._report_error(log_file, e)
+
+    @staticmethod
+    def _report_error(log_file: Optional[_LogFile], error: Exception):
+        if logging.raiseExceptions and sys.stderr:
+            path = log_file.path if log_file is not None else "?"
+            sys.stderr.write(f"--- Logging error ---\nCould not write log file {path}: {error!r}\n")
+
+    def close_all(self, timeout: Optional[float] = 10.0):
+        for log_file in list(self._files.values()):
+            self.close(log_file, timeout)
+
+
+_writer: Optional[LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """The process-wide log writer, created on first use."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = LogWriter()
+                atexit.register(_writer.close_all)
+    return _writer
+
+
+def flush_logs(timeout: Optional[float] = 10.0) -> bool:
+    """Wait until all queued log records are written and fsynced."""
+    return _writer.flush(timeout=timeout) if _writer is not None else True
+
+
+class QueueFileHandler(logging.Handler):
+    """
+    A logging.FileHandler replacement that writes through the LogWriter thread.
+
+    emit() resolves the message (so records do not hold on to mutable
+    arguments) and queues the record; the timestamp and line formatting
+    happen on the writer thread.
+    """
+
+    terminator = "\n"
+
+    def __init__(self, filename: str, mode: str = "a", encoding: str = "utf-8",
+                 compression: Optional[str] = None, writer: Optional[LogWriter] = None):
+        super().__init__()
+        self.baseFilename = os.path.abspath(log_file_path(os.fspath(filename), compression))
+        self.mode = mode
+        self.encoding = encoding
+        self.compression = compression
+        self.writer = writer or get_log_writer()
+        self._log_file: Optional[_LogFile] = self.writer.open(self.baseFilename, mode, encoding, compression)
+
+    def emit(self, record: logging.LogRecord):
+        if self._log_file is None:
+            return
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info and not record.exc_text:
+                record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+            self.writer.write(self._log_file, self, record)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        if self._log_file is not None:
+            self.writer.flush(self._log_file)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._log_file is not None:
+                self.writer.close(self._log_file)
+                self._log_file = None
+        finally:
+            self.release()
+            super().close()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.baseFilename} ({logging.getLevelName(self.level)})>"
@@ -0,0 +1,224 @@
+"""
+Precompiled message templates for effect and hook messages.
+
+Config messages use two placeholder styles:
+
+* ``braces``: the double-brace placeholders filled in by the interaction
+  handlers in ``core_hooks`` (``{{player_name}}``, ``{{target}}``,
+  ``{{object_name}}``, ``{{target_name}}`` and ``{{player_property:X}}``).
+  Other text, including single braces, is literal.
+* ``format``: generate_event messages filled in with ``str.format`` and the
+  action parameters. The three legacy double-brace names are accepted as
+  aliases of ``{player_name}``, ``{object_name}`` and ``{target_name}``.
+
+compile_template parses a template once into literal text and typed
+placeholders, so rendering is a single join. Compiled templates are shared
+by (source, style); GameMaster precompiles every config message at load
+time and reports unknown placeholders there instead of mid-game. Unknown
+braces placeholders still render as written, as before.
+"""
+
+import re
+import string
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+
+BRACES = "braces"
+FORMAT = "format"
+
+# Placeholder kinds understood in the braces style
+PLACEHOLDER_KINDS = {"player_name", "target", "object_name", "target_name", "player_property"}
+# Names the format style always provides besides the action parameters
+FORMAT_BUILTINS = {"player_name", "object_name", "target_name"}
+
+_BRACE_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+_LEGACY_FORMAT_NAMES = (
+    ("{{player_name}}", "{player_name}"),
+    ("{{object_name}}", "{object_name}"),
+    ("{{target_name}}", "{target_name}"),
+)
+_FORMATTER = string.Formatter()
+
+
+class TemplateError(ValueError):
+    """A message template that cannot be compiled."""
+    pass
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    kind: str                   # A PLACEHOLDER_KINDS name, or "param" for format-style fields
+    name: str                   # Value key; the property name for player_property
+    source: str = ""            # Original token, rendered as-is when a braces value is missing
+
+
+Part = Union[str, Placeholder]
+
+
+def normalize_format_template(template: str) -> str:
+    """Convert legacy double-brace placeholders to str.format-compatible tokens."""
+    if not template or not isinstance(template, str):
+        return template
+    for legacy, replacement in _LEGACY_FORMAT_NAMES:
+        template = template.replace(legacy, replacement)
+    return template
+
+
+class MessageTemplate:
+    """A parsed template: literal text and placeholders rendered by one join."""
+
+    __slots__ = ("source", "style", "parts", "params", "unknown", "_fallback")
+
+    def __init__(self, source: str, style: str = BRACES):
+        self.source = source
+        self.style = style
+        self._fallback: Optional[str] = None  # Format source for fields a plain lookup cannot render
+        if style == BRACES:
+            self.parts = tuple(_parse_braces(source))
+        elif style == FORMAT:
+            self.parts = tuple(self._parse_format(normalize_format_template(source)))
+        else:
+            raise TemplateError(f"Unknown template style '{style}'")
+        placeholders = [part for part in self.parts if isinstance(part, Placeholder)]
+        self.params = frozenset(part.name for part in placeholders if part.kind == "param")
+        self.unknown = tuple(part.source for part in placeholders if part.kind == "unknown")
+
+    def _parse_format(self, template: str) -> Iterator[Part]:
+        try:
+            fields = list(_FORMATTER.parse(template))
+        except ValueError as e:
+            raise TemplateError(f"Invalid message template {template!r}: {e}") from e
+        for literal, field_name, format_spec, conversion in fields:
+            if literal:
+                yield literal
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                # Attribute/index lookups and format specs keep str.format semantics
+                self._fallback = template
+                yield Placeholder("param", re.split(r"[.\[]", field_name)[0] or field_name)
+            else:
+                yield Placeholder("param", field_name)
+
+    def render(self, values: Optional[Mapping[str, Any]] = None, player: Any = None) -> str:
+        """
+        Fill in the placeholders.
+
+        Format-style params missing from values raise KeyError, as str.format
+        would. A braces placeholder without a value is left as written.
+        player_property:X reads player.get_property(X, 0).
+        """
+        values = values or {}
+        if self._fallback is not None:
+            return self._fallback.format(**values)
+        rendered = []
+        for part in self.parts:
+            if part.__class__ is str:
+                rendered.append(part)
+            elif part.kind == "param":
+                rendered.append(str(values[part.name]))
+            elif part.kind == "player_property":
+                rendered.append(str(player.get_property(part.name, 0)) if player is not None else part.source)
+            elif part.kind != "unknown" and part.name in values:
+                rendered.append(str(values[part.name]))
+            else:
+                rendered.append(part.source)
+        return "".join(rendered)
+
+    def __repr__(self):
+        return f"MessageTemplate({self.source!r}, style={self.style!r})"
+
+
+def _parse_braces(template: str) -> Iterator[Part]:
+    position = 0
+    for match in _BRACE_PATTERN.finditer(template):
+        if match.start() > position:
+            yield template[position:match.start()]
+        kind, _, argument = match.group(1).strip().partition(":")
+        if kind not in PLACEHOLDER_KINDS or (kind == "player_property") != bool(argument.strip()):
+            yield Placeholder("unknown", match.group(1), match.group(0))
+        elif kind == "player_property":
+            yield Placeholder(kind, argument.strip(), match.group(0))
+        else:
+            yield Placeholder(kind, kind, match.group(0))
+        position = match.end()
+    if position < len(template):
+        yield template[position:]
+
+
+_compiled: Dict[Tuple[str, str], MessageTemplate] = {}
+
+
+def compile_template(source: str, style: str = BRACES) -> MessageTemplate:
+    """The compiled template for source, parsed on first use and shared afterwards."""
+    key = (source, style)
+    template = _compiled.get(key)
+    if template is None:
+        template = _compiled[key] = MessageTemplate(source, style)
+    return template
+
+
+def render_template(source: str, values: Optional[Mapping[str, Any]] = None, player: Any = None,
+                    style: str = BRACES) -> str:
+    """Compile (once) and render a template."""
+    return compile_template(source, style).render(values, player)
+
+
+def iter_messages(spec: Any) -> Iterator[str]:
+    """Yield every message and message_variants message in a nested effect/interaction spec."""
+    if isinstance(spec, dict):
+        items = spec.items()
+    elif isinstance(spec, (list, tuple)):
+        items = ((None, item) for item in spec)
+    elif hasattr(spec, "model_dump"):
+        items = spec.model_dump().items()
+    else:
+        return
+    for key, value in items:
+        if key == "message" and isinstance(value, str) and value:
+            yield value
+        elif isinstance(value, (dict, list, tuple)) or hasattr(value, "model_dump"):
+            yield from iter_messages(value)
+
+
+def precompile_action_messages(action_id: str, action: Any) -> List[str]:
+    """
+    Compile every effect message of an action in the format style.
+
+    Returns problems found: invalid templates and fields that are neither
+    action parameters nor the built-in names.
+    """
+    problems = []
+    parameters = action.get("parameters", []) if isinstance(action, dict) else getattr(action, "parameters", []) or []
+    known = set(FORMAT_BUILTINS)
+    for parameter in parameters or []:
+        known.add(parameter.get("name") if isinstance(parameter, dict) else getattr(parameter, "name", None))
+    effects = action.get("effects", []) if isinstance(action, dict) else getattr(action, "effects", []) or []
+    for message in iter_messages(effects):
+        try:
+            template = compile_template(message, FORMAT)
+        except TemplateError as e:
+            problems.append(f"action '{action_id}': {e}")
+            continue
+        unknown = sorted(template.params - known)
+        if unknown:
+            problems.append(f"action '{action_id}': unknown placeholder(s) {', '.join(unknown)} in {message!r}")
+    return problems
+
+
+def precompile_interaction_messages(owner: str, interactions: Any) -> List[str]:
+    """
+    Compile every interaction message in both styles (handlers differ in
+    which one they use); returns the unknown braces placeholders found.
+    """
+    problems = []
+    for message in iter_messages(interactions):
+        template = compile_template(message, BRACES)
+        if template.unknown:
+            problems.append(f"{owner}: unknown placeholder(s) {', '.join(template.unknown)} in {message!r}")
+        try:
+            compile_template(message, FORMAT)
+        except TemplateError:
+            pass  # The generic interaction handler shows such messages unformatted
+    return problems
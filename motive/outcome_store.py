@@ -0,0 +1,298 @@
+"""
+Columnar store of finished-game outcomes.
+
+Every finished game appends one row per player (config hash, seed, model,
+character, motive, rounds, AP spent, actions per type, tokens, LLM latency
+and outcome). Rows first land in small per-game files under ``pending/``
+(written atomically, so parallel workers never interleave). compact() folds
+pending rows into immutable segment files that store each column
+separately:
+
+* numeric columns as zlib-compressed float64 arrays (NaN for missing),
+* text columns dictionary-encoded: a value list plus int32 codes.
+
+A query only decompresses the columns it needs and never touches the
+per-game log directories, so aggregating hundreds of thousands of games
+takes about a second. ``motive-util stats`` is the command-line front end.
+"""
+
+import json
+import math
+import os
+import struct
+import time
+import uuid
+import zlib
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+SEGMENT_MAGIC = b"MOTIVECOL1\n"
+SEGMENT_SUFFIX = ".mcol"
+NUMERIC = "f8"
+TEXT = "dict"
+
+DEFAULT_GROUP_BY = ("provider", "model")
+
+
+def flatten_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Turn nested values into flat columns: {"actions": {"look": 2}} -> {"actions.look": 2}."""
+    flat = {}
+    for key, value in row.items():
+        if isinstance(value, Mapping):
+            for sub_key, sub_value in value.items():
+                flat[f"{key}.{sub_key}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def _encode_columns(rows: Sequence[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    names = sorted({name for row in rows for name in row})
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        if all(value is None or isinstance(value, (int, float)) for value in values):
+            data = array("d", (math.nan if value is None else float(value) for value in values))
+            columns[name] = {"type": NUMERIC, "data": data.tobytes()}
+        else:
+            dictionary: Dict[str, int] = {}
+            codes = array("i")
+            for value in values:
+                if value is None:
+                    codes.append(-1)
+                else:
+                    codes.append(dictionary.setdefault(str(value), len(dictionary)))
+            columns[name] = {"type": TEXT, "dictionary": list(dictionary), "data": codes.tobytes()}
+    return columns
+
+
+class Segment:
+    """One immutable columnar file; columns are decompressed on first use."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+                raise ValueError(f"{path} is not an outcome store segment")
+            header_length, = struct.unpack("<I", f.read(4))
+            self.header = json.loads(f.read(header_length).decode("utf-8"))
+            self._data_offset = f.tell()
+        self.rows: int = self.header["rows"]
+        self.sources: List[str] = self.header.get("sources", [])
+        self._cache: Dict[str, Any] = {}
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.header["columns"])
+
+    def column(self, name: str):
+        """(type, values, dictionary) for a column; None when the segment lacks it."""
+        if name in self._cache:
+            return self._cache[name]
+        spec = self.header["columns"].get(name)
+        if spec is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset + spec["offset"])
+            raw = zlib.decompress(f.read(spec["length"]))
+        values = array("d" if spec["type"] == NUMERIC else "i")
+        values.frombytes(raw)
+        result = self._cache[name] = (spec["type"], values, spec.get("dictionary"))
+        return result
+
+    @staticmethod
+    def write(path: Path, rows: Sequence[Mapping[str, Any]], sources: Sequence[str] = ()) -> None:
+        """Write rows as a segment (via a temporary file, so readers never see half a segment)."""
+        columns = _encode_columns(rows)
+        header = {"rows": len(rows), "created": time.time(), "sources": list(sources), "columns": {}}
+        blobs = []
+        offset = 0
+        for name, column in columns.items():
+            blob = zlib.compress(column["data"], 6)
+            spec = {"type": column["type"], "offset": offset, "length": len(blob)}
+            if column["type"] == TEXT:
+                spec["dictionary"] = column["dictionary"]
+            header["columns"][name] = spec
+            blobs.append(blob)
+            offset += len(blob)
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(SEGMENT_MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+
+
+class OutcomeStore:
+    """A directory of columnar segments plus not-yet-compacted pending rows."""
+
+    def __init__(self, directory: str, compact_threshold: int = 500):
+        self.directory = Path(directory)
+        self.pending_dir = self.directory / "pending"
+        self.compact_threshold = compact_threshold  # Pending files that trigger compaction on append
+
+    # -- writing ------------------------------------------------------------
+
+    def append(self, rows: Iterable[Mapping[str, Any]]) -> Optional[Path]:
+        """Record one game's rows; returns the pending file written."""
+        rows = [flatten_row(row) for row in rows]
+        if not rows:
+            return None
+        self.pending_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns()}-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl"
+        tmp_path = self.pending_dir / (name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str) + "\n")
+        path = self.pending_dir / name
+        os.replace(tmp_path, path)
+        if self.compact_threshold and len(self._pending_files()) >= self.compact_threshold:
+            self.compact()
+        return path
+
+    def compact(self) -> int:
+        """Fold pending rows into a new segment; returns the number of rows compacted."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_path = self.directory / "compact.lock"
+        try:
+            lock = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if time.time() - lock_path.stat().st_mtime < 300:
+                return 0  # Another process is compacting; its segment will include these rows
+            os.remove(lock_path)  # Left behind by a crashed compaction
+            return self.compact()
+        try:
+            already = {source for segment in self.segments() for source in segment.sources}
+            pending = self._pending_files()
+            fresh = [path for path in pending if path.name not in already]
+            rows = [row for path in fresh for row in self._read_pending(path)]
+            if rows:
+                Segment.write(self.directory / f"segment-{time.time_ns()}-{os.getpid()}{SEGMENT_SUFFIX}",
+                              rows, [path.name for path in fresh])
+            for path in pending:  # Also drops files a crashed compaction had already folded in
+                path.unlink(missing_ok=True)
+            return len(rows)
+        finally:
+            os.close(lock)
+            os.remove(lock_path)
+
+    # -- reading ------------------------------------------------------------
+
+    def segments(self) -> List[Segment]:
+        if not self.directory.exists():
+            return []
+        return [Segment(path) for path in sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))]
+
+    def _pending_files(self) -> List[Path]:
+        if not self.pending_dir.exists():
+            return []
+        return sorted(self.pending_dir.glob("*.jsonl"))
+
+    @staticmethod
+    def _read_pending(path: Path) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return  # Compacted meanwhile
+
+    def column_names(self) -> List[str]:
+        names = set()
+        for segment in self.segments():
+            names.update(segment.column_names)
+        for path in self._pending_files():
+            for row in self._read_pending(path):
+                names.update(row)
+        return sorted(names)
+
+    def columns(self, names: Sequence[str]) -> Dict[str, list]:
+        """Values of the named columns over all rows (None for missing values)."""
+        result: Dict[str, list] = {name: [] for name in names}
+        segments = self.segments()
+        for segment in segments:
+            for name in names:
+                column = segment.column(name)
+                if column is None:
+                    result[name].extend([None] * segment.rows)
+                    continue
+                kind, values, dictionary = column
+                if kind == NUMERIC:
+                    result[name].extend(None if value != value else value for value in values)
+                else:
+                    result[name].extend(None if code < 0 else dictionary[code] for code in values)
+        segment_sources = {source for segment in segments for source in segment.sources}
+        for path in self._pending_files():
+            if path.name in segment_sources:
+                continue
+            for row in self._read_pending(path):
+                for name in names:
+                    result[name].append(row.get(name))
+        return result
+
+    def stats(self, group_by: Sequence[str] = DEFAULT_GROUP_BY,
+              where: Optional[Mapping[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate player rows per group: distinct games, player results, wins,
+        win rate (per result) and the mean AP spent, tokens and LLM seconds.
+        where filters on exact values, compared as numbers in numeric columns.
+        """
+        metrics = ["ap_spent", "input_tokens", "output_tokens", "llm_seconds"]
+        data = self.columns(list(dict.fromkeys([*group_by, *(where or {}), "game_id", "outcome", *metrics])))
+        where = {name: _parse_filter(data[name], value) for name, value in (where or {}).items()}
+        groups: Dict[tuple, Dict[str, Any]] = defaultdict(
+            lambda: {"game_ids": set(), "results": 0, "wins": 0, **{m: 0.0 for m in metrics}})
+        total = len(data["outcome"])
+        for i in range(total):
+            if any(data[name][i] != value for name, value in where.items()):
+                continue
+            group = groups[tuple(data[name][i] for name in group_by)]
+            group["results"] += 1
+            # Rows recorded without a game id each count as their own game
+            group["game_ids"].add(data["game_id"][i] if data["game_id"][i] is not None else ("row", i))
+            if data["outcome"][i] == "won":
+                group["wins"] += 1
+            for metric in metrics:
+                value = data[metric][i]
+                if isinstance(value, (int, float)):
+                    group[metric] += value
+
+        report = []
+        for key, group in groups.items():
+            results = group["results"]
+            row = dict(zip(group_by, key))
+            row.update(games=len(group["game_ids"]), results=results, wins=group["wins"],
+                       win_rate=group["wins"] / results)
+            row.update({f"avg_{metric}": group[metric] / results for metric in metrics})
+            report.append(row)
+        report.sort(key=lambda row: (-row["results"], [str(row[name]) for name in group_by]))
+        return report
+
+
+def _parse_filter(values: Sequence[Any], text: str) -> Any:
+    """A --where value in the column's type: a number for numeric columns (true/false as 1/0), else the text."""
+    if not any(isinstance(value, (int, float)) for value in values):
+        return text
+    if text.lower() in ("true", "false"):
+        return float(text.lower() == "true")  # Booleans are stored as 1.0/0.0 (and True == 1.0 for pending rows)
+    try:
+        return float(text)
+    except ValueError:
+        return text  # Never equals a number, so nothing matches
+
+
+def format_stats(report: List[Dict[str, Any]], group_by: Sequence[str]) -> str:
+    """Render stats() output as an aligned text table."""
+    headers = [*group_by, "games", "player results", "wins", "win%", "avg AP", "avg in tok", "avg out tok",
+               "avg LLM s"]
+    lines = [[*(str(row[name]) for name in group_by), str(row["games"]), str(row["results"]), str(row["wins"]),
+              f"{row['win_rate']:.1%}", f"{row['avg_ap_spent']:.1f}", f"{row['avg_input_tokens']:.0f}",
+              f"{row['avg_output_tokens']:.0f}", f"{row['avg_llm_seconds']:.2f}"] for row in report]
+    widths = [max(len(cell) for cell in column) for column in zip(headers, *lines)]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in [headers, *lines])
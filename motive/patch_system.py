@@ -95,6 +95,9 @@ class PatchProcessor:
             PatchOperation.SET_PATH: self._handle_set_path,
             PatchOperation.UNSET_PATH: self._handle_unset_path,
         }
+        # Containers copied during the current apply_patches call (id -> object);
+        # None outside a call, where handlers patch their argument in place
+        self._owned: Optional[Dict[int, Any]] = None
     
     def apply_patches(self, base_object: Any, patches: List[Dict[str, Any]], 
                      context: Optional[Dict[str, Any]] = None) -> Any:
@@ -107,26 +110,39 @@ class PatchProcessor:
             context: Additional context for conditional operations
             
         Returns:
-            The patched object
+            The patched object (base_object is not modified; containers no
+            patch touches are shared with it rather than copied)
         """
-        result = copy.deepcopy(base_object)
+        result = copy.copy(base_object)
         context = context or {}
+        self._owned = {id(result): result}
         
-        for patch in patches:
-            operation = PatchOperation(patch["operation"])
-            handler = self.operation_handlers.get(operation)
-            
-            if not handler:
-                raise ValueError(f"Unknown patch operation: {operation}")
-            
-            # Check conditions
-            if not self._evaluate_conditions(patch, context):
-                continue
-            
-            result = handler(result, patch, context)
+        try:
+            for patch in patches:
+                operation = PatchOperation(patch["operation"])
+                handler = self.operation_handlers.get(operation)
+                
+                if not handler:
+                    raise ValueError(f"Unknown patch operation: {operation}")
+                
+                # Check conditions
+                if not self._evaluate_conditions(patch, context):
+                    continue
+                
+                result = handler(result, patch, context)
+        finally:
+            self._owned = None
         
         return result
     
+    def _writable(self, obj: Dict[str, Any], field: str) -> Any:
+        """Return obj[field], first copying it if it is still shared with the base object."""
+        value = obj[field]
+        if self._owned is not None and self._owned.get(id(value)) is not value:
+            value = obj[field] = copy.copy(value)
+            self._owned[id(value)] = value
+        return value
+    
     def _evaluate_conditions(self, patch: Dict[str, Any], context: Dict[str, Any]) -> bool:
         """Evaluate conditions for conditional patches."""
         if "if" in patch:
@@ -173,7 +189,7 @@ class PatchProcessor:
         for part in parts[:-1]:
             if part not in current:
                 current[part] = {}
-            current = current[part]
+            current = self._writable(current, part)
         
         current[parts[-1]] = value
     
@@ -196,7 +212,7 @@ class PatchProcessor:
             if isinstance(obj, dict) and patch["field"] in obj:
                 if not isinstance(obj[patch["field"]], list):
                     obj[patch["field"]] = []
-                obj[patch["field"]].extend(patch["items"])
+                self._writable(obj, patch["field"]).extend(patch["items"])
         return obj
     
     def _handle_remove(self, obj: Any, patch: Dict[str, Any], context: Dict[str, Any]) -> Any:
@@ -206,7 +222,7 @@ class PatchProcessor:
                 if isinstance(obj[patch["field"]], list):
                     for item in patch["items"]:
                         if item in obj[patch["field"]]:
-                            obj[patch["field"]].remove(item)
+                            self._writable(obj, patch["field"]).remove(item)
         return obj
     
     def _handle_merge(self, obj: Any, patch: Dict[str, Any], context: Dict[str, Any]) -> Any:
@@ -214,7 +230,7 @@ class PatchProcessor:
         if "field" in patch and "value" in patch:
             if isinstance(obj, dict) and patch["field"] in obj:
                 if isinstance(obj[patch["field"]], dict) and isinstance(patch["value"], dict):
-                    obj[patch["field"]].update(patch["value"])
+                    self._writable(obj, patch["field"]).update(patch["value"])
         return obj
     
     def _handle_replace(self, obj: Any, patch: Dict[str, Any], context: Dict[str, Any]) -> Any:
@@ -239,8 +255,9 @@ class PatchProcessor:
             if isinstance(obj, dict) and patch["field"] in obj:
                 if isinstance(obj[patch["field"]], list):
                     position = patch["position"]
+                    target = self._writable(obj, patch["field"])
                     for i, item in enumerate(patch["items"]):
-                        obj[patch["field"]].insert(position + i, item)
+                        target.insert(position + i, item)
         return obj
     
     def _handle_prepend(self, obj: Any, patch: Dict[str, Any], context: Dict[str, Any]) -> Any:
@@ -258,7 +275,7 @@ class PatchProcessor:
             if isinstance(obj, dict) and patch["field"] in obj:
                 if not isinstance(obj[patch["field"]], list):
                     obj[patch["field"]] = []
-                obj[patch["field"]].extend(patch["items"])
+                self._writable(obj, patch["field"]).extend(patch["items"])
         return obj
     
     def _handle_remove_item(self, obj: Any, patch: Dict[str, Any], context: Dict[str, Any]) -> Any:
@@ -268,7 +285,7 @@ class PatchProcessor:
                 if isinstance(obj[patch["field"]], list):
                     item = patch["item"]
                     if item in obj[patch["field"]]:
-                        obj[patch["field"]].remove(item)
+                        self._writable(obj, patch["field"]).remove(item)
         return obj
     
     def _handle_if(self, obj: Any, patch: Dict[str, Any], context: Dict[str, Any]) -> Any:
@@ -298,6 +315,10 @@ class PatchProcessor:
                     return obj
             
             if isinstance(current, dict) and parts[-1] in current:
+                # Copy the path down to the deleted key before writing
+                current = obj
+                for part in parts[:-1]:
+                    current = self._writable(current, part)
                 del current[parts[-1]]
         
         return obj
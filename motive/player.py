@@ -1,9 +1,11 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 import logging
 import os
 import time
 import asyncio
-from motive.llm_factory import create_llm_client
+from motive.llm_factory import create_llm_client, apply_cache_markers
+from motive.action_parser import ActionLineStream
+from motive.log_writer import QueueFileHandler, log_file_path
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from motive.character import Character
 
@@ -14,11 +16,22 @@ class Player:
     chat history, and logging, with performance optimizations.
     """
 
-    def __init__(self, name: str, provider: str, model: str, log_dir: str, no_file_logging: bool = False):
+    def __init__(self, name: str, provider: str, model: str, log_dir: str, no_file_logging: bool = False,
+                 llm_client: Any = None, log_compression: Optional[str] = None, game_id: Optional[str] = None):
         self.name = name
-        self.llm_client = create_llm_client(provider, model)
+        self.game_id = game_id  # Scopes the chat logger, so games sharing a process keep their own chat logs
+        self.provider = provider
+        self.model = model
+        # Callers may supply a client (e.g. batch mode); otherwise use the provider's chat model
+        self.llm_client = llm_client if llm_client is not None else create_llm_client(provider, model)
+        # Summed over LLM calls; cache_* are the input tokens read from / written to the provider's prompt cache
+        self.token_usage = {"input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0, "cache_creation_tokens": 0}
+        self.streams_cut_short = 0  # Streamed responses stopped once the turn's actions were in
         
         # Context management
+        self.prompt_prefix = []         # Stable leading messages (system, manual, character intro)
+        self.prefix_metrics = []        # Per-call prompt prefix reuse and provider cache hits
+        self._last_request_keys = []    # (type, content hash) per message of the previous request
         self.conversation_history = []  # Full history for logging
         self.recent_messages = []       # Active context (last 4-6 messages)
         self.conversation_summary = ""  # Summarized old history
@@ -34,24 +47,42 @@ class Player:
         
         self.log_dir = log_dir
         self.no_file_logging = no_file_logging
+        self.log_compression = log_compression  # None, "gzip" or "zstd"
         self.logger = self._setup_logger()
         self.character: Optional[Character] = None # Link to Character instance
 
-    def _setup_logger(self):
+    def _setup_logger(self, mode: str = "w"):
         """Sets up a dedicated logger for this player's chat history."""
-        logger = logging.getLogger(self.name)
+        logger = logging.getLogger(f"{self.game_id}.{self.name}" if self.game_id else self.name)
         logger.setLevel(logging.INFO)
         logger.propagate = False
 
         if not self.no_file_logging:
             player_log_file = os.path.join(self.log_dir, f"{self.name}_chat.log")
-            handler = logging.FileHandler(player_log_file, mode="w", encoding="utf-8")
+            # Keep the handler if it already writes this chat log (avoids duplicates in tests),
+            # but replace one left by an earlier build of the same game (a resumed game)
+            handlers = list(logger.handlers)
+            if any(getattr(h, "baseFilename", None) == os.path.abspath(log_file_path(player_log_file, self.log_compression)) for h in handlers):
+                return logger
+            for stale in handlers:
+                logger.removeHandler(stale)
+                stale.close()
+            # Written by the background log writer so chat logging never blocks a turn
+            handler = QueueFileHandler(player_log_file, mode=mode, encoding="utf-8", compression=self.log_compression)
             formatter = logging.Formatter("%(asctime)s - %(message)s")
             handler.setFormatter(formatter)
-            if not logger.handlers: # Avoid adding multiple handlers in tests
-                logger.addHandler(handler)
+            logger.addHandler(handler)
         return logger
 
+    def continue_chat_log(self):
+        """Append to the existing chat log instead of overwriting it (resumed games)."""
+        if self.no_file_logging:
+            return
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()  # Nothing was written yet, so the file was never truncated
+        self.logger = self._setup_logger(mode="a")
+
     def add_message(self, message: Any):
         """Adds a message to the player's full conversation history."""
         self.conversation_history.append(message)
@@ -65,20 +96,36 @@ class Player:
             self.recent_messages.pop(0)
             self.recent_messages.append(message)
 
+    def add_prefix_message(self, message: Any):
+        """
+        Adds a message to the stable prompt prefix.
+
+        Prefix messages open every request in the order they were added, so
+        providers can serve them from their prompt cache. Add them before the
+        first turn message; they never change afterwards.
+        """
+        self.prompt_prefix.append(message)
+        self.conversation_history.append(message)
+
     def _build_smart_context(self, new_human_message: HumanMessage) -> List[Any]:
         """
         Builds a smart context for the LLM, including system prompt,
         conversation summary, recent messages, and the new message.
+
+        The stable prompt prefix comes first so that consecutive requests share
+        the longest possible identical prefix.
         """
         context = []
         
-        # Check if there's already a system message in recent messages
-        has_system_message = any(isinstance(msg, SystemMessage) for msg in self.recent_messages)
+        # Check if there's already a system message in the prefix or recent messages
+        has_system_message = any(isinstance(msg, SystemMessage) for msg in self.prompt_prefix + self.recent_messages)
         
         # Only add generic system prompt if no game-specific system message exists
         if not has_system_message:
             context.append(SystemMessage(content="You are a helpful assistant. Be concise and focused. Keep responses under 1000 characters."))
         
+        context.extend(self.prompt_prefix)
+        
         # Add conversation summary if available
         if self.conversation_summary:
             context.append(HumanMessage(content=f"[Previous context: {self.conversation_summary}]"))
@@ -91,8 +138,8 @@ class Player:
         context.extend(system_messages)
         
         # Calculate remaining slots for other messages
-        # Reserve space for: system messages + (summary) + new message
-        reserved_slots = len(system_messages) + (1 if self.conversation_summary else 0) + 1
+        # Reserve space for: prefix + system messages + (summary) + new message
+        reserved_slots = len(self.prompt_prefix) + len(system_messages) + (1 if self.conversation_summary else 0) + 1
         remaining_slots = self.max_context_messages - reserved_slots
         
         if remaining_slots > 0:
@@ -144,11 +191,15 @@ class Player:
         if len(self.recent_messages) > self.summary_threshold:
             self._create_conversation_summary()
 
-    async def _send_message_with_retry(self, messages: List[Any], max_retries: int = 3) -> AIMessage:
+    async def _send_message_with_retry(self, messages: List[Any], max_retries: int = 3,
+                                       stop_when: Optional[Callable[[List[str]], bool]] = None) -> AIMessage:
         """Sends message to LLM with exponential backoff retry logic."""
         for attempt in range(max_retries + 1):
             try:
+                if stop_when is not None and hasattr(self.llm_client, 'astream'):
+                    return await self._stream_message(messages, stop_when)
                 response = await self.llm_client.ainvoke(messages)
+                self._record_usage(response)
                 return AIMessage(content=response.content)
             except Exception as e:
                 error_msg = str(e)
@@ -161,13 +212,82 @@ class Player:
                     self.logger.error(f"❌ LLM call failed after {attempt + 1} attempts: {error_msg}")
                     raise
 
-    async def get_response_and_update_history(self, messages_for_llm: list) -> AIMessage:
+    async def _stream_message(self, messages: List[Any], stop_when: Callable[[List[str]], bool]) -> AIMessage:
+        """
+        Streams a response, feeding it to an ActionLineStream as it arrives.
+
+        Generation stops as soon as stop_when returns True for the action lines
+        received so far; the response then ends after the line that satisfied it.
+        """
+        action_stream = ActionLineStream()
+        chunks = self.llm_client.astream(messages)
+        stopped = False
+        try:
+            async for chunk in chunks:
+                self._record_usage(chunk)
+                if action_stream.feed(str(chunk.content)) and stop_when(action_stream.action_lines):
+                    stopped = True
+                    break
+        finally:
+            # Closing the generator cancels the provider request
+            if hasattr(chunks, 'aclose'):
+                await chunks.aclose()
+
+        if stopped:
+            self.streams_cut_short += 1
+            self.logger.info(f"✂️ Stopped generation after {len(action_stream.action_lines)} action line(s)")
+            return AIMessage(content=action_stream.complete_text.rstrip("\n"))
+        return AIMessage(content=action_stream.text)
+
+    def _record_usage(self, response: Any) -> None:
+        """Add a response's reported token usage (LangChain usage_metadata), if any."""
+        usage = getattr(response, 'usage_metadata', None)
+        if isinstance(usage, dict):
+            details = usage.get('input_token_details') or {}
+            self.token_usage["input_tokens"] += int(usage.get("input_tokens") or 0)
+            self.token_usage["output_tokens"] += int(usage.get("output_tokens") or 0)
+            self.token_usage["cache_read_tokens"] += int(details.get("cache_read") or 0)
+            self.token_usage["cache_creation_tokens"] += int(details.get("cache_creation") or 0)
+
+    def _prepare_cached_request(self, messages: List[Any]) -> List[Any]:
+        """Marks the prompt prefix and the latest message as cache breakpoints for the provider."""
+        prefix_end = next((i for i, msg in enumerate(messages) if msg is self.prompt_prefix[-1]), None) if self.prompt_prefix else None
+        breakpoints = [len(messages) - 1] if prefix_end is None or prefix_end == len(messages) - 1 else [prefix_end, len(messages) - 1]
+        return apply_cache_markers(self.provider, messages, breakpoints)
+
+    def _record_prefix_metrics(self, messages: List[Any], usage_before: Dict[str, int]) -> None:
+        """Records how much of this request repeated the previous one and what the provider served from cache."""
+        request_keys = [(getattr(msg, 'type', None), hash(str(getattr(msg, 'content', msg)))) for msg in messages]
+        shared = 0
+        for previous_key, key in zip(self._last_request_keys, request_keys):
+            if previous_key != key:
+                break
+            shared += 1
+        self._last_request_keys = request_keys
+        metrics = {
+            "messages": len(messages),
+            "shared_prefix_messages": shared,
+            "prompt_prefix_messages": len(self.prompt_prefix),
+        }
+        for key in ("input_tokens", "cache_read_tokens", "cache_creation_tokens"):
+            metrics[key] = self.token_usage[key] - usage_before[key]
+        self.prefix_metrics.append(metrics)
+        self.logger.info(
+            f"🗄️ Prompt prefix: {shared}/{len(messages)} messages repeated from the previous call; "
+            f"provider cache read {metrics['cache_read_tokens']}/{metrics['input_tokens']} input tokens"
+        )
+
+    async def get_response_and_update_history(self, messages_for_llm: list,
+                                              stop_when: Optional[Callable[[List[str]], bool]] = None) -> AIMessage:
         """
         Invokes the LLM client with smart context management, appends the AI's response
         to the player's chat history, and returns the response.
         
         This method maintains backward compatibility with the existing GameMaster interface
         while providing performance optimizations.
+        
+        When stop_when is given the response is streamed and cut off once
+        stop_when returns True for the '>' action lines received so far.
         """
         # Extract the human message from the messages_for_llm list
         # The GameMaster passes the full conversation history, but we only need the latest human message
@@ -189,7 +309,7 @@ class Player:
                 human_message = HumanMessage(content="Continue the conversation.")
         
         # Check cache first
-        cache_key = hash(human_message.content + str(self.recent_messages))
+        cache_key = hash(human_message.content + str(self.prompt_prefix) + str(self.recent_messages))
         if cache_key in self.response_cache:
             self.logger.info(f"🚀 Cache hit for {self.name}!")
             ai_response = self.response_cache[cache_key]
@@ -202,7 +322,10 @@ class Player:
         messages_for_llm_optimized = self._build_smart_context(human_message)
         
         # Send message with retry logic
-        ai_response = await self._send_message_with_retry(messages_for_llm_optimized)
+        usage_before = dict(self.token_usage)
+        ai_response = await self._send_message_with_retry(
+            self._prepare_cached_request(messages_for_llm_optimized), stop_when=stop_when)
+        self._record_prefix_metrics(messages_for_llm_optimized, usage_before)
         
         # Cache response
         self.response_cache[cache_key] = ai_response
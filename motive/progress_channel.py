@@ -0,0 +1,161 @@
+"""
+Shared-memory progress board for parallel game workers.
+
+The parallel runner creates one ProgressBoard with a fixed-size slot per
+worker and passes ``<board name>:<slot>`` to each worker process. A worker
+publishes its progress (status, round, turn, completed turns, tokens,
+errors) by overwriting its own slot; the monitor reads all slots in a single
+pass, without any stdout parsing.
+
+Each slot has one writer, so a sequence counter is enough for consistency
+(a seqlock): the writer makes it odd while a record is being written and
+even afterwards, and readers retry if they saw an odd or changed counter.
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+STARTING, RUNNING, COMPLETED, FAILED = range(4)
+
+# seq, status, round, total_rounds, turn, total_players, completed_turns,
+# input_tokens, output_tokens, errors, updated_at, log_file length, log_file
+_RECORD = struct.Struct("<IBHHHHIQQIdH")
+_SEQ = struct.Struct("<I")
+LOG_FILE_BYTES = 200
+SLOT_SIZE = 256
+assert _RECORD.size + LOG_FILE_BYTES <= SLOT_SIZE
+
+
+class ProgressRecord(NamedTuple):
+    status: int = STARTING
+    round: int = 0
+    total_rounds: int = 0
+    turn: int = 0                   # Turn within the current round
+    total_players: int = 0
+    completed_turns: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    errors: int = 0
+    updated_at: float = 0.0         # time.time() of the last update; 0 until the worker publishes
+    log_file: str = ""
+
+
+def _encode_log_file(path: str) -> bytes:
+    encoded = path.encode("utf-8")
+    while len(encoded) > LOG_FILE_BYTES:  # Keep the end of long paths, on a character boundary
+        path = path[1:]
+        encoded = path.encode("utf-8")
+    return encoded
+
+
+class ProgressBoard:
+    """Fixed-layout progress slots in a shared memory block."""
+
+    def __init__(self, memory: shared_memory.SharedMemory, slots: int, owner: bool):
+        self.memory = memory
+        self.slots = slots
+        self.owner = owner  # Only the creating process unlinks the block
+
+    @classmethod
+    def create(cls, slots: int) -> "ProgressBoard":
+        memory = shared_memory.SharedMemory(create=True, size=max(1, slots) * SLOT_SIZE)
+        memory.buf[:memory.size] = bytes(memory.size)
+        return cls(memory, slots, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, shared_tracker: bool = False) -> "ProgressBoard":
+        """
+        Attach to a board created by another process. shared_tracker is for
+        multiprocessing children, which share the creator's resource tracker:
+        unregistering there would drop the creator's own registration.
+        """
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13 always registers the block with the resource tracker
+            memory = shared_memory.SharedMemory(name=name)
+            if shared_tracker:
+                return cls(memory, memory.size // SLOT_SIZE, owner=False)
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(memory._name, "shared_memory")
+            except Exception:
+                pass  # The tracker would only warn and unlink the block when this worker exits
+        return cls(memory, memory.size // SLOT_SIZE, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def write(self, slot: int, record: ProgressRecord) -> None:
+        offset = slot * SLOT_SIZE
+        buf = self.memory.buf
+        seq, = _SEQ.unpack_from(buf, offset)
+        writing = seq + 1 if seq % 2 == 0 else seq  # Odd while the record is being written
+        _SEQ.pack_into(buf, offset, writing)
+        log_file = _encode_log_file(record.log_file)
+        _RECORD.pack_into(buf, offset, writing, *record[:-1], len(log_file))
+        buf[offset + _RECORD.size:offset + _RECORD.size + len(log_file)] = log_file
+        _SEQ.pack_into(buf, offset, writing + 1)
+
+    def read(self, slot: int, retries: int = 100) -> Tuple[int, ProgressRecord]:
+        """(sequence number, record) for a slot; the sequence changes with every update."""
+        offset = slot * SLOT_SIZE
+        buf = self.memory.buf
+        for _ in range(retries):
+            fields = _RECORD.unpack_from(buf, offset)
+            seq, log_length = fields[0], fields[-1]
+            log_file = bytes(buf[offset + _RECORD.size:offset + _RECORD.size + min(log_length, LOG_FILE_BYTES)])
+            if seq % 2 == 0 and _SEQ.unpack_from(buf, offset)[0] == seq:
+                return seq, ProgressRecord(*fields[1:-1], log_file.decode("utf-8", errors="replace"))
+            time.sleep(0)
+        raise TimeoutError(f"Progress slot {slot} kept changing while being read")
+
+    def close(self) -> None:
+        self.memory.close()
+        if self.owner:
+            try:
+                self.memory.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class ProgressPublisher:
+    """Worker side: keeps this worker's record and rewrites its slot on every update."""
+
+    def __init__(self, board: ProgressBoard, slot: int):
+        if not 0 <= slot < board.slots:
+            raise ValueError(f"Progress slot {slot} is outside the board's {board.slots} slots")
+        self.board = board
+        self.slot = slot
+        self.record = ProgressRecord()
+
+    @classmethod
+    def attach(cls, spec: str) -> "ProgressPublisher":
+        """Attach to '<board name>:<slot>' as passed by the parallel runner."""
+        name, separator, slot = spec.rpartition(":")
+        if not separator or not slot.isdigit():
+            raise ValueError(f"Invalid progress board '{spec}': expected NAME:SLOT")
+        return cls(ProgressBoard.attach(name), int(slot))
+
+    def update(self, **fields) -> None:
+        self.record = self.record._replace(updated_at=time.time(), **fields)
+        self.board.write(self.slot, self.record)
+
+
+class ProgressReader:
+    """Monitor side: yields only the slots that changed since the last poll."""
+
+    def __init__(self, board: ProgressBoard):
+        self.board = board
+        self._seen: Dict[int, int] = {}
+
+    def changed(self, slots: Optional[List[int]] = None) -> Dict[int, ProgressRecord]:
+        changes = {}
+        for slot in range(self.board.slots) if slots is None else slots:
+            seq, record = self.board.read(slot)
+            if seq and self._seen.get(slot) != seq:
+                self._seen[slot] = seq
+                changes[slot] = record
+        return changes
@@ -0,0 +1,65 @@
+"""
+Cache for rendered prompt fragments.
+
+Player prompts are assembled from fragments (room description, example
+actions, ...) that often do not change between players or between the
+action iterations of one turn. FragmentCache keeps the last renders of each
+fragment keyed on the version of the state it was rendered from, so a
+fragment is only re-rendered after that state changes. Per-fragment hit,
+miss and render-time counters show where prompt assembly time goes.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List
+
+
+@dataclass
+class FragmentStats:
+    hits: int = 0
+    misses: int = 0
+    render_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class FragmentCache:
+    """Rendered fragments by (fragment name, state version key)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries  # Per fragment name; least recently used renders are dropped
+        self.stats: Dict[str, FragmentStats] = {}
+        self._entries: Dict[str, "OrderedDict[Hashable, Any]"] = {}
+
+    def get(self, name: str, key: Hashable, render: Callable[[], Any]) -> Any:
+        """Return the cached render of fragment name for key, rendering it on a miss."""
+        entries = self._entries.setdefault(name, OrderedDict())
+        stats = self.stats.setdefault(name, FragmentStats())
+        if key in entries:
+            stats.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        stats.misses += 1
+        start = time.perf_counter()
+        value = render()
+        stats.render_seconds += time.perf_counter() - start
+        entries[key] = value
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def report(self) -> List[str]:
+        """One line per fragment: hits, misses and time spent rendering."""
+        return [
+            f"{name}: {stats.hits} hits / {stats.misses} renders ({stats.hit_rate:.0%} hit rate), "
+            f"{stats.render_seconds * 1000:.2f}ms rendering"
+            for name, stats in sorted(self.stats.items())
+        ]
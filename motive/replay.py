@@ -0,0 +1,257 @@
+"""
+Replay a recorded game against the engine without calling any LLM.
+
+A game played with checkpoints (the default whenever file logging is on)
+leaves a structured recording under ``<log_dir>/checkpoints/<game_id>/``:
+the manifest says how the game was built and the journal holds every
+message each player sent and received. Replaying rebuilds the game from
+the manifest, answers each LLM call with that player's next recorded
+response and runs the normal turn loop, so the responses go through
+``parse_player_response``, requirement checks, effects and event
+distribution just as they did live. The replayed game is then compared
+with the recording:
+
+* every message of every player's conversation - the game master's
+  prompts, action feedback and the events each player observed;
+* the final state of every object, room and character, plus hints and
+  pending observations;
+* each player's motive outcome.
+
+Without network calls a game replays at CPU speed, so the finished games
+in a log directory double as a regression corpus and an engine benchmark
+(``motive-util replay --all``).
+"""
+
+import io
+import logging
+import os
+import time
+from collections import deque
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import AIMessage
+
+from motive.checkpoint import MANIFEST_FILE, capture_state, checkpoint_dir, load_checkpoint
+
+SNIPPET_LENGTH = 120
+
+
+class ReplayError(Exception):
+    """Raised when a recording cannot be replayed."""
+
+
+class UnfinishedGameError(ReplayError):
+    """Raised for a recording of a game that crashed or is still running."""
+
+
+@dataclass
+class Divergence:
+    kind: str     # "config", "message", "state" or "outcome"
+    subject: str  # Player name, entity key or config path
+    detail: str
+
+    def __str__(self):
+        return f"{self.kind} {self.subject}: {self.detail}"
+
+
+@dataclass
+class ReplayReport:
+    game_id: str
+    turns: int = 0
+    responses: int = 0
+    setup_seconds: float = 0.0
+    seconds: float = 0.0
+    divergences: List[Divergence] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.divergences
+
+
+class RecordedResponses:
+    """LLM client stand-in that answers with one player's recorded responses, in order."""
+
+    def __init__(self):
+        self.player_name: Optional[str] = None
+        self.responses: deque = deque()
+        self.served = 0
+
+    def load(self, player_name: str, responses: List[str]):
+        self.player_name = player_name
+        self.responses = deque(responses)
+
+    async def ainvoke(self, messages: List[Any], **kwargs) -> AIMessage:
+        if not self.responses:
+            raise ReplayError(f"{self.player_name} asked for more than the {self.served} recorded response(s)")
+        self.served += 1
+        return AIMessage(content=self.responses.popleft())
+
+
+class _NoCache(dict):
+    """Stands in for Player.response_cache: a recorded cache hit is just another recorded response."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def find_recordings(log_dir: str) -> List[str]:
+    """Checkpoint directories of every game recorded under log_dir."""
+    root = os.path.join(log_dir, "checkpoints")
+    if not os.path.isdir(root):
+        return []
+    return [os.path.join(root, name) for name in sorted(os.listdir(root))
+            if os.path.isfile(os.path.join(root, name, MANIFEST_FILE))]
+
+
+def resolve_recording(game: str, log_dir: str = "logs") -> str:
+    """A checkpoint directory given either its path or a game id under log_dir."""
+    if os.path.isfile(os.path.join(game, MANIFEST_FILE)):
+        return game
+    return checkpoint_dir(log_dir, game)
+
+
+def _snippet(text: Any) -> str:
+    text = str(text)
+    return repr(text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH] + "...")
+
+
+def _compare_messages(player_name: str, recorded: List[Dict[str, Any]], replayed: List[Any]) -> Optional[Divergence]:
+    """The first message where the replayed conversation departs from the recorded one."""
+    expected = [(message["type"], message["data"]["content"]) for message in recorded]
+    actual = [(message.type, message.content) for message in replayed]
+    for index, (want, got) in enumerate(zip(expected, actual)):
+        if want != got:
+            return Divergence("message", player_name,
+                              f"#{index} recorded {want[0]} {_snippet(want[1])}, replayed {got[0]} {_snippet(got[1])}")
+    if len(expected) != len(actual):
+        index = min(len(expected), len(actual))
+        extra = expected[index] if len(expected) > len(actual) else actual[index]
+        return Divergence("message", player_name,
+                          f"recorded {len(expected)} messages, replayed {len(actual)} (first unmatched: {extra[0]} {_snippet(extra[1])})")
+    return None
+
+
+def _comparable(key: str, state: Any) -> Any:
+    """State without wall-clock fields (LLM latency, event timestamps)."""
+    if key == "game" and isinstance(state, dict):
+        play_stats = {name: {k: v for k, v in stats.items() if k != "llm_seconds"}
+                      for name, stats in state.get("play_stats", {}).items()}
+        observations = {char_id: [{k: v for k, v in event.items() if k != "timestamp"} for event in events]
+                        for char_id, events in state.get("observations", {}).items()}
+        return {**state, "play_stats": play_stats, "observations": observations}
+    return state
+
+
+def _compare_state(recorded: Dict[str, Any], game_master) -> List[Divergence]:
+    replayed = capture_state(game_master)
+    divergences = []
+    for key in sorted(set(recorded) | set(replayed)):
+        want = _comparable(key, recorded.get(key))
+        got = _comparable(key, replayed.get(key))
+        if want == got:
+            continue
+        if isinstance(want, dict) and isinstance(got, dict):
+            fields = sorted(name for name in set(want) | set(got) if want.get(name) != got.get(name))
+            detail = "; ".join(f"{name}: recorded {_snippet(want.get(name))}, replayed {_snippet(got.get(name))}"
+                               for name in fields)
+        else:
+            detail = f"recorded {_snippet(want)}, replayed {_snippet(got)}"
+        divergences.append(Divergence("state", key, detail))
+    return divergences
+
+
+def _compare_outcomes(recorded: List[Dict[str, Any]], game_results: List[Dict[str, Any]]) -> List[Divergence]:
+    replayed = {result["player"]: result for result in game_results}
+    divergences = []
+    for want in recorded:
+        got = replayed.get(want["player"], {})
+        changed = [key for key in ("character", "motive", "outcome") if want.get(key) != got.get(key)]
+        if changed:
+            detail = ", ".join(f"{key} recorded {want.get(key)!r}, replayed {got.get(key)!r}" for key in changed)
+            divergences.append(Divergence("outcome", want["player"], detail))
+    return divergences
+
+
+async def replay_game(directory: str) -> ReplayReport:
+    """
+    Replay the finished game recorded in a checkpoint directory and compare it
+    with the recording. Raises CheckpointError or ReplayError when the
+    recording cannot be replayed at all; engine errors during the replay are
+    reported in ReplayReport.error.
+    """
+    from motive.cli import build_game_master  # The CLI imports most of the engine
+
+    checkpoint = load_checkpoint(directory)
+    manifest = checkpoint.manifest
+    report = ReplayReport(manifest.get("game_id") or os.path.basename(directory), turns=checkpoint.turns)
+    if not checkpoint.complete:
+        raise UnfinishedGameError(f"Game {report.game_id} did not finish; only finished games can be replayed")
+
+    clients: List[RecordedResponses] = []
+
+    def client_factory(provider: str, model: str) -> RecordedResponses:
+        client = RecordedResponses()
+        clients.append(client)
+        return client
+
+    options = {**manifest["options"], "no_file_logging": True}
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()):
+            game_master = build_game_master(manifest["config_path"], game_id=report.game_id,
+                                            llm_client_factory=client_factory, **options)
+    except SystemExit:
+        game_master = None
+    if game_master is None:
+        raise ReplayError(f"Could not rebuild game {report.game_id} from {manifest['config_path']}")
+    if game_master._config_hash() != manifest.get("config_hash"):
+        report.divergences.append(Divergence("config", manifest["config_path"], "changed since the game was recorded"))
+
+    missing = [player.name for player in game_master.players if player.name not in checkpoint.players]
+    if missing:
+        raise ReplayError(f"The rebuilt game has players the recording does not: {', '.join(missing)}")
+    for player in game_master.players:
+        recorded = checkpoint.players[player.name]["messages"]
+        player.llm_client.load(player.name, [message["data"]["content"] for message in recorded
+                                             if message["type"] == "ai"])
+        player.response_cache = _NoCache()
+    game_master.game_logger.setLevel(logging.CRITICAL)  # Narrative logging would dominate the run time
+    report.setup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()):
+            if manifest.get("worker"):
+                await game_master.run_game_worker()
+            else:
+                await game_master.run_game()
+    except Exception as e:
+        report.error = f"{type(e).__name__}: {e}"
+    report.seconds = time.perf_counter() - start
+    report.responses = sum(client.served for client in clients)
+
+    for player in game_master.players:
+        divergence = _compare_messages(player.name, checkpoint.players[player.name]["messages"],
+                                       player.conversation_history)
+        if divergence is not None:
+            report.divergences.append(divergence)
+    report.divergences.extend(_compare_state(checkpoint.entities, game_master))
+    if report.error is None and checkpoint.outcomes is not None:
+        report.divergences.extend(_compare_outcomes(checkpoint.outcomes, game_master.game_results))
+    return report
+
+
+def format_report(report: ReplayReport, max_divergences: int = 10) -> str:
+    timing = f"{report.turns} turns, {report.responses} responses replayed in {report.seconds:.2f}s"
+    if report.ok:
+        return f"✅ {report.game_id}: {timing}"
+    lines = [f"❌ {report.game_id}: {timing}"]
+    if report.error:
+        lines.append(f"   error: {report.error}")
+    lines.extend(f"   {divergence}" for divergence in report.divergences[:max_divergences])
+    if len(report.divergences) > max_divergences:
+        lines.append(f"   ... {len(report.divergences) - max_divergences} more")
+    return "\n".join(lines)
@@ -0,0 +1,64 @@
+"""
+Named random streams derived from one game seed.
+
+Every source of randomness in a game draws from its own stream
+(GameRandom.stream(name)) instead of the module-level ``random``. A
+stream's seed depends only on the game seed and the stream name, so:
+
+* a game is reproducible from its seed alone, however many other games
+  run in the same process and in whatever order they draw numbers;
+* adding draws to one subsystem does not shift the numbers another
+  subsystem sees.
+"""
+
+import hashlib
+import random
+import secrets
+from typing import Any, Dict, Optional
+
+# Stream names used by the game set-up
+ASSIGNMENT = "assignment"      # Characters given to players
+START_ROOMS = "start_rooms"    # Weighted choice among a character's initial rooms
+MOTIVES = "motives"            # A character's motive when several are configured
+PLAYERS = "players"            # Which configured player --players duplicates
+
+DETERMINISTIC_SEED = 42
+
+
+def new_seed() -> int:
+    """A fresh seed for a game that was not given one."""
+    return secrets.randbits(32)
+
+
+def derive_seed(seed: int, name: str) -> int:
+    digest = hashlib.sha256(f"{seed}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class GameRandom:
+    """The random streams of one game; streams are created on first use."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = new_seed() if seed is None else int(seed)
+        self._streams: Dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(derive_seed(self.seed, name))
+        return stream
+
+    def getstate(self) -> Dict[str, Any]:
+        """JSON-serializable state of every stream used so far."""
+        states = {}
+        for name, stream in self._streams.items():
+            version, internal, gauss = stream.getstate()
+            states[name] = [version, list(internal), gauss]
+        return states
+
+    def setstate(self, states: Dict[str, Any]):
+        for name, (version, internal, gauss) in states.items():
+            self.stream(name).setstate((version, tuple(internal), gauss))
+
+    def __repr__(self):
+        return f"GameRandom(seed={self.seed}, streams={sorted(self._streams)})"
@@ -22,13 +22,22 @@ class Room:
         self.tags = set(tags) if tags else set()
         self.properties = properties if properties else {}
         self.players: Dict[str, Character] = {} # New: Stores Character instances in the room
+        self.version = 0 # Bumped when objects or tags change; keys cached renders of this room
 
     def add_object(self, obj: GameObject):
         self.objects[obj.id] = obj
         obj.current_location_id = self.id
+        self.version += 1
 
     def remove_object(self, obj_id: str) -> Optional[GameObject]:
-        return self.objects.pop(obj_id, None)
+        obj = self.objects.pop(obj_id, None)
+        if obj is not None:
+            self.version += 1
+        return obj
+
+    def touch(self):
+        """Marks the room as changed after direct edits to its objects or exits."""
+        self.version += 1
 
     def get_object(self, obj_id: str) -> Optional[GameObject]:
         """Gets a GameObject in this room by its ID or name (case-insensitive)."""
@@ -60,11 +69,24 @@ class Room:
         """Returns a list of all Character instances currently in this room."""
         return list(self.players.values())
 
+    def has_carried_light_source(self) -> bool:
+        """Returns True if any character in this room carries a lit object."""
+        for player_char in self.players.values():
+            for obj in player_char.inventory.values():
+                try:
+                    if obj.get_property('is_lit', False):
+                        return True
+                except Exception:
+                    continue
+        return False
+
     def add_tag(self, tag: str):
         self.tags.add(tag)
+        self.version += 1
 
     def remove_tag(self, tag: str):
         self.tags.discard(tag)
+        self.version += 1
 
     def has_tag(self, tag: str) -> bool:
         return tag in self.tags
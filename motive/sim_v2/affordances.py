@@ -5,8 +5,8 @@ based on their properties and state.
 """
 
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from .conditions import ConditionAST
+from dataclasses import dataclass, field
+from .conditions import CompiledCondition, ConditionAST, compile_condition
 from .effects import Effect, EffectEngine
 
 
@@ -19,12 +19,16 @@ class AffordanceRule:
 
 @dataclass
 class Affordance:
-    """An affordance that adds an action to an entity."""
+    """An affordance that adds an action to an entity.
+
+    ``matches`` is the compiled condition, set when the affordance is registered.
+    """
     affordance_id: str
     action_name: str
     condition: ConditionAST
     effects: List[Effect]
     description: Optional[str] = None
+    matches: Optional[CompiledCondition] = field(default=None, init=False, repr=False, compare=False)
 
 
 class AffordanceEngine:
@@ -36,6 +40,7 @@ class AffordanceEngine:
     
     def register_affordance(self, affordance: Affordance) -> None:
         """Register an affordance with the engine."""
+        affordance.matches = compile_condition(affordance.condition)
         self._affordances[affordance.affordance_id] = affordance
     
     def get_affordance(self, affordance_id: str) -> Optional[Affordance]:
@@ -66,10 +71,6 @@ class AffordanceEngine:
     
     def _is_affordance_available(self, affordance: Affordance, entity_id: str, entities: Dict[str, Any]) -> bool:
         """Check if an affordance is available for an entity."""
-        from .conditions import ConditionEvaluator
-        
-        evaluator = ConditionEvaluator()
-        
         # Get entity properties
         entity = entities.get(entity_id)
         if entity is None:
@@ -83,8 +84,8 @@ class AffordanceEngine:
         else:
             entity_props = {}
         
-        # Evaluate condition
-        return evaluator.evaluate(affordance.condition, entity_props)
+        # Evaluate the condition compiled at registration
+        return affordance.matches(entity_props)
     
     def _find_affordance_for_action(self, entity_id: str, action_name: str, entities: Dict[str, Any]) -> Optional[Affordance]:
         """Find an affordance that provides the specified action for the entity."""
@@ -2,77 +2,190 @@
 
 This module provides a simple DSL for parsing string conditions into AST
 and evaluating them against entity properties.
+
+Parsed ASTs are interned per condition string, and each AST can be compiled
+once into a plain Python closure so hot paths (affordances, triggers, action
+requirements) pay a single function call per evaluation instead of a tree
+walk.
 """
 
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Union
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConditionAST:
-    """Abstract Syntax Tree for condition expressions."""
+    """Abstract Syntax Tree for condition expressions.
+
+    Boolean nodes (AND/OR) hold child ASTs in ``left``/``right``; NOT holds its
+    operand in ``left`` and leaves ``right`` as None. Comparison nodes hold a
+    property name in ``left`` and a literal in ``right``.
+    """
     operator: str
-    left: str
-    right: Union[str, int, float, bool]
+    left: Union["ConditionAST", str]
+    right: Union["ConditionAST", str, int, float, bool, None]
+
+
+# Comparison operators in the order the parser tries them.
+_COMPARISON_OPERATORS = ("==", "!=", ">=", "<=", ">", "<", "contains")
+
+CompiledCondition = Callable[[Mapping[str, Any]], bool]
 
 
 class ConditionParser:
-    """Parses string conditions into ConditionAST."""
+    """Parses string conditions into ConditionAST.
+
+    Precedence from lowest to highest: OR, AND, NOT, comparisons. Results are
+    interned, so parsing the same string twice returns the same AST object.
+    """
     
     def parse(self, condition_str: str) -> ConditionAST:
         """Parse a condition string into AST."""
-        condition_str = condition_str.strip()
-
-        # Parse AND first (lowest precedence)
-        if " AND " in condition_str:
-            left, right = condition_str.split(" AND ", 1)
-            left_ast = self.parse(left.strip())
-            right_ast = self.parse(right.strip())
-            return ConditionAST(operator="AND", left=left_ast, right=right_ast)
-        
-        # Then parse comparison operators
-        elif " == " in condition_str:
-            left, right = condition_str.split(" == ", 1)
-            right = self._parse_value(right.strip())
-            return ConditionAST(operator="==", left=left.strip(), right=right)
-        elif " > " in condition_str:
-            left, right = condition_str.split(" > ", 1)
-            right = self._parse_value(right.strip())
-            return ConditionAST(operator=">", left=left.strip(), right=right)
-        elif " < " in condition_str:
-            left, right = condition_str.split(" < ", 1)
-            right = self._parse_value(right.strip())
-            return ConditionAST(operator="<", left=left.strip(), right=right)
-        elif " contains " in condition_str:
-            left, right = condition_str.split(" contains ", 1)
-            right = self._parse_value(right.strip())
-            return ConditionAST(operator="contains", left=left.strip(), right=right)
-        else:
-            raise ValueError(f"Unsupported condition: {condition_str}")
+        return _parse_cached(condition_str.strip())
     
     def _parse_value(self, value_str: str) -> Union[str, int, float, bool]:
         """Parse a value string into appropriate type."""
-        value_str = value_str.strip()
-        
-        # Remove quotes for strings
-        if value_str.startswith("'") and value_str.endswith("'"):
-            return value_str[1:-1]
-        
-        # Parse booleans
-        if value_str.lower() == "true":
-            return True
-        elif value_str.lower() == "false":
-            return False
-        
-        # Parse numbers
-        try:
-            if "." in value_str:
-                return float(value_str)
-            else:
-                return int(value_str)
-        except ValueError:
-            # If not a number, treat as string
-            return value_str
+        return _parse_value(value_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(condition_str: str) -> ConditionAST:
+    """Parse a stripped condition string; cached so each string parses once."""
+    # Parse OR first (lowest precedence), then AND
+    for keyword in ("OR", "AND"):
+        separator = f" {keyword} "
+        if separator in condition_str:
+            left, right = condition_str.split(separator, 1)
+            return ConditionAST(
+                operator=keyword,
+                left=_parse_cached(left.strip()),
+                right=_parse_cached(right.strip()),
+            )
+
+    if condition_str.startswith("NOT "):
+        operand = _parse_cached(condition_str[4:].strip())
+        return ConditionAST(operator="NOT", left=operand, right=None)
+
+    # Then parse comparison operators
+    for operator in _COMPARISON_OPERATORS:
+        separator = f" {operator} "
+        if separator in condition_str:
+            left, right = condition_str.split(separator, 1)
+            return ConditionAST(
+                operator=operator, left=left.strip(), right=_parse_value(right)
+            )
+
+    raise ValueError(f"Unsupported condition: {condition_str}")
+
+
+def _parse_value(value_str: str) -> Union[str, int, float, bool]:
+    """Parse a value string into appropriate type."""
+    value_str = value_str.strip()
+    
+    # Remove quotes for strings
+    if value_str.startswith("'") and value_str.endswith("'"):
+        return value_str[1:-1]
+    
+    # Parse booleans
+    if value_str.lower() == "true":
+        return True
+    elif value_str.lower() == "false":
+        return False
+    
+    # Parse numbers
+    try:
+        if "." in value_str:
+            return float(value_str)
+        else:
+            return int(value_str)
+    except ValueError:
+        # If not a number, treat as string
+        return value_str
+
+
+def condition_properties(ast: ConditionAST) -> FrozenSet[str]:
+    """Return the property names a condition reads."""
+    if ast.operator in ("AND", "OR"):
+        return condition_properties(ast.left) | condition_properties(ast.right)
+    if ast.operator == "NOT":
+        return condition_properties(ast.left)
+    return frozenset((ast.left,))
+
+
+def compile_condition(ast: ConditionAST) -> CompiledCondition:
+    """Compile a ConditionAST into a closure taking a properties mapping.
+
+    Compiled closures are cached per AST, but a cache lookup hashes the
+    whole tree: compile once (e.g. when a trigger is registered) and keep
+    the closure. Boolean operators short-circuit.
+    """
+    try:
+        return _compile_cached(ast)
+    except TypeError:
+        # Unhashable literal (e.g. a list built by hand); compile uncached
+        return _compile(ast)
+
+
+@lru_cache(maxsize=4096)
+def _compile_cached(ast: ConditionAST) -> CompiledCondition:
+    return _compile(ast)
+
+
+def _compile(ast: ConditionAST) -> CompiledCondition:
+    operator = ast.operator
+
+    if operator in ("AND", "OR"):
+        left_fn = compile_condition(ast.left)
+        right_fn = compile_condition(ast.right)
+        if operator == "AND":
+            return lambda properties: bool(left_fn(properties) and right_fn(properties))
+        return lambda properties: bool(left_fn(properties) or right_fn(properties))
+
+    if operator == "NOT":
+        operand_fn = compile_condition(ast.left)
+        return lambda properties: not operand_fn(properties)
+
+    key = ast.left
+    expected = ast.right
+
+    # Missing properties (None) always evaluate to False
+    if operator == "==":
+        def condition(properties):
+            value = properties.get(key)
+            return value is not None and value == expected
+    elif operator == "!=":
+        def condition(properties):
+            value = properties.get(key)
+            return value is not None and value != expected
+    elif operator == ">":
+        def condition(properties):
+            value = properties.get(key)
+            return value is not None and value > expected
+    elif operator == "<":
+        def condition(properties):
+            value = properties.get(key)
+            return value is not None and value < expected
+    elif operator == ">=":
+        def condition(properties):
+            value = properties.get(key)
+            return value is not None and value >= expected
+    elif operator == "<=":
+        def condition(properties):
+            value = properties.get(key)
+            return value is not None and value <= expected
+    elif operator == "contains":
+        if not isinstance(expected, str):
+            return lambda properties: False
+
+        def condition(properties):
+            # For string contains
+            value = properties.get(key)
+            return isinstance(value, str) and expected in value
+    else:
+        raise ValueError(f"Unsupported operator: {operator}")
+
+    return condition
 
 
 class ConditionEvaluator:
@@ -80,31 +193,4 @@ class ConditionEvaluator:
     
     def evaluate(self, ast: ConditionAST, properties: Dict[str, Any]) -> bool:
         """Evaluate a condition AST against entity properties."""
-        # Handle AND operator with nested ASTs
-        if ast.operator == "AND":
-            left_result = self.evaluate(ast.left, properties)
-            right_result = self.evaluate(ast.right, properties)
-            return left_result and right_result
-        
-        # Handle simple operators
-        left_value = properties.get(ast.left)
-        
-        # Handle missing properties
-        if left_value is None:
-            return False
-        
-        # Evaluate based on operator
-        if ast.operator == "==":
-            return left_value == ast.right
-        elif ast.operator == ">":
-            return left_value > ast.right
-        elif ast.operator == "<":
-            return left_value < ast.right
-        elif ast.operator == "contains":
-            # For string contains
-            if isinstance(left_value, str) and isinstance(ast.right, str):
-                return ast.right in left_value
-            else:
-                return False
-        else:
-            raise ValueError(f"Unsupported operator: {ast.operator}")
+        return compile_condition(ast)(properties)
@@ -0,0 +1,202 @@
+"""
+Config watch mode for content authoring.
+
+ConfigWatcher keeps a config tree loaded in memory and polls the files it is
+built from. When files change it re-parses only those files, re-merges only
+the configs that include them (V2ConfigPreprocessor.reload_files), re-parses
+only the entity and action definitions whose merged data changed, and re-runs
+per-entity validation rules for those entities alone. Cross-reference rules
+run against indexes rebuilt from the current entities, which is a single
+cheap pass.
+
+Files are polled by modification time rather than through inotify, which
+keeps this dependency-free and portable; an include tree is tens of files, so a
+poll is a handful of stat() calls.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .v2_config_preprocessor import V2ConfigPreprocessor
+from .v2_config_rules import (
+    RuleRegistry,
+    SemanticValidator,
+    ValidationReport,
+    build_indexes,
+    run_cross_checks,
+    run_entity_checks,
+)
+from .v2_config_validator import V2GameConfig
+
+
+@dataclass
+class ReloadResult:
+    """Outcome of one (re)load."""
+    changed_files: List[str] = field(default_factory=list)
+    changed_entities: List[str] = field(default_factory=list)
+    removed_entities: List[str] = field(default_factory=list)
+    changed_actions: List[str] = field(default_factory=list)
+    report: Optional[ValidationReport] = None
+    error: Optional[str] = None  # Load/parse/validation error; previous content stays active
+    elapsed: float = 0.0  # seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ConfigWatcher:
+    """Keeps a v2 config tree loaded and incrementally re-validates it on change."""
+
+    def __init__(self, config_path: str, registry: Optional[RuleRegistry] = None,
+                 on_reload: Optional[Callable[['ConfigWatcher', ReloadResult], None]] = None):
+        path = Path(config_path)
+        self.preprocessor = V2ConfigPreprocessor(str(path.parent))
+        self.config_file = path.name
+        self.validator = SemanticValidator(registry)
+        self.on_reload = on_reload
+
+        self.raw_config: Dict[str, Any] = {}
+        self.entities: Dict[str, Any] = {}  # entity_id -> EntityDefinition
+        self.actions: Dict[str, Any] = {}  # action_id -> ActionDefinition
+        self._raw_entities: Dict[str, Any] = {}
+        self._raw_actions: Dict[str, Any] = {}
+        self._entity_issues: Dict[str, Dict[str, List[str]]] = {}  # entity_id -> rule -> issues
+        self._mtimes: Dict[str, int] = {}
+
+    @property
+    def config(self) -> V2GameConfig:
+        """The current content as a V2GameConfig (no re-validation)."""
+        return V2GameConfig.model_construct(
+            **{key: value for key, value in self.raw_config.items()
+               if key not in ('entity_definitions', 'action_definitions')},
+            entity_definitions=dict(self.entities),
+            action_definitions=dict(self.actions),
+        )
+
+    def load(self) -> ReloadResult:
+        """Load and fully validate the tree."""
+        started = time.perf_counter()
+        result = ReloadResult()
+        try:
+            raw_config = self.preprocessor.load_config(self.config_file)
+            result.changed_files = list(self.preprocessor.parsed_files)
+            self._apply(raw_config, result)
+        except Exception as e:
+            result.error = str(e)
+        self._snapshot_mtimes()
+        return self._finish(result, started)
+
+    def poll(self) -> Optional[ReloadResult]:
+        """Reload if any watched file changed since the last (re)load; None otherwise."""
+        current = self._current_mtimes()
+        changed = [path for path, mtime in current.items() if self._mtimes.get(path) != mtime]
+        if not changed:
+            return None
+        return self.reload(changed, current)
+
+    def reload(self, changed_files: List[str], mtimes: Optional[Dict[str, int]] = None) -> ReloadResult:
+        """Re-parse ``changed_files`` and incrementally re-validate.
+
+        ``mtimes`` are the modification times observed before reading, so an
+        edit landing mid-reload is picked up by the next poll.
+        """
+        started = time.perf_counter()
+        result = ReloadResult(changed_files=list(changed_files))
+        try:
+            raw_config = self.preprocessor.reload_files(changed_files)
+            self._apply(raw_config, result)
+        except Exception as e:
+            # Keep serving the previous content; the author fixes the file and saves again
+            result.error = str(e)
+        self._snapshot_mtimes(mtimes)
+        return self._finish(result, started)
+
+    def watch(self, interval: float = 0.25, should_stop: Callable[[], bool] = lambda: False) -> None:
+        """Poll every ``interval`` seconds until ``should_stop()`` returns True."""
+        while not should_stop():
+            self.poll()
+            time.sleep(interval)
+
+    def _apply(self, raw_config: Dict[str, Any], result: ReloadResult) -> None:
+        raw_entities = raw_config.get('entity_definitions') or {}
+        raw_actions = raw_config.get('action_definitions') or {}
+
+        changed_entities = self._changed_keys(self._raw_entities, raw_entities)
+        removed_entities = [entity_id for entity_id in self._raw_entities if entity_id not in raw_entities]
+        changed_actions = self._changed_keys(self._raw_actions, raw_actions)
+
+        # Parse before committing anything so a bad edit leaves the old content active
+        parsed_entities = V2GameConfig.parse_entity_definitions({key: raw_entities[key] for key in changed_entities})
+        parsed_actions = V2GameConfig.parse_action_definitions({key: raw_actions[key] for key in changed_actions})
+
+        entities = {entity_id: parsed_entities.get(entity_id, self.entities.get(entity_id))
+                    for entity_id in raw_entities}
+        report, entity_issues = self._validate(entities, changed_entities)
+        self.validator.raise_for_errors(report)
+
+        self.raw_config = raw_config
+        self._raw_entities = dict(raw_entities)
+        self._raw_actions = dict(raw_actions)
+        self.entities = entities
+        self.actions = {action_id: parsed_actions.get(action_id, self.actions.get(action_id))
+                        for action_id in raw_actions}
+        self._entity_issues = entity_issues
+
+        result.changed_entities = changed_entities
+        result.removed_entities = removed_entities
+        result.changed_actions = changed_actions
+        result.report = report
+
+    def _validate(self, entities: Dict[str, Any],
+                  changed: List[str]) -> Tuple[ValidationReport, Dict[str, Dict[str, List[str]]]]:
+        """Re-run per-entity rules for changed entities; reuse earlier results for the rest."""
+        rules = self.validator.registry.rules()
+        entity_issues = {entity_id: issues for entity_id, issues in self._entity_issues.items()
+                         if entity_id in entities}
+        timings = {rule.name: 0.0 for rule in rules}
+        for entity_id in changed:
+            issues, entity_timings = run_entity_checks(rules, [(entity_id, entities[entity_id])])
+            entity_issues[entity_id] = {name: found for name, found in issues.items() if found}
+            for name, seconds in entity_timings.items():
+                timings[name] += seconds
+
+        report = ValidationReport(entity_count=len(entities), timings=timings)
+        for rule in rules:
+            report.issues[rule.name] = [
+                issue for entity_id in entities
+                for issue in entity_issues.get(entity_id, {}).get(rule.name, ())
+            ]
+        run_cross_checks(rules, build_indexes(entities), report)
+        return report, entity_issues
+
+    @staticmethod
+    def _changed_keys(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+        # Unchanged subtrees are usually shared with the previous merge, so `is` settles most keys
+        return [key for key, value in new.items()
+                if key not in old or (old[key] is not value and old[key] != value)]
+
+    def _current_mtimes(self) -> Dict[str, int]:
+        mtimes = {}
+        for path in self.preprocessor.parsed_files:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = -1  # Deleted files count as changed
+        return mtimes
+
+    def _snapshot_mtimes(self, observed: Optional[Dict[str, int]] = None) -> None:
+        mtimes = self._current_mtimes()
+        if observed:
+            # Files already known keep the time seen before they were read
+            mtimes.update({path: mtime for path, mtime in observed.items() if path in mtimes})
+        self._mtimes = mtimes
+
+    def _finish(self, result: ReloadResult, started: float) -> ReloadResult:
+        result.elapsed = time.perf_counter() - started
+        if self.on_reload is not None:
+            self.on_reload(self, result)
+        return result
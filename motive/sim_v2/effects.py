@@ -4,7 +4,7 @@ This module provides basic effect primitives for modifying entity properties
 and relations in a declarative way.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass
 from .relations import RelationsGraph
 
@@ -57,9 +57,27 @@ class GenerateEventEffect(Effect):
     observers: Optional[List[str]] = None
 
 
+# Called with (entity_id, property_name) after an effect writes a property
+PropertyChangeCallback = Callable[[str, str], None]
+
+
 class EffectEngine:
     """Executes effects against entities and relations."""
     
+    def __init__(self, on_property_change: Optional[PropertyChangeCallback] = None):
+        self._property_listeners: List[PropertyChangeCallback] = []
+        if on_property_change is not None:
+            self.add_property_listener(on_property_change)
+
+    def add_property_listener(self, listener: PropertyChangeCallback) -> None:
+        """Also call ``listener`` after every property write (e.g. triggers and query indexes)."""
+        if listener not in self._property_listeners:
+            self._property_listeners.append(listener)
+
+    def remove_property_listener(self, listener: PropertyChangeCallback) -> None:
+        if listener in self._property_listeners:
+            self._property_listeners.remove(listener)
+    
     def execute_effect(
         self, 
         effect: Effect, 
@@ -106,6 +124,7 @@ class EffectEngine:
                 else:
                     # Fallback: create properties dict
                     entity.properties = {effect.property_name: effect.value}
+            self._notify_property_change(effect.target_entity, effect.property_name)
     
     def _execute_increment_property(self, effect: IncrementPropertyEffect, entities: Dict[str, Any]) -> None:
         """Execute an increment property effect."""
@@ -139,6 +158,12 @@ class EffectEngine:
                 else:
                     # Fallback: create properties dict
                     entity.properties = {effect.property_name: new_value}
+            self._notify_property_change(effect.target_entity, effect.property_name)
+    
+    def _notify_property_change(self, entity_id: str, property_name: str) -> None:
+        """Report a property write to every change listener."""
+        for listener in list(self._property_listeners):
+            listener(entity_id, property_name)
     
     def _execute_move_entity(self, effect: MoveEntityEffect, relations: RelationsGraph) -> None:
         """Execute a move entity effect."""
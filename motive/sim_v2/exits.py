@@ -4,7 +4,7 @@ This module provides a unified system for managing exits between rooms,
 including state properties like visibility, traversability, and locking.
 """
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from .relations import RelationsGraph
 
@@ -23,6 +23,23 @@ class ExitManager:
     def __init__(self):
         self._exits: Dict[str, ExitState] = {}
         self._exit_directions: Dict[str, Dict[str, str]] = {}  # room_id -> direction -> exit_id
+        self._exit_targets: Dict[str, str] = {}  # exit_id -> to_room
+        self._incoming: Dict[str, Dict[str, None]] = {}  # to_room -> ordered set of from_rooms
+        self._exit_origins: Dict[str, Tuple[str, str]] = {}  # exit_id -> (from_room, direction)
+        self._listeners: List[Callable[[str], None]] = []
+    
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(exit_id)`` whenever an exit is created or its state changes."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[str], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, exit_id: str) -> None:
+        for listener in list(self._listeners):
+            listener(exit_id)
     
     def create_exit(self, from_room: str, to_room: str, direction: str, relations: RelationsGraph) -> str:
         """Create an exit between rooms."""
@@ -35,11 +52,18 @@ class ExitManager:
         if from_room not in self._exit_directions:
             self._exit_directions[from_room] = {}
         self._exit_directions[from_room][direction] = exit_id
+        self._exit_targets[exit_id] = to_room
+        self._exit_origins[exit_id] = (from_room, direction)
+        self._incoming.setdefault(to_room, {})[from_room] = None
         
         # Add to relations graph (simplified - just track the connection)
         # In a full implementation, we'd have more sophisticated exit relations
-        relations.place_entity(to_room, from_room)  # Simplified: to_room is "contained" by from_room for exit purposes
+        # Simplified: to_room is "contained" by from_room for exit purposes.
+        # Skip it when a reverse exit already nests from_room inside to_room.
+        if from_room != to_room and not relations.is_inside(from_room, to_room):
+            relations.place_entity(to_room, from_room)
         
+        self._notify(exit_id)
         return exit_id
     
     def get_exit_state(self, exit_id: str) -> Optional[ExitState]:
@@ -50,16 +74,19 @@ class ExitManager:
         """Set the visibility of an exit."""
         if exit_id in self._exits:
             self._exits[exit_id].visible = visible
+            self._notify(exit_id)
     
     def set_exit_traversable(self, exit_id: str, traversable: bool) -> None:
         """Set the traversability of an exit."""
         if exit_id in self._exits:
             self._exits[exit_id].traversable = traversable
+            self._notify(exit_id)
     
     def set_exit_locked(self, exit_id: str, locked: bool) -> None:
         """Set the locked state of an exit."""
         if exit_id in self._exits:
             self._exits[exit_id].is_locked = locked
+            self._notify(exit_id)
     
     def can_traverse_exit(self, exit_id: str) -> bool:
         """Check if an exit can be traversed."""
@@ -73,3 +100,25 @@ class ExitManager:
         """Get exit ID by direction from a room."""
         room_exits = self._exit_directions.get(room_id, {})
         return room_exits.get(direction)
+    
+    def get_adjacent_rooms(self, room_id: str, traversable_only: bool = False) -> List[str]:
+        """Get rooms reachable through one exit from a room, in exit creation order."""
+        adjacent = []
+        for exit_id in self._exit_directions.get(room_id, {}).values():
+            if traversable_only and not self.can_traverse_exit(exit_id):
+                continue
+            to_room = self._exit_targets.get(exit_id)
+            if to_room is not None and to_room not in adjacent:
+                adjacent.append(to_room)
+        return adjacent
+    
+    def iter_exits(self, exit_id: Optional[str] = None) -> Iterator[Tuple[str, str, str, str, ExitState]]:
+        """Yield (exit_id, from_room, direction, to_room, state) for every exit, or just ``exit_id``."""
+        exit_ids = self._exits if exit_id is None else [exit_id] if exit_id in self._exits else []
+        for current_id in exit_ids:
+            from_room, direction = self._exit_origins[current_id]
+            yield current_id, from_room, direction, self._exit_targets[current_id], self._exits[current_id]
+    
+    def get_rooms_leading_to(self, room_id: str) -> List[str]:
+        """Get rooms that have an exit into a room."""
+        return list(self._incoming.get(room_id, ()))
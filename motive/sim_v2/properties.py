@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# Called with (key, old_value, new_value) after a property value changes
+PropertyListener = Callable[[str, Any, Any], None]
 
 
 class PropertyType(str, Enum):
@@ -28,11 +32,25 @@ class PropertyStore:
     - Enforces primitive types (string/number/boolean/enum)
     - Initializes values from schema defaults
     - get/set API with type and key validation
+    - change listeners, notified only when a value actually changes
     """
 
     def __init__(self, schema: Dict[str, PropertySchema]):
         self._schema: Dict[str, PropertySchema] = dict(schema)
         self._values: Dict[str, Any] = {key: sch.default for key, sch in schema.items()}
+        self._listeners: List[PropertyListener] = []
+
+    def subscribe(self, listener: PropertyListener) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: PropertyListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def as_dict(self) -> Mapping[str, Any]:
+        """Read-only live view of the current values (no copy)."""
+        return MappingProxyType(self._values)
 
     def get(self, key: str, default: Any = None) -> Any:
         if key not in self._schema:
@@ -56,7 +74,11 @@ class PropertyStore:
                 raise ValueError(
                     f"Property '{key}' expects one of {schema.allowed_values}, got {value}"
                 )
+        old_value = self._values.get(key)
         self._values[key] = value
+        if self._listeners and old_value != value:
+            for listener in list(self._listeners):
+                listener(key, old_value, value)
 
     @staticmethod
     def _is_type_compatible(schema: PropertySchema, value: Any) -> bool:
@@ -75,3 +97,19 @@ class PropertyStore:
         return True
 
 
+def property_mapping(entity: Any) -> Mapping[str, Any]:
+    """Return an entity's properties as a mapping, without copying.
+
+    Accepts plain dict entities, objects with a PropertyStore, and objects
+    with a dict ``properties`` attribute; anything else maps to {}.
+    """
+    if entity is None:
+        return {}
+    if isinstance(entity, dict):
+        return entity
+    properties = getattr(entity, 'properties', None)
+    if properties is None:
+        return {}
+    if isinstance(properties, PropertyStore):
+        return properties.as_dict()
+    return properties
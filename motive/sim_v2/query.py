@@ -2,98 +2,345 @@
 
 This module provides a simple query DSL for finding entities based on
 relations and conditions, inspired by graph query languages.
+
+Query syntax::
+
+    start.hop[.hop...].target [where condition]
+
+Each hop is one of:
+
+- ``contains``      direct contents
+- ``contains*``     contents at any depth (nested containers)
+- ``located_in``    the entity's container
+- ``located_in*``   every enclosing container
+- ``adjacent_to``   rooms one exit away (requires an ExitManager)
+
+``target`` is a descriptive label. The where clause uses the condition DSL
+from ``conditions``. Parsed queries are cached per string; a small planner
+picks between walking the hops forward from ``start`` and starting from a
+property index (for ``prop == value`` conjuncts) and checking the path
+backwards, whichever is estimated cheaper.
 """
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, KeysView, List, Optional, Tuple
 from dataclasses import dataclass
-from .conditions import ConditionParser, ConditionAST
+from .conditions import ConditionParser, ConditionAST, compile_condition
+from .exits import ExitManager
+from .properties import PropertyListener, PropertyStore, property_mapping
 from .relations import RelationsGraph
 
 
-@dataclass
+SUPPORTED_RELATIONS = ("contains", "contains*", "located_in", "located_in*", "adjacent_to")
+
+# Planner estimates: expected fan-out of a hop walked forward (after the
+# first hop, which is measured exactly) and walked backwards from a candidate.
+_FORWARD_FAN_OUT = {
+    "contains": 8, "contains*": 32, "located_in": 1, "located_in*": 4, "adjacent_to": 4,
+}
+_REVERSE_FAN_OUT = {
+    "contains": 1, "contains*": 4, "located_in": 8, "located_in*": 32, "adjacent_to": 4,
+}
+
+
+@dataclass(frozen=True)
 class QueryAST:
-    """Abstract Syntax Tree for query expressions."""
+    """Abstract Syntax Tree for query expressions.
+
+    ``relation`` is the first hop; ``hops`` holds every hop in order.
+    """
     start_entity: str
     relation: str
     target_entity: str
     condition: Optional[ConditionAST] = None
+    hops: Tuple[str, ...] = ()
+
+
+@dataclass
+class QueryPlan:
+    """How the planner chose to run a query."""
+    strategy: str  # "traverse" or "index"
+    estimated_cost: int
+    index_property: Optional[str] = None
+    index_value: Any = None
+
+
+class PropertyIndex:
+    """Equality index of one property over a dict of entities.
+
+    Entities backed by a PropertyStore are kept current by a listener on
+    their store, so every write (effects, triggers, direct ``set``) reaches
+    the index. Plain dict properties cannot report writes: call ``update``
+    (or ``QueryEngine.on_property_change``) after changing one, and for
+    entities added to the dict later. ``close`` detaches the listeners.
+    """
+
+    def __init__(self, property_name: str, entities: Dict[str, Any]):
+        self.property_name = property_name
+        self._entities = entities
+        self._buckets: Dict[Any, Dict[str, None]] = {}
+        self._value_of: Dict[str, Any] = {}
+        self._store_listeners: Dict[str, Tuple[Any, PropertyListener]] = {}  # entity_id -> (store, listener)
+        for entity_id in entities:
+            self.update(entity_id)
+
+    def update(self, entity_id: str) -> None:
+        """Re-read an entity's value into the index (and listen to its store)."""
+        self._watch(entity_id)
+        self._reindex(entity_id)
+
+    def close(self) -> None:
+        for store, listener in self._store_listeners.values():
+            store.unsubscribe(listener)
+        self._store_listeners.clear()
+
+    def _watch(self, entity_id: str) -> None:
+        store = getattr(self._entities.get(entity_id), 'properties', None)
+        watched = self._store_listeners.get(entity_id)
+        if watched is not None and watched[0] is store:
+            return
+        if watched is not None:
+            watched[0].unsubscribe(watched[1])
+            del self._store_listeners[entity_id]
+        if not isinstance(store, PropertyStore):
+            return
+
+        def listener(key: str, old_value: Any, new_value: Any) -> None:
+            if key == self.property_name:
+                self._reindex(entity_id)
+
+        store.subscribe(listener)
+        self._store_listeners[entity_id] = (store, listener)
+
+    def _reindex(self, entity_id: str) -> None:
+        self.remove(entity_id)
+        value = property_mapping(self._entities.get(entity_id)).get(self.property_name)
+        if value is None:
+            return
+        try:
+            self._buckets.setdefault(value, {})[entity_id] = None
+        except TypeError:
+            # Unhashable values (lists, dicts) are not indexed
+            return
+        self._value_of[entity_id] = value
+
+    def remove(self, entity_id: str) -> None:
+        if entity_id in self._value_of:
+            value = self._value_of.pop(entity_id)
+            bucket = self._buckets[value]
+            bucket.pop(entity_id, None)
+            if not bucket:
+                del self._buckets[value]
+
+    def lookup(self, value: Any) -> KeysView[str]:
+        """Entity ids whose property equals ``value`` (read-only view)."""
+        try:
+            return self._buckets.get(value, {}).keys()
+        except TypeError:
+            return {}.keys()
+
+
+@lru_cache(maxsize=1024)
+def _parse_query(query_str: str) -> QueryAST:
+    """Parse a stripped query string; cached so each string parses once."""
+    # Check for condition
+    if " where " in query_str:
+        main_query, condition_str = query_str.split(" where ", 1)
+        condition = ConditionParser().parse(condition_str.strip())
+    else:
+        main_query = query_str
+        condition = None
+
+    # Parse main query: "entity.relation[.relation...].target"
+    parts = [part.strip() for part in main_query.strip().split(".")]
+    if len(parts) < 3 or not all(parts):
+        raise ValueError(f"Invalid query format: {query_str}")
+
+    start_entity, hops, target_entity = parts[0], tuple(parts[1:-1]), parts[-1]
+    for hop in hops:
+        if hop not in SUPPORTED_RELATIONS:
+            raise ValueError(f"Unsupported relation: {hop}")
+
+    return QueryAST(
+        start_entity=start_entity,
+        relation=hops[0],
+        target_entity=target_entity,
+        condition=condition,
+        hops=hops,
+    )
 
 
 class QueryEngine:
     """Parses and executes queries against entity relations."""
-    
-    def __init__(self):
+
+    def __init__(self, exit_manager: Optional[ExitManager] = None):
         self.condition_parser = ConditionParser()
-    
+        self.exit_manager = exit_manager
+        self._indexes: Dict[str, PropertyIndex] = {}
+
     def parse(self, query_str: str) -> QueryAST:
         """Parse a query string into QueryAST."""
-        query_str = query_str.strip()
-        
-        # Check for condition
-        if " where " in query_str:
-            main_query, condition_str = query_str.split(" where ", 1)
-            condition = self.condition_parser.parse(condition_str.strip())
-        else:
-            main_query = query_str
-            condition = None
-        
-        # Parse main query: "entity.relation.target"
-        parts = main_query.split(".")
-        if len(parts) != 3:
-            raise ValueError(f"Invalid query format: {query_str}")
-        
-        start_entity, relation, target_entity = parts
-        
-        return QueryAST(
-            start_entity=start_entity,
-            relation=relation,
-            target_entity=target_entity,
-            condition=condition
-        )
-    
+        return _parse_query(query_str.strip())
+
+    def create_index(self, property_name: str, entities: Dict[str, Any]) -> PropertyIndex:
+        """Build an equality index on a property for the planner to use."""
+        self.drop_index(property_name)
+        index = PropertyIndex(property_name, entities)
+        self._indexes[property_name] = index
+        return index
+
+    def drop_index(self, property_name: str) -> None:
+        index = self._indexes.pop(property_name, None)
+        if index is not None:
+            index.close()
+
+    def on_property_change(self, entity_id: str, property_name: str) -> None:
+        """Re-read a changed dict-backed property; matches the EffectEngine change listener."""
+        index = self._indexes.get(property_name)
+        if index is not None:
+            index.update(entity_id)
+
+    def explain(self, query_str: str, relations: RelationsGraph) -> QueryPlan:
+        """Return the plan execute() would use for a query."""
+        return self._plan(self.parse(query_str), relations)
+
     def execute(
-        self, 
-        query_str: str, 
-        relations: RelationsGraph, 
-        entities: Dict[str, Dict[str, Any]]
+        self,
+        query_str: str,
+        relations: RelationsGraph,
+        entities: Dict[str, Any]
     ) -> List[str]:
         """Execute a query and return matching entity IDs."""
         query_ast = self.parse(query_str)
-        
-        # Get entities related to start_entity (for "contains" relation)
-        if query_ast.relation == "contains":
-            related_entities = relations.get_contents_of(query_ast.start_entity)
+        plan = self._plan(query_ast, relations)
+
+        if plan.strategy == "index":
+            index = self._indexes[plan.index_property]
+            candidates = [
+                entity_id for entity_id in index.lookup(plan.index_value)
+                if self._reaches_start(entity_id, query_ast, relations)
+            ]
         else:
-            raise ValueError(f"Unsupported relation: {query_ast.relation}")
-        
+            candidates = self._traverse(query_ast, relations)
+
         # Filter by target entity type (simplified - just check if entity exists)
+        matches = compile_condition(query_ast.condition) if query_ast.condition else None
         matching_entities = []
-        for entity_id in related_entities:
+        for entity_id in candidates:
             if entity_id in entities:
                 # Apply condition filter if present
-                if query_ast.condition:
-                    entity_props = entities[entity_id]
-                    if self._evaluate_condition(query_ast.condition, entity_props):
-                        matching_entities.append(entity_id)
-                else:
+                if matches is None or matches(property_mapping(entities[entity_id])):
                     matching_entities.append(entity_id)
-        
+
         return matching_entities
-    
+
+    def _plan(self, query_ast: QueryAST, relations: RelationsGraph) -> QueryPlan:
+        """Pick the cheaper of forward traversal and an index lookup."""
+        plan = QueryPlan(strategy="traverse", estimated_cost=self._traversal_cost(query_ast, relations))
+
+        reverse_factor = 1
+        for hop in query_ast.hops:
+            reverse_factor *= _REVERSE_FAN_OUT[hop]
+
+        for property_name, value in self._indexable_equalities(query_ast.condition):
+            index = self._indexes.get(property_name)
+            if index is None:
+                continue
+            cost = len(index.lookup(value)) * reverse_factor
+            if cost < plan.estimated_cost:
+                plan = QueryPlan(
+                    strategy="index",
+                    estimated_cost=cost,
+                    index_property=property_name,
+                    index_value=value,
+                )
+        return plan
+
+    def _traversal_cost(self, query_ast: QueryAST, relations: RelationsGraph) -> int:
+        first, rest = query_ast.hops[0], query_ast.hops[1:]
+        start = query_ast.start_entity
+        if first == "contains":
+            cost = len(relations.contents_view(start))
+        elif first == "contains*":
+            cost = relations.count_all_contents_of(start)
+        elif first == "adjacent_to":
+            cost = len(self._require_exits().get_adjacent_rooms(start))
+        else:
+            cost = _FORWARD_FAN_OUT[first]
+        for hop in rest:
+            cost *= _FORWARD_FAN_OUT[hop]
+        return max(cost, 1)
+
+    @staticmethod
+    def _indexable_equalities(condition: Optional[ConditionAST]) -> Iterable[Tuple[str, Any]]:
+        """Yield (property, value) pairs that every match must satisfy."""
+        if condition is None:
+            return
+        if condition.operator == "AND":
+            yield from QueryEngine._indexable_equalities(condition.left)
+            yield from QueryEngine._indexable_equalities(condition.right)
+        elif condition.operator == "==":
+            yield condition.left, condition.right
+
+    def _traverse(self, query_ast: QueryAST, relations: RelationsGraph) -> List[str]:
+        """Walk the hops forward from the start entity."""
+        frontier: Iterable[str] = (query_ast.start_entity,)
+        for hop in query_ast.hops:
+            frontier = self._dedupe(
+                related for entity_id in frontier
+                for related in self._step(hop, entity_id, relations)
+            )
+        return list(frontier)
+
+    def _reaches_start(self, entity_id: str, query_ast: QueryAST, relations: RelationsGraph) -> bool:
+        """Walk the hops backwards from a candidate to check it matches the path."""
+        frontier: Iterable[str] = (entity_id,)
+        for hop in reversed(query_ast.hops):
+            frontier = self._dedupe(
+                related for current in frontier
+                for related in self._step_back(hop, current, relations)
+            )
+            if not frontier:
+                return False
+        return query_ast.start_entity in frontier
+
+    def _step(self, hop: str, entity_id: str, relations: RelationsGraph) -> Iterable[str]:
+        if hop == "contains":
+            return relations.contents_view(entity_id)
+        if hop == "contains*":
+            return relations.iter_all_contents_of(entity_id)
+        if hop == "located_in":
+            container = relations.get_container_of(entity_id)
+            return () if container is None else (container,)
+        if hop == "located_in*":
+            return relations.get_ancestors(entity_id)
+        if hop == "adjacent_to":
+            return self._require_exits().get_adjacent_rooms(entity_id)
+        raise ValueError(f"Unsupported relation: {hop}")
+
+    def _step_back(self, hop: str, entity_id: str, relations: RelationsGraph) -> Iterable[str]:
+        if hop == "contains":
+            container = relations.get_container_of(entity_id)
+            return () if container is None else (container,)
+        if hop == "contains*":
+            return relations.get_ancestors(entity_id)
+        if hop == "located_in":
+            return relations.contents_view(entity_id)
+        if hop == "located_in*":
+            return relations.iter_all_contents_of(entity_id)
+        if hop == "adjacent_to":
+            return self._require_exits().get_rooms_leading_to(entity_id)
+        raise ValueError(f"Unsupported relation: {hop}")
+
+    def _require_exits(self) -> ExitManager:
+        if self.exit_manager is None:
+            raise ValueError("Relation 'adjacent_to' requires an ExitManager")
+        return self.exit_manager
+
+    @staticmethod
+    def _dedupe(entity_ids: Iterable[str]) -> List[str]:
+        return list(dict.fromkeys(entity_ids))
+
     def _evaluate_condition(self, condition: ConditionAST, properties: Dict[str, Any]) -> bool:
         """Evaluate a condition against entity properties."""
-        left_value = properties.get(condition.left)
-        
-        # Handle missing properties
-        if left_value is None:
-            return False
-        
-        # Evaluate based on operator
-        if condition.operator == "==":
-            return left_value == condition.right
-        elif condition.operator == ">":
-            return left_value > condition.right
-        elif condition.operator == "<":
-            return left_value < condition.right
-        else:
-            raise ValueError(f"Unsupported operator: {condition.operator}")
+        return compile_condition(condition)(properties)
@@ -1,41 +1,125 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, KeysView, List, Optional
 
 
 class RelationsGraph:
     """Simple container/location relations.
 
-    Maintains a mapping of entity_id -> container_id and container_id -> contents list.
+    Maintains a mapping of entity_id -> container_id and container_id -> contents.
+    Contents are insertion-ordered sets (dict keys), so membership, insertion
+    and removal are O(1). A root index maps every contained entity to its
+    outermost container, so "which room is this ultimately in" is O(1);
+    moving an entity updates the index for its subtree only. Nested-content
+    counts are kept per container for query planning.
     MVP: no capacity/constraints; atomic updates; idempotent operations.
     """
 
     def __init__(self) -> None:
         self._container_of: Dict[str, Optional[str]] = {}
-        self._contents_of: Dict[str, List[str]] = defaultdict(list)
+        self._contents_of: Dict[str, Dict[str, None]] = {}
+        self._root_of: Dict[str, str] = {}
+        self._nested_count: Dict[str, int] = {}
+        self._contents_version: Dict[str, int] = {}
 
     def get_container_of(self, entity_id: str) -> Optional[str]:
         return self._container_of.get(entity_id)
 
     def get_contents_of(self, container_id: str) -> List[str]:
-        return list(self._contents_of.get(container_id, []))
+        """Return a copy of the direct contents of a container."""
+        return list(self._contents_of.get(container_id, ()))
+
+    def contents_view(self, container_id: str) -> KeysView[str]:
+        """Read-only, zero-copy view of the direct contents of a container.
+
+        The view reflects later moves; do not move entities while iterating it.
+        """
+        return self._contents_of.get(container_id, {}).keys()
+
+    def get_contents_version(self, container_id: str) -> int:
+        """Counter bumped whenever anything inside a container moves in or out, at any depth."""
+        return self._contents_version.get(container_id, 0)
+
+    def contains(self, container_id: str, entity_id: str) -> bool:
+        """Whether entity_id is directly inside container_id."""
+        return entity_id in self._contents_of.get(container_id, ())
+
+    def iter_all_contents_of(self, container_id: str) -> Iterator[str]:
+        """Yield everything inside a container, including nested contents.
+
+        Depth-first, parents before their contents; O(k) in the result size.
+        """
+        stack = [iter(self._contents_of.get(container_id, ()))]
+        while stack:
+            for entity_id in stack[-1]:
+                yield entity_id
+                nested = self._contents_of.get(entity_id)
+                if nested:
+                    stack.append(iter(nested))
+                    break
+            else:
+                stack.pop()
+
+    def get_all_contents_of(self, container_id: str) -> List[str]:
+        """Everything inside a container, including nested containers' contents."""
+        return list(self.iter_all_contents_of(container_id))
+
+    def count_all_contents_of(self, container_id: str) -> int:
+        """Number of entities inside a container at any depth (O(1))."""
+        return self._nested_count.get(container_id, 0)
+
+    def get_ancestors(self, entity_id: str) -> List[str]:
+        """Containers enclosing an entity, innermost first."""
+        ancestors = []
+        container = self._container_of.get(entity_id)
+        while container is not None:
+            ancestors.append(container)
+            container = self._container_of.get(container)
+        return ancestors
+
+    def get_root_container(self, entity_id: str) -> Optional[str]:
+        """Outermost container of an entity (e.g. its room), or None if uncontained."""
+        return self._root_of.get(entity_id)
+
+    def is_inside(self, entity_id: str, container_id: str) -> bool:
+        """Whether entity_id is inside container_id at any depth."""
+        container = self._container_of.get(entity_id)
+        while container is not None:
+            if container == container_id:
+                return True
+            container = self._container_of.get(container)
+        return False
 
     def place_entity(self, entity_id: str, container_id: str) -> None:
+        if entity_id == container_id or self.is_inside(container_id, entity_id):
+            raise ValueError(
+                f"Cannot place '{entity_id}' inside '{container_id}': would create a containment cycle"
+            )
+
+        subtree_size = 1 + self._nested_count.get(entity_id, 0)
+
         # Remove from previous container if exists
         prev = self._container_of.get(entity_id)
         if prev is not None:
-            try:
-                self._contents_of[prev].remove(entity_id)
-            except ValueError:
-                pass
+            self._contents_of[prev].pop(entity_id, None)
+            self._record_subtree_change(prev, -subtree_size)
 
         # Place into new container
         self._container_of[entity_id] = container_id
-        if entity_id not in self._contents_of[container_id]:
-            self._contents_of[container_id].append(entity_id)
+        self._contents_of.setdefault(container_id, {})[entity_id] = None
+        self._record_subtree_change(container_id, subtree_size)
 
-    def move_entity(self, entity_id: str, new_container_id: str) -> None:
-        self.place_entity(entity_id=entity_id, container_id=new_container_id)
+        # Re-root the moved subtree
+        root = self._root_of.get(container_id, container_id)
+        self._root_of[entity_id] = root
+        for nested_id in self.iter_all_contents_of(entity_id):
+            self._root_of[nested_id] = root
 
+    def _record_subtree_change(self, container_id: Optional[str], delta: int) -> None:
+        while container_id is not None:
+            self._nested_count[container_id] = self._nested_count.get(container_id, 0) + delta
+            self._contents_version[container_id] = self._contents_version.get(container_id, 0) + 1
+            container_id = self._container_of.get(container_id)
 
+    def move_entity(self, entity_id: str, new_container_id: str) -> None:
+        self.place_entity(entity_id=entity_id, container_id=new_container_id)
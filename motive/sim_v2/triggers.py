@@ -2,12 +2,26 @@
 
 This module provides triggers that respond to condition changes and execute
 effects when conditions transition from false to true or true to false.
+
+Triggers subscribe to the properties they read. Property writes (through a
+watched PropertyStore, MotiveEntity.set_property, or the engine's own
+EffectEngine) mark the affected triggers dirty, and process_dirty() evaluates
+only those, in registration order, with cycle and fan-out limits.
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from .conditions import ConditionAST
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from .conditions import CompiledCondition, ConditionAST, compile_condition, condition_properties
 from .effects import Effect, EffectEngine
+from .properties import property_mapping
+
+
+logger = logging.getLogger(__name__)
+
+# Subscription key used when a trigger reads a property on any entity
+ANY_ENTITY = "*"
 
 
 @dataclass
@@ -19,82 +33,275 @@ class TriggerState:
 
 @dataclass
 class Trigger:
-    """A trigger that responds to condition changes."""
+    """A trigger that responds to condition changes.
+
+    ``entity_id`` scopes the condition to one entity's properties; without it
+    the condition sees the merged properties of all entities. ``watches``
+    lists the properties the trigger reads, as ``"property"`` (any entity) or
+    ``"entity_id.property"``; when omitted it is derived from the condition.
+    ``matches`` is the compiled condition, set when the trigger is registered.
+    """
     trigger_id: str
     condition: ConditionAST
     effects: List[Effect]
     undo_effects: Optional[List[Effect]] = None
+    entity_id: Optional[str] = None
+    watches: Optional[List[str]] = None
+    matches: Optional[CompiledCondition] = field(default=None, init=False, repr=False, compare=False)
 
 
 class TriggerEngine:
     """Manages triggers and their reactive behavior."""
-    
-    def __init__(self):
+
+    def __init__(self, max_cycles_per_trigger: int = 8, max_fan_out: int = 256):
         self._triggers: Dict[str, Trigger] = {}
         self._trigger_states: Dict[str, TriggerState] = {}
-        self._effect_engine = EffectEngine()
-    
+        self._effect_engine = EffectEngine(on_property_change=self.mark_dirty)
+
+        # (entity_id or ANY_ENTITY, property) -> subscribed trigger ids
+        self._subscribers: Dict[Tuple[str, str], Set[str]] = {}
+        self._subscriptions: Dict[str, FrozenSet[Tuple[str, str]]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+        # Dirty queue (deterministic: registration order within each wave)
+        self._dirty: Set[str] = set()
+        self._queue: Deque[str] = deque()
+
+        # Watched property stores: entity_id -> listener
+        self._store_listeners: Dict[str, Any] = {}
+
+        self.max_cycles_per_trigger = max_cycles_per_trigger
+        self.max_fan_out = max_fan_out
+        self._firing_trigger: Optional[str] = None
+        self._fan_out_count = 0
+
+    @property
+    def effect_engine(self) -> EffectEngine:
+        """Runs trigger effects; add property listeners to it to see their writes too."""
+        return self._effect_engine
+
     def register_trigger(self, trigger: Trigger) -> None:
         """Register a trigger with the engine."""
+        if trigger.trigger_id in self._triggers:
+            self._unsubscribe(trigger.trigger_id)
+        else:
+            self._order[trigger.trigger_id] = self._next_order
+            self._next_order += 1
+        trigger.matches = compile_condition(trigger.condition)
         self._triggers[trigger.trigger_id] = trigger
         self._trigger_states[trigger.trigger_id] = TriggerState()
-    
+        self._subscribe(trigger)
+        # New triggers need an initial evaluation
+        self._enqueue(trigger.trigger_id)
+
     def get_trigger(self, trigger_id: str) -> Optional[Trigger]:
         """Get a registered trigger."""
         return self._triggers.get(trigger_id)
-    
+
     def get_trigger_state(self, trigger_id: str) -> Optional[TriggerState]:
         """Get the state of a trigger."""
         return self._trigger_states.get(trigger_id)
-    
+
+    def watch_entity(self, entity_id: str, entity: Any) -> None:
+        """Mark triggers dirty whenever a PropertyStore-backed entity changes."""
+        store = getattr(entity, 'properties', None)
+        if store is None or not hasattr(store, 'subscribe'):
+            return
+        self.unwatch_entity(entity_id, entity)
+
+        def listener(key: str, old_value: Any, new_value: Any) -> None:
+            self.mark_dirty(entity_id, key)
+
+        store.subscribe(listener)
+        self._store_listeners[entity_id] = listener
+
+    def watch_entities(self, entities: Dict[str, Any]) -> None:
+        """Watch every PropertyStore-backed entity in ``entities``."""
+        for entity_id, entity in entities.items():
+            self.watch_entity(entity_id, entity)
+
+    def unwatch_entity(self, entity_id: str, entity: Any) -> None:
+        """Stop watching an entity's property store."""
+        listener = self._store_listeners.pop(entity_id, None)
+        store = getattr(entity, 'properties', None)
+        if listener is not None and store is not None and hasattr(store, 'unsubscribe'):
+            store.unsubscribe(listener)
+
+    def mark_dirty(self, entity_id: str, property_name: str) -> None:
+        """Queue every trigger that reads ``entity_id.property_name``."""
+        affected = self._subscribers.get((entity_id, property_name), set()) | \
+            self._subscribers.get((ANY_ENTITY, property_name), set())
+        for trigger_id in sorted(affected, key=self._order.__getitem__):
+            self._enqueue(trigger_id)
+
+    def has_dirty_triggers(self) -> bool:
+        """Whether any trigger is waiting to be evaluated."""
+        return bool(self._queue)
+
+    def process_dirty(self, entities: Dict[str, Any]) -> List[str]:
+        """Evaluate dirty triggers until the queue drains.
+
+        Effects fired by a trigger may dirty further triggers; those run in
+        the same pass. A trigger evaluated more than ``max_cycles_per_trigger``
+        times in one pass is assumed to be oscillating and is skipped.
+
+        Returns the ids of the triggers evaluated, in evaluation order.
+        """
+        evaluated: List[str] = []
+        cycles: Dict[str, int] = {}
+        merged: Optional[Dict[str, Any]] = None
+
+        while self._queue:
+            trigger_id = self._queue.popleft()
+            self._dirty.discard(trigger_id)
+            trigger = self._triggers.get(trigger_id)
+            if trigger is None:
+                continue
+
+            cycles[trigger_id] = cycles.get(trigger_id, 0) + 1
+            if cycles[trigger_id] > self.max_cycles_per_trigger:
+                logger.warning(
+                    f"Trigger '{trigger_id}' exceeded {self.max_cycles_per_trigger} "
+                    f"evaluations in one pass; skipping (possible trigger cycle)"
+                )
+                continue
+
+            if trigger.entity_id is None:
+                # Merged view is shared until an effect fires
+                if merged is None:
+                    merged = self._merge_properties(entities)
+                properties = merged
+            else:
+                properties = property_mapping(entities.get(trigger.entity_id))
+
+            evaluated.append(trigger_id)
+            if self._evaluate_trigger_with(trigger, properties, entities):
+                merged = None
+
+        return evaluated
+
     def evaluate_triggers(self, entities: Dict[str, Any]) -> None:
-        """Evaluate all triggers against current entity state."""
-        for trigger_id, trigger in self._triggers.items():
+        """Evaluate all triggers against current entity state (full sweep)."""
+        self._queue.clear()
+        self._dirty.clear()
+        for trigger_id, trigger in list(self._triggers.items()):
             self._evaluate_trigger(trigger, entities)
-    
+        # A full sweep is single-pass; drop writes queued by its own effects
+        self._queue.clear()
+        self._dirty.clear()
+
     def _evaluate_trigger(self, trigger: Trigger, entities: Dict[str, Any]) -> None:
         """Evaluate a single trigger."""
-        from .conditions import ConditionEvaluator
-        
-        evaluator = ConditionEvaluator()
+        if trigger.entity_id is None:
+            properties = self._merge_properties(entities)
+        else:
+            properties = property_mapping(entities.get(trigger.entity_id))
+        self._evaluate_trigger_with(trigger, properties, entities)
+
+    def _evaluate_trigger_with(
+        self,
+        trigger: Trigger,
+        properties: Mapping[str, Any],
+        entities: Dict[str, Any],
+    ) -> bool:
+        """Evaluate a trigger against prepared properties.
+
+        Returns True if effects were executed.
+        """
         state = self._trigger_states[trigger.trigger_id]
-        
-        # Evaluate condition
-        # For simplicity, assume condition evaluates against first entity
-        # In a full implementation, this would be more sophisticated
-        entity_props = {}
-        for entity_id, entity in entities.items():
-            if hasattr(entity, 'properties'):
-                entity_props.update(entity.properties)
-            elif isinstance(entity, dict):
-                entity_props.update(entity)
-        
-        current_evaluation = evaluator.evaluate(trigger.condition, entity_props)
-        
+        current_evaluation = trigger.matches(properties)
+        fired = False
+
         # Check for edge transitions
         if current_evaluation != state.last_evaluation:
             if current_evaluation:  # False -> True
-                self._execute_effects(trigger.effects, entities)
+                self._fire(trigger.trigger_id, trigger.effects, entities)
+                fired = True
             else:  # True -> False
                 if trigger.undo_effects:
-                    self._execute_effects(trigger.undo_effects, entities)
-        
+                    self._fire(trigger.trigger_id, trigger.undo_effects, entities)
+                    fired = True
+
         # Update state
         state.is_active = current_evaluation
         state.last_evaluation = current_evaluation
-    
+        return fired
+
+    def _fire(self, trigger_id: str, effects: List[Effect], entities: Dict[str, Any]) -> None:
+        """Execute a trigger's effects, tracking how many triggers they dirty."""
+        previous = (self._firing_trigger, self._fan_out_count)
+        self._firing_trigger, self._fan_out_count = trigger_id, 0
+        try:
+            self._execute_effects(effects, entities)
+        finally:
+            self._firing_trigger, self._fan_out_count = previous
+
     def _execute_effects(self, effects: List[Effect], entities: Dict[str, Any]) -> None:
         """Execute a list of effects."""
         for effect in effects:
             self._effect_engine.execute_effect(effect, entities)
-    
+
+    def _enqueue(self, trigger_id: str) -> None:
+        if trigger_id in self._dirty:
+            return
+        if self._firing_trigger is not None:
+            if self._fan_out_count >= self.max_fan_out:
+                logger.warning(
+                    f"Trigger '{self._firing_trigger}' dirtied more than "
+                    f"{self.max_fan_out} triggers; not queueing '{trigger_id}'"
+                )
+                return
+            self._fan_out_count += 1
+        self._dirty.add(trigger_id)
+        self._queue.append(trigger_id)
+
+    def _subscribe(self, trigger: Trigger) -> None:
+        if trigger.watches is not None:
+            keys = set()
+            for watch in trigger.watches:
+                entity_id, _, property_name = watch.rpartition(".")
+                keys.add((entity_id or trigger.entity_id or ANY_ENTITY, property_name))
+        else:
+            scope = trigger.entity_id or ANY_ENTITY
+            keys = {(scope, name) for name in condition_properties(trigger.condition)}
+
+        self._subscriptions[trigger.trigger_id] = frozenset(keys)
+        for key in keys:
+            self._subscribers.setdefault(key, set()).add(trigger.trigger_id)
+
+    def _unsubscribe(self, trigger_id: str) -> None:
+        for key in self._subscriptions.pop(trigger_id, frozenset()):
+            subscribers = self._subscribers.get(key)
+            if subscribers is not None:
+                subscribers.discard(trigger_id)
+                if not subscribers:
+                    del self._subscribers[key]
+
+    def _merge_properties(self, entities: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge all entities' properties into one dict (legacy unscoped triggers)."""
+        entity_props: Dict[str, Any] = {}
+        for entity in entities.values():
+            entity_props.update(property_mapping(entity))
+        return entity_props
+
     def remove_trigger(self, trigger_id: str) -> None:
         """Remove a trigger from the engine."""
         if trigger_id in self._triggers:
+            self._unsubscribe(trigger_id)
             del self._triggers[trigger_id]
             del self._trigger_states[trigger_id]
-    
+            self._order.pop(trigger_id, None)
+            if trigger_id in self._dirty:
+                self._dirty.discard(trigger_id)
+                self._queue.remove(trigger_id)
+
     def clear_all_triggers(self) -> None:
         """Clear all registered triggers."""
         self._triggers.clear()
         self._trigger_states.clear()
+        self._subscribers.clear()
+        self._subscriptions.clear()
+        self._order.clear()
+        self._dirty.clear()
+        self._queue.clear()
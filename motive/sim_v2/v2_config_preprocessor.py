@@ -7,14 +7,33 @@ This module provides a pre-processor for v2 configurations that:
 3. Provides the same interface as v1 config_loader.py
 
 The merged config dict is then validated by Pydantic models in v2_config_validator.py
+
+Every file in the include tree is parsed exactly once per load: a parse pass
+walks the tree breadth-first (with the libyaml C loader when available;
+max_parse_workers > 1 reads each level's includes in threads, which only pays
+off on slow filesystems), then the merge pass works from the parsed documents. load_config_with_metadata also reports
+whether the tree is a v2 config, so callers need no separate detection pass.
 """
 
 import os
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Set, Optional
 from pathlib import Path
 import logging
-from ..config_merging import ConfigMerger
+from ..config_merging import ConfigMerger, MergeSession, Provenance
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _parse_yaml_file(path: Path) -> Any:
+    """Parse one YAML file with the fastest available safe loader."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 class V2ConfigLoadError(Exception):
@@ -22,13 +41,34 @@ class V2ConfigLoadError(Exception):
     pass
 
 
+@dataclass
+class V2ConfigLoadResult:
+    """Result of a single-pass config load."""
+    config: Optional[Dict[str, Any]]  # Merged config; None when the tree is not v2
+    is_v2: bool
+    has_includes: bool  # Whether the root file declares includes
+    files: List[str] = field(default_factory=list)  # Absolute paths parsed, in discovery order
+
+
+class _ParseFailure:
+    """Placeholder for a file whose YAML failed to parse (raised during merge)."""
+
+    def __init__(self, error: yaml.YAMLError):
+        self.error = error
+
+
 class V2ConfigPreprocessor:
     """Pre-processor for v2 configurations with include support."""
     
-    def __init__(self, base_path: str = "configs"):
+    def __init__(self, base_path: str = "configs", max_parse_workers: int = 1):
         self.base_path = Path(base_path)
         self.loaded_configs: Dict[str, Dict[str, Any]] = {}
         self.loading_stack: List[str] = []  # Track loading order for circular dependency detection
+        self.parsed_files: Dict[str, Any] = {}  # abs path -> parsed YAML document (one parse per load)
+        self.provenance: Dict[str, Provenance] = {}  # abs path -> key path -> file that wrote it
+        self.includes_of: Dict[str, List[str]] = {}  # abs path -> abs paths it includes
+        self.root_path: Optional[str] = None  # abs path of the root file of the last load
+        self.max_parse_workers = max_parse_workers
         self.logger = logging.getLogger(__name__)
         self.config_merger = ConfigMerger()
     
@@ -48,22 +88,127 @@ class V2ConfigPreprocessor:
             ValueError: If circular dependency is detected
             yaml.YAMLError: If YAML parsing fails
         """
+        return self._load(config_path, base_path, detect_version=False).config
+    
+    def load_config_with_metadata(self, config_path: str, base_path: Optional[str] = None) -> V2ConfigLoadResult:
+        """
+        Load a config tree once and report its version alongside the merged config.
+        
+        The tree is v2 if any parsed file declares entity_definitions or
+        action_definitions. Non-v2 trees are parsed but not merged.
+        
+        Args:
+            config_path: Path to the config file relative to base_path
+            base_path: Override the base path for this load operation
+            
+        Returns:
+            V2ConfigLoadResult with the merged config (None for non-v2 trees)
+        """
+        return self._load(config_path, base_path, detect_version=True)
+    
+    def _load(self, config_path: str, base_path: Optional[str], detect_version: bool) -> V2ConfigLoadResult:
         # Use provided base_path or fall back to instance base_path
+        original_base_path = self.base_path
         if base_path is not None:
-            original_base_path = self.base_path
             self.base_path = Path(base_path)
-            try:
-                # Reset state for this load
-                self.loaded_configs.clear()
-                self.loading_stack.clear()
-                return self._load_config_recursive(config_path)
-            finally:
-                self.base_path = original_base_path
-        else:
+        try:
             # Reset state for this load
             self.loaded_configs.clear()
             self.loading_stack.clear()
-            return self._load_config_recursive(config_path)
+            self.provenance.clear()
+            self.includes_of.clear()
+            self.root_path = str(self._resolve_path(config_path))
+            self._parse_tree(config_path)
+            
+            root = self.parsed_files.get(self.root_path)
+            has_includes = isinstance(root, dict) and 'includes' in root
+            is_v2 = any(
+                isinstance(doc, dict) and ('entity_definitions' in doc or 'action_definitions' in doc)
+                for doc in self.parsed_files.values()
+            )
+            config = None
+            has_parse_errors = any(isinstance(doc, _ParseFailure) for doc in self.parsed_files.values())
+            if is_v2 or not detect_version or has_parse_errors:
+                # Parse errors are raised by the merge pass, with the loading chain
+                config = self._load_config_recursive(config_path)
+            return V2ConfigLoadResult(
+                config=config,
+                is_v2=is_v2,
+                has_includes=has_includes,
+                files=list(self.parsed_files),
+            )
+        finally:
+            self.base_path = original_base_path
+    
+    def _resolve_path(self, config_path: str) -> Path:
+        """Resolve a config path (relative to base_path) to an absolute path."""
+        if os.path.isabs(config_path):
+            return Path(config_path)
+        # Handle relative paths that go up directories
+        if config_path.startswith('../'):
+            # Go up from base_path and then follow the relative path
+            # Remove '../' prefix and resolve relative to parent directory
+            relative_path = config_path[3:]  # Remove '../'
+            return (self.base_path.parent / relative_path).resolve()
+        return (self.base_path / config_path).resolve()
+    
+    @staticmethod
+    def _include_paths(config_path: str, config_data: Any) -> List[str]:
+        """Include paths declared by a parsed file, resolved relative to that file."""
+        if not isinstance(config_data, dict) or 'includes' not in config_data:
+            return []
+        includes = config_data['includes']
+        if not isinstance(includes, list):
+            includes = [includes]
+        resolved = []
+        for include_path in includes:
+            # Resolve include path relative to current config
+            if not os.path.isabs(include_path):
+                include_path = os.path.join(os.path.dirname(config_path), include_path)
+            resolved.append(include_path)
+        return resolved
+    
+    def _parse_tree(self, config_path: str) -> None:
+        """Parse every reachable file once, breadth-first (threaded per level if max_parse_workers > 1).
+        
+        Missing files and YAML errors are recorded, not raised; the merge pass
+        reports them with the full loading chain.
+        """
+        self.parsed_files.clear()
+        frontier = [config_path]
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            while frontier:
+                batch = []
+                for path in frontier:
+                    abs_path = self._resolve_path(path)
+                    abs_path_str = str(abs_path)
+                    if abs_path_str in self.parsed_files or not abs_path.exists():
+                        continue
+                    self.parsed_files[abs_path_str] = None  # Reserve slot (keeps discovery order)
+                    batch.append((path, abs_path))
+                
+                if len(batch) > 1 and self.max_parse_workers > 1:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=self.max_parse_workers)
+                    documents = list(executor.map(self._parse_file, [abs_path for _, abs_path in batch]))
+                else:
+                    documents = [self._parse_file(abs_path) for _, abs_path in batch]
+                
+                frontier = []
+                for (path, abs_path), document in zip(batch, documents):
+                    self.parsed_files[str(abs_path)] = document
+                    frontier.extend(self._include_paths(path, document))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+    
+    @staticmethod
+    def _parse_file(abs_path: Path) -> Any:
+        try:
+            return _parse_yaml_file(abs_path)
+        except yaml.YAMLError as e:
+            return _ParseFailure(e)
     
     def _load_config_recursive(self, config_path: str) -> Dict[str, Any]:
         """
@@ -76,17 +221,7 @@ class V2ConfigPreprocessor:
             Merged configuration dictionary
         """
         # Resolve absolute path, handling relative paths correctly
-        if os.path.isabs(config_path):
-            abs_path = Path(config_path)
-        else:
-            # Handle relative paths that go up directories
-            if config_path.startswith('../'):
-                # Go up from base_path and then follow the relative path
-                # Remove '../' prefix and resolve relative to parent directory
-                relative_path = config_path[3:]  # Remove '../'
-                abs_path = (self.base_path.parent / relative_path).resolve()
-            else:
-                abs_path = (self.base_path / config_path).resolve()
+        abs_path = self._resolve_path(config_path)
         abs_path_str = str(abs_path)
         
         # Check for circular dependency
@@ -108,31 +243,36 @@ class V2ConfigPreprocessor:
         self.loading_stack.append(abs_path_str)
         
         try:
-            # Load the YAML file
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f) or {}
+            # Use the document from the parse pass (parse now if loaded directly)
+            if abs_path_str in self.parsed_files and self.parsed_files[abs_path_str] is not None:
+                config_data = self.parsed_files[abs_path_str]
+            else:
+                config_data = self.parsed_files[abs_path_str] = _parse_yaml_file(abs_path)
+            if isinstance(config_data, _ParseFailure):
+                raise config_data.error
+            # Shallow copy so popping includes leaves the parsed document intact
+            config_data = dict(config_data) if isinstance(config_data, dict) else (config_data or {})
             
             # Handle includes (C++ convention: includes at top, processed first)
             if 'includes' in config_data:
-                includes = config_data.pop('includes')  # Remove includes from final config
-                if not isinstance(includes, list):
-                    includes = [includes]
+                includes = self._include_paths(config_path, config_data)
+                config_data.pop('includes')  # Remove includes from final config
+                self.includes_of[abs_path_str] = [str(self._resolve_path(path)) for path in includes]
                 
-                # Load all included configs first (like C++ #include)
-                merged_config = {}
+                # Load all included configs first (like C++ #include); the session
+                # shares their subtrees and copies only what later files write into
+                session = MergeSession({}, self.config_merger, track_provenance=True)
                 for include_path in includes:
-                    # Resolve include path relative to current config
-                    if not os.path.isabs(include_path):
-                        include_path = os.path.join(os.path.dirname(config_path), include_path)
-                    
                     included_config = self._load_config_recursive(include_path)
-                    merged_config = self._merge_configs(merged_config, included_config)
+                    session.merge(included_config, source=str(self._resolve_path(include_path)))
                 
                 # Merge current config on top of included configs (current config overrides)
-                merged_config = self._merge_configs(merged_config, config_data)
+                merged_config = session.merge(config_data, source=abs_path_str)
             else:
                 # Even with no includes, we need to process merge strategy markers
-                merged_config = self._merge_configs({}, config_data)
+                session = MergeSession({}, self.config_merger, track_provenance=True)
+                merged_config = session.merge(config_data, source=abs_path_str)
+            self.provenance[abs_path_str] = session.provenance
             
             # Enforce: entity-level 'config' dicts are not allowed in v2 YAML
             if 'entity_definitions' in merged_config and isinstance(merged_config['entity_definitions'], dict):
@@ -155,6 +295,95 @@ class V2ConfigPreprocessor:
             # Remove from loading stack
             self.loading_stack.pop()
     
+    def reload_files(self, changed_paths: List[str]) -> Dict[str, Any]:
+        """
+        Re-parse changed files and re-merge only the configs that depend on them.
+        
+        Must follow a load of the same tree. Merged results of files that neither
+        changed nor include a changed file (directly or transitively) are reused.
+        
+        Args:
+            changed_paths: Paths of files that changed (absolute, or relative to the cwd)
+            
+        Returns:
+            The merged root configuration
+            
+        Raises:
+            V2ConfigLoadError: If a changed file is missing or no longer parses
+        """
+        if self.root_path is None:
+            raise V2ConfigLoadError("reload_files() called before a config was loaded")
+        
+        changed = {str(Path(path).resolve()) for path in changed_paths}
+        for abs_path_str in changed:
+            # Missing files are reported by the merge pass, with the loading chain
+            self.parsed_files.pop(abs_path_str, None)
+            if Path(abs_path_str).exists():
+                self.parsed_files[abs_path_str] = self._parse_file(Path(abs_path_str))
+        
+        for abs_path_str in self._dependents_of(changed):
+            self.loaded_configs.pop(abs_path_str, None)
+            self.provenance.pop(abs_path_str, None)
+        self.loading_stack.clear()
+        return self._load_config_recursive(self.root_path)
+    
+    def _dependents_of(self, changed: Set[str]) -> Set[str]:
+        """Changed files plus every file that includes one of them, transitively."""
+        included_by: Dict[str, List[str]] = {}
+        for parent, children in self.includes_of.items():
+            for child in children:
+                included_by.setdefault(child, []).append(parent)
+        
+        affected = set(changed)
+        frontier = list(changed)
+        while frontier:
+            for parent in included_by.get(frontier.pop(), ()):
+                if parent not in affected:
+                    affected.add(parent)
+                    frontier.append(parent)
+        return affected
+    
+    def get_provenance(self, key_path: str, config_path: Optional[str] = None) -> Optional[str]:
+        """
+        Return the file that last set a dotted key path in the most recent load.
+        
+        Looks up the longest recorded prefix of the path and follows it into the
+        included file that supplied the value, so the answer is the file where
+        the value was actually written.
+        
+        Args:
+            key_path: Dotted key path, e.g. "entity_definitions.torch.properties"
+            config_path: Loaded file to start from (defaults to the root of the last load)
+            
+        Returns:
+            Absolute path of the source file, or None if the key was never set
+        """
+        if config_path is None:
+            if self.root_path is None:
+                return None
+            current = self.root_path
+        else:
+            current = str(self._resolve_path(config_path))
+        
+        parts = tuple(key_path.split("."))
+        visited = set()
+        while current not in visited:
+            visited.add(current)
+            table = self.provenance.get(current)
+            if not table:
+                return None
+            source = None
+            for end in range(len(parts), 0, -1):
+                source = table.get(parts[:end])
+                if source is not None:
+                    break
+            if source is None:
+                return None
+            if source == current:
+                return current
+            current = source
+        return current
+    
     def _merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge two v2 configuration dictionaries using the unified merging system.
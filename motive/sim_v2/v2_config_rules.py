@@ -0,0 +1,433 @@
+"""
+V2 Config Semantic Rules
+
+Content checks for v2 entity definitions, run by a single-pass validation
+engine. Each rule registers a per-entity check (optionally limited to entities
+of some types) and/or a cross-reference check that runs once after the pass
+against shared indexes (rooms, objects, characters, exits, object references,
+motives) built during that same pass.
+
+Per-entity checks can be sharded across a process pool for very large
+editions; the report records time spent in each rule so slow rules show up.
+"""
+
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+
+# (entity_id, entity_def, types, attributes) -> issue messages
+EntityCheck = Callable[[str, Any, FrozenSet[str], Dict[str, Any]], List[str]]
+
+
+@dataclass
+class ValidationIndexes:
+    """Cross-reference indexes built once per validation pass."""
+    rooms: set = field(default_factory=set)
+    objects: set = field(default_factory=set)
+    characters: set = field(default_factory=set)
+    room_exits: Dict[str, List[str]] = field(default_factory=dict)  # room_id -> destination_room_ids
+    room_object_refs: Dict[str, List[str]] = field(default_factory=dict)  # room_id -> object_type_ids
+    motives: Dict[str, List[Any]] = field(default_factory=dict)  # character_id -> motives
+
+
+@dataclass
+class ValidationRule:
+    """A registered semantic check.
+
+    ``check`` runs once per entity (only for entities with one of
+    ``entity_types`` when set); ``cross_check`` runs once after the pass.
+    Error rules raise with ``error_message(issues)``; warning rules are logged
+    under ``header``. Checks must be module-level functions to run in a
+    process pool.
+    """
+    name: str
+    header: str = ""
+    check: Optional[EntityCheck] = None
+    cross_check: Optional[Callable[[ValidationIndexes], List[str]]] = None
+    entity_types: Optional[FrozenSet[str]] = None
+    severity: str = "warning"  # "warning" or "error"
+    error_message: Optional[Callable[[List[str]], str]] = None
+
+
+@dataclass
+class ValidationReport:
+    """Issues and time spent per rule, in rule registration order."""
+    issues: Dict[str, List[str]] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)  # rule name -> seconds
+    entity_count: int = 0
+
+    def slowest_rules(self, limit: int = 5) -> List[Tuple[str, float]]:
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+class RuleRegistry:
+    """Ordered collection of validation rules."""
+
+    def __init__(self, rules: Iterable[ValidationRule] = ()):
+        self._rules: Dict[str, ValidationRule] = {}
+        for rule in rules:
+            self.register(rule)
+
+    def register(self, rule: ValidationRule) -> None:
+        if rule.name in self._rules:
+            raise ValueError(f"Validation rule already registered: {rule.name}")
+        self._rules[rule.name] = rule
+
+    def unregister(self, name: str) -> None:
+        self._rules.pop(name, None)
+
+    def rules(self) -> List[ValidationRule]:
+        return list(self._rules.values())
+
+    def copy(self) -> 'RuleRegistry':
+        return RuleRegistry(self._rules.values())
+
+
+def entity_types(entity_def: Any) -> FrozenSet[str]:
+    types = getattr(entity_def, 'types', None)
+    return frozenset(types) if isinstance(types, (list, tuple, set, frozenset)) else frozenset()
+
+
+def entity_attributes(entity_def: Any) -> Dict[str, Any]:
+    attributes = getattr(entity_def, 'attributes', None)
+    return attributes if isinstance(attributes, dict) else {}
+
+
+def _attribute_properties(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    properties = attributes.get('properties', {})
+    return properties if isinstance(properties, dict) else {}
+
+
+# --- Per-entity checks -------------------------------------------------------
+
+def _looks_string_encoded(value: Any) -> bool:
+    """A string holding a dict literal (e.g. "{'north': {...}}"), not a {{template}}."""
+    if isinstance(value, str):
+        text = value.strip()
+        return (text.startswith('{') and text.endswith('}') and
+                not text.startswith('{{') and ("'" in text or '"' in text) and ':' in text)
+    if isinstance(value, dict):
+        return any(_looks_string_encoded(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_looks_string_encoded(item) for item in value)
+    return False
+
+
+def check_no_string_encoded_yaml(entity_id, entity_def, types, attributes) -> List[str]:
+    properties = getattr(entity_def, 'properties', None)
+    if not properties:
+        return []
+    for schema in properties.values():
+        # Property schemas carry their value as the default
+        if _looks_string_encoded(getattr(schema, 'default', schema)):
+            return [
+                f"String-encoded YAML detected in entity '{entity_id}'. "
+                f"Use proper YAML structure instead of string encoding. "
+                f"See AGENT.md for proper YAML formatting guidelines."
+            ]
+    return []
+
+
+def check_character_has_motives(entity_id, entity_def, types, attributes) -> List[str]:
+    # Check for motives (new format) or motive (legacy format)
+    motives = attributes.get('motives', [])
+    if (motives and len(motives) > 0) or attributes.get('motive'):
+        return []
+    return [entity_id]
+
+
+def check_object_interactions(entity_id, entity_def, types, attributes) -> List[str]:
+    issues = []
+    interactions = attributes.get('interactions', {})
+    properties = _attribute_properties(attributes)
+    pickup_action = properties.get('pickup_action')
+    if pickup_action and isinstance(interactions, dict) and pickup_action not in interactions:
+        issues.append(
+            f"Object '{entity_id}' has pickup_action '{pickup_action}' but no corresponding interaction"
+        )
+
+    # Check for action aliases that don't map to valid interactions
+    action_aliases = attributes.get('action_aliases', {})
+    if isinstance(action_aliases, dict) and isinstance(interactions, dict):
+        for alias, target_action in action_aliases.items():
+            if target_action not in interactions:
+                issues.append(
+                    f"Object '{entity_id}' has action alias '{alias}' -> '{target_action}' but no '{target_action}' interaction"
+                )
+    return issues
+
+
+def check_motive_conditions(entity_id, entity_def, types, attributes) -> List[str]:
+    issues = []
+    motives = attributes.get('motives', [])
+    if not isinstance(motives, list):
+        return issues
+    for motive in motives:
+        if not isinstance(motive, dict):
+            continue
+        success_conditions = motive.get('success_conditions', [])
+        if not success_conditions:
+            issues.append(f"Character '{entity_id}' has motive '{motive.get('id', 'unnamed')}' with no success conditions")
+
+        # Check for common issues in success conditions
+        for condition in success_conditions:
+            if isinstance(condition, dict) and condition.get('type') == 'character_has_property':
+                if not condition.get('property'):
+                    issues.append(f"Character '{entity_id}' has motive with invalid property condition (missing property name)")
+    return issues
+
+
+_DESCRIBED_TYPES = (('object', 'Object'), ('room', 'Room'), ('character', 'Character'))
+
+
+def check_descriptions(entity_id, entity_def, types, attributes) -> List[str]:
+    description = attributes.get('description', '')
+    if description and description.strip() != '':
+        return []
+    return [f"{label} '{entity_id}' has no description" for type_name, label in _DESCRIBED_TYPES if type_name in types]
+
+
+_REQUIRED_INTERACTIONS = (('usable', 'use'), ('readable', 'read'), ('pickupable', 'pickup'))
+
+
+def check_action_integrity(entity_id, entity_def, types, attributes) -> List[str]:
+    properties = attributes.get('properties', {})
+    interactions = attributes.get('interactions', {})
+    return [
+        f"Object '{entity_id}' is marked as {flag} but has no '{interaction}' interaction"
+        for flag, interaction in _REQUIRED_INTERACTIONS
+        if properties.get(flag, False) and interaction not in interactions
+    ]
+
+
+# --- Cross-reference checks --------------------------------------------------
+
+def check_room_exits(indexes: ValidationIndexes) -> List[str]:
+    return [
+        f"Room '{room_id}' has exit pointing to undefined room '{destination}'"
+        for room_id, destinations in indexes.room_exits.items()
+        for destination in destinations
+        if destination not in indexes.rooms
+    ]
+
+
+def check_room_object_refs(indexes: ValidationIndexes) -> List[str]:
+    return [
+        f"Room '{room_id}' references undefined object type '{object_type_id}'"
+        for room_id, object_type_ids in indexes.room_object_refs.items()
+        for object_type_id in object_type_ids
+        if object_type_id not in indexes.objects
+    ]
+
+
+def _first_issue(issues: List[str]) -> str:
+    return issues[0]
+
+
+def _missing_motives_message(character_ids: List[str]) -> str:
+    return (
+        f"Characters without motives found: {character_ids}. "
+        f"All characters must have motives defined. Characters without motives should be removed "
+        f"or moved to a separate NPCs configuration file."
+    )
+
+
+DEFAULT_RULES = RuleRegistry([
+    ValidationRule(
+        name="no_string_encoded_yaml",
+        check=check_no_string_encoded_yaml,
+        severity="error",
+        error_message=_first_issue,
+    ),
+    ValidationRule(
+        name="character_motives",
+        check=check_character_has_motives,
+        entity_types=frozenset({'character'}),
+        severity="error",
+        error_message=_missing_motives_message,
+    ),
+    ValidationRule(
+        name="room_navigation",
+        header="🚨 MISSING ROOM REFERENCES DETECTED 🚨",
+        cross_check=check_room_exits,
+    ),
+    ValidationRule(
+        name="object_interactions",
+        header="🚨 OBJECT INTERACTION ISSUES DETECTED 🚨",
+        check=check_object_interactions,
+        entity_types=frozenset({'object'}),
+    ),
+    ValidationRule(
+        name="character_motive_conditions",
+        header="🚨 CHARACTER MOTIVE ISSUES DETECTED 🚨",
+        check=check_motive_conditions,
+        entity_types=frozenset({'character'}),
+    ),
+    ValidationRule(
+        name="content_consistency",
+        header="🚨 CONTENT CONSISTENCY ISSUES DETECTED 🚨",
+        check=check_descriptions,
+        entity_types=frozenset({'object', 'room', 'character'}),
+    ),
+    ValidationRule(
+        name="action_system_integrity",
+        header="🚨 ACTION SYSTEM ISSUES DETECTED 🚨",
+        check=check_action_integrity,
+        entity_types=frozenset({'object'}),
+    ),
+    ValidationRule(
+        name="object_references",
+        header="🚨 MISSING OBJECT TYPE REFERENCES DETECTED 🚨",
+        cross_check=check_room_object_refs,
+    ),
+])
+
+
+# --- Engine ------------------------------------------------------------------
+
+def build_indexes(entities: Dict[str, Any]) -> ValidationIndexes:
+    """Build the cross-reference indexes in one pass over the entities."""
+    indexes = ValidationIndexes()
+    for entity_id, entity_def in entities.items():
+        _index_entity(indexes, entity_id, entity_types(entity_def), entity_attributes(entity_def))
+    return indexes
+
+
+def _index_entity(indexes: ValidationIndexes, entity_id: str, types: FrozenSet[str],
+                  attributes: Dict[str, Any]) -> None:
+    if 'character' in types:
+        indexes.characters.add(entity_id)
+        indexes.motives[entity_id] = attributes.get('motives', [])
+    if 'object' in types:
+        indexes.objects.add(entity_id)
+    if 'room' not in types:
+        return
+    indexes.rooms.add(entity_id)
+    properties = _attribute_properties(attributes)
+
+    exits = properties.get('exits', {})
+    if isinstance(exits, dict):
+        indexes.room_exits[entity_id] = [
+            exit_data['destination_room_id'] for exit_data in exits.values()
+            if isinstance(exit_data, dict) and exit_data.get('destination_room_id')
+        ]
+
+    # Rooms that are also objects are indexed as objects only (as before)
+    objects = properties.get('objects', {})
+    if 'object' not in types and isinstance(objects, dict):
+        indexes.room_object_refs[entity_id] = [
+            obj_data['object_type_id'] for obj_data in objects.values()
+            if isinstance(obj_data, dict) and obj_data.get('object_type_id')
+        ]
+
+
+def run_entity_checks(
+    rules: Sequence[ValidationRule],
+    entities: Sequence[Tuple[str, Any]],
+) -> Tuple[Dict[str, List[str]], Dict[str, float]]:
+    """Run every per-entity check over ``entities``; also the process pool worker.
+
+    Returns (rule name -> issues, rule name -> seconds spent).
+    """
+    issues: Dict[str, List[str]] = {rule.name: [] for rule in rules}
+    timings: Dict[str, float] = {rule.name: 0.0 for rule in rules}
+    checked = [rule for rule in rules if rule.check is not None]
+    clock = time.perf_counter
+    for entity_id, entity_def in entities:
+        types = entity_types(entity_def)
+        attributes = entity_attributes(entity_def)
+        for rule in checked:
+            if rule.entity_types is not None and not (rule.entity_types & types):
+                continue
+            started = clock()
+            found = rule.check(entity_id, entity_def, types, attributes)
+            timings[rule.name] += clock() - started
+            if found:
+                issues[rule.name].extend(found)
+    return issues, timings
+
+
+def run_cross_checks(rules: Sequence[ValidationRule], indexes: ValidationIndexes,
+                     report: ValidationReport) -> None:
+    """Append cross-reference issues and their timings to ``report``."""
+    for rule in rules:
+        if rule.cross_check is None:
+            continue
+        started = time.perf_counter()
+        report.issues.setdefault(rule.name, []).extend(rule.cross_check(indexes))
+        report.timings[rule.name] = report.timings.get(rule.name, 0.0) + time.perf_counter() - started
+
+
+class SemanticValidator:
+    """Runs registered rules over entity definitions in one pass.
+
+    With ``workers`` > 1 and at least ``min_entities_per_worker`` entities per
+    worker, per-entity checks are sharded across a process pool; indexes and
+    cross-reference checks always run in the calling process.
+    """
+
+    def __init__(self, registry: Optional[RuleRegistry] = None, workers: int = 1,
+                 min_entities_per_worker: int = 2000):
+        self.registry = registry or DEFAULT_RULES
+        self.workers = workers
+        self.min_entities_per_worker = min_entities_per_worker
+
+    def collect(self, entities: Dict[str, Any]) -> ValidationReport:
+        """Run every rule and return the issues found, without raising or logging."""
+        rules = self.registry.rules()
+        items = list(entities.items())
+        report = ValidationReport(entity_count=len(items))
+
+        shards = self._shard(items)
+        if len(shards) > 1:
+            with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+                results = list(pool.map(run_entity_checks, [rules] * len(shards), shards))
+        else:
+            results = [run_entity_checks(rules, items)]
+
+        for rule in rules:
+            report.issues[rule.name] = [issue for issues, _ in results for issue in issues[rule.name]]
+            report.timings[rule.name] = sum(timings[rule.name] for _, timings in results)
+        run_cross_checks(rules, build_indexes(entities), report)
+        return report
+
+    def validate(self, entities: Dict[str, Any]) -> ValidationReport:
+        """Run every rule, raise on the first failing error rule, and log warnings."""
+        report = self.collect(entities)
+        self.emit(report)
+        return report
+
+    def emit(self, report: ValidationReport) -> None:
+        """Raise for the first error rule with issues, then log every warning rule's issues."""
+        self.raise_for_errors(report)
+        for rule in self.registry.rules():
+            issues = report.issues[rule.name]
+            if issues and rule.severity != "error":
+                logger = logging.getLogger(__name__)
+                warning_msg = f"{rule.header or rule.name}\n" + "\n".join(issues)
+                logger.warning(warning_msg)
+                print(f"WARNING: {warning_msg}", file=sys.stderr)
+
+    def raise_for_errors(self, report: ValidationReport) -> None:
+        """Raise V2ConfigValidationError for the first error rule that found issues."""
+        from .v2_config_validator import V2ConfigValidationError
+
+        for rule in self.registry.rules():
+            issues = report.issues.get(rule.name)
+            if issues and rule.severity == "error":
+                format_error = rule.error_message or "\n".join
+                raise V2ConfigValidationError(format_error(issues))
+
+    def _shard(self, items: List[Tuple[str, Any]]) -> List[List[Tuple[str, Any]]]:
+        if self.workers <= 1:
+            return [items]
+        count = min(self.workers, len(items) // max(self.min_entities_per_worker, 1))
+        if count <= 1:
+            return [items]
+        size = -(-len(items) // count)
+        # Contiguous shards keep issues in entity order when concatenated
+        return [items[start:start + size] for start in range(0, len(items), size)]
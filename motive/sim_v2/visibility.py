@@ -2,13 +2,30 @@
 
 This module provides computed visibility properties and search mechanics
 for entities, allowing hidden objects to be discovered through actions.
+
+Visible sets are cached per (observer, room). An entry stays valid while the
+room's contents version (bumped by RelationsGraph whenever anything moves in
+or out of the room, at any depth) is unchanged and every visibility property
+it was computed from (the room's ``dark``, its contents' ``is_lit`` and
+``visible``) still holds the same value, so entities can be changed in place.
+Searches that discover something, and property changes reported through
+on_property_change, drop the affected entries.
 """
 
-from typing import Dict, List, Set, Any
+from typing import Dict, FrozenSet, List, Set, Any, Tuple
 from dataclasses import dataclass
+from .properties import property_mapping
 from .relations import RelationsGraph
 
 
+# Property writes that can change what an observer sees
+VISIBILITY_PROPERTIES = frozenset({"visible", "is_lit", "dark"})
+_PROPERTY_DEFAULTS = {"visible": True, "is_lit": False, "dark": False}
+
+# (entity_id, property, value) a visible set was computed from
+_Watch = Tuple[str, str, Any]
+
+
 @dataclass
 class VisibilityRule:
     """Rule for determining entity visibility."""
@@ -16,93 +33,185 @@ class VisibilityRule:
     visible: bool   # Whether entity is visible when condition is true
 
 
+@dataclass
+class _VisibleSetEntry:
+    relations_id: int
+    entities_id: int
+    contents_version: int
+    watches: Tuple[_Watch, ...]
+    visible: Tuple[str, ...]
+    visible_set: FrozenSet[str]
+
+
 class VisibilityEngine:
     """Manages entity visibility and search mechanics."""
-    
+
     def __init__(self):
         self._search_results: Dict[str, Set[str]] = {}  # character_id -> set of discovered entity_ids
-    
+        self._visible_cache: Dict[Tuple[str, str], _VisibleSetEntry] = {}  # (observer, room) -> entry
+        self._cache_keys_by_room: Dict[str, Set[Tuple[str, str]]] = {}
+        self._room_of_seen_entity: Dict[str, str] = {}  # entity_id -> room it was last cached under
+
     def can_see(self, observer_id: str, target_id: str, entities: Dict[str, Dict[str, Any]], relations: RelationsGraph) -> bool:
         """Check if observer can see target entity."""
         # Don't see self
         if observer_id == target_id:
             return False
-        
+
         # Check if entities are in same room
         observer_container = relations.get_container_of(observer_id)
-        target_container = relations.get_container_of(target_id)
-        
-        if observer_container != target_container:
-            return False
-        
-        # Check target visibility
-        target_entity = entities.get(target_id)
-        if target_entity is None:
+        if observer_container is None or relations.get_container_of(target_id) != observer_container:
             return False
-        
-        # Default visibility
-        target_visible = target_entity.get("visible", True)
-        if not target_visible:
-            # Check if target was discovered through search
-            if observer_id in self._search_results and target_id in self._search_results[observer_id]:
-                return True
-            return False
-        
-        return True
-    
+
+        entry = self._get_visible_set(observer_id, observer_container, entities, relations)
+        return target_id in entry.visible_set
+
     def perform_search(self, searcher_id: str, room_id: str, entities: Dict[str, Dict[str, Any]], relations: RelationsGraph) -> List[str]:
         """Perform search action to discover hidden entities."""
         discovered = []
-        
+
         # Get all entities in the room
-        room_contents = relations.get_contents_of(room_id)
-        
+        room_contents = relations.contents_view(room_id)
+
         # Initialize search results for searcher if needed
         if searcher_id not in self._search_results:
             self._search_results[searcher_id] = set()
-        
+
         # Search for hidden, searchable entities
         for entity_id in room_contents:
             entity = entities.get(entity_id)
             if entity is None:
                 continue
-            
+
             # Check if entity is hidden and searchable
-            if (not entity.get("visible", True) and 
-                entity.get("searchable", False) and 
+            if (not entity.get("visible", True) and
+                entity.get("searchable", False) and
                 entity_id not in self._search_results[searcher_id]):
-                
+
                 # Discover the entity
                 self._search_results[searcher_id].add(entity_id)
                 discovered.append(entity_id)
-        
+
+        if discovered:
+            self._drop_entry((searcher_id, room_id))
         return discovered
-    
+
     def get_visible_entities(self, observer_id: str, entities: Dict[str, Dict[str, Any]], relations: RelationsGraph) -> List[str]:
         """Get all entities visible to the observer."""
-        visible = []
-        
         # Get observer's container
         observer_container = relations.get_container_of(observer_id)
         if observer_container is None:
-            return visible
-        
-        # Get all entities in same container
-        room_contents = relations.get_contents_of(observer_container)
-        
-        # Check visibility for each entity
-        for entity_id in room_contents:
-            if self.can_see(observer_id, entity_id, entities, relations):
-                visible.append(entity_id)
-        
-        return visible
-    
+            return []
+
+        entry = self._get_visible_set(observer_id, observer_container, entities, relations)
+        return list(entry.visible)
+
+    def on_property_change(self, entity_id: str, property_name: str) -> None:
+        """Drop cached visible sets affected by a property write.
+
+        Matches the EffectEngine change callback signature.
+        """
+        if property_name not in VISIBILITY_PROPERTIES:
+            return
+        self.invalidate_room(entity_id)
+        room_id = self._room_of_seen_entity.get(entity_id)
+        if room_id is not None:
+            self.invalidate_room(room_id)
+
+    def invalidate_room(self, room_id: str) -> None:
+        """Drop every cached visible set for a room."""
+        for key in list(self._cache_keys_by_room.get(room_id, ())):
+            self._drop_entry(key)
+
+    def invalidate_all(self) -> None:
+        """Drop every cached visible set."""
+        self._visible_cache.clear()
+        self._cache_keys_by_room.clear()
+        self._room_of_seen_entity.clear()
+
     def is_discovered(self, searcher_id: str, entity_id: str) -> bool:
         """Check if entity was discovered through search."""
-        return (searcher_id in self._search_results and 
+        return (searcher_id in self._search_results and
                 entity_id in self._search_results[searcher_id])
-    
+
     def reset_search_results(self, searcher_id: str) -> None:
         """Reset search results for a character (useful for testing)."""
         if searcher_id in self._search_results:
             self._search_results[searcher_id].clear()
+        for key in [key for key in self._visible_cache if key[0] == searcher_id]:
+            self._drop_entry(key)
+
+    def _get_visible_set(
+        self,
+        observer_id: str,
+        room_id: str,
+        entities: Dict[str, Dict[str, Any]],
+        relations: RelationsGraph,
+    ) -> _VisibleSetEntry:
+        key = (observer_id, room_id)
+        version = relations.get_contents_version(room_id)
+        entry = self._visible_cache.get(key)
+        if (entry is not None and entry.contents_version == version
+                and entry.relations_id == id(relations) and entry.entities_id == id(entities)
+                and all(property_mapping(entities.get(entity_id)).get(name, _PROPERTY_DEFAULTS[name]) == value
+                        for entity_id, name, value in entry.watches)):
+            return entry
+
+        watches: List[_Watch] = []
+        visible = tuple(self._compute_visible(observer_id, room_id, entities, relations, watches))
+        entry = _VisibleSetEntry(
+            relations_id=id(relations),
+            entities_id=id(entities),
+            contents_version=version,
+            watches=tuple(watches),
+            visible=visible,
+            visible_set=frozenset(visible),
+        )
+        self._visible_cache[key] = entry
+        self._cache_keys_by_room.setdefault(room_id, set()).add(key)
+        return entry
+
+    def _compute_visible(
+        self,
+        observer_id: str,
+        room_id: str,
+        entities: Dict[str, Dict[str, Any]],
+        relations: RelationsGraph,
+        watches: List[_Watch],
+    ) -> List[str]:
+        """Entities in the room the observer can see, in placement order; watches gets the values read."""
+        def read(entity_id: str, name: str) -> Any:
+            value = property_mapping(entities.get(entity_id)).get(name, _PROPERTY_DEFAULTS[name])
+            watches.append((entity_id, name, value))
+            return value
+
+        # Dark rooms show nothing unless something in the room (carried or not) is lit
+        if read(room_id, "dark"):
+            has_light = False
+            for entity_id in relations.iter_all_contents_of(room_id):
+                self._room_of_seen_entity[entity_id] = room_id
+                if read(entity_id, "is_lit"):
+                    has_light = True
+                    break
+            if not has_light:
+                return []
+
+        discovered = self._search_results.get(observer_id, ())
+        visible = []
+        for entity_id in relations.contents_view(room_id):
+            self._room_of_seen_entity[entity_id] = room_id
+            if entity_id == observer_id:
+                continue
+            target_entity = entities.get(entity_id)
+            if target_entity is None:
+                continue
+            # Default visibility; hidden entities need to be discovered through search
+            if read(entity_id, "visible") or entity_id in discovered:
+                visible.append(entity_id)
+        return visible
+
+    def _drop_entry(self, key: Tuple[str, str]) -> None:
+        if self._visible_cache.pop(key, None) is not None:
+            keys = self._cache_keys_by_room.get(key[1])
+            if keys is not None:
+                keys.discard(key)
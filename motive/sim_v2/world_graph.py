@@ -0,0 +1,324 @@
+"""World graph: room connectivity analytics.
+
+WorldGraph is a directed graph of rooms joined by exits, built from v1 room
+exit dicts or from an ExitManager. It answers shortest-path, reachability and
+component queries without a per-call search: for each traversal mode (whether
+hidden and/or locked exits may be used) it keeps a breadth-first tree from
+every room, built on first use.
+
+Exit changes update the built tables incrementally. A newly usable exit
+u -> v relaxes every distance through it (d(s, t) = d(s, u) + 1 + d(v, t));
+an exit that stops being usable only forces a new search from the rooms whose
+tree actually used that step. Rooms are unweighted; every exit costs one move.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .exits import ExitManager
+
+
+Mode = Tuple[bool, bool]  # (use hidden exits, use locked exits)
+
+
+@dataclass(frozen=True)
+class WorldExit:
+    """One directed exit between rooms.
+
+    ``locked`` covers anything that can stop a character passing (a locked
+    exit or travel requirements); ``blocked`` exits are never traversable.
+    """
+    exit_id: str
+    from_room: str
+    to_room: str
+    name: str = ""
+    hidden: bool = False
+    locked: bool = False
+    blocked: bool = False
+
+    def usable(self, mode: Mode) -> bool:
+        use_hidden, use_locked = mode
+        return not self.blocked and (use_hidden or not self.hidden) and (use_locked or not self.locked)
+
+
+class _PathTable:
+    """Breadth-first trees from every room under one traversal mode."""
+
+    def __init__(self) -> None:
+        self.dist: Dict[str, Dict[str, int]] = {}  # source -> target -> moves
+        self.parent: Dict[str, Dict[str, str]] = {}  # source -> target -> previous room on the path
+
+
+class WorldGraph:
+    """Directed room graph with precomputed paths and reachability."""
+
+    def __init__(self) -> None:
+        self._rooms: Dict[str, None] = {}  # Ordered set
+        self._exits: Dict[str, Dict[str, WorldExit]] = {}  # from_room -> exit_id -> exit
+        self._tables: Dict[Mode, _PathTable] = {}
+        self._components: Dict[Mode, List[List[str]]] = {}
+        self._exit_manager: Optional[ExitManager] = None
+
+    # ----- construction -----
+
+    @classmethod
+    def from_rooms(cls, rooms: Mapping[str, Any]) -> 'WorldGraph':
+        """Build from v1 rooms (Room objects or room config dicts) keyed by room id."""
+        graph = cls()
+        for room_id in rooms:
+            graph.add_room(room_id)
+        for room_id, room in rooms.items():
+            exits = room.get('exits') if isinstance(room, Mapping) else getattr(room, 'exits', None)
+            for exit_id, exit_data in (exits or {}).items():
+                exit = cls.exit_from_config(room_id, exit_id, exit_data)
+                if exit.to_room:
+                    graph.set_exit(exit)
+        return graph
+
+    @classmethod
+    def from_entity_definitions(cls, entities: Mapping[str, Any]) -> 'WorldGraph':
+        """Build from v2 entity definitions, reading room exits as GameInitializer does."""
+        rooms = {}
+        for entity_id, entity_def in entities.items():
+            if 'room' not in (getattr(entity_def, 'types', None) or ()):
+                continue
+            properties = getattr(entity_def, 'properties', None) or {}
+            attributes = getattr(entity_def, 'attributes', None) or {}
+            exits = properties.get('exits') or attributes.get('exits')
+            rooms[entity_id] = {'exits': exits if isinstance(exits, Mapping) else {}}
+        return cls.from_rooms(rooms)
+
+    @classmethod
+    def from_exit_manager(cls, exit_manager: ExitManager) -> 'WorldGraph':
+        """Build from an ExitManager and keep following its exit changes."""
+        graph = cls()
+        graph.attach(exit_manager)
+        return graph
+
+    @staticmethod
+    def exit_from_config(room_id: str, exit_id: str, exit_data: Any) -> WorldExit:
+        """Convert a v1 exit (dict or ExitConfig) to a WorldExit."""
+        get = exit_data.get if isinstance(exit_data, Mapping) else lambda key, default=None: getattr(exit_data, key, default)
+        return WorldExit(
+            exit_id=exit_id,
+            from_room=room_id,
+            to_room=get('destination_room_id'),
+            name=get('name') or exit_id,
+            hidden=bool(get('is_hidden', False)),
+            locked=bool(get('is_locked', False)) or bool(get('travel_requirements')),
+        )
+
+    def attach(self, exit_manager: ExitManager) -> None:
+        """Mirror an ExitManager's exits and subscribe to its changes."""
+        self._exit_manager = exit_manager
+        for exit_id, from_room, direction, to_room, state in exit_manager.iter_exits():
+            self.set_exit(self._exit_from_state(exit_id, from_room, direction, to_room, state))
+        exit_manager.subscribe(self._on_exit_change)
+
+    def _on_exit_change(self, exit_id: str) -> None:
+        for _exit_id, from_room, direction, to_room, state in self._exit_manager.iter_exits(exit_id):
+            self.set_exit(self._exit_from_state(exit_id, from_room, direction, to_room, state))
+
+    @staticmethod
+    def _exit_from_state(exit_id: str, from_room: str, direction: str, to_room: str, state: Any) -> WorldExit:
+        return WorldExit(
+            exit_id=exit_id,
+            from_room=from_room,
+            to_room=to_room,
+            name=direction,
+            hidden=not state.visible,
+            locked=state.is_locked,
+            blocked=not state.traversable,
+        )
+
+    # ----- updates -----
+
+    def add_room(self, room_id: str) -> None:
+        if room_id in self._rooms:
+            return
+        self._rooms[room_id] = None
+        self._components.clear()
+        for table in self._tables.values():
+            table.dist[room_id] = {room_id: 0}
+            table.parent[room_id] = {}
+
+    def set_exit(self, exit: WorldExit) -> None:
+        """Add an exit or replace the one with the same id in its room."""
+        self.add_room(exit.from_room)
+        self.add_room(exit.to_room)
+        room_exits = self._exits.setdefault(exit.from_room, {})
+        previous = room_exits.get(exit.exit_id)
+        room_exits[exit.exit_id] = exit
+        self._exit_changed(previous, exit)
+
+    def update_exit(self, from_room: str, exit_id: str, **changes: Any) -> WorldExit:
+        """Change fields of an existing exit (e.g. ``locked=False``)."""
+        exit = replace(self._exits[from_room][exit_id], **changes)
+        self.set_exit(exit)
+        return exit
+
+    def remove_exit(self, from_room: str, exit_id: str) -> None:
+        previous = self._exits.get(from_room, {}).pop(exit_id, None)
+        if previous is not None:
+            self._exit_changed(previous, None)
+
+    def _exit_changed(self, previous: Optional[WorldExit], current: Optional[WorldExit]) -> None:
+        if previous == current:
+            return
+        self._components.clear()
+        for mode, table in self._tables.items():
+            if previous is not None and previous.usable(mode) and not self._has_step(previous.from_room, previous.to_room, mode):
+                self._remove_step(table, previous.from_room, previous.to_room, mode)
+            if current is not None and current.usable(mode):
+                self._add_step(table, current.from_room, current.to_room)
+
+    def _add_step(self, table: _PathTable, u: str, v: str) -> None:
+        """Relax every distance through a newly usable step u -> v."""
+        from_v = table.dist[v]
+        parent_v = table.parent[v]
+        for source, dist in table.dist.items():
+            to_u = dist.get(u)
+            if to_u is None:
+                continue
+            parent = table.parent[source]
+            for target, v_to_target in from_v.items():
+                candidate = to_u + 1 + v_to_target
+                current = dist.get(target)
+                if current is None or candidate < current:
+                    dist[target] = candidate
+                    parent[target] = u if target == v else parent_v[target]
+
+    def _remove_step(self, table: _PathTable, u: str, v: str, mode: Mode) -> None:
+        """Re-search from the rooms whose tree used the step u -> v."""
+        for source, parent in table.parent.items():
+            if parent.get(v) == u:
+                table.dist[source], table.parent[source] = self._search(source, mode)
+
+    def _has_step(self, u: str, v: str, mode: Mode) -> bool:
+        return any(exit.to_room == v and exit.usable(mode) for exit in self._exits.get(u, {}).values())
+
+    # ----- queries -----
+
+    @property
+    def rooms(self) -> List[str]:
+        return list(self._rooms)
+
+    def exits_from(self, room_id: str) -> List[WorldExit]:
+        return list(self._exits.get(room_id, {}).values())
+
+    def neighbors(self, room_id: str, hidden: bool = False, locked: bool = False) -> List[str]:
+        """Rooms one usable exit away, in exit order."""
+        return self._successors(room_id, (hidden, locked))
+
+    def distance(self, from_room: str, to_room: str, hidden: bool = False, locked: bool = False) -> Optional[int]:
+        """Fewest moves between rooms, or None if unreachable.
+
+        By default only exits a character can use right now count; pass
+        ``hidden=True`` / ``locked=True`` to also route through hidden or
+        locked exits.
+        """
+        if from_room not in self._rooms:
+            return None
+        return self._table((hidden, locked)).dist[from_room].get(to_room)
+
+    def can_reach(self, from_room: str, to_room: str, hidden: bool = False, locked: bool = False) -> bool:
+        return self.distance(from_room, to_room, hidden, locked) is not None
+
+    def reachable_from(self, from_room: str, hidden: bool = False, locked: bool = False) -> Set[str]:
+        """Rooms reachable from a room, including itself."""
+        if from_room not in self._rooms:
+            return set()
+        return set(self._table((hidden, locked)).dist[from_room])
+
+    def shortest_path(self, from_room: str, to_room: str, hidden: bool = False, locked: bool = False) -> Optional[List[str]]:
+        """Rooms along a shortest route, both ends included, or None if unreachable."""
+        if not self.can_reach(from_room, to_room, hidden, locked):
+            return None
+        parent = self._table((hidden, locked)).parent[from_room]
+        path = [to_room]
+        while path[-1] != from_room:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+    def next_exit(self, from_room: str, to_room: str, hidden: bool = False, locked: bool = False) -> Optional[WorldExit]:
+        """First exit to take towards ``to_room`` (None if unreachable or already there)."""
+        path = self.shortest_path(from_room, to_room, hidden, locked)
+        if not path or len(path) < 2:
+            return None
+        mode = (hidden, locked)
+        for exit in self._exits.get(from_room, {}).values():
+            if exit.to_room == path[1] and exit.usable(mode):
+                return exit
+        return None
+
+    def unreachable_from(self, start_rooms: Iterable[str], hidden: bool = True, locked: bool = True) -> List[str]:
+        """Rooms no start room can reach. Defaults to counting every exit that can ever open."""
+        reached: Set[str] = set()
+        for room_id in start_rooms:
+            reached |= self.reachable_from(room_id, hidden, locked)
+        return [room_id for room_id in self._rooms if room_id not in reached]
+
+    def components(self, hidden: bool = True, locked: bool = True) -> List[List[str]]:
+        """Connected components, ignoring exit direction, largest first."""
+        mode = (hidden, locked)
+        if mode not in self._components:
+            self._components[mode] = self._weak_components(mode)
+        return [list(component) for component in self._components[mode]]
+
+    # ----- internals -----
+
+    def _successors(self, room_id: str, mode: Mode) -> List[str]:
+        successors: Dict[str, None] = {}
+        for exit in self._exits.get(room_id, {}).values():
+            if exit.usable(mode):
+                successors[exit.to_room] = None
+        return list(successors)
+
+    def _table(self, mode: Mode) -> _PathTable:
+        table = self._tables.get(mode)
+        if table is None:
+            table = _PathTable()
+            adjacency = {room_id: self._successors(room_id, mode) for room_id in self._rooms}
+            for source in self._rooms:
+                table.dist[source], table.parent[source] = self._search(source, mode, adjacency)
+            self._tables[mode] = table
+        return table
+
+    def _search(self, source: str, mode: Mode,
+                adjacency: Optional[Dict[str, List[str]]] = None) -> Tuple[Dict[str, int], Dict[str, str]]:
+        dist = {source: 0}
+        parent: Dict[str, str] = {}
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for room_id in frontier:
+                successors = adjacency[room_id] if adjacency is not None else self._successors(room_id, mode)
+                for next_room in successors:
+                    if next_room not in dist:
+                        dist[next_room] = dist[room_id] + 1
+                        parent[next_room] = room_id
+                        next_frontier.append(next_room)
+            frontier = next_frontier
+        return dist, parent
+
+    def _weak_components(self, mode: Mode) -> List[List[str]]:
+        root: Dict[str, str] = {room_id: room_id for room_id in self._rooms}
+
+        def find(room_id: str) -> str:
+            while root[room_id] != room_id:
+                root[room_id] = root[root[room_id]]
+                room_id = root[room_id]
+            return room_id
+
+        for room_exits in self._exits.values():
+            for exit in room_exits.values():
+                if exit.usable(mode):
+                    a, b = find(exit.from_room), find(exit.to_room)
+                    if a != b:
+                        root[b] = a
+
+        grouped: Dict[str, List[str]] = {}
+        for room_id in self._rooms:
+            grouped.setdefault(find(room_id), []).append(room_id)
+        return sorted(grouped.values(), key=len, reverse=True)
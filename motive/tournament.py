@@ -0,0 +1,416 @@
+"""
+Adaptive model tournaments.
+
+A tournament ranks provider/model entries by how often they achieve their
+character's motive. Games are scheduled one at a time as worker slots free
+up: the scheduler keeps a Glicko rating (mean and deviation) per entry,
+seats the entries whose relative order is least certain, gives each the
+character/motive it has played least, and stops as soon as neighbouring
+entries on the leaderboard are separated by more than ``z`` combined
+deviations or the budget (games, tokens or dollars) runs out.
+
+Each game runs as a ``motive --worker`` process, the same way parallel games
+do; its ``WORKER_RESULT`` lines report per-player outcomes and token usage.
+"""
+
+import asyncio
+import json
+import math
+import os
+import sys
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import combinations
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from motive.sim_v2.v2_config_rules import entity_attributes, entity_types
+
+
+GLICKO_Q = math.log(10) / 400
+OUTCOME_SCORES = {"won": 1.0}  # Anything else (failed, not_achieved, quit) scores 0
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    """A provider/model under test, with optional USD prices per million tokens."""
+    provider: str
+    model: str
+    input_price: float = 0.0
+    output_price: float = 0.0
+
+    @property
+    def label(self) -> str:
+        return f"{self.provider}/{self.model}"
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        return (input_tokens * self.input_price + output_tokens * self.output_price) / 1_000_000
+
+
+def parse_entry(spec: str) -> ModelEntry:
+    """Parse ``provider/model`` or ``provider/model@input_price,output_price``."""
+    spec, _, prices = spec.partition('@')
+    provider, sep, model = spec.partition('/')
+    if not sep or not provider or not model:
+        raise ValueError(f"Invalid tournament entry '{spec}': expected provider/model")
+    input_price = output_price = 0.0
+    if prices:
+        try:
+            input_price, output_price = (float(price) for price in prices.split(','))
+        except ValueError:
+            raise ValueError(f"Invalid prices for '{spec}': expected @input_usd,output_usd per million tokens")
+    return ModelEntry(provider, model, input_price, output_price)
+
+
+def characters_from_config(config: Any) -> Dict[str, List[str]]:
+    """Character id -> motive ids, in config order."""
+    characters: Dict[str, List[str]] = {}
+    for entity_id, entity_def in (getattr(config, 'entity_definitions', None) or {}).items():
+        if 'character' not in entity_types(entity_def):
+            continue
+        motives = entity_attributes(entity_def).get('motives') or []
+        characters[entity_id] = [motive['id'] for motive in motives if isinstance(motive, dict) and motive.get('id')]
+    return characters
+
+
+@dataclass
+class Rating:
+    """Glicko-1 rating: mean and deviation."""
+    mu: float = 1500.0
+    rd: float = 350.0
+    games: int = 0
+
+    def interval(self, z: float) -> Tuple[float, float]:
+        return self.mu - z * self.rd, self.mu + z * self.rd
+
+
+def _g(rd: float) -> float:
+    return 1 / math.sqrt(1 + 3 * GLICKO_Q ** 2 * rd ** 2 / math.pi ** 2)
+
+
+def expected_score(rating: Rating, opponent: Rating) -> float:
+    return 1 / (1 + 10 ** (-_g(opponent.rd) * (rating.mu - opponent.mu) / 400))
+
+
+@dataclass
+class Budget:
+    """Stop once any limit is reached (None means unlimited)."""
+    max_games: Optional[int] = None
+    max_tokens: Optional[int] = None
+    max_dollars: Optional[float] = None
+
+
+@dataclass
+class Seat:
+    entry: ModelEntry
+    character: str
+    motive: Optional[str] = None
+
+
+@dataclass
+class Matchup:
+    game_index: int
+    seats: List[Seat]
+
+    def worker_args(self) -> List[str]:
+        """CLI arguments assigning models, characters and motives to Player_1..N."""
+        args = ["--player-models"] + [seat.entry.label for seat in self.seats]
+        if all(seat.motive for seat in self.seats):
+            args += ["--character-motives"] + [f"{seat.character}:{seat.motive}" for seat in self.seats]
+        else:
+            args += ["--characters"] + [seat.character for seat in self.seats]
+        return args
+
+
+@dataclass
+class GameRecord:
+    game_index: int
+    seats: List[Dict[str, Any]]
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class TournamentScheduler:
+    """Chooses informative matchups and tracks ratings, spend and stopping."""
+
+    def __init__(self, entries: List[ModelEntry], characters: Dict[str, List[str]],
+                 players_per_game: int, budget: Budget, z: float = 1.96,
+                 min_games_per_entry: int = 3, max_failed_games: int = 3):
+        if len(entries) < 2:
+            raise ValueError("A tournament needs at least two entries")
+        if players_per_game < 2:
+            raise ValueError("Tournament games need at least two players")
+        if len(characters) < players_per_game:
+            raise ValueError(f"Config defines {len(characters)} characters; {players_per_game} are needed per game")
+        self.entries = list(entries)
+        self.characters = characters
+        self.players_per_game = players_per_game
+        self.budget = budget
+        self.z = z
+        self.min_games_per_entry = min_games_per_entry
+        self.max_failed_games = max_failed_games
+
+        self.ratings: Dict[ModelEntry, Rating] = {entry: Rating() for entry in entries}
+        self.pair_games: Dict[Tuple[ModelEntry, ModelEntry], int] = {}
+        self.assignment_counts: Dict[Tuple[ModelEntry, str, Optional[str]], int] = {}
+        self.records: List[GameRecord] = []
+        self.games_started = 0
+        self.games_running = 0
+        self.failed_games = 0
+        self.tokens_spent = 0
+        self.dollars_spent = 0.0
+
+    # ----- stopping -----
+
+    def separated(self) -> bool:
+        """Whether every pair of neighbours on the leaderboard is statistically separated."""
+        ranked = [rating for _entry, rating in self.leaderboard()]
+        if any(rating.games < self.min_games_per_entry for rating in ranked):
+            return False
+        return all(self._pair_separated(a, b) for a, b in zip(ranked, ranked[1:]))
+
+    def _pair_separated(self, a: Rating, b: Rating) -> bool:
+        return abs(a.mu - b.mu) > self.z * math.sqrt(a.rd ** 2 + b.rd ** 2)
+
+    def stop_reason(self) -> Optional[str]:
+        """Why no further games should start, or None."""
+        if self.separated():
+            return "rankings separated"
+        if self.failed_games >= self.max_failed_games:
+            return f"{self.failed_games} games failed"
+        budget = self.budget
+        if budget.max_games is not None and self.games_started >= budget.max_games:
+            return "game budget spent"
+        if budget.max_tokens is not None and self.tokens_spent >= budget.max_tokens:
+            return "token budget spent"
+        if budget.max_dollars is not None and self.dollars_spent >= budget.max_dollars:
+            return "dollar budget spent"
+        return None
+
+    # ----- scheduling -----
+
+    def next_matchup(self) -> Optional[Matchup]:
+        """The most informative game to run next, or None when the tournament should stop."""
+        if self.stop_reason() is not None:
+            return None
+        group = self._pick_entries()
+        matchup = Matchup(game_index=self.games_started, seats=self._assign_characters(group))
+        self.games_started += 1
+        self.games_running += 1
+        for a, b in combinations(group, 2):
+            if a != b:
+                key = self._pair_key(a, b)
+                self.pair_games[key] = self.pair_games.get(key, 0) + 1
+        return matchup
+
+    def pair_information(self, a: ModelEntry, b: ModelEntry) -> float:
+        """Expected information from one more comparison of two entries.
+
+        Outcome variance p(1 - p) times the combined rating variance; pairs
+        already separated count for a quarter, and games already scheduled
+        for the pair damp it so concurrent slots spread out.
+        """
+        ra, rb = self.ratings[a], self.ratings[b]
+        p = expected_score(ra, rb)
+        information = p * (1 - p) * (ra.rd ** 2 + rb.rd ** 2)
+        if self._pair_separated(ra, rb):
+            information *= 0.25
+        return information / (1 + 0.1 * self.pair_games.get(self._pair_key(a, b), 0))
+
+    def _pick_entries(self) -> List[ModelEntry]:
+        a, b = max(combinations(self.entries, 2), key=lambda pair: self.pair_information(*pair))
+        group = [a, b]
+        while len(group) < self.players_per_game:
+            candidates = [entry for entry in self.entries if entry not in group] or self.entries
+            group.append(max(candidates, key=lambda entry: sum(
+                self.pair_information(entry, member) for member in group if member != entry)))
+        return group
+
+    def _assign_characters(self, group: List[ModelEntry]) -> List[Seat]:
+        """Give each entry the character/motive it has played least."""
+        seats = []
+        used = set()
+        for entry in group:
+            options = [
+                (character, motive)
+                for character, motives in self.characters.items() if character not in used
+                for motive in (motives or [None])
+            ]
+            character, motive = min(options, key=lambda option: (
+                sum(count for (e, c, _m), count in self.assignment_counts.items() if e == entry and c == option[0]),
+                self.assignment_counts.get((entry, *option), 0),
+            ))
+            used.add(character)
+            key = (entry, character, motive)
+            self.assignment_counts[key] = self.assignment_counts.get(key, 0) + 1
+            seats.append(Seat(entry, character, motive))
+        return seats
+
+    @staticmethod
+    def _pair_key(a: ModelEntry, b: ModelEntry) -> Tuple[ModelEntry, ModelEntry]:
+        return (a, b) if a.label <= b.label else (b, a)
+
+    # ----- results -----
+
+    def record(self, matchup: Matchup, results: List[Dict[str, Any]], error: Optional[str] = None) -> None:
+        """Record a finished game; results are WORKER_RESULT dicts in seat order."""
+        self.games_running -= 1
+        self.records.append(GameRecord(
+            game_index=matchup.game_index,
+            seats=[{"entry": seat.entry.label, "character": seat.character, "motive": seat.motive}
+                   for seat in matchup.seats],
+            results=results,
+            error=error,
+        ))
+        for seat, result in zip(matchup.seats, results):
+            tokens_in = int(result.get("input_tokens") or 0)
+            tokens_out = int(result.get("output_tokens") or 0)
+            self.tokens_spent += tokens_in + tokens_out
+            self.dollars_spent += seat.entry.cost(tokens_in, tokens_out)
+        if error is not None or len(results) != len(matchup.seats):
+            self.failed_games += 1
+            return
+        scores = [OUTCOME_SCORES.get(result.get("outcome"), 0.0) for result in results]
+        self._update_ratings([seat.entry for seat in matchup.seats], scores)
+
+    def _update_ratings(self, entries: List[ModelEntry], scores: List[float]) -> None:
+        """Glicko-1 update treating the game as pairwise comparisons between seats."""
+        before = {entry: Rating(rating.mu, rating.rd, rating.games) for entry, rating in self.ratings.items()}
+        comparisons: Dict[ModelEntry, List[Tuple[Rating, float]]] = {}
+        for i, j in combinations(range(len(entries)), 2):
+            a, b = entries[i], entries[j]
+            if a == b:
+                continue
+            score = 0.5 if scores[i] == scores[j] else float(scores[i] > scores[j])
+            comparisons.setdefault(a, []).append((before[b], score))
+            comparisons.setdefault(b, []).append((before[a], 1 - score))
+
+        for entry, games in comparisons.items():
+            rating = before[entry]
+            d_inv = GLICKO_Q ** 2 * sum(
+                _g(opponent.rd) ** 2 * expected_score(rating, opponent) * (1 - expected_score(rating, opponent))
+                for opponent, _score in games
+            )
+            precision = 1 / rating.rd ** 2 + d_inv
+            delta = sum(_g(opponent.rd) * (score - expected_score(rating, opponent)) for opponent, score in games)
+            updated = self.ratings[entry]
+            updated.mu = rating.mu + GLICKO_Q / precision * delta
+            updated.rd = math.sqrt(1 / precision)
+            updated.games += 1
+
+    def leaderboard(self) -> List[Tuple[ModelEntry, Rating]]:
+        return sorted(self.ratings.items(), key=lambda item: item[1].mu, reverse=True)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "stop_reason": self.stop_reason(),
+            "games": self.games_started,
+            "failed_games": self.failed_games,
+            "tokens": self.tokens_spent,
+            "dollars": round(self.dollars_spent, 4),
+            "z": self.z,
+            "leaderboard": [
+                {"entry": entry.label, **asdict(rating),
+                 "interval": [round(bound, 1) for bound in rating.interval(self.z)]}
+                for entry, rating in self.leaderboard()
+            ],
+            "games_played": [asdict(record) for record in self.records],
+        }
+
+
+GameLauncher = Callable[[str, Matchup], Awaitable[List[Dict[str, Any]]]]
+
+
+class TournamentRunner:
+    """Runs scheduler-chosen games concurrently as worker processes."""
+
+    def __init__(self, scheduler: TournamentScheduler, config_path: str, concurrency: int = 2,
+                 tournament_id: Optional[str] = None, log_dir: str = "logs",
+                 worker_args: Optional[List[str]] = None, launch: Optional[GameLauncher] = None):
+        self.scheduler = scheduler
+        self.config_path = os.path.abspath(config_path)
+        self.concurrency = max(1, concurrency)
+        self.tournament_id = tournament_id or f"tournament_{uuid.uuid4().hex[:8]}"
+        self.log_dir = log_dir
+        self.worker_args = worker_args or []
+        self.launch = launch or self._launch_worker
+
+    async def run(self) -> Dict[str, Any]:
+        """Play games until the scheduler stops; returns the summary."""
+        running: Dict[asyncio.Task, Matchup] = {}
+        while True:
+            while len(running) < self.concurrency:
+                matchup = self.scheduler.next_matchup()
+                if matchup is None:
+                    break
+                game_id = f"{self.tournament_id}_game_{matchup.game_index + 1}"
+                print(f"🎲 Game {matchup.game_index + 1}: " + ", ".join(
+                    f"{seat.entry.label} as {seat.character}" for seat in matchup.seats))
+                running[asyncio.ensure_future(self.launch(game_id, matchup))] = matchup
+            if not running:
+                break
+            done, _pending = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                matchup = running.pop(task)
+                try:
+                    self.scheduler.record(matchup, task.result())
+                except Exception as e:
+                    self.scheduler.record(matchup, [], error=str(e))
+                self._print_standings()
+        return self.scheduler.summary()
+
+    async def _launch_worker(self, game_id: str, matchup: Matchup) -> List[Dict[str, Any]]:
+        # Same worker entry point as parallel games, without needing the console script on PATH
+        cmd = [sys.executable, "-m", "motive.cli", "-c", self.config_path, "--game-id", game_id, "--worker",
+               "--log-dir", self.log_dir, *self.worker_args, *matchup.worker_args()]
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        results = []
+        async for raw_line in process.stdout:
+            line = raw_line.decode(errors='replace').strip()
+            if line.startswith("WORKER_RESULT:"):
+                results.append(json.loads(line.split(":", 1)[1]))
+        if await process.wait() != 0:
+            raise RuntimeError(f"Game {game_id} exited with code {process.returncode}")
+        return results
+
+    def _print_standings(self) -> None:
+        scheduler = self.scheduler
+        print(f"📊 After {len(scheduler.records)} game(s): " + ", ".join(
+            f"{entry.label} {rating.mu:.0f}±{scheduler.z * rating.rd:.0f}"
+            for entry, rating in scheduler.leaderboard()))
+
+    def save_summary(self, summary: Dict[str, Any]) -> str:
+        path = os.path.join(self.log_dir, "tournaments", f"{self.tournament_id}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"tournament_id": self.tournament_id, "config": self.config_path,
+                       "finished": datetime.now().isoformat(), **summary}, f, indent=2)
+        return path
+
+
+def run_tournament(config_path: str, entry_specs: List[str], budget: Budget, concurrency: int = 2,
+                   players: Optional[int] = None, z: float = 1.96, log_dir: str = "logs",
+                   worker_args: Optional[List[str]] = None, tournament_id: Optional[str] = None) -> Dict[str, Any]:
+    """Load the config, run a tournament and print/save the leaderboard."""
+    from motive.cli import load_config
+
+    config = load_config(config_path)
+    entries = [parse_entry(spec) for spec in entry_specs]
+    players_per_game = players or len(getattr(config, 'players', None) or []) or 2
+    scheduler = TournamentScheduler(entries, characters_from_config(config), players_per_game, budget, z=z)
+    runner = TournamentRunner(scheduler, config_path, concurrency=concurrency, tournament_id=tournament_id,
+                              log_dir=log_dir, worker_args=worker_args)
+
+    print(f"🏟️  Tournament {runner.tournament_id}: {len(entries)} entries, "
+          f"{players_per_game} players per game, {runner.concurrency} concurrent")
+    summary = asyncio.run(runner.run())
+    path = runner.save_summary(summary)
+
+    print(f"\n🏁 Stopped: {summary['stop_reason']} after {summary['games']} game(s), "
+          f"{summary['tokens']} tokens, ${summary['dollars']:.2f}")
+    for rank, row in enumerate(summary['leaderboard'], 1):
+        low, high = row['interval']
+        print(f"  {rank}. {row['entry']:<40} {row['mu']:7.1f}  [{low:.0f}, {high:.0f}]  ({row['games']} games)")
+    print(f"Results saved to {path}")
+    return summary
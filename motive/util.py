@@ -15,10 +15,17 @@ import json
 import sys
 import shutil
 import os
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 
+from motive.outcome_store import DEFAULT_GROUP_BY, OutcomeStore, format_stats
+from motive.benchmark import (DEFAULT_BASELINE, DEFAULT_STATISTIC, DEFAULT_THRESHOLD, MISSING, REGRESSED,
+                              BenchmarkResults, compare as compare_benchmarks, format_comparison,
+                              run_suite as run_benchmark_suite)
+from motive.world_generator import TOPOLOGIES as WORLD_TOPOLOGIES, WorldSpec
+
 try:
     from motive.cli import load_config as cli_load_config
     HIERARCHICAL_SUPPORT = True
@@ -1147,6 +1154,7 @@ Configuration Analysis Examples:
   motive-util config --raw-config              # Output merged config as YAML
   motive-util config --raw-config-json         # Output merged config as JSON
   motive-util config --validate                # Validate config through Pydantic
+  motive-util config --watch                   # Re-validate on every save while editing
 
 Training Data Examples:
   motive-util training copy                   # Copy latest log run
@@ -1158,6 +1166,27 @@ Training Data Examples:
   motive-util training publish -f              # Force overwrite existing published data
   motive-util training list                   # List available runs
   motive-util training stats                  # Show statistics
+
+Game Outcome Examples:
+  motive-util stats                           # Win rates per provider/model
+  motive-util stats --by model,character      # Group by other columns
+  motive-util stats --where motive=solve_the_mystery --json
+
+Replay Examples:
+  motive-util replay --all                    # Re-run every finished game in logs/ without LLMs
+  motive-util replay 2025-01-01_12hr_00min_00sec_ab12cd34  # One game by id
+  motive-util replay --all --json             # Per-game divergences and timings as JSON
+
+Benchmark Examples:
+  motive-util bench run                       # Run engine micro-benchmarks, compare with the baseline
+  motive-util bench run -k parse --threshold 0.1
+  motive-util bench run --save tests/benchmarks/baseline.json  # Refresh the baseline
+  motive-util bench compare before.json after.json
+
+Synthetic World Examples:
+  motive-util worldgen write /tmp/world --rooms 10000 --objects-per-room 10  # Write game.yaml + world.yaml
+  motive-util worldgen write /tmp/world --topology random --extra-exits 0.5 --actions 20
+  motive-util worldgen scale --sizes 100,1000,10000    # Load/build time, memory and turns/s per size
         """
     )
     
@@ -1241,6 +1270,18 @@ Training Data Examples:
         metavar='OBJECT_ID',
         help='Debug action aliases (optionally for specific object)'
     )
+    config_parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Watch the config and its includes, re-validating changed entities on every save'
+    )
+    config_parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=0.25,
+        metavar='SECONDS',
+        help='Polling interval for --watch (default: 0.25)'
+    )
     
     # Training data subcommand
     training_parser = subparsers.add_parser('training', help='Manage training data')
@@ -1268,6 +1309,84 @@ Training Data Examples:
     publish_parser.add_argument('-n', '--name', help='Custom name for the published run')
     publish_parser.add_argument('-f', '--force', action='store_true', help='Force overwrite existing published data')
     
+    # Cross-run game outcome statistics
+    stats_parser = subparsers.add_parser('stats', help='Aggregate finished-game outcomes across runs')
+    stats_parser.add_argument('--store', default='logs/outcomes', help='Outcome store directory (default: logs/outcomes)')
+    stats_parser.add_argument('--by', default=','.join(DEFAULT_GROUP_BY),
+                              help='Comma-separated columns to group by (default: provider,model)')
+    stats_parser.add_argument('--where', action='append', default=[], metavar='COLUMN=VALUE',
+                              help='Only count rows whose column equals VALUE (repeatable)')
+    stats_parser.add_argument('--columns', action='store_true', help='List the stored columns and exit')
+    stats_parser.add_argument('--json', action='store_true', help='Output the aggregates as JSON')
+    stats_parser.add_argument('--no-compact', action='store_true',
+                              help='Do not fold pending rows into a columnar segment before querying')
+
+    # Re-run recorded games against the engine
+    replay_parser = subparsers.add_parser('replay', help='Replay recorded games without LLMs and diff against the recording')
+    replay_parser.add_argument('games', nargs='*', metavar='GAME',
+                               help='Game ids (under --log-dir) or checkpoint directories')
+    replay_parser.add_argument('--log-dir', default='logs', help='Directory the games were logged to (default: logs)')
+    replay_parser.add_argument('--all', action='store_true', help='Replay every finished game recorded under --log-dir')
+    replay_parser.add_argument('--json', action='store_true', help='Output the replay reports as JSON')
+
+    # Engine micro-benchmarks
+    bench_parser = subparsers.add_parser('bench', help='Run engine micro-benchmarks and flag regressions')
+    bench_subparsers = bench_parser.add_subparsers(dest='bench_command', help='Benchmark commands')
+    bench_run_parser = bench_subparsers.add_parser('run', help='Run tests/benchmarks and compare with the baseline')
+    bench_run_parser.add_argument('-k', dest='keyword', help='Only run benchmarks matching this pytest -k expression')
+    bench_run_parser.add_argument('--save', metavar='PATH', help='Save the results to PATH (e.g. the baseline)')
+    bench_run_parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                                  help=f'Results to compare against (default: {DEFAULT_BASELINE})')
+    bench_compare_parser = bench_subparsers.add_parser('compare', help='Compare two saved benchmark results')
+    bench_compare_parser.add_argument('baseline', help='Results file from before the change')
+    bench_compare_parser.add_argument('current', help='Results file from after the change')
+    for sub in (bench_run_parser, bench_compare_parser):
+        sub.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                         help=f'Relative slowdown that counts as a regression (default: {DEFAULT_THRESHOLD})')
+        sub.add_argument('--stat', default=DEFAULT_STATISTIC, choices=['min', 'median', 'mean'],
+                         help=f'Statistic to compare (default: {DEFAULT_STATISTIC})')
+
+    # Synthetic worlds for scale testing
+    worldgen_parser = subparsers.add_parser('worldgen', help='Generate synthetic worlds and measure how the engine scales')
+    worldgen_subparsers = worldgen_parser.add_subparsers(dest='worldgen_command', help='World generator commands')
+    worldgen_write_parser = worldgen_subparsers.add_parser('write', help='Write a synthetic world config to a directory')
+    worldgen_write_parser.add_argument('directory', help='Directory for game.yaml and world.yaml')
+    worldgen_write_parser.add_argument('--players', type=int, default=2, help='Dummy players in game.yaml (default: 2)')
+    worldgen_write_parser.add_argument('--rounds', type=int, default=2, help='Rounds in game.yaml (default: 2)')
+    worldgen_scale_parser = worldgen_subparsers.add_parser('scale', help='Measure load, build and play across world sizes')
+    worldgen_scale_parser.add_argument('--sizes', default='100,1000,10000',
+                                       help='Comma-separated room counts (default: 100,1000,10000)')
+    worldgen_scale_parser.add_argument('--dir', default='logs/synthetic_worlds',
+                                       help='Where the generated worlds are written (default: logs/synthetic_worlds)')
+    worldgen_scale_parser.add_argument('--players', type=int, default=2, help='Players per game (default: 2)')
+    worldgen_scale_parser.add_argument('--rounds', type=int, default=2, help='Rounds played per size (default: 2)')
+    worldgen_scale_parser.add_argument('--no-memory', action='store_true',
+                                       help='Skip the traced pass that measures peak memory')
+    worldgen_scale_parser.add_argument('--json', action='store_true', help='Output the measurements as JSON')
+    for sub in (worldgen_write_parser, worldgen_scale_parser):
+        sub.add_argument('--rooms', type=int, default=WorldSpec.rooms, help=f'Rooms (default: {WorldSpec.rooms})')
+        sub.add_argument('--topology', choices=WORLD_TOPOLOGIES, default=WorldSpec.topology,
+                         help=f'Room graph (default: {WorldSpec.topology})')
+        sub.add_argument('--extra-exits', type=float, default=WorldSpec.extra_exits,
+                         help='Additional random exits per room')
+        sub.add_argument('--exit-aliases', type=int, default=WorldSpec.exit_aliases,
+                         help=f'Aliases per exit (default: {WorldSpec.exit_aliases})')
+        sub.add_argument('--objects-per-room', type=float, default=WorldSpec.objects_per_room,
+                         help=f'Mean objects per room (default: {WorldSpec.objects_per_room})')
+        sub.add_argument('--object-types', type=int, default=WorldSpec.object_types,
+                         help=f'Distinct object types (default: {WorldSpec.object_types})')
+        sub.add_argument('--interactive', type=float, default=WorldSpec.interactive,
+                         help=f'Share of object types with a look interaction (default: {WorldSpec.interactive})')
+        sub.add_argument('--characters', type=int, default=WorldSpec.characters,
+                         help=f'Characters (default: {WorldSpec.characters})')
+        sub.add_argument('--motives', type=int, default=WorldSpec.motives_per_character,
+                         help=f'Motives per character (default: {WorldSpec.motives_per_character})')
+        sub.add_argument('--conditions', type=int, default=WorldSpec.conditions_per_motive,
+                         help=f'Success conditions per motive (default: {WorldSpec.conditions_per_motive})')
+        sub.add_argument('--actions', type=int, default=WorldSpec.actions,
+                         help='Synthetic actions on top of the core actions')
+        sub.add_argument('--seed', type=int, default=WorldSpec.seed, help='Generator seed')
+
     # Legacy support - if no subcommand, assume config analysis
     # Note: Arguments are already defined above for the config subcommand
     
@@ -1285,11 +1404,62 @@ Training Data Examples:
     # Handle different commands
     if args.command == 'training':
         handle_training_command(args)
+    elif args.command == 'stats':
+        handle_stats_command(args)
+    elif args.command == 'replay':
+        handle_replay_command(args)
+    elif args.command == 'bench':
+        handle_bench_command(args)
+    elif args.command == 'worldgen':
+        handle_worldgen_command(args)
     else:
         # Default to config analysis (legacy support)
         handle_config_command(args)
 
 
+def print_reload_result(watcher, result):
+    """Print a one-reload summary for config watch mode."""
+    timestamp = datetime.now().strftime('%H:%M:%S')
+    elapsed_ms = result.elapsed * 1000
+    if not result.ok:
+        print(f"[{timestamp}] Reload failed ({elapsed_ms:.0f} ms); keeping previous content:")
+        print(f"  {result.error}")
+        return
+    
+    print(f"[{timestamp}] Reloaded {len(result.changed_files)} file(s) in {elapsed_ms:.0f} ms: "
+          f"{len(result.changed_entities)} entity(ies) re-validated, "
+          f"{len(result.removed_entities)} removed, {len(result.changed_actions)} action(s) changed "
+          f"({len(watcher.entities)} entities total)")
+    if result.changed_entities and len(result.changed_entities) <= 10:
+        print(f"  Changed: {', '.join(result.changed_entities)}")
+    
+    issue_count = 0
+    for rule in watcher.validator.registry.rules():
+        issues = result.report.issues.get(rule.name) if result.report else None
+        if issues:
+            issue_count += len(issues)
+            print(f"  {rule.header or rule.name}")  # Error rules have no header of their own
+            for issue in issues:
+                print(f"    - {issue}")
+    if issue_count == 0:
+        print("  No issues found")
+
+
+def watch_config(config_path, interval=0.25):
+    """Keep a config loaded and re-validate it whenever one of its files changes."""
+    from motive.sim_v2.config_watch import ConfigWatcher
+    
+    print(f"Watching configuration: {config_path} (Ctrl+C to stop)")
+    watcher = ConfigWatcher(config_path, on_reload=print_reload_result)
+    watcher.load()
+    print(f"Watching {len(watcher.preprocessor.parsed_files)} file(s)")
+    try:
+        watcher.watch(interval)
+    except KeyboardInterrupt:
+        print()
+        print("Stopped watching.")
+
+
 def handle_config_command(args):
     """Handle configuration analysis commands"""
     # Check if config file exists
@@ -1298,6 +1468,10 @@ def handle_config_command(args):
         print(f"Error: Configuration file '{args.config}' not found.", file=sys.stderr)
         sys.exit(1)
     
+    if getattr(args, 'watch', False):
+        watch_config(args.config, args.watch_interval)
+        return
+    
     # Load configuration
     print(f"Loading configuration from: {args.config}")
     print()
@@ -1411,6 +1585,169 @@ def handle_training_command(args):
         sys.exit(1)
 
 
+def handle_stats_command(args):
+    """Handle the cross-run outcome statistics command"""
+    store = OutcomeStore(args.store)
+    if not args.no_compact:
+        store.compact()
+    if args.columns:
+        for name in store.column_names():
+            print(name)
+        return
+
+    group_by = [name.strip() for name in args.by.split(',') if name.strip()]
+    where = {}
+    for condition in args.where:
+        column, separator, value = condition.partition('=')
+        if not separator:
+            print(f"Error: --where expects COLUMN=VALUE, got '{condition}'")
+            sys.exit(1)
+        where[column.strip()] = value.strip()
+
+    start = time.perf_counter()
+    report = store.stats(group_by, where)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif not report:
+        print(f"No game outcomes in {args.store}")
+    else:
+        print(format_stats(report, group_by))
+        print(f"\n{sum(row['results'] for row in report)} player results aggregated in {elapsed:.2f}s")
+
+
+def handle_replay_command(args):
+    """Handle the record/replay regression command"""
+    import asyncio
+    from dataclasses import asdict
+    from motive.checkpoint import CheckpointError
+    from motive.replay import (ReplayError, ReplayReport, UnfinishedGameError, find_recordings, format_report,
+                               replay_game, resolve_recording)
+
+    directories = [resolve_recording(game, args.log_dir) for game in args.games]
+    named = set(directories)
+    if args.all:
+        directories.extend(directory for directory in find_recordings(args.log_dir) if directory not in directories)
+    if not directories:
+        print(f"Error: No games to replay. Name game ids or use --all to replay every game in {args.log_dir}")
+        sys.exit(1)
+
+    reports = []
+    for directory in directories:
+        try:
+            report = asyncio.run(replay_game(directory))
+        except (CheckpointError, ReplayError) as e:
+            if isinstance(e, UnfinishedGameError) and directory not in named:
+                continue  # --all skips crashed and still running games
+            report = ReplayReport(os.path.basename(directory), error=str(e))
+        reports.append(report)
+        if not args.json:
+            print(format_report(report))
+
+    if args.json:
+        print(json.dumps([{**asdict(report), 'ok': report.ok} for report in reports], indent=2))
+    else:
+        turns = sum(report.turns for report in reports)
+        seconds = sum(report.seconds for report in reports)
+        matched = sum(report.ok for report in reports)
+        rate = f" ({turns / seconds:.0f} turns/s)" if seconds else ""
+        print(f"\n{matched}/{len(reports)} games match their recording; {turns} turns replayed in {seconds:.2f}s{rate}")
+    sys.exit(0 if all(report.ok for report in reports) else 1)
+
+
+def handle_bench_command(args):
+    """Handle the micro-benchmark commands"""
+    if args.bench_command == 'run':
+        try:
+            current = run_benchmark_suite(args.keyword)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        baseline_path = args.baseline
+    elif args.bench_command == 'compare':
+        try:
+            current = BenchmarkResults.load(args.current)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read {args.current}: {e}")
+            sys.exit(1)
+        baseline_path = args.baseline
+    else:
+        print("Error: No bench command specified. Use 'motive-util bench --help' for options.")
+        sys.exit(1)
+
+    regressed = False
+    if os.path.exists(baseline_path):
+        try:
+            baseline = BenchmarkResults.load(baseline_path)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        comparisons = compare_benchmarks(baseline, current, args.threshold, args.stat)
+        if args.bench_command == 'run':
+            # A filtered run says nothing about the benchmarks it skipped
+            comparisons = [c for c in comparisons if c.status != MISSING or not args.keyword]
+        print(f"\nCompared with {baseline_path} (threshold {args.threshold:.0%}):")
+        print(format_comparison(comparisons, args.stat))
+        regressed = any(c.status == REGRESSED for c in comparisons)
+    elif args.bench_command == 'compare':
+        print(f"Error: Baseline {baseline_path} not found")
+        sys.exit(1)
+    else:
+        print(f"\nNo baseline at {baseline_path}; use --save {baseline_path} to create one")
+
+    if args.bench_command == 'run' and args.save:
+        current.save(args.save)
+        print(f"Saved results to {args.save}")
+    sys.exit(1 if regressed else 0)
+
+
+def handle_worldgen_command(args):
+    """Handle the synthetic world commands"""
+    from dataclasses import asdict
+    from motive.world_generator import format_scaling, measure_scaling, write_world
+
+    if args.worldgen_command not in ('write', 'scale'):
+        print("Error: No worldgen command specified. Use 'motive-util worldgen --help' for options.")
+        sys.exit(1)
+    try:
+        spec = WorldSpec(rooms=args.rooms, topology=args.topology, extra_exits=args.extra_exits,
+                         exit_aliases=args.exit_aliases, objects_per_room=args.objects_per_room,
+                         object_types=args.object_types, interactive=args.interactive, characters=args.characters,
+                         motives_per_character=args.motives, conditions_per_motive=args.conditions,
+                         actions=args.actions, seed=args.seed)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.players > spec.characters:
+        print(f"Error: {args.players} players need at least as many characters (--characters {spec.characters})")
+        sys.exit(1)
+
+    if args.worldgen_command == 'write':
+        start = time.perf_counter()
+        config_path = write_world(args.directory, spec, players=args.players, rounds=args.rounds)
+        print(f"Wrote {spec.rooms} rooms and about {spec.objects} objects to {config_path} "
+              f"in {time.perf_counter() - start:.2f}s")
+        return
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    except ValueError:
+        print(f"Error: --sizes must be comma-separated room counts, got '{args.sizes}'")
+        sys.exit(1)
+    points = []
+    for size in sizes:
+        points.extend(measure_scaling([size], spec, directory=args.dir, players=args.players, rounds=args.rounds,
+                                      memory=not args.no_memory))
+        if not args.json:
+            print(f"Measured {size} rooms", file=sys.stderr)
+    if args.json:
+        print(json.dumps([{**asdict(point), 'turns_per_second': point.turns_per_second} for point in points],
+                         indent=2))
+    else:
+        print(format_scaling(points))
+    sys.exit(1 if any(point.error for point in points) else 0)
+
+
 def main():
     """Main CLI entry point."""
     util_main()
@@ -0,0 +1,352 @@
+"""
+Bounded pool of long-lived game workers for large parallel batches.
+
+``--parallel N`` normally starts one interpreter per game, all at once. With
+``--pool-workers K`` the runner instead starts K worker processes and
+hands each idle worker the next game through that worker's own queue (so
+slow games never hold up the others); workers run their games one after
+another. The parent records which worker holds a game before sending it,
+so a worker that dies before reporting the start still has its game
+requeued. Games still report progress through the shared-memory progress
+board; the pool itself only carries start/finish messages and a periodic
+heartbeat with the worker's rate-limit counters from llm_factory.
+
+The parent keeps at most ``controller.limit`` games queued or running. The
+limit follows an additive-increase / multiplicative-decrease rule: it is
+halved when workers report throttling or rate-limit errors and grows by one
+after a quiet interval, so a batch settles at what the provider accepts.
+Failed games, and games held by a worker that died, are requeued until
+max_attempts is reached; with file logging on, games write per-turn
+checkpoints and a requeued game continues after its last checkpointed
+turn instead of starting over. A worker is only considered hung when its
+heartbeat stops, not when a game is merely slow.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Worker -> parent messages: (kind, worker index, payload)
+STARTED = "started"
+FINISHED = "finished"
+HEARTBEAT = "heartbeat"
+
+PRESSURE_EVENTS = ("throttled", "rate_limit_errors")
+
+
+@dataclass
+class GameSpec:
+    """One game to run: its ID, its progress board slot, its seed and the attempt number."""
+    game_id: str
+    slot: int
+    attempt: int = 1
+    seed: Optional[int] = None  # None draws a fresh seed
+
+
+@dataclass
+class PoolEvent:
+    """What happened to a game, as returned by WorkerPool.poll()."""
+    kind: str                     # STARTED or FINISHED
+    spec: GameSpec
+    ok: bool = True
+    error: Optional[str] = None
+    final: bool = True            # False when a failed game was requeued
+
+
+class ConcurrencyController:
+    """
+    AIMD limit on the number of games in flight.
+
+    observe() takes the rate-limit pressure seen since the last call (new
+    throttle waits plus 429/quota errors): any pressure halves the limit, at
+    most once per cooldown; increase_after seconds without pressure raise it
+    by one, up to maximum.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, initial: Optional[int] = None,
+                 increase_after: float = 10.0, cooldown: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = min(self.maximum, max(self.minimum, initial or self.maximum))
+        self.increase_after = increase_after
+        self.cooldown = cooldown
+        self.clock = clock
+        self._last_change = clock()
+        self._last_decrease: Optional[float] = None
+
+    def observe(self, pressure: int) -> int:
+        now = self.clock()
+        if pressure > 0:
+            if self._last_decrease is None or now - self._last_decrease >= self.cooldown:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._last_decrease = self._last_change = now
+        elif now - self._last_change >= self.increase_after and self.limit < self.maximum:
+            self.limit += 1
+            self._last_change = now
+        return self.limit
+
+
+def _pressure_total(snapshot: Dict[str, Dict[str, int]]) -> int:
+    return sum(counters.get(event, 0) for counters in snapshot.values() for event in PRESSURE_EVENTS)
+
+
+def _redirect_output(stderr_path: str):
+    """Send the worker's stdout (narrative, WORKER_ lines) to devnull and stderr to its file."""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    stderr = os.open(stderr_path, os.O_WRONLY | os.O_APPEND)
+    os.dup2(stderr, 2)
+    os.close(stderr)
+
+
+def _heartbeat(index: int, results, interval: float, stop: threading.Event):
+    from motive.llm_factory import rate_limit_pressure
+    while not stop.wait(interval):
+        results.put((HEARTBEAT, index, rate_limit_pressure()))
+
+
+def _load_checkpoint(game_kwargs: Dict[str, Any], spec: GameSpec):
+    """The checkpoint a requeued game continues from, or None to start it over."""
+    from motive.checkpoint import CheckpointError, checkpoint_dir, load_checkpoint
+    if spec.attempt == 1 or game_kwargs.get("no_file_logging"):
+        return None
+    try:
+        return load_checkpoint(checkpoint_dir(game_kwargs.get("log_dir", "logs"), spec.game_id))
+    except CheckpointError:
+        return None  # Failed before its first checkpoint
+
+
+async def _play(config_path: str, game_kwargs: Dict[str, Any], spec: GameSpec, board):
+    from motive.checkpoint import CheckpointError, restore
+    from motive.cli import build_game_master
+    from motive.progress_channel import ProgressPublisher
+    checkpoint = _load_checkpoint(game_kwargs, spec)
+    if checkpoint is not None and checkpoint.complete:
+        return  # The game finished before the attempt failed
+    if checkpoint is not None:
+        manifest = checkpoint.manifest
+        game_master = build_game_master(manifest["config_path"], game_id=spec.game_id, **manifest["options"])
+    else:
+        game_master = build_game_master(config_path, game_id=spec.game_id, seed=spec.seed, **game_kwargs)
+    if game_master is None:
+        raise RuntimeError("Could not create the game")
+    if checkpoint is not None:
+        if game_master._config_hash() != manifest["config_hash"]:
+            raise CheckpointError(f"The configuration in {manifest['config_path']} changed since the game started")
+        restore(game_master, checkpoint)
+        game_master.enable_checkpoints().prime(game_master, checkpoint.turns)
+    elif not game_kwargs.get("no_file_logging"):
+        # Same manifest as a --worker subprocess writes, so motive --resume works on pool games too
+        options = {**game_kwargs, "seed": game_master.seed}
+        game_master.enable_checkpoints({"config_path": config_path, "options": options, "worker": True})
+    if board is not None:
+        game_master.progress_publisher = ProgressPublisher(board, spec.slot)
+    try:
+        await game_master.run_game_worker()
+    finally:
+        game_master.close_logs()  # The worker goes on to other games
+
+
+def worker_main(index: int, config_path: str, game_kwargs: Dict[str, Any], board_name: Optional[str],
+                tasks, results, stderr_path: Optional[str] = None, heartbeat_interval: float = 2.0):
+    """Entry point of a pool worker: run games from tasks until a None sentinel arrives."""
+    if stderr_path:
+        _redirect_output(stderr_path)
+    from motive.progress_channel import ProgressBoard
+    board = ProgressBoard.attach(board_name, shared_tracker=True) if board_name else None
+    stop = threading.Event()
+    threading.Thread(target=_heartbeat, args=(index, results, heartbeat_interval, stop), daemon=True).start()
+    try:
+        while True:
+            spec = tasks.get()
+            if spec is None:
+                break
+            results.put((STARTED, index, spec))
+            try:
+                asyncio.run(_play(config_path, game_kwargs, spec, board))
+                results.put((FINISHED, index, (spec, True, None)))
+            except KeyboardInterrupt:
+                raise
+            except BaseException as e:  # build_game_master exits on bad configs
+                traceback.print_exc()
+                error = f"exit code {e.code}" if isinstance(e, SystemExit) else f"{type(e).__name__}: {e}"
+                results.put((FINISHED, index, (spec, False, error)))
+    finally:
+        stop.set()
+        if board is not None:
+            board.close()
+
+
+class WorkerPool:
+    """
+    Parent side of the pool: starts the workers, dispatches games under the
+    concurrency limit and turns worker messages into PoolEvents.
+    """
+
+    def __init__(self, config_path: str, game_kwargs: Dict[str, Any], workers: int,
+                 board_name: Optional[str] = None, max_attempts: int = 3,
+                 heartbeat_interval: float = 2.0, heartbeat_timeout: float = 60.0,
+                 controller: Optional[ConcurrencyController] = None, context=None):
+        self.config_path = os.path.abspath(config_path)
+        self.game_kwargs = game_kwargs
+        self.workers = max(1, workers)
+        self.board_name = board_name
+        self.max_attempts = max(1, max_attempts)
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.controller = controller or ConcurrencyController(self.workers)
+        # spawn: forking would copy the parent's log writer and other threads' locks
+        self.context = context or multiprocessing.get_context("spawn")
+        self.tasks: Dict[int, Any] = {}                # Worker index -> its task queue
+        self.results = self.context.Queue()
+        self.pending: Deque[GameSpec] = deque()
+        self.in_flight: Dict[str, GameSpec] = {}       # Dispatched and not yet finished
+        self.running: Dict[int, GameSpec] = {}         # Worker index -> game it was sent
+        self.processes: Dict[int, Any] = {}
+        self.last_seen: Dict[int, float] = {}
+        self.pressure: Dict[int, int] = {}             # Last cumulative pressure per worker
+        self.stderr_paths: Dict[int, str] = {}
+        self._next_index = 0
+        self._closed = False
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def start(self):
+        for _ in range(self.workers):
+            self._spawn()
+
+    def _spawn(self) -> int:
+        index = self._next_index
+        self._next_index += 1
+        fd, stderr_path = tempfile.mkstemp(prefix=f"motive-worker-{index}-", suffix=".stderr")
+        os.close(fd)
+        self.stderr_paths[index] = stderr_path
+        self.tasks[index] = self.context.Queue()
+        process = self.context.Process(
+            target=worker_main, name=f"motive-worker-{index}", daemon=True,
+            args=(index, self.config_path, self.game_kwargs, self.board_name, self.tasks[index], self.results,
+                  stderr_path, self.heartbeat_interval))
+        process.start()
+        self.processes[index] = process
+        self.last_seen[index] = time.monotonic()
+        return index
+
+    def submit(self, spec: GameSpec):
+        self.pending.append(spec)
+
+    @property
+    def done(self) -> bool:
+        return not self.pending and not self.in_flight
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the workers: sentinels if every game finished, otherwise terminate."""
+        if self._closed:
+            return
+        self._closed = True
+        alive = {index: process for index, process in self.processes.items() if process.is_alive()}
+        if self.done:
+            for index in alive:
+                self.tasks[index].put(None)
+        deadline = time.monotonic() + (timeout if self.done else 0)
+        for process in alive.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout)
+        for queue_ in [*self.tasks.values(), self.results]:
+            queue_.close()
+            queue_.cancel_join_thread()
+        for path in self.stderr_paths.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # -- scheduling -----------------------------------------------------------
+
+    def poll(self, timeout: float = 0.0) -> List[PoolEvent]:
+        """Handle worker messages (waiting up to timeout for the first), check liveness and dispatch."""
+        events: List[PoolEvent] = []
+        pressure = 0
+        block = timeout > 0
+        while True:
+            try:
+                kind, index, payload = self.results.get(block, timeout) if block else self.results.get_nowait()
+            except queue.Empty:
+                break
+            block = False
+            self.last_seen[index] = time.monotonic()
+            if kind == HEARTBEAT:
+                total = _pressure_total(payload)
+                pressure += max(0, total - self.pressure.get(index, 0))
+                self.pressure[index] = total
+            elif kind == STARTED:
+                events.append(PoolEvent(STARTED, payload))
+            elif kind == FINISHED:
+                spec, ok, error = payload
+                if index in self.running and self.running[index].game_id == spec.game_id:
+                    del self.running[index]
+                events.append(self._finish(spec, ok, error))
+        events.extend(self._check_workers())
+        self.controller.observe(pressure)
+        self._dispatch()
+        return events
+
+    def _finish(self, spec: GameSpec, ok: bool, error: Optional[str]) -> PoolEvent:
+        self.in_flight.pop(spec.game_id, None)
+        if ok or spec.attempt >= self.max_attempts:
+            return PoolEvent(FINISHED, spec, ok=ok, error=error)
+        retry = replace(spec, attempt=spec.attempt + 1)
+        self.pending.appendleft(retry)  # Retry before starting new games
+        return PoolEvent(FINISHED, spec, ok=False, error=error, final=False)
+
+    def _check_workers(self) -> List[PoolEvent]:
+        """Fail (and maybe requeue) the games of dead or silent workers and replace those workers."""
+        events = []
+        now = time.monotonic()
+        for index, process in list(self.processes.items()):
+            silent = now - self.last_seen.get(index, now) > self.heartbeat_timeout
+            if process.is_alive() and not silent:
+                continue
+            if process.is_alive():
+                process.terminate()
+            del self.processes[index]
+            worker_tasks = self.tasks.pop(index)
+            worker_tasks.close()
+            worker_tasks.cancel_join_thread()
+            spec = self.running.pop(index, None)  # Sent to it, whether or not it reported the start
+            if spec is not None:
+                reason = "stopped responding" if silent else f"exited with code {process.exitcode}"
+                tail = self.stderr_tail(index)
+                events.append(self._finish(spec, False, f"Worker {reason}" + (f": {tail[-1]}" if tail else "")))
+            if not self.done:
+                self._spawn()
+        return events
+
+    def _dispatch(self):
+        idle = deque(index for index in self.processes if index not in self.running)
+        while self.pending and idle and len(self.in_flight) < self.controller.limit:
+            spec = self.pending.popleft()
+            index = idle.popleft()
+            # Claimed before it is sent: a worker that dies right after taking it still has it requeued
+            self.in_flight[spec.game_id] = spec
+            self.running[index] = spec
+            self.tasks[index].put(spec)
+
+    def stderr_tail(self, index: int, lines: int = 20) -> List[str]:
+        path = self.stderr_paths.get(index)
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return [line.strip() for line in f.read().splitlines()[-lines:] if line.strip()]
+        except (OSError, TypeError):
+            return []
@@ -0,0 +1,338 @@
+"""
+Synthetic v2 worlds for scale-testing the engine.
+
+``generate_world(spec)`` builds ``action_definitions`` and
+``entity_definitions`` for a world of any size: rooms connected in a
+chosen topology, exits with aliases, objects spread over the rooms, look
+interactions that set character properties, and characters whose motives
+are met by those properties. ``write_world(directory, spec)`` writes it
+as ``world.yaml`` next to a ``game.yaml`` that includes ``configs/core.yaml``
+and the world, so it loads like any other config::
+
+    motive-util worldgen write /tmp/world_10k --rooms 10000 --objects-per-room 10
+    motive -c /tmp/world_10k/game.yaml --player-models dummy/a dummy/b
+
+``measure_scaling`` writes one world per size and times config loading
+(pre-processing and validation), world building (GameMaster creation) and
+a few rounds of play, with the peak memory of loading and building - the
+curves ``motive-util worldgen scale`` prints. Play uses ``Wanderer``
+clients instead of LLMs: each turn they look, pick up and look at
+something in the room and move through a random exit, so turns exercise
+parsing, requirements, effects, interactions and event distribution.
+
+Worlds depend only on the spec (including its seed).
+"""
+
+import asyncio
+import contextlib
+import io
+import logging
+import math
+import os
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from langchain_core.messages import AIMessage
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_CONFIG = os.path.join(REPO_ROOT, "configs", "core.yaml")
+
+GRID, RING, TREE, RANDOM = "grid", "ring", "tree", "random"
+TOPOLOGIES = (GRID, RING, TREE, RANDOM)
+TREE_BRANCHING = 3
+
+# Exit aliases are drawn from these, in order, after the grid direction (if any)
+ALIAS_TEMPLATES = ("{id}", "{name}", "path to {name}", "door to {name}", "road to {name}", "way to {name}",
+                   "passage to {name}", "gate to {name}")
+DIRECTIONS = {(0, -1): "north", (0, 1): "south", (1, 0): "east", (-1, 0): "west"}
+OBJECT_NOUNS = ("crate", "lantern", "ledger", "barrel", "statue", "map", "chest", "candle", "rope", "key",
+                "scroll", "coin", "mirror", "bottle", "bell", "anvil", "loom", "painting", "compass", "drum")
+
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@dataclass
+class WorldSpec:
+    """Shape of a synthetic world."""
+    rooms: int = 100
+    topology: str = GRID
+    extra_exits: float = 0.0        # Additional random two-way exits, per room
+    exit_aliases: int = 2           # Aliases per exit, besides its name
+    objects_per_room: float = 3.0   # Mean; rooms get floor or ceil of it
+    object_types: int = 20
+    interactive: float = 0.5        # Share of object types with a look interaction
+    characters: int = 8
+    motives_per_character: int = 1
+    conditions_per_motive: int = 2
+    start_rooms: int = 3            # Initial rooms per character
+    actions: int = 0                # Synthetic actions on top of the core actions
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology '{self.topology}'; choose from {', '.join(TOPOLOGIES)}")
+        if self.rooms < 1 or self.characters < 1 or self.object_types < 1:
+            raise ValueError("A world needs at least one room, character and object type")
+
+    @property
+    def objects(self) -> int:
+        return int(self.rooms * self.objects_per_room)
+
+
+def _ids(prefix: str, count: int) -> List[str]:
+    width = len(str(max(count - 1, 0)))
+    return [f"{prefix}_{i:0{width}d}" for i in range(count)]
+
+
+def _room_graph(spec: WorldSpec, rng: random.Random) -> Tuple[List[Tuple[int, int]], Dict[Tuple[int, int], str]]:
+    """Two-way edges between room indices, and the compass direction of each grid edge."""
+    n = spec.rooms
+    edges, directions = [], {}
+    if spec.topology == GRID:
+        width = math.ceil(math.sqrt(n))
+        for i in range(n):
+            x, y = i % width, i // width
+            for (dx, dy), direction in DIRECTIONS.items():
+                j = (y + dy) * width + (x + dx)
+                if 0 <= x + dx < width and 0 <= j < n:
+                    directions[(i, j)] = direction
+                    if i < j:
+                        edges.append((i, j))
+    elif spec.topology == RING:
+        edges = [(i, (i + 1) % n) for i in range(n)] if n > 2 else [(0, 1)] if n == 2 else []
+    elif spec.topology == TREE:
+        edges = [((i - 1) // TREE_BRANCHING, i) for i in range(1, n)]
+    else:  # RANDOM: a random spanning tree, so every room is reachable
+        edges = [(rng.randrange(i), i) for i in range(1, n)]
+
+    connected = {frozenset(edge) for edge in edges}
+    for _ in range(int(n * spec.extra_exits)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        if i != j and frozenset((i, j)) not in connected:
+            connected.add(frozenset((i, j)))
+            edges.append((i, j))
+    return edges, directions
+
+
+def _exit(room_id: str, name: str, direction: Optional[str], aliases: int) -> Dict[str, Any]:
+    candidates = ([direction] if direction else []) + [t.format(id=room_id, name=name.lower()) for t in ALIAS_TEMPLATES]
+    return {"id": room_id, "name": name, "destination_room_id": room_id, "aliases": candidates[:aliases]}
+
+
+def generate_world(spec: WorldSpec) -> Dict[str, Any]:
+    """The world's action_definitions and entity_definitions (without game_settings or players)."""
+    rng = random.Random(spec.seed)
+    room_ids = _ids("room", spec.rooms)
+    room_names = [f"Room {i}" for i in range(spec.rooms)]
+    type_ids = _ids("thing", spec.object_types)
+    type_names = [f"{OBJECT_NOUNS[i % len(OBJECT_NOUNS)].title()} {i // len(OBJECT_NOUNS) + 1}"
+                  for i in range(spec.object_types)]
+    clues = {type_id: f"found_{type_id}" for type_id in type_ids[:round(spec.object_types * spec.interactive)]}
+
+    entities: Dict[str, Any] = {}
+    for type_id, name in zip(type_ids, type_names):
+        attributes = {"name": name, "description": f"A synthetic {name.lower()}."}
+        if type_id in clues:
+            attributes["interactions"] = {"look": {"effects": [
+                {"type": "set_property", "target_type": "player", "property": clues[type_id], "value": True}]}}
+        entities[type_id] = {"behaviors": ["object"], "attributes": attributes,
+                             "properties": {"pickupable": rng.random() < 0.5, "size": "small"}}
+
+    exits: List[Dict[str, Any]] = [{} for _ in room_ids]
+    edges, directions = _room_graph(spec, rng)
+    for i, j in edges:
+        exits[i][room_ids[j]] = _exit(room_ids[j], room_names[j], directions.get((i, j)), spec.exit_aliases)
+        exits[j][room_ids[i]] = _exit(room_ids[i], room_names[i], directions.get((j, i)), spec.exit_aliases)
+
+    whole, fraction = divmod(spec.objects_per_room, 1)
+    for index, (room_id, name) in enumerate(zip(room_ids, room_names)):
+        count = int(whole) + (rng.random() < fraction)
+        objects = {}
+        for k in range(count):
+            type_index = rng.randrange(spec.object_types)
+            object_id = f"{type_ids[type_index]}_{index}_{k}"
+            objects[object_id] = {"object_type_id": type_ids[type_index], "id": object_id,
+                                  "name": f"{type_names[type_index]}-{k}"}
+        entities[room_id] = {"behaviors": ["room"],
+                             "attributes": {"name": name, "description": f"Synthetic room {index}.", "objects": objects},
+                             "properties": {"exits": exits[index]}}
+
+    clue_properties = sorted(clues.values())
+    for character_id in _ids("character", spec.characters):
+        motives = []
+        for m in range(spec.motives_per_character):
+            chosen = rng.sample(clue_properties, min(spec.conditions_per_motive, len(clue_properties)))
+            motives.append({"id": f"motive_{m}", "description": f"Find {len(chosen)} synthetic clue(s).",
+                            "success_conditions": [{"operator": "AND"}] + [
+                                {"type": "character_has_property", "property": prop, "value": True} for prop in chosen],
+                            "failure_conditions": [
+                                {"type": "character_has_property", "property": "gave_up", "value": True}]})
+        start_rooms = rng.sample(room_ids, min(spec.start_rooms, spec.rooms))
+        entities[character_id] = {
+            "behaviors": ["character"],
+            "attributes": {"name": character_id.replace("_", " ").title(), "description": "A synthetic character."},
+            "properties": {prop: {"type": "boolean", "default": False} for prop in clue_properties + ["gave_up"]},
+            "motives": motives,
+            "initial_rooms": [{"room_id": room_id, "chance": 100 // len(start_rooms), "reason": "Synthetic start"}
+                              for room_id in start_rooms],
+        }
+
+    actions = {}
+    for action_id in _ids("tinker", spec.actions):
+        actions[action_id] = {
+            "name": action_id, "description": "Tinker with an object in the room.", "cost": 5,
+            "category": "interaction",
+            "parameters": [{"name": "object_name", "type": "string", "description": "Object to tinker with",
+                            "required": True, "default_value": None}],
+            "requirements": [{"type": "object_in_room", "object_name_param": "object_name"}],
+            "effects": [{"type": "increment_property", "target_type": "player", "property": "tinkered"},
+                        {"type": "generate_event", "message": "{{player_name}} tinkers with the {{object_name}}.",
+                         "observers": ["room_characters"]}],
+        }
+    return {"action_definitions": actions, "entity_definitions": entities}
+
+
+def write_world(directory: str, spec: WorldSpec, players: int = 2, rounds: int = 2, ap: int = 30) -> str:
+    """Write world.yaml and a game.yaml for it (dummy players) into directory; returns game.yaml's path."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "world.yaml"), "w", encoding="utf-8") as f:
+        yaml.dump(generate_world(spec), f, Dumper=_Dumper, sort_keys=False)
+    game = {
+        "includes": [os.path.relpath(CORE_CONFIG, os.path.abspath(directory)), "world.yaml"],
+        "game_settings": {"num_rounds": rounds, "initial_ap_per_turn": ap, "manual": "../docs/MANUAL.md",
+                          "log_path": "synthetic/{game_id}"},
+        "players": [{"name": f"Player_{i + 1}", "provider": "dummy", "model": "synthetic"} for i in range(players)],
+        "synthetic_world": asdict(spec),  # Not read by the engine; records how the world was made
+    }
+    path = os.path.join(directory, "game.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(game, f, Dumper=_Dumper, sort_keys=False)
+    return path
+
+
+class Wanderer:
+    """
+    LLM client stand-in that plays from the live game state: look, pick up
+    and look at an object in the room, then move through a random exit.
+    bind() it to its character once the GameMaster exists.
+    """
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.game_master = None
+        self.character = None
+
+    def bind(self, game_master, character):
+        self.game_master, self.character = game_master, character
+
+    async def ainvoke(self, messages: List[Any], **kwargs) -> AIMessage:
+        lines = ["> look"]
+        room = self.game_master.rooms.get(self.character.current_room_id) if self.game_master else None
+        if room is not None:
+            if room.objects:
+                obj = room.objects[self.rng.choice(sorted(room.objects))]
+                lines += [f'> pickup "{obj.name}"', f'> look "{obj.name}"']
+            if room.exits:
+                lines.append(f"> move {self.rng.choice(sorted(room.exits))}")
+        return AIMessage(content="\n".join(lines))
+
+
+@dataclass
+class ScalePoint:
+    """Measurements of one world size."""
+    rooms: int
+    objects: int
+    load_seconds: float = 0.0       # Pre-processing and validation of the config
+    build_seconds: float = 0.0      # GameMaster creation: world and characters
+    peak_mb: float = 0.0            # Peak traced memory while loading and building
+    turns: int = 0
+    turn_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.turn_seconds if self.turn_seconds else 0.0
+
+
+def _load_and_build(config_path: str, players: int, seed: int):
+    from motive.cli import load_config
+    from motive.game_master import GameMaster
+
+    clients = [Wanderer(seed + i) for i in range(players)]
+    factory_clients = iter(clients)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        config = load_config(config_path)
+        loaded = time.perf_counter()
+        game_master = GameMaster(config, game_id=f"scale_{seed}", no_file_logging=True, seed=seed,
+                                 llm_client_factory=lambda provider, model: next(factory_clients))
+        built = time.perf_counter()
+    game_master.game_logger.setLevel(logging.CRITICAL)
+    for player, client in zip(game_master.players, clients):
+        client.bind(game_master, player.character)
+    return game_master, loaded - start, built - loaded
+
+
+def measure_point(config_path: str, seed: int = 0, memory: bool = True) -> ScalePoint:
+    """Load, build and play config_path (written by write_world) and time each stage."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        game = yaml.safe_load(f)
+    spec = WorldSpec(**game["synthetic_world"])
+    players, rounds = len(game["players"]), game["game_settings"]["num_rounds"]
+    point = ScalePoint(rooms=spec.rooms, objects=spec.objects)
+    try:
+        game_master, point.load_seconds, point.build_seconds = _load_and_build(config_path, players, seed)
+        point.objects = len(game_master.game_objects)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(game_master.run_game())
+        point.turn_seconds = time.perf_counter() - start
+        point.turns = rounds * players
+        if memory:
+            # A second, traced pass: tracemalloc slows allocation, so it stays out of the timings
+            del game_master
+            tracemalloc.start()
+            try:
+                _load_and_build(config_path, players, seed)
+                point.peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        point.error = f"{type(e).__name__}: {e}"
+    return point
+
+
+def measure_scaling(sizes: List[int], spec: Optional[WorldSpec] = None, directory: str = "logs/synthetic_worlds",
+                    players: int = 2, rounds: int = 2, memory: bool = True) -> List[ScalePoint]:
+    """Write a world of each size (rooms) shaped like spec, and measure it."""
+    spec = spec or WorldSpec()
+    points = []
+    for rooms in sizes:
+        world_spec = replace(spec, rooms=rooms)
+        config_path = write_world(os.path.join(directory, f"rooms_{rooms}"), world_spec, players=players,
+                                  rounds=rounds)
+        points.append(measure_point(config_path, seed=spec.seed, memory=memory))
+    return points
+
+
+def format_scaling(points: List[ScalePoint]) -> str:
+    lines = [f"{'rooms':>8}  {'objects':>8}  {'load':>9}  {'build':>9}  {'peak MB':>8}  {'turns/s':>8}  growth"]
+    previous = None
+    for point in points:
+        if point.error:
+            lines.append(f"{point.rooms:>8}  {point.objects:>8}  error: {point.error}")
+            continue
+        growth = ""
+        if previous is not None and previous.rooms and previous.load_seconds + previous.build_seconds:
+            # Setup time ratio over size ratio: about 1 is linear, clearly above 1 is worse
+            size_ratio = point.rooms / previous.rooms
+            time_ratio = (point.load_seconds + point.build_seconds) / (previous.load_seconds + previous.build_seconds)
+            growth = f"x{time_ratio:.1f} setup for x{size_ratio:.0f} rooms"
+        lines.append(f"{point.rooms:>8}  {point.objects:>8}  {point.load_seconds:>8.2f}s  {point.build_seconds:>8.2f}s  "
+                     f"{point.peak_mb:>8.1f}  {point.turns_per_second:>8.1f}  {growth}")
+        previous = point
+    return "\n".join(lines)
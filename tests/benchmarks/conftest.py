@@ -0,0 +1,100 @@
+"""
+Fixtures for the engine micro-benchmarks.
+
+Benchmarks are skipped in normal test runs. Set MOTIVE_BENCHMARK=1 to run
+them (``motive-util bench run`` does); MOTIVE_BENCHMARK_JSON=<path> also
+saves the results for ``motive-util bench compare``.
+"""
+
+import contextlib
+import io
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from motive.benchmark import BenchmarkResults, format_results, measure
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = "configs/game.yaml"  # hearth_and_shadow
+SEED = 1234
+
+_results = BenchmarkResults()
+
+
+def benchmarks_enabled() -> bool:
+    return os.environ.get("MOTIVE_BENCHMARK") == "1"
+
+
+def pytest_collection_modifyitems(config, items):
+    if benchmarks_enabled():
+        return
+    skip = pytest.mark.skip(reason="Benchmarks run with MOTIVE_BENCHMARK=1 (motive-util bench run)")
+    for item in items:
+        if str(item.fspath).startswith(BENCHMARKS_DIR):
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = os.environ.get("MOTIVE_BENCHMARK_JSON")
+    if path and _results.benchmarks:
+        _results.save(path)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _results.benchmarks:
+        terminalreporter.section("benchmarks (seconds per call)")
+        terminalreporter.write_line(format_results(_results))
+
+
+class BenchmarkFixture:
+    """Times a callable and records it under the test's name (pytest-benchmark calling convention)."""
+
+    def __init__(self, name: str, group: str):
+        self.name = name
+        self.group = group
+        self.stats = None
+
+    def __call__(self, target, *args, **kwargs):
+        self.stats, result = measure(self.name, target, args, kwargs, group=self.group)
+        _results.add(self.stats)
+        return result
+
+    def pedantic(self, target, args=(), kwargs=None, setup=None, rounds=None):
+        self.stats, result = measure(self.name, target, args, kwargs, group=self.group, setup=setup, rounds=rounds)
+        _results.add(self.stats)
+        return result
+
+
+@pytest.fixture
+def benchmark(request):
+    group = request.module.__name__.rsplit(".", 1)[-1].replace("test_bench_", "")
+    return BenchmarkFixture(request.node.name.replace("test_", "", 1), group)
+
+
+@pytest.fixture(scope="session")
+def game_master():
+    """A two-player hearth_and_shadow game, set up but not started, with logging silenced."""
+    from motive.cli import build_game_master
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_master = build_game_master(CONFIG_PATH, game_id="benchmark", no_file_logging=True,
+                                        player_models=["dummy/a", "dummy/b"], seed=SEED)
+    game_master.game_logger.setLevel(logging.CRITICAL)
+    return game_master
+
+
+@pytest.fixture
+def stand_in_players(game_master):
+    """
+    make(count): lightweight players spread over the world's rooms - enough
+    for event distribution, which only reads each character's id and room.
+    """
+    room_ids = sorted(game_master.rooms)
+
+    def make(count: int):
+        return [SimpleNamespace(name=f"Player_{i + 1}", character=SimpleNamespace(
+                    id=f"stand_in_{i + 1}", current_room_id=room_ids[i % len(room_ids)]))
+                for i in range(count)]
+    return make
@@ -0,0 +1,76 @@
+"""Benchmarks for config loading, world building and response parsing."""
+
+import contextlib
+import io
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from motive.action_parser import parse_player_response
+from motive.cli import load_config
+from motive.game_initializer import GameInitializer
+from motive.rng import GameRandom
+
+CONFIG_PATH = "configs/game.yaml"  # hearth_and_shadow
+
+# Responses in the shape models actually send: reasoning prose around '>' action lines
+RESPONSES = {
+    "single_action": "> look",
+    "several_actions": (
+        "I should get my bearings before heading anywhere.\n\n"
+        "> look\n"
+        "> read notice board\n"
+        "> pickup \"Fresh Evidence\"\n"
+        "> move market"
+    ),
+    "chatty_with_speech": (
+        "The square is quiet, but the symbols on the ground worry me. Bella has been watching "
+        "the bank all morning, and if anyone knows who paid for the lanterns it will be her. "
+        "I'll keep my questions casual so the crowd does not notice.\n\n"
+        "> whisper \"Player_2\" \"Meet me behind the tavern after dark - bring the ledger.\"\n"
+        "> say \"Has anyone seen the mayor since the festival?\"\n"
+        "> investigate fresh evidence\n\n"
+        "If nobody answers I will try the church next; Father Marcus owes me a favour.\n"
+        "> move church"
+    ),
+    "invalid_action": (
+        "Let me try something bold.\n\n"
+        "> look\n"
+        "> summon the town guard\n"
+        "> pickup \"Town Statue\""
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def config():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_config(CONFIG_PATH)
+
+
+def test_load_config(benchmark):
+    with contextlib.redirect_stdout(io.StringIO()):
+        config = benchmark(load_config, CONFIG_PATH)
+    assert config.entity_definitions
+
+
+def test_game_initializer_world_build(benchmark, config):
+    logger = logging.getLogger("benchmark.world_build")
+    logger.setLevel(logging.CRITICAL)
+
+    def build_world():
+        initializer = GameInitializer(config, "benchmark", logger, rng=GameRandom(1234))
+        initializer.initialize_game_world([SimpleNamespace(name="Player_1"), SimpleNamespace(name="Player_2")])
+        return initializer
+
+    initializer = benchmark(build_world)
+    assert initializer.rooms and initializer.game_objects and len(initializer.player_characters) == 2
+
+
+@pytest.mark.parametrize("response", sorted(RESPONSES))
+def test_parse_player_response(benchmark, game_master, response):
+    room = game_master.rooms[game_master.players[0].character.current_room_id]
+    with contextlib.redirect_stdout(io.StringIO()):
+        actions, invalid = benchmark(parse_player_response, RESPONSES[response], game_master.game_actions, room.objects)
+    assert actions or invalid
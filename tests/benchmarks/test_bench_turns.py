@@ -0,0 +1,139 @@
+"""Benchmarks for the per-action hot paths: requirements, effects, events and motives."""
+
+import contextlib
+import io
+from datetime import datetime
+
+import pytest
+
+from motive.action_parser import parse_player_response
+from motive.config import Event
+
+# One requirement of every type the engine checks, set up to pass for Player_1
+REQUIREMENTS = {
+    "exit_exists": ({"type": "exit_exists", "direction_param": "direction"}, {"direction": "market"}),
+    "object_in_room": ({"type": "object_in_room", "object_name_param": "object_name"},
+                       {"object_name": "Fresh Evidence"}),
+    "object_possession_allowed": ({"type": "object_possession_allowed", "object_name_param": "object_name"},
+                                  {"object_name": "Fresh Evidence"}),
+    "object_in_inventory": ({"type": "object_in_inventory", "object_name_param": "object_name"},
+                            {"object_name": "Torch"}),
+    "player_has_object_in_inventory": ({"type": "player_has_object_in_inventory", "object_name_param": "object_name"},
+                                       {"object_name": "Torch"}),
+    "object_property_equals": ({"type": "object_property_equals", "object_name_param": "object_name",
+                                "property": "is_lit", "value": False}, {"object_name": "Torch"}),
+    "player_in_room": ({"type": "player_in_room", "target_player_param": "player"}, {"player": "Player_2"}),
+    "player_has_tag": ({"type": "player_has_tag", "tag": "benchmark_tag"}, {}),
+    "character_has_property": ({"type": "character_has_property", "property": "benchmark_ready", "value": True}, {}),
+    "entity_has_property": ({"type": "entity_has_property", "target_type": "player",
+                             "property": "benchmark_ready", "value": True}, {}),
+}
+
+EFFECT_ACTIONS = {
+    "look": "> look",
+    "say": "> say \"Has anyone seen the mayor since the festival?\"",
+    "read": "> read notice board",
+    "investigate": "> investigate fresh evidence",
+}
+
+
+@pytest.fixture(scope="module")
+def actor(game_master):
+    """Player_1 holding an unlit torch, sharing the starting room with Player_2."""
+    player, other = game_master.players[:2]
+    character = player.character
+    torch = next(obj for obj in game_master.game_objects.values() if obj.name == "Torch")
+    if torch.id not in character.inventory:
+        room = game_master.rooms.get(torch.current_location_id)
+        if room is not None:
+            room.remove_object(torch.id)
+        character.add_item_to_inventory(torch)
+    torch.set_property("is_lit", False)
+    character.add_tag("benchmark_tag")
+    character.set_property("benchmark_ready", True)
+    if other.character.current_room_id != character.current_room_id:
+        game_master.rooms[other.character.current_room_id].remove_player(other.character.id)
+        other.character.current_room_id = character.current_room_id
+        game_master.rooms[character.current_room_id].add_player(other.character)
+    return player
+
+
+def _parse(game_master, player, line):
+    room = game_master.rooms[player.character.current_room_id]
+    with contextlib.redirect_stdout(io.StringIO()):
+        actions, invalid = parse_player_response(line, game_master.game_actions, room.objects)
+    assert actions and not invalid, line
+    return actions[0]
+
+
+@pytest.mark.parametrize("requirement", sorted(REQUIREMENTS))
+def test_check_requirements(benchmark, game_master, actor, requirement):
+    requirement_config, params = REQUIREMENTS[requirement]
+    action_config = {"name": f"benchmark_{requirement}", "requirements": [requirement_config]}
+    passed, message, _ = benchmark(game_master._check_requirements, actor.character, action_config, params)
+    assert passed, message
+
+
+@pytest.mark.parametrize("action", sorted(EFFECT_ACTIONS))
+def test_execute_effects(benchmark, game_master, actor, action):
+    action_config, params = _parse(game_master, actor, EFFECT_ACTIONS[action])
+    with contextlib.redirect_stdout(io.StringIO()):
+        events, feedback = benchmark(game_master._execute_effects, actor.character, action_config, params)
+    assert feedback
+
+
+def test_execute_effects_pickup(benchmark, game_master, actor):
+    """Pickup moves the object, so every call starts from the object back in the room."""
+    character = actor.character
+    room = game_master.rooms[character.current_room_id]
+    action_config, params = _parse(game_master, actor, '> pickup "Fresh Evidence"')
+    evidence = room.get_object("Fresh Evidence")
+
+    def put_back():
+        if character.remove_item_from_inventory(evidence.id) is not None:
+            room.add_object(evidence)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        benchmark.pedantic(game_master._execute_effects, (character, action_config, params), setup=put_back, rounds=200)
+    assert evidence.id in character.inventory
+    put_back()
+
+
+def _events(game_master, room_id):
+    timestamp = datetime.now().isoformat()
+    adjacent = next(iter(game_master.rooms[room_id].exits.values()))["destination_room_id"]
+    scopes = [["room_characters"], ["adjacent_rooms"], ["all_players"], ["player", "room_characters"]]
+    return [Event(message=f"Event {i}", event_type="player_action", source_room_id=(room_id, adjacent)[i % 2],
+                  timestamp=timestamp, related_player_id="stand_in_1", observers=scopes[i % len(scopes)])
+            for i in range(8)]
+
+
+@pytest.mark.parametrize("players", [2, 10, 50])
+def test_distribute_events(benchmark, game_master, stand_in_players, monkeypatch, players):
+    stand_ins = stand_in_players(players)
+    monkeypatch.setattr(game_master, "players", stand_ins)
+    monkeypatch.setattr(game_master, "player_observations", {p.character.id: [] for p in stand_ins})
+    events = _events(game_master, stand_ins[0].character.current_room_id)
+
+    def queue_events():
+        for observations in game_master.player_observations.values():
+            observations.clear()
+        game_master.event_queue[:] = events
+
+    benchmark.pedantic(game_master._distribute_events, setup=queue_events, rounds=300)
+    assert any(game_master.player_observations.values())
+    game_master.event_queue.clear()
+
+
+def test_motive_evaluation(benchmark, game_master):
+    def evaluate():
+        return [(player.character.check_motive_success(game_master), player.character.check_motive_failure(game_master))
+                for player in game_master.players]
+
+    results = benchmark(evaluate)
+    assert len(results) == len(game_master.players)
+
+
+def test_motive_status_message(benchmark, game_master):
+    character = game_master.players[0].character
+    benchmark(character.get_motive_status_message, game_master)
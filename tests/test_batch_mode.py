@@ -0,0 +1,123 @@
+"""Tests for batch-mode LLM request collection."""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from motive.batch_mode import BatchBackend, BatchCollector, FileBatchBackend, run_batch_games
+
+
+async def _game(collector, provider, turns, replies):
+    client = collector.client(provider, f"{provider}-model")
+    for turn in range(turns):
+        response = await client.ainvoke([SystemMessage(content="rules"), HumanMessage(content=f"turn {turn}")])
+        replies.append(response.content)
+
+
+def test_collector_flushes_once_every_game_is_waiting(tmp_path):
+    """Test that games advance in lockstep with one job per provider per flush."""
+    backend = FileBatchBackend(str(tmp_path), responder=lambda request: "> look")
+    collector = BatchCollector(backend, max_wait=None)
+    replies = []
+
+    async def run():
+        return await collector.run_games([
+            _game(collector, "openai", 3, replies),
+            _game(collector, "openai", 3, replies),
+            _game(collector, "google", 1, replies),
+        ])
+
+    results = asyncio.run(run())
+
+    assert results == [None, None, None]
+    assert replies == ["> look"] * 7
+    # Round one mixes providers; later rounds only have the two openai games left
+    assert collector.batches_flushed == 3
+    assert backend.jobs_submitted == 4
+    assert sorted(path.name for path in tmp_path.iterdir())[:2] == ["job_00001_openai", "job_00002_google"]
+
+
+def test_request_file_uses_batch_api_format(tmp_path):
+    """Test the JSONL request lines written for each job."""
+    backend = FileBatchBackend(str(tmp_path), responder=lambda request: "> help")
+    collector = BatchCollector(backend, max_wait=None)
+
+    asyncio.run(collector.run_games([_game(collector, "openai", 1, [])]))
+
+    lines = (tmp_path / "job_00001_openai" / "input.jsonl").read_text().splitlines()
+    request = json.loads(lines[0])
+    assert request["method"] == "POST"
+    assert request["url"] == "/v1/chat/completions"
+    assert request["body"] == {"model": "openai-model", "messages": [
+        {"role": "system", "content": "rules"}, {"role": "user", "content": "turn 0"},
+    ]}
+
+
+def test_batch_errors_reach_the_waiting_game():
+    """Test that per-request errors fail only the affected game."""
+    class FailingBackend(BatchBackend):
+        async def run(self, provider, requests):
+            results = {}
+            for request in requests:
+                if request["body"]["model"] == "bad-model":
+                    results[request["custom_id"]] = {"custom_id": request["custom_id"], "error": {"code": "invalid"}}
+                else:
+                    results[request["custom_id"]] = {"custom_id": request["custom_id"], "error": None, "response": {
+                        "body": {"choices": [{"message": {"content": "> look"}}],
+                                 "usage": {"prompt_tokens": 12, "completion_tokens": 3}}}}
+            return results
+
+    collector = BatchCollector(FailingBackend(), max_wait=None)
+
+    async def run():
+        good = collector.client("openai", "good-model")
+        bad = collector.client("openai", "bad-model")
+        return await collector.run_games([good.ainvoke([HumanMessage(content="hi")]),
+                                          bad.ainvoke([HumanMessage(content="hi")])])
+
+    good_result, bad_result = asyncio.run(run())
+
+    assert good_result.usage_metadata["total_tokens"] == 15
+    assert isinstance(bad_result, RuntimeError)
+    assert "invalid" in str(bad_result)
+
+
+def test_backend_without_run_fails_when_constructed():
+    """Test that an incomplete backend is rejected before any batch starts."""
+    class IncompleteBackend(BatchBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+def test_max_wait_submits_partial_batches(tmp_path):
+    """Test that a game busy elsewhere does not block the others forever."""
+    backend = FileBatchBackend(str(tmp_path), responder=lambda request: "> look")
+    collector = BatchCollector(backend, max_wait=0.01)
+
+    async def slow_game():
+        await asyncio.sleep(0.2)
+
+    async def run():
+        return await asyncio.wait_for(
+            collector.run_games([_game(collector, "openai", 2, []), slow_game()]), timeout=5)
+
+    assert asyncio.run(run()) == [None, None]
+    assert backend.jobs_submitted == 2
+
+
+def test_batch_games_keep_their_own_logs(tmp_path):
+    """Test that games run side by side in one process each log only their own rounds."""
+    results = run_batch_games(2, str(tmp_path / "jobs"), responder=lambda request: "> look", max_wait=None,
+                              base_game_id="bt", seed=3, config_path="configs/game.yaml", rounds=2,
+                              player_models=["openai/a", "openai/b"], log_dir=str(tmp_path / "logs"))
+    assert results == [None, None]
+
+    game_logs = {path.parent.name: path.read_text(encoding="utf-8") for path in (tmp_path / "logs").rglob("game.log")}
+    assert sorted(game_logs) == ["bt_game_1", "bt_game_2"]
+    for game_id, game_log in game_logs.items():
+        assert game_log.count("🎯 Round") == 2, game_id
+        assert game_log.count("GAME OVER") == 1, game_id
@@ -0,0 +1,58 @@
+"""Tests for the micro-benchmark harness and motive-util bench compare."""
+
+import pytest
+
+from motive import benchmark
+from motive.benchmark import BenchmarkResults, BenchmarkStats, compare, measure
+from motive.util import util_main
+
+
+def _results(**times):
+    results = BenchmarkResults()
+    for name, seconds in times.items():
+        results.add(BenchmarkStats(name=name, group="", rounds=5, iterations=1, min=seconds, max=seconds,
+                                   mean=seconds, median=seconds, stddev=0.0))
+    return results
+
+
+def test_compare_flags_changes_beyond_threshold():
+    baseline = _results(parse=1.0, events=1.0, effects=1.0, gone=1.0)
+    current = _results(parse=1.2, events=1.5, effects=0.5, added=1.0)
+    statuses = {c.name: c.status for c in compare(baseline, current, threshold=0.25)}
+    assert statuses == {"parse": benchmark.UNCHANGED, "events": benchmark.REGRESSED, "effects": benchmark.IMPROVED,
+                        "gone": benchmark.MISSING, "added": benchmark.NEW}
+
+
+def test_measure_calibrates_calls_and_runs_setup_per_round(monkeypatch):
+    monkeypatch.setattr(benchmark, "MIN_TIME", 0.01)
+    calls = []
+    stats, result = measure("append", lambda: calls.append(1) or len(calls))
+    assert result == len(calls)
+    assert stats.rounds >= benchmark.MIN_ROUNDS and stats.iterations > 1
+    assert 0 < stats.min <= stats.median <= stats.max
+
+    state = {"resets": 0, "runs": 0}
+
+    def reset():
+        state["resets"] += 1
+
+    stats, _ = measure("with_setup", lambda: state.__setitem__("runs", state["runs"] + 1), setup=reset, rounds=7)
+    assert (stats.rounds, stats.iterations) == (7, 1)
+    assert state == {"resets": 7, "runs": 7}
+
+
+def test_bench_compare_command_exits_on_regression(tmp_path, capsys):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    _results(parse=1.0).save(str(baseline))
+    assert BenchmarkResults.load(str(baseline)).benchmarks["parse"].min == 1.0
+
+    _results(parse=1.1).save(str(current))
+    with pytest.raises(SystemExit) as exit_info:
+        util_main(["bench", "compare", str(baseline), str(current)])
+    assert exit_info.value.code == 0
+
+    _results(parse=2.0).save(str(current))
+    with pytest.raises(SystemExit) as exit_info:
+        util_main(["bench", "compare", str(baseline), str(current), "--threshold", "0.5"])
+    assert exit_info.value.code == 1
+    assert "1 regression(s)" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+"""Tests for per-turn checkpoints and motive --resume."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from motive import cli
+from motive.checkpoint import checkpoint_dir, load_checkpoint
+from motive.game_master import GameMaster
+from motive.player import Player
+
+
+def _run(log_dir, crash_at=None, resume=False):
+    """Run (or resume) a 3-round dummy game; crash_at=N fails the Nth turn like a provider timeout."""
+    original = GameMaster._execute_player_turn
+    turns = []
+
+    async def execute_player_turn(self, player, round_num):
+        turns.append((round_num, player.name))
+        if len(turns) == crash_at:
+            raise RuntimeError("provider timeout")
+        return await original(self, player, round_num)
+
+    with patch.object(GameMaster, "_execute_player_turn", execute_player_turn):
+        try:
+            if resume:
+                game_master = cli.asyncio.run(cli.resume_game("ckpt_game", log_dir=str(log_dir)))
+            else:
+                game_master = cli.asyncio.run(cli.run_game(
+                    "configs/game.yaml", game_id="ckpt_game", rounds=3,
+                    player_models=["dummy/a", "dummy/b"], log_dir=str(log_dir)))
+        except SystemExit:
+            game_master = None
+    return game_master, turns
+
+
+def test_resume_continues_after_last_completed_turn(tmp_path):
+    crashed, turns = _run(tmp_path, crash_at=4)
+    assert crashed is None
+    assert turns[-1] == (2, "Player_2")
+
+    checkpoint = load_checkpoint(checkpoint_dir(str(tmp_path), "ckpt_game"))
+    assert (checkpoint.turns, checkpoint.round, checkpoint.done) == (3, 2, ["Player_1"])
+    history_before = len(checkpoint.players["Player_1"]["messages"])
+    assert history_before > 0
+
+    resumed, turns = _run(tmp_path, resume=True)
+    # Only the unfinished turns are played again
+    assert turns == [(2, "Player_2"), (3, "Player_1"), (3, "Player_2")]
+    player_1 = next(player for player in resumed.players if player.name == "Player_1")
+    assert len(player_1.conversation_history) > history_before
+    assert player_1.prompt_prefix and player_1.prompt_prefix[0] is player_1.conversation_history[0]
+
+    checkpoint = load_checkpoint(checkpoint_dir(str(tmp_path), "ckpt_game"))
+    assert checkpoint.complete and checkpoint.turns == 6
+    _, turns = _run(tmp_path, resume=True)
+    assert turns == []  # A finished game is not played again
+
+
+def test_journal_holds_deltas_and_survives_a_torn_line(tmp_path):
+    _run(tmp_path, crash_at=3)
+    directory = checkpoint_dir(str(tmp_path), "ckpt_game")
+    journal = os.path.join(directory, "journal.jsonl")
+    with open(journal, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 3  # Initial state plus two completed turns
+    assert len(records[1]["entities"]) < len(records[0]["entities"]) / 10
+    assert records[2]["players"]["Player_1"]["messages"] == []  # Player 1 did not speak in player 2's turn
+
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"turn": 3, "round"')  # Crash in the middle of a write
+    assert load_checkpoint(directory).turns == 2
+
+
+def test_missing_checkpoint_exits_with_error(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        cli.asyncio.run(cli.resume_game("no_such_game", log_dir=str(tmp_path)))
+    assert "No checkpoint found" in capsys.readouterr().err
+
+
+def test_continue_chat_log_appends(tmp_path):
+    player = Player("Checkpoint_Player", "dummy", "a", log_dir=str(tmp_path))
+    player.logger.info("before the crash")
+    player.logger.handlers[0].close()
+
+    resumed = Player("Checkpoint_Player", "dummy", "a", log_dir=str(tmp_path / "other"))
+    resumed.log_dir = str(tmp_path)
+    resumed.continue_chat_log()
+    resumed.logger.info("after resuming")
+    resumed.logger.handlers[0].close()
+
+    with open(tmp_path / "Checkpoint_Player_chat.log", encoding="utf-8") as f:
+        content = f.read()
+    assert "before the crash" in content and "after resuming" in content
@@ -7,7 +7,7 @@ the foundational config merging system is robust and reliable.
 
 import pytest
 from typing import Dict, Any, List
-from motive.config_merging import ConfigMerger, merge_configs
+from motive.config_merging import ConfigMerger, MergeSession, merge_configs
 from motive.list_merge_strategies import ListMergeStrategy
 
 
@@ -517,3 +517,62 @@ class TestConfigMergerEdgeCases:
         assert "level_2" in result["level_0"]["level_1"]
         # The final value should be preserved at the deepest level
         assert result["level_0"]["level_1"]["level_2"]["final"] == "value"
+
+
+class TestMergeSession:
+    """Test copy-on-write merging across several configs."""
+
+    def test_untouched_subtrees_are_shared(self):
+        """Test that subtrees no later merge writes into are not copied."""
+        base = {"objects": {"torch": {"lit": False}}, "rooms": {"hall": {"exits": ["north"]}}}
+        session = MergeSession({})
+        session.merge(base)
+        session.merge({"objects": {"sword": {"sharp": True}}})
+
+        assert session.result["rooms"] is base["rooms"]
+        assert session.result["objects"]["torch"] is base["objects"]["torch"]
+        assert "sword" not in base["objects"]
+
+    def test_inputs_are_never_mutated(self):
+        """Test that appends and nested merges copy shared containers first."""
+        first = {"players": [{"name": "a"}], "settings": {"rounds": 1}}
+        second = {"players": [{"name": "b"}], "settings": {"ap": 20}}
+        third = {"players": [{"name": "c"}]}
+        session = MergeSession({})
+        for config in (first, second, third):
+            session.merge(config)
+
+        assert [p["name"] for p in session.result["players"]] == ["a", "b", "c"]
+        assert session.result["settings"] == {"rounds": 1, "ap": 20}
+        assert first == {"players": [{"name": "a"}], "settings": {"rounds": 1}}
+        assert second == {"players": [{"name": "b"}], "settings": {"ap": 20}}
+
+    def test_matches_pairwise_merges(self):
+        """Test that a session gives the same result as chained merge_configs calls."""
+        configs = [
+            {"a": {"b": [1]}, "c": 1, "includes": ["x.yaml"]},
+            {"a": {"b": [2], "d": {"e": 1}}},
+            {"a": {"d": {"f": 2}}, "c": 3, "l": [{"__merge_strategy__": "prepend"}, 0]},
+        ]
+        merger = ConfigMerger()
+        expected = {}
+        for config in configs:
+            expected = merger.merge_configs(expected, config)
+
+        session = MergeSession({}, merger)
+        for config in configs:
+            session.merge(config)
+
+        assert session.result == expected
+
+    def test_provenance_records_last_writer(self):
+        """Test that provenance maps written key paths to their source."""
+        session = MergeSession({}, track_provenance=True)
+        session.merge({"settings": {"rounds": 1, "ap": 20}}, source="base.yaml")
+        session.merge({"settings": {"rounds": 5}}, source="game.yaml")
+
+        # New subtrees are recorded where they were attached; later writes at their leaves
+        assert session.provenance[("settings",)] == "base.yaml"
+        assert session.provenance[("settings", "rounds")] == "game.yaml"
+        assert ("settings", "ap") not in session.provenance
+
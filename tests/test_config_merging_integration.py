@@ -342,3 +342,66 @@ name: "ConfigB"
                 config_a_path.unlink()
             if config_b_path.exists():
                 config_b_path.unlink()
+
+    def test_each_included_file_parsed_once(self, tmp_path, monkeypatch):
+        """Test that a diamond include tree parses the shared file only once."""
+        from motive.sim_v2 import v2_config_preprocessor as preprocessor_module
+
+        (tmp_path / "shared.yaml").write_text("action_definitions:\n  look:\n    id: look\n")
+        (tmp_path / "left.yaml").write_text("includes:\n  - shared.yaml\nleft: 1\n")
+        (tmp_path / "right.yaml").write_text("includes:\n  - shared.yaml\nright: 2\n")
+        (tmp_path / "game.yaml").write_text("includes:\n  - left.yaml\n  - right.yaml\n")
+
+        parsed = []
+        original = preprocessor_module._parse_yaml_file
+
+        def counting_parse(path):
+            parsed.append(Path(path).name)
+            return original(path)
+
+        monkeypatch.setattr(preprocessor_module, "_parse_yaml_file", counting_parse)
+        result = V2ConfigPreprocessor(str(tmp_path), max_parse_workers=4).load_config_with_metadata("game.yaml")
+
+        assert sorted(parsed) == ["game.yaml", "left.yaml", "right.yaml", "shared.yaml"]
+        assert result.is_v2
+        assert result.has_includes
+        assert result.config["left"] == 1
+        assert result.config["right"] == 2
+        assert "look" in result.config["action_definitions"]
+
+    def test_metadata_reports_non_v2_without_merging(self, tmp_path):
+        """Test that a tree without v2 sections is detected and not merged."""
+        (tmp_path / "base.yaml").write_text("theme: fantasy\n")
+        (tmp_path / "game.yaml").write_text("includes:\n  - base.yaml\n")
+
+        result = V2ConfigPreprocessor(str(tmp_path)).load_config_with_metadata("game.yaml")
+
+        assert not result.is_v2
+        assert result.config is None
+        assert len(result.files) == 2
+
+    def test_invalid_yaml_in_include_reports_loading_chain(self, tmp_path):
+        """Test that YAML errors found by the parse pass keep the include chain."""
+        from motive.sim_v2.v2_config_preprocessor import V2ConfigLoadError
+
+        (tmp_path / "broken.yaml").write_text("key: [unclosed\n")
+        (tmp_path / "game.yaml").write_text("includes:\n  - broken.yaml\n")
+
+        with pytest.raises(V2ConfigLoadError) as exc_info:
+            V2ConfigPreprocessor(str(tmp_path)).load_config_with_metadata("game.yaml")
+        assert "game.yaml" in str(exc_info.value)
+
+    def test_provenance_follows_includes_to_defining_file(self, tmp_path):
+        """Test that get_provenance reports the file that actually wrote a key."""
+        (tmp_path / "core.yaml").write_text("action_definitions:\n  look:\n    cost: 1\n")
+        (tmp_path / "theme.yaml").write_text("includes:\n  - core.yaml\naction_definitions:\n  say:\n    cost: 0\n")
+        (tmp_path / "game.yaml").write_text("includes:\n  - theme.yaml\naction_definitions:\n  say:\n    cost: 2\n")
+
+        preprocessor = V2ConfigPreprocessor(str(tmp_path))
+        config = preprocessor.load_config("game.yaml")
+
+        assert config["action_definitions"]["say"]["cost"] == 2
+        assert preprocessor.get_provenance("action_definitions.look.cost") == str(tmp_path / "core.yaml")
+        assert preprocessor.get_provenance("action_definitions.say.cost") == str(tmp_path / "game.yaml")
+        assert preprocessor.get_provenance("missing.key") is None
+
@@ -461,5 +461,83 @@ class TestConfigValidation:
                 mock_logger_instance.warning.assert_not_called()
 
 
+
+def _visit_entity(entity_id, entity_def, types, attributes):
+    """Module-level check so it can run in a process pool."""
+    return [f"{entity_id} visited"]
+
+
+class TestSemanticValidator:
+    """Test the single-pass rule engine behind the entity checks."""
+
+    def _entities(self, count):
+        from motive.sim_v2.definitions import EntityDefinition
+        entities = {}
+        for i in range(count):
+            entities[f"room_{i}"] = EntityDefinition(
+                definition_id=f"room_{i}",
+                types=["room"],
+                attributes={
+                    "description": "" if i % 2 else "A room",
+                    "properties": {"exits": {"north": {"destination_room_id": f"room_{i + 1}"}}},
+                },
+            )
+        return entities
+
+    def test_rules_share_one_pass_and_report_timings(self):
+        """Test that every rule reports issues and a timing from one collect call."""
+        from motive.sim_v2.v2_config_rules import SemanticValidator
+
+        report = SemanticValidator().collect(self._entities(4))
+
+        assert report.entity_count == 4
+        assert report.issues["room_navigation"] == ["Room 'room_3' has exit pointing to undefined room 'room_4'"]
+        assert report.issues["content_consistency"] == ["Room 'room_1' has no description", "Room 'room_3' has no description"]
+        assert set(report.timings) == set(report.issues)
+        assert all(seconds >= 0 for seconds in report.timings.values())
+
+    def test_custom_rule_only_sees_matching_types(self):
+        """Test registering a rule limited to some entity types."""
+        from motive.sim_v2.v2_config_rules import DEFAULT_RULES, SemanticValidator, ValidationRule
+
+        registry = DEFAULT_RULES.copy()
+        registry.register(ValidationRule(
+            name="visit_characters",
+            check=_visit_entity,
+            entity_types=frozenset({"character"}),
+        ))
+        report = SemanticValidator(registry).collect(self._entities(3))
+
+        assert report.issues["visit_characters"] == []
+        with pytest.raises(ValueError):
+            registry.register(ValidationRule(name="visit_characters"))
+
+    def test_process_pool_matches_serial_results(self):
+        """Test that sharding per-entity checks keeps issues and their order."""
+        from motive.sim_v2.v2_config_rules import SemanticValidator
+
+        entities = self._entities(12)
+        serial = SemanticValidator().collect(entities)
+        sharded = SemanticValidator(workers=3, min_entities_per_worker=1).collect(entities)
+
+        assert sharded.issues == serial.issues
+
+    def test_string_encoded_property_is_rejected(self):
+        """Test that a dict stored as a string in properties fails validation."""
+        config_data = {
+            "entity_definitions": {
+                "encoded_room": {
+                    "types": ["room"],
+                    "attributes": {"description": "A room"},
+                    "properties": {"exits": {"type": "string", "default": "{'north': {'id': 'n'}}"}},
+                }
+            }
+        }
+
+        with pytest.raises(V2ConfigValidationError) as exc_info:
+            V2GameConfig(**config_data)
+        assert "String-encoded YAML detected in entity 'encoded_room'" in str(exc_info.value)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,161 @@
+"""Tests for config watch mode (incremental reload and re-validation)."""
+
+import os
+
+import pytest
+
+from motive.sim_v2.config_watch import ConfigWatcher
+from motive.sim_v2.v2_config_preprocessor import V2ConfigPreprocessor
+
+
+ROOMS_YAML = """\
+entity_definitions:
+  hall:
+    types: [room]
+    attributes:
+      description: A long hall
+      properties:
+        exits:
+          north: {destination_room_id: study}
+  study:
+    types: [room]
+    attributes:
+      description: A quiet study
+"""
+
+GAME_YAML = """\
+includes:
+  - rooms.yaml
+action_definitions:
+  look:
+    action_id: look
+    name: look
+    cost: 1
+    description: Look around
+    parameters: []
+    requirements: []
+    effects: []
+"""
+
+
+def _write(path, text):
+    path.write_text(text)
+    # Give every write a distinct mtime even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "rooms.yaml").write_text(ROOMS_YAML)
+    (tmp_path / "game.yaml").write_text(GAME_YAML)
+    return tmp_path
+
+
+class TestConfigWatcher:
+    """Test reloading a config tree as its files change."""
+
+    def test_load_validates_everything(self, config_dir):
+        """Test that the initial load parses and checks every entity."""
+        watcher = ConfigWatcher(str(config_dir / "game.yaml"))
+        result = watcher.load()
+
+        assert result.ok, result.error
+        assert sorted(result.changed_entities) == ["hall", "study"]
+        assert result.changed_actions == ["look"]
+        assert set(watcher.config.entity_definitions) == {"hall", "study"}
+        assert not any(result.report.issues.values())
+
+    def test_poll_without_changes_does_nothing(self, config_dir):
+        """Test that polling an untouched tree does not reload."""
+        watcher = ConfigWatcher(str(config_dir / "game.yaml"))
+        watcher.load()
+
+        assert watcher.poll() is None
+
+    def test_edit_revalidates_only_changed_entity(self, config_dir):
+        """Test that only the edited entity is re-parsed and its issues reported."""
+        watcher = ConfigWatcher(str(config_dir / "game.yaml"))
+        watcher.load()
+        hall = watcher.entities["hall"]
+
+        _write(config_dir / "rooms.yaml", ROOMS_YAML.replace("A quiet study", "''"))
+        result = watcher.poll()
+
+        assert result is not None and result.ok, result and result.error
+        assert result.changed_files == [str(config_dir / "rooms.yaml")]
+        assert result.changed_entities == ["study"]
+        assert result.changed_actions == []
+        assert watcher.entities["hall"] is hall
+        assert result.report.issues["content_consistency"] == ["Room 'study' has no description"]
+
+    def test_cross_reference_issues_follow_removed_entities(self, config_dir):
+        """Test that removing an exit target is caught without re-checking the room."""
+        watcher = ConfigWatcher(str(config_dir / "game.yaml"))
+        watcher.load()
+
+        _write(config_dir / "rooms.yaml", ROOMS_YAML.split("  study:")[0])
+        result = watcher.poll()
+
+        assert result.ok, result.error
+        assert result.changed_entities == []
+        assert result.removed_entities == ["study"]
+        assert result.report.issues["room_navigation"] == [
+            "Room 'hall' has exit pointing to undefined room 'study'"
+        ]
+
+    def test_broken_edit_keeps_previous_content(self, config_dir):
+        """Test that a YAML error is reported and the last good content stays active."""
+        reloads = []
+        watcher = ConfigWatcher(str(config_dir / "game.yaml"), on_reload=lambda w, r: reloads.append(r))
+        watcher.load()
+
+        _write(config_dir / "rooms.yaml", "entity_definitions: [unclosed\n")
+        failed = watcher.poll()
+
+        assert not failed.ok
+        assert "rooms.yaml" in failed.error
+        assert set(watcher.entities) == {"hall", "study"}
+        assert watcher.poll() is None
+
+        _write(config_dir / "rooms.yaml", ROOMS_YAML)
+        fixed = watcher.poll()
+
+        assert fixed.ok, fixed.error
+        assert fixed.changed_entities == []
+        assert reloads == [reloads[0], failed, fixed]
+
+
+class TestPreprocessorReload:
+    """Test re-merging only the configs affected by a file change."""
+
+    def test_reload_files_keeps_unaffected_merges(self, tmp_path):
+        """Test that configs not including a changed file are not re-merged."""
+        (tmp_path / "a.yaml").write_text("action_definitions:\n  look: {cost: 1}\n")
+        (tmp_path / "b.yaml").write_text("action_definitions:\n  say: {cost: 0}\n")
+        (tmp_path / "game.yaml").write_text("includes:\n  - a.yaml\n  - b.yaml\n")
+
+        preprocessor = V2ConfigPreprocessor(str(tmp_path))
+        preprocessor.load_config("game.yaml")
+        merged_b = preprocessor.loaded_configs[str(tmp_path / "b.yaml")]
+
+        _write(tmp_path / "a.yaml", "action_definitions:\n  look: {cost: 3}\n")
+        config = preprocessor.reload_files([str(tmp_path / "a.yaml")])
+
+        assert config["action_definitions"]["look"]["cost"] == 3
+        assert config["action_definitions"]["say"]["cost"] == 0
+        assert preprocessor.loaded_configs[str(tmp_path / "b.yaml")] is merged_b
+
+
+def test_reload_summary_names_rules_without_a_header(config_dir, capsys):
+    """Test that issues of an error rule (which has no header) print under the rule's name."""
+    from motive.util import print_reload_result
+
+    watcher = ConfigWatcher(str(config_dir / "game.yaml"))
+    result = watcher.load()
+    result.report.issues["character_motives"] = ["ghost"]
+    print_reload_result(watcher, result)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "  character_motives" in lines and "    - ghost" in lines
+    assert not any(not line.strip() for line in lines)
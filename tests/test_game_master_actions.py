@@ -23,7 +23,7 @@ def mock_game_master():
     # Mock logging setup to prevent actual file writing during tests
     with (
         patch('os.makedirs'),
-        patch('logging.FileHandler') as mock_file_handler_class,
+        patch('motive.game_master.QueueFileHandler') as mock_file_handler_class,
         patch('os.path.join', return_value='mock/log/path'), # Mock os.path.join
         patch('motive.player.create_llm_client', return_value=MagicMock()), # Mock create_llm_client
         patch('motive.player.Player') as mock_player_class, # Mock the Player class
@@ -232,7 +232,7 @@ class TestGameMasterInitialization:
         gm = GameMaster(game_config, "test_game")
         
         # Verify logger was created and configured
-        assert gm.game_logger.name == "GameNarrative"
+        assert gm.game_logger.name == "GameNarrative.test_game"
         assert gm.game_logger.level == 20  # INFO level
         assert len(gm.game_logger.handlers) == 2  # FileHandler + StreamHandler
         assert gm.game_logger.propagate is False
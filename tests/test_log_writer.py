@@ -0,0 +1,69 @@
+"""Tests for the asynchronous, batched log writer."""
+
+import gzip
+import logging
+
+import pytest
+
+from motive.log_writer import LazyMessage, LogWriter, QueueFileHandler, log_file_path
+
+
+def _logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def test_handler_writes_records_in_order_through_writer_thread(tmp_path):
+    """Test that queued records reach the file formatted and in order."""
+    writer = LogWriter(fsync_interval=0.05)
+    handler = QueueFileHandler(tmp_path / "game.log", mode="w", writer=writer)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger = _logger("test_log_writer.order", handler)
+
+    for i in range(500):
+        logger.info("line %d", i)
+    handler.flush()
+
+    lines = (tmp_path / "game.log").read_text(encoding="utf-8").splitlines()
+    assert lines == [f"INFO line {i}" for i in range(500)]
+    assert writer.records_written == 500
+    assert writer.batches_written < 500  # Records are written in batches
+    handler.close()
+
+
+def test_lazy_messages_are_not_built_for_disabled_levels(tmp_path):
+    """Test that expensive messages cost nothing below the logger level."""
+    built = []
+    handler = QueueFileHandler(tmp_path / "game.log", writer=LogWriter())
+    logger = _logger("test_log_writer.lazy", handler)
+    logger.setLevel(logging.WARNING)
+
+    logger.info(LazyMessage(lambda: built.append("info") or "report"))
+    logger.warning(LazyMessage(lambda: built.append("warning") or "report"))
+    handler.close()
+
+    assert built == ["warning"]
+    assert (tmp_path / "game.log").read_text(encoding="utf-8") == "report\n"
+
+
+def test_gzip_compressed_logs(tmp_path):
+    """Test that compressed logs get a suffix and decompress to the records."""
+    handler = QueueFileHandler(tmp_path / "Player_1_chat.log", compression="gzip", writer=LogWriter())
+    logger = _logger("test_log_writer.gzip", handler)
+
+    logger.info("hello")
+    logger.info("world")
+    handler.close()
+
+    assert handler.baseFilename.endswith("Player_1_chat.log.gz")
+    with gzip.open(handler.baseFilename, "rt", encoding="utf-8") as f:
+        assert f.read() == "hello\nworld\n"
+
+
+def test_unknown_compression_is_rejected():
+    """Test that log_compression values are validated up front."""
+    with pytest.raises(ValueError):
+        log_file_path("game.log", "lz4")
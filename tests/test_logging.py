@@ -19,7 +19,7 @@ from pydantic import BaseModel
 def mock_game_master_logging():
     with (
         patch('os.makedirs'),
-        patch('logging.FileHandler') as mock_file_handler_class,
+        patch('motive.game_master.QueueFileHandler') as mock_file_handler_class,
         patch('os.path.join', return_value='mock/log/path'),
         patch('motive.player.create_llm_client', return_value=MagicMock()),
         patch('motive.player.Player') as mock_player_class,
@@ -0,0 +1,72 @@
+"""Tests for the precompiled message-template engine."""
+
+import pytest
+
+from motive.cli import build_game_master
+from motive.message_templates import (
+    BRACES, FORMAT, TemplateError, compile_template, precompile_action_messages,
+    precompile_interaction_messages, render_template,
+)
+
+
+class _Player:
+    def __init__(self, **properties):
+        self.properties = properties
+
+    def get_property(self, name, default=None):
+        return self.properties.get(name, default)
+
+
+def test_braces_templates_render_known_placeholders():
+    """Test handler-style placeholders, including player properties."""
+    template = compile_template("{{player_name}} shows {{target}} ({{player_property:evidence}} clues). {odd}")
+
+    assert compile_template("{{player_name}} shows {{target}} ({{player_property:evidence}} clues). {odd}") is template
+    assert template.unknown == ()
+    assert template.render({"player_name": "Ada", "target": "the mayor"}, _Player(evidence=3)) == \
+        "Ada shows the mayor (3 clues). {odd}"
+    assert template.render({"player_name": "Ada"}, _Player()) == "Ada shows {{target}} (0 clues). {odd}"
+
+
+def test_braces_templates_keep_unknown_placeholders_as_written():
+    """Test that unknown placeholders are reported but still rendered as-is."""
+    template = compile_template("{{player_name}} and {{mystery}}", BRACES)
+
+    assert template.unknown == ("{{mystery}}",)
+    assert template.render({"player_name": "Ada", "mystery": "x"}) == "Ada and {{mystery}}"
+    assert precompile_interaction_messages("object 'lamp'", {"use": {"effects": [{"message": "{{mystery}}"}]}}) == [
+        "object 'lamp': unknown placeholder(s) {{mystery}} in '{{mystery}}'"]
+
+
+def test_format_templates_match_str_format():
+    """Test format-style rendering, legacy aliases and its errors."""
+    template = compile_template("{{player_name}} picks up the {object_name}.", FORMAT)
+
+    assert template.params == {"player_name", "object_name"}
+    assert template.render({"player_name": "Ada", "object_name": "lamp"}) == "Ada picks up the lamp."
+    with pytest.raises(KeyError):
+        template.render({"player_name": "Ada"})
+    assert render_template("{count:>3}|", {"count": 7}, style=FORMAT) == "  7|"
+    with pytest.raises(TemplateError):
+        compile_template("unbalanced {", FORMAT)
+
+
+def test_precompile_action_messages_reports_unknown_params():
+    """Test load-time checks of action effect messages."""
+    action = {
+        "parameters": [{"name": "object_name"}],
+        "effects": [
+            {"type": "generate_event", "message": "{player_name} reads {object_name}."},
+            {"type": "generate_event", "message": "{player_name} drops {item}."},
+        ],
+    }
+
+    assert precompile_action_messages("read", action) == [
+        "action 'read': unknown placeholder(s) item in '{player_name} drops {item}.'"]
+
+
+def test_game_config_messages_precompile_cleanly():
+    """Test that the shipped configs compile without template problems."""
+    game_master = build_game_master("configs/game.yaml", no_file_logging=True, player_models=["dummy/a"])
+
+    assert game_master.template_problems == []
@@ -0,0 +1,96 @@
+"""Tests for the columnar game-outcome store and motive-util stats."""
+
+import json
+
+from motive.cli import build_game_master
+from motive.outcome_store import OutcomeStore, Segment
+from motive.util import util_main
+
+
+def _row(model, outcome, **extra):
+    return {"provider": "dummy", "model": model, "character": "detective", "outcome": outcome,
+            "ap_spent": 30, "input_tokens": 100, "output_tokens": 10, "llm_seconds": 1.0, **extra}
+
+
+def test_pending_rows_and_segments_read_the_same(tmp_path):
+    """Test that compaction keeps every row and column."""
+    store = OutcomeStore(tmp_path / "outcomes", compact_threshold=0)
+    store.append([_row("a", "won", actions={"look": 2}), _row("b", "failed", seed=None)])
+    store.append([_row("a", "not_achieved", actions={"look": 1, "move": 3})])
+    before = store.columns(["model", "outcome", "actions.look", "actions.move", "seed"])
+
+    assert store.compact() == 3
+    assert store.compact() == 0
+    assert len(store.segments()) == 1
+    assert store.columns(["model", "outcome", "actions.look", "actions.move", "seed"]) == before
+    assert before["actions.move"] == [None, None, 3]
+
+
+def test_stats_groups_and_filters(tmp_path):
+    """Test win rates and averages per group."""
+    store = OutcomeStore(tmp_path / "outcomes", compact_threshold=0)
+    store.append([_row("a", "won"), _row("b", "failed")])
+    store.compact()
+    store.append([_row("a", "failed", ap_spent=10), _row("b", "won")])
+
+    report = {row["model"]: row for row in store.stats(["model"])}
+    assert report["a"]["games"] == 2
+    assert report["a"]["win_rate"] == 0.5
+    assert report["a"]["avg_ap_spent"] == 20
+
+    filtered = store.stats(["model"], where={"outcome": "won"})
+    assert sorted(row["model"] for row in filtered) == ["a", "b"]
+    # Numeric columns are stored as floats, so "10" has to match 10.0 - in segments and pending rows alike
+    assert [row["avg_ap_spent"] for row in store.stats(["model"], where={"ap_spent": "10"})] == [10]
+    store.compact()
+    assert [row["avg_ap_spent"] for row in store.stats(["model"], where={"ap_spent": "10"})] == [10]
+
+
+def test_stats_counts_games_not_player_rows(tmp_path):
+    """Test that a two-player game counts once under games and twice under results."""
+    store = OutcomeStore(tmp_path / "outcomes", compact_threshold=0)
+    store.append([_row("a", "won", game_id="g1"), _row("a", "failed", game_id="g1")])
+    store.append([_row("a", "won", game_id="g2"), _row("b", "failed", game_id="g2")])
+
+    report = {row["model"]: row for row in store.stats(["model"])}
+    assert (report["a"]["games"], report["a"]["results"], report["a"]["wins"]) == (2, 3, 2)
+    assert (report["b"]["games"], report["b"]["results"]) == (1, 1)
+
+
+def test_compaction_skips_rows_already_in_a_segment(tmp_path):
+    """Test recovery from a compaction that crashed before deleting its pending files."""
+    store = OutcomeStore(tmp_path / "outcomes", compact_threshold=0)
+    pending = store.append([_row("a", "won")])
+    Segment.write(store.directory / "segment-0.mcol", [_row("a", "won")], [pending.name])
+
+    assert len(store.columns(["model"])["model"]) == 1
+    assert store.compact() == 0
+    assert not pending.exists()
+
+
+def test_finished_game_appends_player_rows(tmp_path):
+    """Test that a game records one row per player with its play stats."""
+    game_master = build_game_master("configs/game.yaml", player_models=["dummy/a", "dummy/b"],
+                                    log_dir=str(tmp_path), rounds=1)
+    game_master.no_file_logging = False
+    game_master._record_action_stats(game_master.players[0], "look", 10)
+    game_master._check_win_conditions_and_summarize()
+    game_master._record_outcomes()
+
+    rows = OutcomeStore(tmp_path / "outcomes").columns(["player", "model", "ap_spent", "actions.look", "config_hash"])
+    assert rows["model"] == ["a", "b"]
+    assert rows["ap_spent"] == [10, 0]
+    assert rows["actions.look"] == [1, None]
+    assert len(set(rows["config_hash"])) == 1
+
+
+def test_util_stats_command(tmp_path, capsys):
+    """Test the motive-util stats front end."""
+    store = OutcomeStore(tmp_path / "outcomes", compact_threshold=0)
+    store.append([_row("a", "won"), _row("b", "failed")])
+
+    util_main(["stats", "--store", str(store.directory), "--json"])
+
+    report = json.loads(capsys.readouterr().out)
+    assert [(row["model"], row["wins"]) for row in report] == [("a", 1), ("b", 0)]
+    assert store.segments()  # Pending rows were compacted first
@@ -1,5 +1,7 @@
 """Tests for --players CLI argument functionality."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch
 from motive.config import GameConfig, GameSettings, PlayerConfig
@@ -150,3 +152,19 @@ class TestPlayersCLI:
                 config.players = config.players[:players]
         
         assert len(config.players) == 0
+
+    @pytest.mark.asyncio
+    async def test_player_models_replace_configured_players(self):
+        """Test --player-models builds one player per provider/model entry."""
+        config = self.base_config.model_copy(deep=True)
+        with patch('motive.cli.load_config', return_value=config), \
+             patch('motive.cli.setup_logging'), \
+             patch('motive.cli.GameMaster') as mock_game_master:
+            mock_game_master.return_value.run_game = Mock(side_effect=lambda: asyncio.sleep(0))
+            await run_game("game.yaml", game_id="g", player_models=["openai/gpt-4o", "google/gemini-2.5-flash"])
+
+        players = mock_game_master.call_args.args[0].players
+        assert [(p.name, p.provider, p.model) for p in players] == [
+            ("Player_1", "openai", "gpt-4o"),
+            ("Player_2", "google", "gemini-2.5-flash"),
+        ]
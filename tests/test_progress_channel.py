@@ -0,0 +1,115 @@
+"""Tests for the shared-memory progress channel used by parallel games."""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from motive import progress_channel
+from motive.cli import GameProgress, GameStatus, ParallelGameRunner
+from motive.progress_channel import ProgressBoard, ProgressPublisher, ProgressReader
+
+
+@pytest.fixture
+def board():
+    board = ProgressBoard.create(4)
+    yield board
+    board.close()
+
+
+def test_publisher_records_round_trip_through_shared_memory(board):
+    """Test that a worker's updates are read back field for field."""
+    publisher = ProgressPublisher.attach(f"{board.name}:2")
+    publisher.update(status=progress_channel.RUNNING, total_rounds=3, total_players=2, log_file="logs/g/game.log")
+    publisher.update(round=1, turn=1, input_tokens=1200, output_tokens=80)
+
+    seq, record = board.read(2)
+    assert seq % 2 == 0
+    assert record.status == progress_channel.RUNNING
+    assert (record.round, record.total_rounds, record.turn, record.total_players) == (1, 3, 1, 2)
+    assert (record.input_tokens, record.output_tokens) == (1200, 80)
+    assert record.log_file == "logs/g/game.log"
+    assert record.updated_at > 0
+    publisher.board.close()
+
+
+def test_reader_reports_only_changed_slots(board):
+    """Test that the monitor only sees slots updated since its last poll."""
+    reader = ProgressReader(board)
+    first = ProgressPublisher(board, 0)
+    second = ProgressPublisher(board, 3)
+
+    assert reader.changed() == {}
+    first.update(round=1)
+    second.update(round=2)
+    assert set(reader.changed()) == {0, 3}
+    assert reader.changed() == {}
+    second.update(completed_turns=1)
+    assert set(reader.changed()) == {3}
+
+
+def test_publisher_rejects_bad_specs(board):
+    """Test validation of the NAME:SLOT argument."""
+    with pytest.raises(ValueError):
+        ProgressPublisher.attach(board.name)
+    with pytest.raises(ValueError):
+        ProgressPublisher(board, board.slots)
+
+
+def _runner_with_board(board, games=2):
+    runner = ParallelGameRunner(games, "configs/game.yaml")
+    runner.progress_board = board
+    runner.progress_reader = ProgressReader(board)
+    for slot in range(games):
+        game_id = f"g{slot}"
+        runner.games[game_id] = GameProgress(game_id=game_id, status=GameStatus.STARTING, start_time=datetime.now())
+        runner.game_slots[game_id] = slot
+    return runner
+
+
+def test_runner_applies_progress_records(board):
+    """Test that board records drive the monitor's game progress."""
+    runner = _runner_with_board(board)
+    ProgressPublisher(board, 1).update(status=progress_channel.RUNNING, round=2, total_rounds=3, turn=1,
+                                       total_players=2, completed_turns=3, input_tokens=10, output_tokens=5)
+
+    assert runner._sync_progress() is True
+    game = runner.games["g1"]
+    assert game.status == GameStatus.RUNNING
+    assert (game.current_round, game.current_turn_in_round, game.completed_turns, game.tokens) == (2, 1, 3, 15)
+    assert runner.games["g0"].status == GameStatus.STARTING
+    assert runner._sync_progress() is False
+
+
+def test_runner_flags_workers_without_progress(board):
+    """Test hang detection from the last progress update."""
+    runner = _runner_with_board(board)
+    runner.hang_timeout_seconds = 5
+    publisher = ProgressPublisher(board, 0)
+    publisher.update(status=progress_channel.RUNNING)
+    board.write(0, publisher.record._replace(updated_at=time.time() - 10))
+
+    runner._sync_progress()
+    assert runner.games["g0"].status == GameStatus.FAILED
+    assert "no progress" in runner.games["g0"].error_message
+
+
+def test_fancy_display_rewrites_only_changed_lines(board, capsys, monkeypatch):
+    """Test incremental redraws in fancy mode."""
+    monkeypatch.delenv("MOTIVE_NO_CLEAR", raising=False)
+    runner = _runner_with_board(board)
+    for game in runner.games.values():
+        game.start_time = None  # Keep the duration column fixed between frames
+    runner.display_status(fancy_mode=True)
+    assert "\033[2J" in capsys.readouterr().out
+
+    runner.display_status(fancy_mode=True)
+    assert capsys.readouterr().out == ""
+
+    runner.games["g1"].status = GameStatus.FAILED
+    runner.games["g1"].error_message = "boom"
+    runner.display_status(fancy_mode=True)
+    output = capsys.readouterr().out
+    assert "\033[2J" not in output
+    assert output.count("\033[2K") == 1
+    assert "boom" in output
@@ -0,0 +1,62 @@
+"""Tests for cached prompt fragment rendering."""
+
+from motive.cli import build_game_master
+from motive.game_object import GameObject
+from motive.prompt_fragments import FragmentCache
+
+
+def test_fragment_cache_counts_hits_and_evicts_oldest():
+    """Test hits, renders and the per-fragment entry limit."""
+    cache = FragmentCache(max_entries=2)
+    renders = []
+
+    def render(value):
+        renders.append(value)
+        return value
+
+    assert cache.get("room", 1, lambda: render("a")) == "a"
+    assert cache.get("room", 1, lambda: render("b")) == "a"
+    cache.get("room", 2, lambda: render("c"))
+    cache.get("room", 3, lambda: render("d"))
+    cache.get("room", 1, lambda: render("e"))
+
+    assert renders == ["a", "c", "d", "e"]
+    assert (cache.stats["room"].hits, cache.stats["room"].misses) == (1, 4)
+    assert cache.report()[0].startswith("room: 1 hits / 4 renders")
+
+
+def _game_master():
+    return build_game_master("configs/game.yaml", no_file_logging=True, player_models=["dummy/a", "dummy/b"])
+
+
+def test_room_description_rerenders_after_objects_change():
+    """Test that room fragments are keyed on the room version."""
+    game_master = _game_master()
+    room = next(iter(game_master.rooms.values()))
+
+    first = game_master._render_room_description(room)
+    assert game_master._render_room_description(room) is first
+
+    room.add_object(GameObject("test_lantern", "Test Lantern", "A lantern.", room.id))
+    updated = game_master._render_room_description(room)
+    assert "Test Lantern" in updated
+    room.remove_object("test_lantern")
+    assert game_master._render_room_description(room) == first
+    assert game_master.prompt_fragments.stats["room_description"].misses == 3
+
+
+def test_cached_action_display_matches_uncached_rendering():
+    """Test that caching keeps the example action rotation unchanged."""
+    cached, uncached = _game_master(), _game_master()
+    player_char = cached.players[0].character
+    other_char = uncached.players[0].character
+
+    # The ranking rotates through a cycle of recently shown actions, so keys repeat once it wraps
+    for turn in range(40):
+        player_char.action_points = other_char.action_points = 15 if turn % 10 == 5 else 40
+        uncached.prompt_fragments.clear()
+        assert cached._get_action_display(player_char) == uncached._get_action_display(other_char)
+
+    stats = cached.prompt_fragments.stats["example_actions"]
+    assert stats.hits > 0
+    assert stats.hits + stats.misses == 40
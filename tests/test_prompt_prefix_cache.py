@@ -0,0 +1,95 @@
+"""Tests for the cache-friendly prompt prefix and prefix metrics."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from motive.cli import build_game_master
+from motive.llm_factory import apply_cache_markers
+from motive.player import Player
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.requests = []
+
+    async def ainvoke(self, messages, **kwargs):
+        self.requests.append(messages)
+        cached = 1500 if len(self.requests) > 1 else 0
+        return AIMessage(content="> look", usage_metadata={
+            "input_tokens": 2000, "output_tokens": 5, "total_tokens": 2005,
+            "input_token_details": {"cache_read": cached, "cache_creation": 1500 - cached},
+        })
+
+
+def _player(provider="dummy"):
+    llm = _RecordingLLM()
+    player = Player("Cacher", provider, "model", log_dir="logs", no_file_logging=True, llm_client=llm)
+    player.add_prefix_message(SystemMessage(content="rules"))
+    player.add_prefix_message(HumanMessage(content="manual"))
+    player.add_prefix_message(HumanMessage(content="you are the detective"))
+    return player, llm
+
+
+async def _turn(player, text):
+    message = HumanMessage(content=text)
+    player.add_message(message)
+    return await player.get_response_and_update_history(player.chat_history)
+
+
+@pytest.mark.asyncio
+async def test_prefix_leads_every_request_and_metrics_are_recorded():
+    """Test that requests start with the prefix and grow by appending."""
+    player, llm = _player()
+
+    await _turn(player, "turn 1")
+    await _turn(player, "turn 2")
+
+    for request in llm.requests:
+        assert [message.content for message in request[:3]] == ["rules", "manual", "you are the detective"]
+    assert llm.requests[1][:len(llm.requests[0]) - 1] == llm.requests[0][:-1]
+    first, second = player.prefix_metrics
+    assert first["shared_prefix_messages"] == 0
+    assert second["shared_prefix_messages"] >= 4
+    assert second["prompt_prefix_messages"] == 3
+    assert (first["cache_creation_tokens"], second["cache_read_tokens"]) == (1500, 1500)
+    assert player.token_usage["cache_read_tokens"] == 1500
+
+
+@pytest.mark.asyncio
+async def test_anthropic_requests_carry_cache_breakpoints():
+    """Test that only providers needing markers get them, on copies."""
+    player, llm = _player(provider="anthropic")
+
+    await _turn(player, "turn 1")
+
+    request = llm.requests[0]
+    assert request[2].content[0]["cache_control"] == {"type": "ephemeral"}
+    assert request[-1].content[0]["cache_control"] == {"type": "ephemeral"}
+    assert isinstance(request[1].content, str)
+    assert isinstance(player.prompt_prefix[2].content, str)
+
+
+def test_apply_cache_markers_ignores_automatic_cache_providers():
+    """Test that OpenAI/Gemini style requests are passed through unchanged."""
+    messages = [SystemMessage(content="rules"), HumanMessage(content="turn")]
+
+    assert apply_cache_markers("openai", messages, [0, 1]) is messages
+    marked = apply_cache_markers("anthropic", messages, [0])
+    assert marked[0].content[0]["text"] == "rules"
+    assert messages[0].content == "rules"
+
+
+def test_players_share_system_and_manual_prefix():
+    """Test that the GameMaster opens each conversation with the same prefix messages."""
+    game_master = build_game_master(
+        "configs/game.yaml", rounds=1, no_file_logging=True, player_models=["dummy/a", "dummy/b"])
+
+    asyncio.run(game_master.run_game())
+
+    first, second = (player.prompt_prefix for player in game_master.players)
+    assert len(first) == len(second) == 3
+    assert first[0] is second[0] and first[1] is second[1]
+    assert "GAME MANUAL" in first[1].content
+    assert first[2].content != second[2].content
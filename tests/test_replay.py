@@ -0,0 +1,75 @@
+"""Tests for replaying recorded games without LLMs (motive-util replay)."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from motive import cli
+from motive.checkpoint import JOURNAL_FILE, checkpoint_dir
+from motive.replay import UnfinishedGameError, replay_game
+from motive.util import util_main
+
+
+def _record(log_dir, game_id="replay_game", rounds=2):
+    cli.asyncio.run(cli.run_game("configs/game.yaml", game_id=game_id, rounds=rounds,
+                                 player_models=["dummy/a", "dummy/b"], log_dir=str(log_dir)))
+    return checkpoint_dir(str(log_dir), game_id)
+
+
+def _replay(directory):
+    return cli.asyncio.run(replay_game(directory))
+
+
+def test_replay_matches_recording(tmp_path, capsys):
+    directory = _record(tmp_path)
+    report = _replay(directory)
+    assert report.ok, [str(divergence) for divergence in report.divergences]
+    assert report.turns == 4 and report.responses > 0
+
+    with pytest.raises(SystemExit) as exit_info:
+        util_main(["replay", "--all", "--log-dir", str(tmp_path)])
+    assert exit_info.value.code == 0
+    assert "1/1 games match their recording" in capsys.readouterr().out
+
+
+def test_replay_reports_changed_engine_behaviour(tmp_path):
+    directory = _record(tmp_path)
+    with patch("motive.game_master.parse_player_response", return_value=([], [])):
+        report = _replay(directory)
+    assert not report.ok
+    kinds = {divergence.kind for divergence in report.divergences}
+    assert "message" in kinds
+    assert any("did not provide any actions" in divergence.detail for divergence in report.divergences)
+
+
+def test_replay_feeds_recorded_responses(tmp_path):
+    directory = _record(tmp_path)
+    journal = os.path.join(directory, JOURNAL_FILE)
+    with open(journal, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    # Rewrite Player_1's first action as if the model had answered differently
+    messages = next(record["players"]["Player_1"]["messages"] for record in records
+                    if any(message["type"] == "ai" for message in record["players"]["Player_1"]["messages"]))
+    first_response = next(message for message in messages if message["type"] == "ai")
+    first_response["data"]["content"] = "> help"
+    with open(journal, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+
+    report = _replay(directory)
+    # The edited response itself is replayed as recorded; the feedback to it is not
+    player_1 = next(divergence for divergence in report.divergences
+                    if divergence.kind == "message" and divergence.subject == "Player_1")
+    assert "recorded human" in player_1.detail
+
+
+def test_unfinished_game_is_not_replayed(tmp_path):
+    directory = _record(tmp_path)
+    journal = os.path.join(directory, JOURNAL_FILE)
+    with open(journal, encoding="utf-8") as f:
+        lines = f.readlines()
+    with open(journal, "w", encoding="utf-8") as f:
+        f.writelines(lines[:-1])  # Drop the completion record
+    with pytest.raises(UnfinishedGameError):
+        _replay(directory)
@@ -193,3 +193,21 @@ def test_affordance_engine_entity_specific_affordances():
     
     # Should not include magic action
     assert "magic_light" not in actions
+
+
+def test_affordance_engine_compiles_condition_once_at_registration(monkeypatch):
+    """Test that availability checks call the closure compiled at registration."""
+    import motive.sim_v2.affordances as affordances_module
+
+    compiled = []
+    original = affordances_module.compile_condition
+    monkeypatch.setattr(affordances_module, "compile_condition",
+                        lambda ast: compiled.append(ast) or original(ast))
+    engine = AffordanceEngine()
+    engine.register_affordance(Affordance(affordance_id="light_torch", action_name="light",
+                                          condition=ConditionParser().parse("is_lit == false"), effects=[]))
+
+    for is_lit in (False, True, False):
+        engine.get_available_actions("torch_1", {"torch_1": {"is_lit": is_lit}})
+    assert len(compiled) == 1
+    assert engine.get_available_actions("torch_1", {"torch_1": {"is_lit": False}}) == ["light"]
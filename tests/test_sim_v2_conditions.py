@@ -1,6 +1,6 @@
 import pytest
 
-from motive.sim_v2.conditions import ConditionParser, ConditionAST, ConditionEvaluator
+from motive.sim_v2.conditions import ConditionParser, ConditionAST, ConditionEvaluator, compile_condition
 
 
 def test_parse_simple_equals_condition():
@@ -102,3 +102,77 @@ def test_evaluate_missing_property():
     # Evaluate - should handle missing property gracefully
     result = evaluator.evaluate(ast, properties)
     assert result is False  # Missing property should evaluate to false
+
+
+def test_parse_is_interned():
+    """Parsing the same string twice returns the cached AST."""
+    parser = ConditionParser()
+    
+    first = parser.parse("fuel > 50 AND is_lit == true")
+    second = ConditionParser().parse("  fuel > 50 AND is_lit == true  ")
+    
+    assert first is second
+
+
+def test_parse_or_and_not_precedence():
+    """OR binds loosest, then AND, then NOT."""
+    parser = ConditionParser()
+    
+    ast = parser.parse("is_lit == true OR NOT fuel < 10 AND name == 'torch'")
+    
+    assert ast.operator == "OR"
+    assert ast.left.operator == "=="
+    assert ast.right.operator == "AND"
+    assert ast.right.left.operator == "NOT"
+    assert ast.right.left.left.operator == "<"
+
+
+def test_compiled_condition_matches_evaluator():
+    """Compiled closures agree with ConditionEvaluator across operators."""
+    parser = ConditionParser()
+    evaluator = ConditionEvaluator()
+    properties = {"name": "oil torch", "fuel": 40, "is_lit": False}
+    
+    cases = {
+        "fuel >= 40": True,
+        "fuel <= 39": False,
+        "name != 'torch'": True,
+        "name contains 'torch'": True,
+        "is_lit == true OR fuel > 10": True,
+        "NOT is_lit == true AND fuel < 50": True,
+        "missing == 1 OR NOT missing == 1": True,
+    }
+    for condition_str, expected in cases.items():
+        ast = parser.parse(condition_str)
+        assert compile_condition(ast)(properties) is expected, condition_str
+        assert evaluator.evaluate(ast, properties) is expected, condition_str
+
+
+def test_compiled_condition_short_circuits():
+    """AND/OR stop evaluating once the result is known."""
+    parser = ConditionParser()
+    
+    class CountingProps(dict):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.lookups = []
+        
+        def get(self, key, default=None):
+            self.lookups.append(key)
+            return super().get(key, default)
+    
+    props = CountingProps({"a": 1, "b": 2})
+    compile_condition(parser.parse("a == 2 AND b == 2"))(props)
+    assert props.lookups == ["a"]
+    
+    props = CountingProps({"a": 1, "b": 2})
+    compile_condition(parser.parse("a == 1 OR b == 2"))(props)
+    assert props.lookups == ["a"]
+
+
+def test_compile_condition_is_cached_per_ast():
+    """Equal ASTs share one compiled closure."""
+    ast = ConditionAST(operator="==", left="name", right="torch")
+    same = ConditionAST(operator="==", left="name", right="torch")
+    
+    assert compile_condition(ast) is compile_condition(same)
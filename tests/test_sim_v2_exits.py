@@ -89,3 +89,16 @@ def test_exit_direction_mapping():
     assert manager.get_exit_by_direction("room_1", "north") == north_exit
     assert manager.get_exit_by_direction("room_1", "south") == south_exit
     assert manager.get_exit_by_direction("room_1", "east") is None  # No east exit
+
+
+def test_exit_manager_two_way_exits():
+    """Reverse exits do not create containment cycles."""
+    manager = ExitManager()
+    relations = RelationsGraph()
+    
+    north = manager.create_exit("room_1", "room_2", "north", relations)
+    south = manager.create_exit("room_2", "room_1", "south", relations)
+    
+    assert manager.get_exit_by_direction("room_1", "north") == north
+    assert manager.get_exit_by_direction("room_2", "south") == south
+    assert relations.get_container_of("room_1") is None
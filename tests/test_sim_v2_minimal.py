@@ -81,3 +81,45 @@ def test_relations_move_and_contains():
     assert item_id not in graph.get_contents_of(room_id)
 
 
+
+
+def test_relations_nested_contents_and_root_index():
+    from motive.sim_v2.relations import RelationsGraph
+
+    graph = RelationsGraph()
+    graph.place_entity("chest_1", "room_1")
+    graph.place_entity("box_1", "chest_1")
+    graph.place_entity("gem_1", "box_1")
+    graph.place_entity("torch_1", "room_1")
+
+    assert graph.get_all_contents_of("room_1") == ["chest_1", "box_1", "gem_1", "torch_1"]
+    assert graph.count_all_contents_of("room_1") == 4
+    assert graph.get_ancestors("gem_1") == ["box_1", "chest_1", "room_1"]
+    assert graph.get_root_container("gem_1") == "room_1"
+    assert graph.is_inside("gem_1", "chest_1")
+
+    # Moving a container re-roots everything inside it
+    graph.move_entity("chest_1", "room_2")
+    assert graph.get_root_container("gem_1") == "room_2"
+    assert graph.get_all_contents_of("room_1") == ["torch_1"]
+    assert graph.count_all_contents_of("room_2") == 3
+    assert not graph.is_inside("gem_1", "room_1")
+
+    # Views are live and read-only
+    view = graph.contents_view("room_2")
+    graph.place_entity("torch_1", "room_2")
+    assert list(view) == ["chest_1", "torch_1"]
+
+
+def test_relations_rejects_containment_cycles():
+    from motive.sim_v2.relations import RelationsGraph
+
+    graph = RelationsGraph()
+    graph.place_entity("bag_1", "room_1")
+    graph.place_entity("pouch_1", "bag_1")
+
+    with pytest.raises(ValueError):
+        graph.place_entity("bag_1", "pouch_1")
+    with pytest.raises(ValueError):
+        graph.place_entity("bag_1", "bag_1")
+    assert graph.get_container_of("bag_1") == "room_1"
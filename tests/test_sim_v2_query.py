@@ -103,3 +103,124 @@ def test_execute_query_no_results():
     
     # Should return empty list
     assert len(results) == 0
+
+
+def _nested_world():
+    relations = RelationsGraph()
+    relations.place_entity("chest_1", "room_1")
+    relations.place_entity("gem_1", "chest_1")
+    relations.place_entity("gem_2", "chest_1")
+    relations.place_entity("torch_1", "room_1")
+    relations.place_entity("gem_3", "room_2")
+    entities = {
+        "chest_1": {"name": "Chest"},
+        "gem_1": {"color": "red", "value": 10},
+        "gem_2": {"color": "blue", "value": 50},
+        "torch_1": {"fuel": 80},
+        "gem_3": {"color": "red", "value": 30},
+        "room_1": {"name": "Vault"},
+        "room_2": {"name": "Hall"},
+    }
+    return relations, entities
+
+
+def test_parse_multi_hop_query_is_cached():
+    """Multi-hop queries parse into ordered hops and are cached per string."""
+    engine = QueryEngine()
+    
+    query_ast = engine.parse("gem_1.located_in.located_in*.room")
+    
+    assert query_ast.hops == ("located_in", "located_in*")
+    assert query_ast.relation == "located_in"
+    assert engine.parse("gem_1.located_in.located_in*.room") is query_ast
+
+
+def test_parse_rejects_unknown_relation():
+    """Unknown hops fail at parse time."""
+    with pytest.raises(ValueError):
+        QueryEngine().parse("room_1.owns.torch")
+
+
+def test_execute_transitive_contains_with_rich_condition():
+    """contains* reaches nested containers and supports the full condition DSL."""
+    engine = QueryEngine()
+    relations, entities = _nested_world()
+    
+    results = engine.execute("room_1.contains*.gem where color == 'red' OR value >= 50", relations, entities)
+    
+    assert results == ["gem_1", "gem_2"]
+
+
+def test_execute_located_in_and_adjacent_to():
+    """located_in walks up and adjacent_to follows ExitManager exits."""
+    from motive.sim_v2.exits import ExitManager
+    
+    exits = ExitManager()
+    engine = QueryEngine(exit_manager=exits)
+    relations, entities = _nested_world()
+    exits.create_exit("room_1", "room_2", "north", RelationsGraph())
+    
+    assert engine.execute("gem_1.located_in*.place", relations, entities) == ["chest_1", "room_1"]
+    assert engine.execute("gem_1.located_in*.adjacent_to.room", relations, entities) == ["room_2"]
+    assert engine.execute("room_1.adjacent_to.contains.gem where color == 'red'", relations, entities) == ["gem_3"]
+
+
+def test_planner_uses_property_index_when_cheaper():
+    """An equality on an indexed property drives the plan for broad traversals."""
+    engine = QueryEngine()
+    relations, entities = _nested_world()
+    for index in range(100):
+        entity_id = f"coin_{index}"
+        relations.place_entity(entity_id, "chest_1")
+        entities[entity_id] = {"color": "gold"}
+    
+    query = "room_1.contains*.gem where color == 'red'"
+    assert engine.explain(query, relations).strategy == "traverse"
+    
+    engine.create_index("color", entities)
+    plan = engine.explain(query, relations)
+    assert plan.strategy == "index"
+    assert plan.index_property == "color"
+    assert engine.execute(query, relations, entities) == ["gem_1"]
+    
+    # Index stays current through the EffectEngine change callback
+    from motive.sim_v2.effects import EffectEngine, SetPropertyEffect
+    effects = EffectEngine(on_property_change=engine.on_property_change)
+    effects.execute_effect(SetPropertyEffect("gem_2", "color", "red"), entities)
+    assert engine.execute(query, relations, entities) == ["gem_1", "gem_2"]
+
+
+def test_property_index_follows_property_store_writes():
+    """Test that PropertyStore.set reaches the index without any effect callback."""
+    from types import SimpleNamespace
+    from motive.sim_v2.effects import SetPropertyEffect
+    from motive.sim_v2.properties import PropertySchema, PropertyStore, PropertyType
+    from motive.sim_v2.triggers import TriggerEngine
+
+    engine = QueryEngine()
+    relations = RelationsGraph()
+    schema = {"color": PropertySchema(type=PropertyType.STRING, default="grey")}
+    entities = {}
+    for index in range(50):
+        entity_id = f"stone_{index}"
+        relations.place_entity(entity_id, "room_1")
+        entities[entity_id] = SimpleNamespace(properties=PropertyStore(schema))
+    engine.create_index("color", entities)
+
+    query = "room_1.contains.stone where color == 'red'"
+    assert engine.explain(query, relations).strategy == "index"
+    assert engine.execute(query, relations, entities) == []
+
+    entities["stone_7"].properties.set("color", "red")
+    assert engine.execute(query, relations, entities) == ["stone_7"]
+    entities["stone_7"].properties.set("color", "blue")
+    assert engine.execute(query, relations, entities) == []
+
+    # Trigger effects and the index share the trigger engine's effect listeners
+    triggers = TriggerEngine()
+    triggers.effect_engine.add_property_listener(engine.on_property_change)
+    triggers.effect_engine.execute_effect(SetPropertyEffect("stone_3", "color", "red"), entities)
+    assert engine.execute(query, relations, entities) == ["stone_3"]
+
+    engine.drop_index("color")
+    assert not entities["stone_3"].properties._listeners
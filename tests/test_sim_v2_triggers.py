@@ -170,3 +170,127 @@ def test_trigger_engine_handles_missing_entities():
     
     # Trigger should be inactive due to missing property
     assert engine.get_trigger_state("fuel_warning").is_active is False
+
+
+def test_trigger_engine_process_dirty_only_evaluates_subscribers():
+    """Only triggers reading a dirtied property are evaluated."""
+    engine = TriggerEngine()
+    parser = ConditionParser()
+    
+    engine.register_trigger(Trigger("lamp_on", parser.parse("is_lit == true"), [], entity_id="lamp"))
+    engine.register_trigger(Trigger("door_open", parser.parse("is_open == true"), [], entity_id="door"))
+    entities = {"lamp": {"is_lit": False}, "door": {"is_open": False}}
+    
+    # Newly registered triggers are evaluated once
+    assert engine.process_dirty(entities) == ["lamp_on", "door_open"]
+    assert engine.process_dirty(entities) == []
+    
+    entities["lamp"]["is_lit"] = True
+    engine.mark_dirty("lamp", "is_lit")
+    assert engine.process_dirty(entities) == ["lamp_on"]
+    assert engine.get_trigger_state("lamp_on").is_active is True
+    assert engine.get_trigger_state("door_open").is_active is False
+
+
+def test_trigger_engine_property_store_writes_mark_dirty():
+    """PropertyStore.set and MotiveEntity.set_property dirty watching triggers."""
+    from motive.sim_v2.entity import MotiveEntity
+    from motive.sim_v2.properties import PropertySchema, PropertyStore, PropertyType
+    
+    store = PropertyStore({"is_lit": PropertySchema(type=PropertyType.BOOLEAN, default=False)})
+    lamp = MotiveEntity("lamp", "lamp", ["object"], store)
+    entities = {"lamp": lamp}
+    
+    engine = TriggerEngine()
+    engine.register_trigger(Trigger("lamp_on", ConditionParser().parse("is_lit == true"), [], entity_id="lamp"))
+    engine.watch_entities(entities)
+    engine.process_dirty(entities)
+    
+    lamp.set_property("is_lit", True)
+    assert engine.has_dirty_triggers()
+    assert engine.process_dirty(entities) == ["lamp_on"]
+    assert engine.get_trigger_state("lamp_on").is_active is True
+    
+    # Writing the same value is not a change
+    store.set("is_lit", True)
+    assert not engine.has_dirty_triggers()
+
+
+def test_trigger_engine_effects_cascade_in_order():
+    """Effects fired by one trigger dirty downstream triggers in the same pass."""
+    engine = TriggerEngine()
+    parser = ConditionParser()
+    
+    engine.register_trigger(Trigger(
+        "lever_pulled", parser.parse("pulled == true"),
+        [SetPropertyEffect("gate", "open", True)], entity_id="lever",
+    ))
+    engine.register_trigger(Trigger(
+        "gate_opened", parser.parse("open == true"),
+        [SetPropertyEffect("bell", "ringing", True)], entity_id="gate",
+    ))
+    entities = {"lever": {"pulled": False}, "gate": {"open": False}, "bell": {"ringing": False}}
+    engine.process_dirty(entities)
+    
+    entities["lever"]["pulled"] = True
+    engine.mark_dirty("lever", "pulled")
+    
+    assert engine.process_dirty(entities) == ["lever_pulled", "gate_opened"]
+    assert entities["bell"]["ringing"] is True
+
+
+def test_trigger_engine_cycle_limit_stops_oscillation():
+    """A trigger that keeps re-dirtying itself is cut off."""
+    engine = TriggerEngine(max_cycles_per_trigger=3)
+    parser = ConditionParser()
+    
+    engine.register_trigger(Trigger(
+        "flip", parser.parse("on == true"),
+        [SetPropertyEffect("switch", "on", False)],
+        undo_effects=[SetPropertyEffect("switch", "on", True)],
+        entity_id="switch",
+    ))
+    entities = {"switch": {"on": True}}
+    
+    evaluated = engine.process_dirty(entities)
+    
+    assert evaluated == ["flip", "flip", "flip"]
+    assert not engine.has_dirty_triggers()
+
+
+def test_trigger_engine_fan_out_limit():
+    """A single firing cannot queue more than max_fan_out triggers."""
+    engine = TriggerEngine(max_fan_out=2)
+    parser = ConditionParser()
+    
+    engine.register_trigger(Trigger(
+        "source", parser.parse("go == true"),
+        [SetPropertyEffect("hub", "signal", 1)], entity_id="src",
+    ))
+    for index in range(5):
+        engine.register_trigger(Trigger(f"sink_{index}", parser.parse("signal == 1"), [], watches=["hub.signal"]))
+    entities = {"src": {"go": False}, "hub": {"signal": 0}}
+    engine.process_dirty(entities)
+    
+    entities["src"]["go"] = True
+    engine.mark_dirty("src", "go")
+    
+    assert engine.process_dirty(entities) == ["source", "sink_0", "sink_1"]
+
+
+def test_trigger_engine_compiles_condition_once_at_registration(monkeypatch):
+    """Test that evaluations call the closure compiled at registration."""
+    import motive.sim_v2.triggers as triggers_module
+
+    compiled = []
+    original = triggers_module.compile_condition
+    monkeypatch.setattr(triggers_module, "compile_condition",
+                        lambda ast: compiled.append(ast) or original(ast))
+    engine = TriggerEngine()
+    trigger = Trigger(trigger_id="fuel_warning", condition=ConditionParser().parse("fuel > 50"), effects=[])
+    engine.register_trigger(trigger)
+
+    for fuel in (100, 10, 100):
+        engine.evaluate_triggers({"torch_1": {"fuel": fuel}})
+    assert len(compiled) == 1
+    assert engine.get_trigger_state("fuel_warning").is_active is True
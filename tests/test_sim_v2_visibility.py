@@ -137,3 +137,96 @@ def test_visibility_engine_get_visible_entities():
     assert "hidden_key" not in visible
     assert "torch_2" not in visible  # Different room
     assert "character_1" not in visible  # Don't see self
+
+
+def test_visibility_engine_caches_visible_sets_until_invalidated():
+    """Visible sets are reused until movement, search or property changes."""
+    engine = VisibilityEngine()
+    relations = RelationsGraph()
+    
+    relations.place_entity("character_1", "room_1")
+    relations.place_entity("torch_1", "room_1")
+    relations.place_entity("hidden_key", "room_1")
+    entities = {
+        "character_1": {"visible": True},
+        "torch_1": {"visible": True},
+        "hidden_key": {"visible": False, "searchable": True},
+        "coin_1": {"visible": True},
+    }
+    
+    assert engine.get_visible_entities("character_1", entities, relations) == ["torch_1"]
+    entry = engine._visible_cache[("character_1", "room_1")]
+    assert engine.can_see("character_1", "torch_1", entities, relations) is True
+    assert engine._visible_cache[("character_1", "room_1")] is entry  # Served from the cache
+    
+    # Reported property changes invalidate the room
+    engine.on_property_change("torch_1", "visible")
+    assert ("character_1", "room_1") not in engine._visible_cache
+    entities["torch_1"]["visible"] = False
+    assert engine.get_visible_entities("character_1", entities, relations) == []
+    
+    # Movement into the room invalidates through the contents version
+    relations.place_entity("coin_1", "room_1")
+    assert engine.get_visible_entities("character_1", entities, relations) == ["coin_1"]
+    
+    # Discovery through search invalidates the searcher's entry
+    engine.perform_search("character_1", "room_1", entities, relations)
+    assert engine.get_visible_entities("character_1", entities, relations) == ["hidden_key", "coin_1"]
+
+
+def test_visibility_engine_dark_rooms_need_light():
+    """Dark rooms hide everything until a light source in the room is lit."""
+    engine = VisibilityEngine()
+    relations = RelationsGraph()
+    
+    relations.place_entity("character_1", "cellar")
+    relations.place_entity("torch_1", "character_1")
+    relations.place_entity("barrel_1", "cellar")
+    entities = {
+        "cellar": {"dark": True},
+        "character_1": {"visible": True},
+        "torch_1": {"is_lit": False},
+        "barrel_1": {"visible": True},
+    }
+    
+    assert engine.get_visible_entities("character_1", entities, relations) == []
+    assert engine.can_see("character_1", "barrel_1", entities, relations) is False
+    
+    entities["torch_1"]["is_lit"] = True
+    engine.on_property_change("torch_1", "is_lit")
+    
+    assert engine.get_visible_entities("character_1", entities, relations) == ["barrel_1"]
+    assert engine.can_see("character_1", "barrel_1", entities, relations) is True
+
+
+def test_visibility_engine_sees_properties_changed_in_place():
+    """Unreported writes to visible, is_lit and dark still update the visible set."""
+    engine = VisibilityEngine()
+    relations = RelationsGraph()
+    
+    relations.place_entity("character_1", "room_1")
+    relations.place_entity("torch_1", "character_1")
+    relations.place_entity("key", "room_1")
+    entities = {
+        "room_1": {},
+        "character_1": {"visible": True},
+        "torch_1": {"is_lit": False},
+        "key": {"visible": True},
+    }
+    
+    assert engine.get_visible_entities("character_1", entities, relations) == ["key"]
+    entities["key"]["visible"] = False
+    assert engine.get_visible_entities("character_1", entities, relations) == []
+    entities["key"]["visible"] = True
+    assert engine.can_see("character_1", "key", entities, relations) is True
+    
+    entities["room_1"]["dark"] = True
+    assert engine.get_visible_entities("character_1", entities, relations) == []
+    entities["torch_1"]["is_lit"] = True
+    assert engine.get_visible_entities("character_1", entities, relations) == ["key"]
+    entities["torch_1"]["is_lit"] = False
+    assert engine.can_see("character_1", "key", entities, relations) is False
+    
+    # Replacing an entity's property mapping is seen too
+    entities["room_1"] = {"dark": False}
+    assert engine.get_visible_entities("character_1", entities, relations) == ["key"]
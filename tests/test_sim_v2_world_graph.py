@@ -0,0 +1,115 @@
+import random
+
+from motive.sim_v2.exits import ExitManager
+from motive.sim_v2.relations import RelationsGraph
+from motive.sim_v2.world_graph import WorldExit, WorldGraph
+
+
+def _rooms():
+    return {
+        "square": {"exits": {
+            "north": {"name": "North", "destination_room_id": "church"},
+            "east": {"name": "East", "destination_room_id": "market"},
+        }},
+        "church": {"exits": {
+            "south": {"name": "South", "destination_room_id": "square"},
+            "crypt": {"name": "Crypt", "destination_room_id": "crypt", "is_hidden": True},
+        }},
+        "market": {"exits": {
+            "west": {"name": "West", "destination_room_id": "square"},
+            "vault": {"name": "Vault", "destination_room_id": "crypt", "is_locked": True},
+        }},
+        "crypt": {"exits": {}},
+        "island": {"exits": {}},
+    }
+
+
+def test_world_graph_shortest_paths_respect_exit_conditions():
+    """Test that hidden and locked exits only count when asked for."""
+    graph = WorldGraph.from_rooms(_rooms())
+
+    assert graph.distance("square", "church") == 1
+    assert graph.distance("church", "market") == 2
+    assert graph.shortest_path("church", "market") == ["church", "square", "market"]
+    assert graph.distance("square", "crypt") is None
+    assert graph.shortest_path("square", "crypt", hidden=True) == ["square", "church", "crypt"]
+    assert graph.shortest_path("square", "crypt", locked=True) == ["square", "market", "crypt"]
+    assert graph.next_exit("square", "church").name == "North"
+    assert graph.next_exit("square", "square") is None
+
+
+def test_world_graph_components_and_unreachable_rooms():
+    """Test reachability summaries used for config validation."""
+    graph = WorldGraph.from_rooms(_rooms())
+
+    assert graph.components() == [["square", "church", "market", "crypt"], ["island"]]
+    assert graph.unreachable_from(["square"]) == ["island"]
+    assert graph.unreachable_from(["square"], hidden=False, locked=False) == ["crypt", "island"]
+    assert graph.reachable_from("crypt") == {"crypt"}
+
+
+def test_world_graph_updates_incrementally():
+    """Test that unlocking and removing exits update built path tables."""
+    graph = WorldGraph.from_rooms(_rooms())
+    assert graph.distance("square", "crypt") is None
+
+    graph.update_exit("market", "vault", locked=False)
+    assert graph.shortest_path("square", "crypt") == ["square", "market", "crypt"]
+
+    graph.remove_exit("square", "east")
+    assert graph.distance("square", "crypt") is None
+    assert graph.distance("market", "church") == 2
+
+    graph.set_exit(WorldExit("bridge", "island", "square"))
+    assert graph.distance("island", "crypt", hidden=True) == 3
+
+
+def test_world_graph_incremental_matches_rebuild():
+    """Test random exit edits against a graph rebuilt from scratch."""
+    rng = random.Random(7)
+    rooms = [f"room_{i}" for i in range(7)]
+    modes = [(hidden, locked) for hidden in (False, True) for locked in (False, True)]
+    graph = WorldGraph()
+    for room_id in rooms:
+        graph.add_room(room_id)
+    for mode in modes:
+        graph.distance(rooms[0], rooms[0], *mode)  # Build every table before editing
+
+    exits = {}
+    for step in range(150):
+        key = (rng.choice(rooms), f"exit_{rng.randint(0, 4)}")
+        if key in exits and rng.random() < 0.4:
+            graph.remove_exit(*key)
+            del exits[key]
+        else:
+            exits[key] = WorldExit(key[1], key[0], rng.choice(rooms),
+                                   hidden=rng.random() < 0.3, locked=rng.random() < 0.3)
+            graph.set_exit(exits[key])
+
+        rebuilt = WorldGraph()
+        for room_id in rooms:
+            rebuilt.add_room(room_id)
+        for exit in exits.values():
+            rebuilt.set_exit(exit)
+        for mode in modes:
+            for source in rooms:
+                for target in rooms:
+                    assert graph.distance(source, target, *mode) == rebuilt.distance(source, target, *mode)
+
+
+def test_world_graph_follows_exit_manager():
+    """Test that ExitManager state changes reach an attached graph."""
+    manager = ExitManager()
+    relations = RelationsGraph()
+    manager.create_exit("hall", "study", "north", relations)
+    graph = WorldGraph.from_exit_manager(manager)
+    door = manager.create_exit("study", "vault", "down", relations)
+
+    assert graph.distance("hall", "vault") == 2
+
+    manager.set_exit_locked(door, True)
+    assert graph.distance("hall", "vault") is None
+    assert graph.distance("hall", "vault", locked=True) == 2
+
+    manager.set_exit_traversable(door, False)
+    assert graph.distance("hall", "vault", hidden=True, locked=True) is None
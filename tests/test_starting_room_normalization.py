@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from motive.game_initializer import GameInitializer
+from motive.rng import GameRandom
 from motive.config import GameConfig, GameSettings, CharacterConfig, InitialRoomConfig
 
 
@@ -14,6 +15,7 @@ class TestInitialRoomNormalization:
         # Create a minimal GameInitializer for testing
         self.gi = Mock()
         self.gi.deterministic = False
+        self.gi.rng = GameRandom(seed=0)
         self.gi.game_rooms = {
             'room1': Mock(),
             'room2': Mock(),
@@ -0,0 +1,149 @@
+"""Tests for streamed player responses that stop once the turn's actions are in."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+from motive import llm_factory
+from motive.action_parser import ActionLineStream
+from motive.cli import build_game_master
+from motive.player import Player
+
+
+class _StreamingLLM:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+        self.closed = False
+
+    async def astream(self, messages, **kwargs):
+        try:
+            for chunk in self.chunks:
+                self.sent += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def _player(llm_client):
+    return Player("Streamer", "dummy", "dummy-model", log_dir="logs", no_file_logging=True, llm_client=llm_client)
+
+
+def test_action_line_stream_waits_for_complete_lines():
+    """Test that action lines are only reported once their newline arrives."""
+    stream = ActionLineStream()
+
+    assert stream.feed("Let me think.\n> lo") == []
+    assert stream.feed("ok\n> move no") == ["look"]
+    assert stream.feed("rth\n\n>   \n") == ["move north"]
+    assert stream.feed("> say \"hi\"") == []
+    assert stream.finish() == ['say "hi"']
+    assert stream.action_lines == ["look", "move north", 'say "hi"']
+
+
+@pytest.mark.asyncio
+async def test_player_stops_stream_after_enough_action_lines():
+    """Test that generation stops and the rambling tail is dropped."""
+    llm = _StreamingLLM([
+        AIMessageChunk(content="I should look around.\n> lo", usage_metadata={"input_tokens": 40, "output_tokens": 0, "total_tokens": 40}),
+        AIMessageChunk(content="ok\n> move north\n"),
+        AIMessageChunk(content="Now a long explanation of my plan..."),
+        AIMessageChunk(content="\n> quit\n", usage_metadata={"input_tokens": 0, "output_tokens": 90, "total_tokens": 90}),
+    ])
+    player = _player(llm)
+
+    response = await player.get_response_and_update_history(
+        [HumanMessage(content="What do you do?")], stop_when=lambda lines: len(lines) >= 2)
+
+    assert response.content == "I should look around.\n> look\n> move north"
+    assert llm.sent == 2
+    assert llm.closed
+    assert player.streams_cut_short == 1
+    assert player.token_usage["input_tokens"] == 40
+    assert player.token_usage["output_tokens"] == 0
+    assert player.chat_history[-1].content == response.content
+
+
+@pytest.mark.asyncio
+async def test_player_keeps_full_stream_when_never_stopped():
+    """Test that a stream that never meets the condition is returned whole."""
+    player = _player(_StreamingLLM([AIMessageChunk(content="> look\nand"), AIMessageChunk(content=" more")]))
+
+    response = await player.get_response_and_update_history(
+        [HumanMessage(content="What do you do?")], stop_when=lambda lines: False)
+
+    assert response.content == "> look\nand more"
+    assert player.streams_cut_short == 0
+
+
+@pytest.mark.asyncio
+async def test_player_without_stream_support_falls_back_to_ainvoke():
+    """Test that clients without astream (e.g. batch mode) still answer."""
+    class _InvokeOnly:
+        async def ainvoke(self, messages, **kwargs):
+            return AIMessage(content="> look\n> help")
+
+    response = await _player(_InvokeOnly()).get_response_and_update_history(
+        [HumanMessage(content="What do you do?")], stop_when=lambda lines: True)
+
+    assert response.content == "> look\n> help"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_stream_times_out_between_chunks():
+    """Test the per-chunk timeout of streamed provider requests."""
+    class _StallingLLM:
+        closed = False
+
+        async def astream(self, messages, **kwargs):
+            try:
+                yield AIMessageChunk(content="> look\n")
+                await asyncio.sleep(1)
+                yield AIMessageChunk(content="> help\n")
+            finally:
+                _StallingLLM.closed = True
+
+    received = []
+    with pytest.raises(TimeoutError):
+        async for chunk in llm_factory._rate_limited_stream("dummy", _StallingLLM(), [], timeout=0.01):
+            received.append(chunk.content)
+
+    assert received == ["> look\n"]
+    assert _StallingLLM.closed
+
+
+def test_action_cutoff_stops_at_line_limit_or_spent_ap():
+    """Test the GameMaster stop condition against action costs."""
+    game_master = build_game_master(
+        "configs/game.yaml", no_file_logging=True, player_models=["dummy/a"], stream_max_actions=4)
+    player_char = game_master.players[0].character
+    player_char.action_points = 30
+
+    assert game_master.stream_responses is True
+    stop_when = game_master._action_cutoff(player_char, {})
+    assert not stop_when(["look"])
+    assert not stop_when(["look", "not an action"])
+    assert stop_when(["look", "not an action", "look", "look"])  # Three 10 AP looks
+
+    stop_when = game_master._action_cutoff(player_char, {})
+    assert not stop_when(["not an action", "still not one", "nope"])
+    assert stop_when(["not an action", "still not one", "nope", "no"])  # Line limit
+
+
+def test_action_cutoff_skips_actions_it_cannot_afford_like_the_turn_loop():
+    """Test that an unaffordable or failing action does not end the stream before a cheaper one."""
+    game_master = build_game_master("configs/game.yaml", no_file_logging=True, player_models=["dummy/a"])
+    player_char = game_master.players[0].character
+    exit_name = next(iter(game_master.rooms[player_char.current_room_id].exits.values()))["name"]
+
+    player_char.action_points = 5
+    stop_when = game_master._action_cutoff(player_char, {})
+    assert not stop_when([f"move {exit_name}"])  # 10 AP: skipped by the turn loop, not spent
+    assert not stop_when([f"move {exit_name}", "pickup no such thing"])  # Fails its requirements
+    assert not stop_when([f"move {exit_name}", "pickup no such thing", "help"])  # 1 AP, runs
+
+    player_char.action_points = 11
+    stop_when = game_master._action_cutoff(player_char, {})
+    assert not stop_when([f"move {exit_name}"])
+    assert stop_when([f"move {exit_name}", "help"])  # Spends the last AP
@@ -0,0 +1,101 @@
+"""Tests for adaptive model tournaments."""
+
+import asyncio
+import random
+
+import pytest
+
+from motive.tournament import (
+    Budget,
+    TournamentRunner,
+    TournamentScheduler,
+    parse_entry,
+)
+
+
+CHARACTERS = {f"character_{i}": [f"motive_{i}_a", f"motive_{i}_b"] for i in range(4)}
+
+
+def _scheduler(labels=("p/strong", "p/mid", "p/weak"), players=3, **budget):
+    entries = [parse_entry(label) for label in labels]
+    return TournamentScheduler(entries, CHARACTERS, players, Budget(**budget))
+
+
+def _results(matchup, outcomes):
+    return [
+        {"player": f"Player_{i + 1}", "outcome": outcome, "input_tokens": 1000, "output_tokens": 100}
+        for i, outcome in enumerate(outcomes)
+    ]
+
+
+def test_parse_entry_with_prices():
+    """Test provider/model entries with optional per-million-token prices."""
+    entry = parse_entry("openai/gpt-4o@2.5,10")
+
+    assert entry.label == "openai/gpt-4o"
+    assert entry.cost(1_000_000, 100_000) == pytest.approx(3.5)
+    with pytest.raises(ValueError):
+        parse_entry("gpt-4o")
+
+
+def test_winner_gains_rating_and_deviation_shrinks():
+    """Test a Glicko update after one game."""
+    scheduler = _scheduler(labels=("p/a", "p/b"), players=2)
+    matchup = scheduler.next_matchup()
+    winner, loser = (seat.entry for seat in matchup.seats)
+
+    scheduler.record(matchup, _results(matchup, ["won", "not_achieved"]))
+
+    assert scheduler.ratings[winner].mu > 1500 > scheduler.ratings[loser].mu
+    assert scheduler.ratings[winner].rd < 350
+    assert scheduler.tokens_spent == 2200
+
+
+def test_matchups_rotate_characters_and_motives():
+    """Test that each entry plays the characters it has played least."""
+    scheduler = _scheduler(labels=("p/a", "p/b"), players=2, max_games=4)
+    characters_by_entry = {}
+    while (matchup := scheduler.next_matchup()) is not None:
+        for seat in matchup.seats:
+            characters_by_entry.setdefault(seat.entry.label, []).append(seat.character)
+        assert len({seat.character for seat in matchup.seats}) == 2
+        assert matchup.worker_args()[:3] == ["--player-models"] + [seat.entry.label for seat in matchup.seats]
+        scheduler.record(matchup, _results(matchup, ["won", "won"]))
+
+    assert scheduler.stop_reason() == "game budget spent"
+    for characters in characters_by_entry.values():
+        assert len(set(characters)) == len(characters)
+
+
+def test_failed_games_count_but_do_not_rate():
+    """Test that worker failures stop the tournament without touching ratings."""
+    scheduler = _scheduler()
+    for _ in range(3):
+        scheduler.record(scheduler.next_matchup(), [], error="worker crashed")
+
+    assert scheduler.stop_reason() == "3 games failed"
+    assert all(rating.games == 0 for rating in scheduler.ratings.values())
+
+
+def test_runner_stops_early_once_rankings_separate():
+    """Test a simulated tournament ranks entries correctly within budget."""
+    rng = random.Random(0)
+    skill = {"p/strong": 0.85, "p/mid": 0.45, "p/weak": 0.05}
+    scheduler = _scheduler(max_games=300, max_dollars=100.0)
+    launched = []
+
+    async def launch(game_id, matchup):
+        launched.append(game_id)
+        await asyncio.sleep(0)
+        return _results(matchup, [
+            "won" if rng.random() < skill[seat.entry.label] else "not_achieved" for seat in matchup.seats
+        ])
+
+    runner = TournamentRunner(scheduler, "game.yaml", concurrency=4, tournament_id="t", launch=launch)
+    summary = asyncio.run(runner.run())
+
+    assert summary["stop_reason"] == "rankings separated"
+    assert summary["games"] < 300
+    assert [row["entry"] for row in summary["leaderboard"]] == ["p/strong", "p/mid", "p/weak"]
+    assert launched[0] == "t_game_1"
+    assert scheduler.games_running == 0
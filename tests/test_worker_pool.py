@@ -0,0 +1,183 @@
+"""Tests for the bounded worker pool used by --parallel --pool-workers."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from motive import worker_pool
+from motive.checkpoint import checkpoint_dir, load_checkpoint
+from motive.game_master import GameMaster
+from motive.worker_pool import ConcurrencyController, GameSpec, WorkerPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_controller_halves_on_pressure_and_recovers_slowly():
+    clock = FakeClock()
+    controller = ConcurrencyController(8, increase_after=10, cooldown=5, clock=clock)
+    assert controller.limit == 8
+
+    clock.now = 1
+    assert controller.observe(3) == 4
+    clock.now = 2
+    assert controller.observe(1) == 4  # Within the cooldown: one halving per burst
+    clock.now = 7
+    assert controller.observe(1) == 2
+    clock.now = 8
+    assert controller.observe(0) == 2  # Not quiet for long enough yet
+    clock.now = 17
+    assert controller.observe(0) == 3
+    clock.now = 27
+    assert controller.observe(0) == 4
+
+    for step in range(10):
+        clock.now = 30 + step * 5
+        controller.observe(5)
+    assert controller.limit == 1  # Never below the minimum
+
+
+def _deliver(pool, *messages):
+    for message in messages:
+        pool.results.put(message)
+    time.sleep(0.2)  # Let the queue's feeder thread flush
+    return pool.poll(timeout=1.0)
+
+
+class FakeProcess:
+    """Stands in for a worker process: never runs, alive until killed."""
+
+    def __init__(self, **kwargs):
+        self.alive = True
+        self.exitcode = None
+
+    def start(self):
+        pass
+
+    def is_alive(self):
+        return self.alive
+
+    def kill(self):
+        self.alive, self.exitcode = False, -9
+
+    def join(self, timeout=None):
+        pass
+
+    terminate = kill
+
+
+def _fake_pool(monkeypatch, workers, **kwargs):
+    pool = WorkerPool("configs/game.yaml", {}, workers=workers, **kwargs)
+    monkeypatch.setattr(pool.context, "Process", FakeProcess)
+    pool.start()
+    return pool
+
+
+def test_pool_dispatches_under_limit_and_requeues_failures(monkeypatch):
+    pool = _fake_pool(monkeypatch, 2, max_attempts=2, controller=ConcurrencyController(2, increase_after=3600))
+    try:
+        for slot in range(3):
+            pool.submit(GameSpec(f"g{slot}", slot))
+        pool.poll()
+        assert sorted(pool.in_flight) == ["g0", "g1"]  # Backpressure: game 3 waits
+        assert [spec.game_id for spec in pool.pending] == ["g2"]
+
+        events = _deliver(pool, (worker_pool.STARTED, 0, pool.in_flight["g0"]),
+                          (worker_pool.FINISHED, 0, (GameSpec("g0", 0), False, "boom")))
+        assert [(event.kind, event.spec.game_id, event.final) for event in events] == [
+            (worker_pool.STARTED, "g0", True), (worker_pool.FINISHED, "g0", False)]
+        # The retry goes ahead of queued games
+        assert pool.in_flight["g0"].attempt == 2
+        assert [spec.game_id for spec in pool.pending] == ["g2"]
+
+        events = _deliver(pool, (worker_pool.FINISHED, 0, (GameSpec("g0", 0, attempt=2), False, "boom")),
+                          (worker_pool.FINISHED, 1, (GameSpec("g1", 1), True, None)))
+        assert [(event.spec.game_id, event.ok, event.final) for event in events] == [
+            ("g0", False, True), ("g1", True, True)]
+        assert list(pool.in_flight) == ["g2"]
+        assert not pool.done
+    finally:
+        pool.shutdown(timeout=0)
+
+
+def test_pool_requeues_game_of_worker_that_died_before_starting_it(monkeypatch):
+    pool = _fake_pool(monkeypatch, 1, controller=ConcurrencyController(1, increase_after=3600))
+    try:
+        pool.submit(GameSpec("g0", 0))
+        pool.poll()
+        assert pool.running[0].game_id == "g0"
+
+        pool.processes[0].kill()  # Took the game off its queue, then died before sending STARTED
+        events = pool.poll()
+        assert [(event.spec.game_id, event.ok, event.final) for event in events] == [("g0", False, False)]
+        assert "exited with code -9" in events[0].error
+        # The replacement worker gets the retry
+        assert list(pool.processes) == [1] and pool.running[1] == GameSpec("g0", 0, attempt=2)
+        assert pool.in_flight["g0"].attempt == 2
+    finally:
+        pool.shutdown(timeout=0)
+
+
+def test_pool_backs_off_on_rate_limit_pressure():
+    pool = WorkerPool("configs/game.yaml", {}, workers=4,
+                      controller=ConcurrencyController(4, cooldown=0, increase_after=3600))
+    try:
+        _deliver(pool, (worker_pool.HEARTBEAT, 0, {"openai": {"requests": 10, "throttled": 0}}))
+        assert pool.controller.limit == 4
+        _deliver(pool, (worker_pool.HEARTBEAT, 0, {"openai": {"requests": 12, "throttled": 2}}))
+        assert pool.controller.limit == 2
+        # Counters are cumulative: an unchanged snapshot is no new pressure
+        _deliver(pool, (worker_pool.HEARTBEAT, 0, {"openai": {"requests": 14, "throttled": 2}}))
+        assert pool.controller.limit == 2
+    finally:
+        pool.shutdown(timeout=0)
+
+
+def test_pool_runs_games_on_fewer_workers(tmp_path):
+    game_kwargs = {"validate": True, "rounds": 1, "player_models": ["dummy/a", "dummy/b"],
+                   "log_dir": str(tmp_path), "no_file_logging": True}
+    pool = WorkerPool("configs/game.yaml", game_kwargs, workers=2)
+    for slot in range(3):
+        pool.submit(GameSpec(f"pool_{slot}", slot))
+    pool.start()
+    finished = {}
+    try:
+        deadline = time.monotonic() + 100
+        while not pool.done and time.monotonic() < deadline:
+            for event in pool.poll(timeout=0.5):
+                if event.kind == worker_pool.FINISHED:
+                    finished[event.spec.game_id] = (event.ok, event.error)
+    finally:
+        pool.shutdown()
+    assert finished == {f"pool_{slot}": (True, None) for slot in range(3)}
+    assert len(pool.stderr_paths) == 2
+
+
+def test_requeued_game_continues_from_its_checkpoint(tmp_path):
+    game_kwargs = {"rounds": 3, "player_models": ["dummy/a", "dummy/b"], "log_dir": str(tmp_path)}
+    original = GameMaster._execute_player_turn
+    turns = []
+
+    async def execute_player_turn(self, player, round_num):
+        turns.append((round_num, player.name))
+        if len(turns) == 4:
+            raise RuntimeError("provider timeout")
+        return await original(self, player, round_num)
+
+    with patch.object(GameMaster, "_execute_player_turn", execute_player_turn):
+        with pytest.raises(RuntimeError):
+            asyncio.run(worker_pool._play("configs/game.yaml", game_kwargs, GameSpec("pool_ckpt", 0, seed=7), None))
+        assert load_checkpoint(checkpoint_dir(str(tmp_path), "pool_ckpt")).turns == 3
+
+        turns.clear()
+        asyncio.run(worker_pool._play("configs/game.yaml", game_kwargs,
+                                      GameSpec("pool_ckpt", 0, attempt=2, seed=7), None))
+    assert turns == [(2, "Player_2"), (3, "Player_1"), (3, "Player_2")]  # Not from round 1
+    assert load_checkpoint(checkpoint_dir(str(tmp_path), "pool_ckpt")).complete
@@ -0,0 +1,60 @@
+"""Tests for the synthetic world generator and its scaling measurements."""
+
+import pytest
+
+from motive.world_generator import (GRID, RANDOM, RING, TOPOLOGIES, TREE, TREE_BRANCHING, WorldSpec, format_scaling,
+                                    generate_world, measure_point, write_world)
+
+
+def _rooms(world):
+    return {entity_id: entity for entity_id, entity in world["entity_definitions"].items()
+            if entity["behaviors"] == ["room"]}
+
+
+def _reachable(rooms):
+    start = sorted(rooms)[0]
+    seen, frontier = {start}, [start]
+    while frontier:
+        for exit_cfg in rooms[frontier.pop()]["properties"]["exits"].values():
+            if exit_cfg["destination_room_id"] not in seen:
+                seen.add(exit_cfg["destination_room_id"])
+                frontier.append(exit_cfg["destination_room_id"])
+    return seen
+
+
+# Exits per room without extra exits: (fewest, most)
+DEGREES = {GRID: (2, 4), RING: (2, 2), TREE: (1, TREE_BRANCHING + 1), RANDOM: (1, 49)}
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+def test_every_topology_connects_all_rooms_with_two_way_exits(topology):
+    rooms = _rooms(generate_world(WorldSpec(rooms=50, topology=topology, exit_aliases=3)))
+    assert len(rooms) == 50 and _reachable(rooms) == set(rooms)
+    for room_id, room in rooms.items():
+        assert DEGREES[topology][0] <= len(room["properties"]["exits"]) <= DEGREES[topology][1]
+        for exit_cfg in room["properties"]["exits"].values():
+            assert room_id in rooms[exit_cfg["destination_room_id"]]["properties"]["exits"]
+            assert len(exit_cfg["aliases"]) == 3
+
+    exits = sum(len(room["properties"]["exits"]) for room in rooms.values())
+    denser = _rooms(generate_world(WorldSpec(rooms=50, topology=topology, extra_exits=1.0)))
+    assert sum(len(room["properties"]["exits"]) for room in denser.values()) > exits
+
+
+def test_generation_is_deterministic_per_seed():
+    spec = WorldSpec(rooms=30, topology=RANDOM, extra_exits=0.5, objects_per_room=2.5, actions=2)
+    assert generate_world(spec) == generate_world(WorldSpec(**vars(spec)))
+    assert generate_world(spec) != generate_world(WorldSpec(**{**vars(spec), "seed": 1}))
+    with pytest.raises(ValueError):
+        WorldSpec(topology="hypercube")
+
+
+def test_written_world_loads_builds_and_plays(tmp_path):
+    spec = WorldSpec(rooms=12, objects_per_room=3, interactive=1.0, characters=3, conditions_per_motive=2, actions=2)
+    config_path = write_world(str(tmp_path / "world"), spec, players=2, rounds=2)
+
+    point = measure_point(config_path, memory=False)
+    assert point.error is None
+    assert (point.rooms, point.objects, point.turns) == (12, 36, 4)
+    assert point.load_seconds > 0 and point.build_seconds > 0 and point.turns_per_second > 0
+    assert "12" in format_scaling([point])